@@ -0,0 +1,326 @@
+import threading
+
+import requests
+
+from basketball_reference_web_scraper.async_http_service import AsyncHTTPService, DEFAULT_MAX_CONCURRENCY
+from basketball_reference_web_scraper.errors import InvalidSeason, InvalidDate, InvalidPlayerAndSeason
+from basketball_reference_web_scraper.output.columns import BOX_SCORE_COLUMN_NAMES, SCHEDULE_COLUMN_NAMES, \
+    PLAYER_SEASON_TOTALS_COLUMN_NAMES, \
+    PLAYER_ADVANCED_SEASON_TOTALS_COLUMN_NAMES, TEAM_BOX_SCORES_COLUMN_NAMES, PLAY_BY_PLAY_COLUMN_NAMES, \
+    PLAYER_SEASON_BOX_SCORE_COLUMN_NAMES, SEARCH_RESULTS_COLUMN_NAMES, STANDINGS_COLUMNS_NAMES, SALARIES_COLUMN_NAMES, \
+    CONTRACTS_COLUMN_NAMES, PLAYER_TOTAL_CONTRACT_COLUMN_NAMES, COMBINED_PLAYER_SEASON_BOX_SCORE_COLUMN_NAMES
+from basketball_reference_web_scraper.output.service import default_output_service
+from basketball_reference_web_scraper.output.writers import CSVWriter, FileOptions, OutputOptions, SearchCSVWriter, \
+    PlayerSeasonBoxScoresCSVWriter, DataFrameWriter, SearchDataFrameWriter, PlayerSeasonBoxScoresDataFrameWriter, \
+    JSONLinesWriter, SearchJSONLinesWriter, PlayerSeasonBoxScoresJSONLinesWriter
+
+_default_http_service = None
+_default_http_service_lock = threading.Lock()
+
+
+def default_http_service():
+    global _default_http_service
+
+    with _default_http_service_lock:
+        if _default_http_service is None:
+            _default_http_service = AsyncHTTPService()
+
+        return _default_http_service
+
+
+def configure_default_http_service(max_concurrency=DEFAULT_MAX_CONCURRENCY, executor=None):
+    global _default_http_service
+
+    http_service = AsyncHTTPService(
+        max_concurrency=max_concurrency,
+        executor=executor,
+    )
+
+    with _default_http_service_lock:
+        _default_http_service = http_service
+
+    return http_service
+
+
+async def _output(http_service, values, options, csv_writer_class=CSVWriter, dataframe_writer_class=DataFrameWriter,
+                  json_lines_writer_class=JSONLinesWriter):
+    output_service = default_output_service(
+        csv_writer_class=csv_writer_class,
+        dataframe_writer_class=dataframe_writer_class,
+        json_lines_writer_class=json_lines_writer_class,
+    )
+    # Writing output can involve file I/O so it is also kept off of the event loop
+    return await http_service.run_in_executor(output_service.output, data=values, options=options)
+
+
+async def standings(season_end_year, output_type=None, output_file_path=None, output_write_option=None,
+                    json_options=None):
+    http_service = default_http_service()
+    try:
+        values = await http_service.standings(season_end_year=season_end_year)
+    except requests.exceptions.HTTPError as http_error:
+        if http_error.response.status_code == requests.codes.not_found:
+            raise InvalidSeason(season_end_year=season_end_year)
+        else:
+            raise http_error
+    options = OutputOptions.of(
+        file_options=FileOptions.of(path=output_file_path, mode=output_write_option),
+        output_type=output_type,
+        json_options=json_options,
+        csv_options={"column_names": STANDINGS_COLUMNS_NAMES}
+    )
+    return await _output(http_service=http_service, values=values, options=options)
+
+
+async def player_box_scores(day, month, year, output_type=None, output_file_path=None, output_write_option=None,
+                            json_options=None):
+    http_service = default_http_service()
+    try:
+        values = await http_service.player_box_scores(day=day, month=month, year=year)
+    except requests.exceptions.HTTPError as http_error:
+        if http_error.response.status_code == requests.codes.not_found:
+            raise InvalidDate(day=day, month=month, year=year)
+        else:
+            raise http_error
+    options = OutputOptions.of(
+        file_options=FileOptions.of(path=output_file_path, mode=output_write_option),
+        output_type=output_type,
+        json_options=json_options,
+        csv_options={"column_names": BOX_SCORE_COLUMN_NAMES}
+    )
+    return await _output(http_service=http_service, values=values, options=options)
+
+
+async def regular_season_player_box_scores(player_identifier, season_end_year, output_type=None,
+                                           output_file_path=None, output_write_option=None, json_options=None,
+                                           include_inactive_games=False):
+    http_service = default_http_service()
+    try:
+        values = await http_service.regular_season_player_box_scores(
+            player_identifier=player_identifier,
+            season_end_year=season_end_year,
+            include_inactive_games=include_inactive_games,
+        )
+    except requests.exceptions.HTTPError as http_error:
+        if http_error.response.status_code == requests.codes.internal_server_error \
+                or http_error.response.status_code == requests.codes.not_found:
+            raise InvalidPlayerAndSeason(player_identifier=player_identifier, season_end_year=season_end_year)
+        else:
+            raise http_error
+    options = OutputOptions.of(
+        file_options=FileOptions.of(path=output_file_path, mode=output_write_option),
+        output_type=output_type,
+        json_options=json_options,
+        csv_options={"column_names": PLAYER_SEASON_BOX_SCORE_COLUMN_NAMES}
+    )
+    return await _output(http_service=http_service, values=values, options=options)
+
+
+async def playoff_player_box_scores(player_identifier, season_end_year, output_type=None, output_file_path=None,
+                                    output_write_option=None, json_options=None, include_inactive_games=False):
+    http_service = default_http_service()
+    try:
+        values = await http_service.playoff_player_box_scores(
+            player_identifier=player_identifier,
+            season_end_year=season_end_year,
+            include_inactive_games=include_inactive_games,
+        )
+    except requests.exceptions.HTTPError as http_error:
+        if http_error.response.status_code == requests.codes.internal_server_error \
+                or http_error.response.status_code == requests.codes.not_found:
+            raise InvalidPlayerAndSeason(player_identifier=player_identifier, season_end_year=season_end_year)
+        else:
+            raise http_error
+    options = OutputOptions.of(
+        file_options=FileOptions.of(path=output_file_path, mode=output_write_option),
+        output_type=output_type,
+        json_options=json_options,
+        csv_options={"column_names": PLAYER_SEASON_BOX_SCORE_COLUMN_NAMES}
+    )
+    return await _output(http_service=http_service, values=values, options=options)
+
+
+async def player_season_box_scores(player_identifier, season_end_year, include_playoffs=True, output_type=None,
+                                   output_file_path=None, output_write_option=None, json_options=None,
+                                   include_inactive_games=False):
+    http_service = default_http_service()
+    try:
+        values = await http_service.player_season_box_scores(
+            player_identifier=player_identifier,
+            season_end_year=season_end_year,
+            include_playoffs=include_playoffs,
+            include_inactive_games=include_inactive_games,
+        )
+    except requests.exceptions.HTTPError as http_error:
+        if http_error.response.status_code == requests.codes.internal_server_error \
+                or http_error.response.status_code == requests.codes.not_found:
+            raise InvalidPlayerAndSeason(player_identifier=player_identifier, season_end_year=season_end_year)
+        else:
+            raise http_error
+    options = OutputOptions.of(
+        file_options=FileOptions.of(path=output_file_path, mode=output_write_option),
+        output_type=output_type,
+        json_options=json_options,
+        csv_options={"column_names": COMBINED_PLAYER_SEASON_BOX_SCORE_COLUMN_NAMES}
+    )
+    return await _output(
+        http_service=http_service,
+        values=values,
+        options=options,
+        csv_writer_class=PlayerSeasonBoxScoresCSVWriter,
+        dataframe_writer_class=PlayerSeasonBoxScoresDataFrameWriter,
+        json_lines_writer_class=PlayerSeasonBoxScoresJSONLinesWriter,
+    )
+
+
+async def season_schedule(season_end_year, output_type=None, output_file_path=None, output_write_option=None,
+                          json_options=None):
+    http_service = default_http_service()
+    try:
+        values = await http_service.season_schedule(season_end_year=season_end_year)
+    except requests.exceptions.HTTPError as http_error:
+        if http_error.response.status_code == requests.codes.not_found:
+            raise InvalidSeason(season_end_year=season_end_year)
+        else:
+            raise http_error
+    options = OutputOptions.of(
+        file_options=FileOptions.of(path=output_file_path, mode=output_write_option),
+        output_type=output_type,
+        json_options=json_options,
+        csv_options={"column_names": SCHEDULE_COLUMN_NAMES}
+    )
+    return await _output(http_service=http_service, values=values, options=options)
+
+
+async def players_season_totals(season_end_year, output_type=None, output_file_path=None, output_write_option=None,
+                                json_options=None):
+    http_service = default_http_service()
+    try:
+        values = await http_service.players_season_totals(season_end_year=season_end_year)
+    except requests.exceptions.HTTPError as http_error:
+        if http_error.response.status_code == requests.codes.not_found:
+            raise InvalidSeason(season_end_year=season_end_year)
+        else:
+            raise http_error
+    options = OutputOptions.of(
+        file_options=FileOptions.of(path=output_file_path, mode=output_write_option),
+        output_type=output_type,
+        json_options=json_options,
+        csv_options={"column_names": PLAYER_SEASON_TOTALS_COLUMN_NAMES}
+    )
+    return await _output(http_service=http_service, values=values, options=options)
+
+
+async def players_advanced_season_totals(season_end_year, include_combined_values=False, output_type=None,
+                                         output_file_path=None, output_write_option=None, json_options=None):
+    http_service = default_http_service()
+    try:
+        values = await http_service.players_advanced_season_totals(
+            season_end_year=season_end_year,
+            include_combined_values=include_combined_values
+        )
+    except requests.exceptions.HTTPError as http_error:
+        if http_error.response.status_code == requests.codes.not_found:
+            raise InvalidSeason(season_end_year=season_end_year)
+        else:
+            raise http_error
+    options = OutputOptions.of(
+        file_options=FileOptions.of(path=output_file_path, mode=output_write_option),
+        output_type=output_type,
+        json_options=json_options,
+        csv_options={"column_names": PLAYER_ADVANCED_SEASON_TOTALS_COLUMN_NAMES}
+    )
+    return await _output(http_service=http_service, values=values, options=options)
+
+
+async def team_box_scores(day, month, year, output_type=None, output_file_path=None, output_write_option=None,
+                          json_options=None):
+    http_service = default_http_service()
+    try:
+        values = await http_service.team_box_scores(day=day, month=month, year=year)
+    except requests.exceptions.HTTPError as http_error:
+        if http_error.response.status_code == requests.codes.not_found:
+            raise InvalidDate(day=day, month=month, year=year)
+        else:
+            raise http_error
+    options = OutputOptions.of(
+        file_options=FileOptions.of(path=output_file_path, mode=output_write_option),
+        output_type=output_type,
+        json_options=json_options,
+        csv_options={"column_names": TEAM_BOX_SCORES_COLUMN_NAMES}
+    )
+    return await _output(http_service=http_service, values=values, options=options)
+
+
+async def play_by_play(home_team, day, month, year, output_type=None, output_file_path=None, output_write_option=None,
+                       json_options=None):
+    http_service = default_http_service()
+    try:
+        values = await http_service.play_by_play(home_team=home_team, day=day, month=month, year=year)
+    except requests.exceptions.HTTPError as http_error:
+        if http_error.response.status_code == requests.codes.not_found:
+            raise InvalidDate(day=day, month=month, year=year)
+        else:
+            raise http_error
+    options = OutputOptions.of(
+        file_options=FileOptions.of(path=output_file_path, mode=output_write_option),
+        output_type=output_type,
+        json_options=json_options,
+        csv_options={"column_names": PLAY_BY_PLAY_COLUMN_NAMES}
+    )
+    return await _output(http_service=http_service, values=values, options=options)
+
+
+async def search(term, output_type=None, output_file_path=None, output_write_option=None, json_options=None):
+    http_service = default_http_service()
+    values = await http_service.search(term=term)
+    options = OutputOptions.of(
+        file_options=FileOptions.of(path=output_file_path, mode=output_write_option),
+        output_type=output_type,
+        json_options=json_options,
+        csv_options={"column_names": SEARCH_RESULTS_COLUMN_NAMES}
+    )
+    return await _output(
+        http_service=http_service,
+        values=values,
+        options=options,
+        csv_writer_class=SearchCSVWriter,
+        dataframe_writer_class=SearchDataFrameWriter,
+        json_lines_writer_class=SearchJSONLinesWriter,
+    )
+
+
+async def get_salaries(team, output_type=None, output_file_path=None, output_write_option=None, json_options=None):
+    http_service = default_http_service()
+    values = await http_service.player_salaries(team=team)
+    options = OutputOptions.of(
+        file_options=FileOptions.of(path=output_file_path, mode=output_write_option),
+        output_type=output_type,
+        json_options=json_options,
+        csv_options={"column_names": SALARIES_COLUMN_NAMES}
+    )
+    return await _output(http_service=http_service, values=values, options=options)
+
+
+async def get_contracts(output_type=None, output_file_path=None, output_write_option=None, json_options=None):
+    http_service = default_http_service()
+    values = await http_service.team_contracts()
+    options = OutputOptions.of(
+        file_options=FileOptions.of(path=output_file_path, mode=output_write_option),
+        output_type=output_type,
+        json_options=json_options,
+        csv_options={"column_names": CONTRACTS_COLUMN_NAMES}
+    )
+    return await _output(http_service=http_service, values=values, options=options)
+
+
+async def all_player_contracts(output_type=None, output_file_path=None, output_write_option=None, json_options=None):
+    http_service = default_http_service()
+    values = await http_service.total_player_contracts()
+    options = OutputOptions.of(
+        file_options=FileOptions.of(path=output_file_path, mode=output_write_option),
+        output_type=output_type,
+        json_options=json_options,
+        csv_options={"column_names": PLAYER_TOTAL_CONTRACT_COLUMN_NAMES}
+    )
+    return await _output(http_service=http_service, values=values, options=options)
@@ -0,0 +1,114 @@
+import asyncio
+import functools
+
+from basketball_reference_web_scraper.http_service import HTTPService
+from basketball_reference_web_scraper.parser_service import default_parser_service
+
+DEFAULT_MAX_CONCURRENCY = 4
+
+
+class AsyncHTTPService:
+    """
+    Exposes the HTTPService methods as coroutines.
+
+    Each call (both the request and the parsing of the returned HTML) is run in an executor so that the event loop is
+    never blocked, and the number of calls that are in-flight at the same time is bounded by a semaphore.
+
+    When no http_service is given, a new HTTPService is created for each call, so that calls use the default session,
+    cache, rate limiter and cassette that are configured at the time of the call.
+    """
+
+    def __init__(self, http_service=None, max_concurrency=DEFAULT_MAX_CONCURRENCY, executor=None):
+        self._http_service = http_service
+        self.max_concurrency = max_concurrency
+        self.executor = executor
+        self._semaphore = None
+        self._semaphore_loop = None
+
+    @property
+    def http_service(self):
+        if self._http_service is None:
+            return HTTPService(parser=default_parser_service())
+
+        return self._http_service
+
+    @property
+    def semaphore(self):
+        # asyncio primitives are bound to the loop they are first used in, so a new semaphore is created if this
+        # service is reused from a different event loop (like across multiple asyncio.run calls)
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+
+        return self._semaphore
+
+    async def run_in_executor(self, function, **kwargs):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, functools.partial(function, **kwargs))
+
+    async def run(self, function, **kwargs):
+        async with self.semaphore:
+            return await self.run_in_executor(function, **kwargs)
+
+    async def standings(self, season_end_year):
+        return await self.run(self.http_service.standings, season_end_year=season_end_year)
+
+    async def player_box_scores(self, day, month, year):
+        return await self.run(self.http_service.player_box_scores, day=day, month=month, year=year)
+
+    async def regular_season_player_box_scores(self, player_identifier, season_end_year, include_inactive_games=False):
+        return await self.run(
+            self.http_service.regular_season_player_box_scores,
+            player_identifier=player_identifier,
+            season_end_year=season_end_year,
+            include_inactive_games=include_inactive_games,
+        )
+
+    async def playoff_player_box_scores(self, player_identifier, season_end_year, include_inactive_games=False):
+        return await self.run(
+            self.http_service.playoff_player_box_scores,
+            player_identifier=player_identifier,
+            season_end_year=season_end_year,
+            include_inactive_games=include_inactive_games,
+        )
+
+    async def player_season_box_scores(self, player_identifier, season_end_year, include_playoffs=True,
+                                       include_inactive_games=False):
+        return await self.run(
+            self.http_service.player_season_box_scores,
+            player_identifier=player_identifier,
+            season_end_year=season_end_year,
+            include_playoffs=include_playoffs,
+            include_inactive_games=include_inactive_games,
+        )
+
+    async def play_by_play(self, home_team, day, month, year):
+        return await self.run(self.http_service.play_by_play, home_team=home_team, day=day, month=month, year=year)
+
+    async def players_advanced_season_totals(self, season_end_year, include_combined_values=False):
+        return await self.run(
+            self.http_service.players_advanced_season_totals,
+            season_end_year=season_end_year,
+            include_combined_values=include_combined_values,
+        )
+
+    async def players_season_totals(self, season_end_year):
+        return await self.run(self.http_service.players_season_totals, season_end_year=season_end_year)
+
+    async def player_salaries(self, team):
+        return await self.run(self.http_service.player_salaries, team=team)
+
+    async def team_contracts(self):
+        return await self.run(self.http_service.team_contracts)
+
+    async def total_player_contracts(self):
+        return await self.run(self.http_service.total_player_contracts)
+
+    async def season_schedule(self, season_end_year):
+        return await self.run(self.http_service.season_schedule, season_end_year=season_end_year)
+
+    async def team_box_scores(self, day, month, year):
+        return await self.run(self.http_service.team_box_scores, day=day, month=month, year=year)
+
+    async def search(self, term):
+        return await self.run(self.http_service.search, term=term)
@@ -0,0 +1,258 @@
+import csv
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+import requests
+
+from basketball_reference_web_scraper.data import PartialResults
+from basketball_reference_web_scraper.errors import InvalidPlayerAndSeason, PlayerSeasonBoxScoresError
+from basketball_reference_web_scraper.output.columns import BULK_PLAYER_SEASON_BOX_SCORE_COLUMN_NAMES
+from basketball_reference_web_scraper.output.fields import format_value
+from basketball_reference_web_scraper.output.writers import PlayerSeasonBoxScoresCSVWriter
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_RETRY_BACKOFF_SECONDS = 5
+
+COMPLETED = "completed"
+FAILED = "failed"
+
+# Basketball Reference responds with a 404 or 500 for players that didn't play in a season, so retrying won't help
+INVALID_PLAYER_AND_SEASON_STATUS_CODES = {requests.codes.not_found, requests.codes.internal_server_error}
+RETRYABLE_STATUS_CODES = {
+    requests.codes.too_many_requests,
+    requests.codes.bad_gateway,
+    requests.codes.service_unavailable,
+    requests.codes.gateway_timeout,
+}
+
+
+def truncate_partial_line(path):
+    # A process that dies while appending to a file can leave a partial last line, which is dropped so that the next
+    # line is appended after the last complete one. The complete contents of the file are returned.
+    with open(path, "rb+") as file:
+        contents = file.read()
+        complete_contents_length = contents.rfind(b"\n") + 1
+        if complete_contents_length != len(contents):
+            file.truncate(complete_contents_length)
+
+    return contents[:complete_contents_length]
+
+
+class CheckpointJournal:
+    """
+    An append-only file of the player seasons that a bulk job has finished, one JSON object per line.
+
+    Each entry is flushed and synced to disk before record returns. If the process dies while an entry is being
+    written, the partial last line is dropped when the journal is next opened.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self.entries = self.read()
+
+    def read(self):
+        if not os.path.exists(self.path):
+            return {}
+
+        entries = {}
+        for line in truncate_partial_line(path=self.path).splitlines():
+            if line.strip():
+                entry = json.loads(line.decode("utf8"))
+                entries[(entry["player_identifier"], entry["season_end_year"])] = entry["status"]
+
+        return entries
+
+    def is_finished(self, player_identifier, season_end_year):
+        return (player_identifier, season_end_year) in self.entries
+
+    def record(self, player_identifier, season_end_year, status):
+        line = json.dumps({
+            "player_identifier": player_identifier,
+            "season_end_year": season_end_year,
+            "status": status,
+        }) + "\n"
+
+        with self._lock:
+            with open(self.path, "a", encoding="utf8") as journal_file:
+                journal_file.write(line)
+                journal_file.flush()
+                os.fsync(journal_file.fileno())
+
+            self.entries[(player_identifier, season_end_year)] = status
+
+
+class CSVFileSink:
+    """
+    Appends the box scores for each player season to a CSV file as soon as they are fetched.
+
+    The header is only written when the file is empty, so an interrupted job can keep appending to the same file. If
+    the process died while a row was being written, the partial last row is dropped when the sink is created.
+    """
+
+    def __init__(self, path, column_names=None, value_formatter=format_value):
+        self.path = path
+        self.column_names = BULK_PLAYER_SEASON_BOX_SCORE_COLUMN_NAMES if column_names is None else column_names
+        self.csv_writer = PlayerSeasonBoxScoresCSVWriter(value_formatter=value_formatter)
+        if os.path.exists(self.path):
+            truncate_partial_line(path=self.path)
+
+    def __call__(self, player_identifier, season_end_year, box_scores):
+        with open(self.path, "a", newline="", encoding="utf8") as csv_file:
+            writer = csv.writer(csv_file)
+            if csv_file.tell() == 0:
+                writer.writerow(self.column_names)
+
+            rows = (
+                dict(row, player_identifier=player_identifier, season_end_year=season_end_year)
+                for row in self.csv_writer.rows(data=box_scores)
+            )
+            for chunk in self.csv_writer.formatted_chunks(rows=rows, column_names=self.column_names):
+                writer.writerows(chunk)
+            csv_file.flush()
+            os.fsync(csv_file.fileno())
+
+
+class BulkPlayerBoxScoresJob:
+    """
+    Fetches the box scores for every combination of players and seasons.
+
+    Up to http_service.max_workers player seasons are fetched at the same time. As each one finishes, its box scores
+    are passed to the sink and then recorded in the journal (if there is one), so only a bounded number of results are
+    ever held in memory and a job that is run again skips everything that was already recorded.
+
+    Player seasons that don't exist are recorded as failed and aren't fetched again. Player seasons that couldn't be
+    fetched because of transient errors (even after retrying), or that couldn't be parsed, are not recorded so that they
+    are retried on the next run - one bad page never stops the rest of the job.
+
+    Box scores are delivered at least once: the sink is called before the journal records the player season, so if the
+    process dies in between, the player season's box scores are passed to the sink again when the job is resumed.
+    """
+
+    def __init__(self, http_service, sink, journal=None, include_playoffs=True, include_inactive_games=False,
+                 max_attempts=DEFAULT_MAX_ATTEMPTS, retry_backoff=DEFAULT_RETRY_BACKOFF_SECONDS, sleep=time.sleep):
+        self.http_service = http_service
+        self.sink = sink
+        self.journal = journal
+        self.include_playoffs = include_playoffs
+        self.include_inactive_games = include_inactive_games
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.sleep = sleep
+
+    def player_seasons(self, player_identifiers, season_end_years):
+        return [
+            (player_identifier, season_end_year)
+            for player_identifier in player_identifiers
+            for season_end_year in season_end_years
+            if self.journal is None or not self.journal.is_finished(
+                player_identifier=player_identifier,
+                season_end_year=season_end_year,
+            )
+        ]
+
+    def is_retryable(self, error):
+        if isinstance(error, requests.exceptions.HTTPError):
+            return error.response is not None and error.response.status_code in RETRYABLE_STATUS_CODES
+
+        return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+
+    def fetch(self, player_identifier, season_end_year):
+        attempt = 1
+        while True:
+            try:
+                return self.http_service.player_season_box_scores(
+                    player_identifier=player_identifier,
+                    season_end_year=season_end_year,
+                    include_playoffs=self.include_playoffs,
+                    include_inactive_games=self.include_inactive_games,
+                )
+            except requests.exceptions.RequestException as error:
+                if isinstance(error, requests.exceptions.HTTPError) and error.response is not None \
+                        and error.response.status_code in INVALID_PLAYER_AND_SEASON_STATUS_CODES:
+                    raise InvalidPlayerAndSeason(player_identifier=player_identifier, season_end_year=season_end_year)
+
+                if not self.is_retryable(error) or attempt >= self.max_attempts:
+                    raise error
+
+            self.sleep(self.retry_backoff * 2 ** (attempt - 1))
+            attempt += 1
+
+    def isolated_fetch(self, player_identifier, season_end_year):
+        try:
+            return self.fetch(player_identifier=player_identifier, season_end_year=season_end_year), None
+        except Exception as error:
+            # Any error (like a page that can't be parsed) is only that player season's error
+            return None, error
+
+    def record(self, player_identifier, season_end_year, status):
+        if self.journal is not None:
+            self.journal.record(player_identifier=player_identifier, season_end_year=season_end_year, status=status)
+
+    def finish(self, player_identifier, season_end_year, box_scores, error):
+        if error is None:
+            # The sink is written to before the journal so that a crash in between results in the player season being
+            # fetched again rather than lost
+            self.sink(player_identifier=player_identifier, season_end_year=season_end_year, box_scores=box_scores)
+            self.record(player_identifier=player_identifier, season_end_year=season_end_year, status=COMPLETED)
+            return None
+
+        if isinstance(error, InvalidPlayerAndSeason):
+            self.record(player_identifier=player_identifier, season_end_year=season_end_year, status=FAILED)
+
+        return PlayerSeasonBoxScoresError(
+            player_identifier=player_identifier,
+            season_end_year=season_end_year,
+            error=error,
+        )
+
+    def run(self, player_identifiers, season_end_years):
+        pending_player_seasons = iter(self.player_seasons(
+            player_identifiers=player_identifiers,
+            season_end_years=season_end_years,
+        ))
+        max_workers = max(1, self.http_service.max_workers)
+        completed = []
+        errors = []
+
+        # The sink and the journal are only ever called from this thread, so neither has to be thread-safe
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            in_flight = {}
+
+            def submit_next():
+                player_season = next(pending_player_seasons, None)
+                if player_season is not None:
+                    player_identifier, season_end_year = player_season
+                    future = executor.submit(
+                        self.isolated_fetch,
+                        player_identifier=player_identifier,
+                        season_end_year=season_end_year,
+                    )
+                    in_flight[future] = player_season
+
+            for _ in range(max_workers):
+                submit_next()
+
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    player_identifier, season_end_year = in_flight.pop(future)
+                    box_scores, fetch_error = future.result()
+                    error = self.finish(
+                        player_identifier=player_identifier,
+                        season_end_year=season_end_year,
+                        box_scores=box_scores,
+                        error=fetch_error,
+                    )
+
+                    if error is None:
+                        completed.append((player_identifier, season_end_year))
+                    else:
+                        errors.append(error)
+
+                    submit_next()
+
+        return PartialResults(values=completed, errors=errors)
@@ -0,0 +1,253 @@
+import hashlib
+import re
+from abc import ABC, abstractmethod
+import sqlite3
+import threading
+import time
+from datetime import date, datetime
+from urllib.parse import urlsplit, parse_qs
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+DEFAULT_CURRENT_TIME_TO_LIVE = 60 * 60
+DEFAULT_SETTLED_AFTER_DAYS = 2
+# Seasons start in October, so from October onwards the "current" season is the one that ends next year
+SEASON_START_MONTH = 10
+
+SEASON_END_YEAR_REGEX = re.compile(r'(?:NBA_|/gamelog/)(?P<season_end_year>[0-9]{4})')
+GAME_DATE_REGEX = re.compile(r'/boxscores/(?:pbp/)?(?P<year>[0-9]{4})(?P<month>[0-9]{2})(?P<day>[0-9]{2})')
+
+
+def current_season_end_year(today):
+    if today.month >= SEASON_START_MONTH:
+        return today.year + 1
+
+    return today.year
+
+
+def cache_key(url, params=None):
+    formatted_params = "&".join(
+        "{key}={value}".format(key=key, value=value)
+        for key, value in sorted((params or {}).items())
+    )
+    return hashlib.sha256("{url}?{params}".format(url=url, params=formatted_params).encode("utf8")).hexdigest()
+
+
+class CachePolicy:
+    """
+    Decides how long a cached page can be used before it has to be revalidated.
+
+    Pages for finished seasons and for games that were played more than a couple of days ago can't change, so they
+    never expire. Everything else (current season pages, contracts, search results) expires after a short TTL.
+    """
+
+    def __init__(self, current_time_to_live=DEFAULT_CURRENT_TIME_TO_LIVE,
+                 settled_after_days=DEFAULT_SETTLED_AFTER_DAYS):
+        self.current_time_to_live = current_time_to_live
+        self.settled_after_days = settled_after_days
+
+    def game_date(self, url, params):
+        match = GAME_DATE_REGEX.search(url)
+        if match is not None:
+            return date(year=int(match.group("year")), month=int(match.group("month")), day=int(match.group("day")))
+
+        query = dict((key, values[0]) for key, values in parse_qs(urlsplit(url).query).items())
+        query.update(params or {})
+
+        try:
+            return date(year=int(query["year"]), month=int(query["month"]), day=int(query["day"]))
+        except (KeyError, ValueError):
+            return None
+
+    def is_immutable(self, url, params, today):
+        game_date = self.game_date(url=url, params=params)
+        if game_date is not None:
+            return (today - game_date).days > self.settled_after_days
+
+        match = SEASON_END_YEAR_REGEX.search(url)
+        if match is not None:
+            return int(match.group("season_end_year")) < current_season_end_year(today=today)
+
+        return False
+
+    def time_to_live(self, url, params, today):
+        if self.is_immutable(url=url, params=params, today=today):
+            return None
+
+        return self.current_time_to_live
+
+
+class CacheEntry:
+    def __init__(self, url, content, etag, last_modified, expires_at):
+        self.url = url
+        self.content = content
+        self.etag = etag
+        self.last_modified = last_modified
+        # An expiration of None means that the entry never expires
+        self.expires_at = expires_at
+
+    def is_fresh(self, now):
+        return self.expires_at is None or now < self.expires_at
+
+    @property
+    def validation_headers(self):
+        headers = {}
+
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+
+        return headers
+
+    def to_response(self):
+        response = requests.Response()
+        response.status_code = requests.codes.ok
+        response.url = self.url
+        response._content = self.content
+        response.headers = CaseInsensitiveDict()
+
+        if self.etag is not None:
+            response.headers["ETag"] = self.etag
+
+        if self.last_modified is not None:
+            response.headers["Last-Modified"] = self.last_modified
+
+        return response
+
+    def __eq__(self, other):
+        if isinstance(other, CacheEntry):
+            return self.url == other.url \
+                   and self.content == other.content \
+                   and self.etag == other.etag \
+                   and self.last_modified == other.last_modified \
+                   and self.expires_at == other.expires_at
+        return False
+
+
+class ResponseCache(ABC):
+    def __init__(self, policy=None, clock=time.time):
+        self.policy = CachePolicy() if policy is None else policy
+        self.clock = clock
+
+    @abstractmethod
+    def read(self, key):
+        pass
+
+    @abstractmethod
+    def write(self, key, entry):
+        pass
+
+    def close(self):
+        pass
+
+    def expires_at(self, url, params, now):
+        time_to_live = self.policy.time_to_live(url=url, params=params, today=datetime.fromtimestamp(now).date())
+
+        if time_to_live is None:
+            return None
+
+        return now + time_to_live
+
+    def get(self, session, url, params=None, allow_redirects=True):
+        key = cache_key(url=url, params=params)
+        entry = self.read(key)
+        now = self.clock()
+
+        if entry is not None and entry.is_fresh(now=now):
+            return entry.to_response()
+
+        response = session.get(
+            url=url,
+            params=params,
+            allow_redirects=allow_redirects,
+            headers=None if entry is None else entry.validation_headers,
+        )
+
+        if entry is not None and response.status_code == requests.codes.not_modified:
+            entry.expires_at = self.expires_at(url=url, params=params, now=now)
+            self.write(key, entry)
+            return entry.to_response()
+
+        # Only successful responses are cached - redirects and errors are always re-requested
+        if response.status_code == requests.codes.ok:
+            self.write(key, CacheEntry(
+                url=response.url,
+                content=response.content,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+                expires_at=self.expires_at(url=url, params=params, now=now),
+            ))
+
+        return response
+
+
+class SQLiteResponseCache(ResponseCache):
+    def __init__(self, path, policy=None, clock=time.time, timeout=30):
+        super().__init__(policy=policy, clock=clock)
+        self.path = path
+        self.timeout = timeout
+        self._connections = threading.local()
+        self._opened_connections = []
+        self._opened_connections_lock = threading.Lock()
+
+        with self.connection as connection:
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    content BLOB NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    expires_at REAL
+                )
+                """
+            )
+
+    @property
+    def connection(self):
+        # sqlite3 connections can't be shared across threads, so each thread gets its own connection. SQLite's own
+        # file locking makes the database safe to share across processes.
+        connection = getattr(self._connections, "connection", None)
+
+        if connection is None:
+            # Connections are only used by the thread that opened them, but close can be called from any thread
+            connection = sqlite3.connect(self.path, timeout=self.timeout, check_same_thread=False)
+            self._connections.connection = connection
+            with self._opened_connections_lock:
+                self._opened_connections.append(connection)
+
+        return connection
+
+    def close(self):
+        # Closes every thread's connection - threads that use the cache afterwards open new connections
+        with self._opened_connections_lock:
+            connections = self._opened_connections
+            self._connections = threading.local()
+            self._opened_connections = []
+
+        for connection in connections:
+            connection.close()
+
+    def read(self, key):
+        row = self.connection.execute(
+            "SELECT url, content, etag, last_modified, expires_at FROM responses WHERE key = ?",
+            (key,),
+        ).fetchone()
+
+        if row is None:
+            return None
+
+        url, content, etag, last_modified, expires_at = row
+        return CacheEntry(url=url, content=content, etag=etag, last_modified=last_modified, expires_at=expires_at)
+
+    def write(self, key, entry):
+        with self.connection as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO responses (key, url, content, etag, last_modified, expires_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, entry.url, entry.content, entry.etag, entry.last_modified, entry.expires_at),
+            )
@@ -0,0 +1,134 @@
+import json
+import os
+import threading
+import zipfile
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from basketball_reference_web_scraper.cache import cache_key
+from basketball_reference_web_scraper.errors import RequestNotRecorded
+
+
+class Cassette:
+    """
+    A compressed (zip) archive of requests and the responses that were returned for them.
+
+    When recording, every response is written to the archive as it is returned. When replaying, responses are read
+    from the archive instead of being requested, so that no network access is needed.
+
+    Requests are identified by their URL and query parameters. A request that is already in the archive isn't
+    recorded again.
+    """
+
+    def __init__(self, path, record=False):
+        self.path = path
+        self.record = record
+        self._lock = threading.Lock()
+        self.keys = self.read_keys()
+
+    @classmethod
+    def from_directory(cls, path, directory, url_to_path):
+        """
+        Creates a cassette that replays pages that were saved to a directory (like tests/integration/files).
+
+        url_to_path maps the URL of each page to its file path (relative to the directory). Every page is replayed as a
+        200 response.
+        """
+        cassette = cls(path=path)
+        for url, page_path in url_to_path.items():
+            with open(os.path.join(directory, page_path), "rb") as page:
+                cassette.write(url=url, params=None, response=saved_page_response(url=url, content=page.read()))
+
+        return cassette
+
+    def read_keys(self):
+        if not os.path.exists(self.path):
+            return set()
+
+        with zipfile.ZipFile(self.path) as archive:
+            return set(name.split("/")[0] for name in archive.namelist())
+
+    def write(self, url, params, response):
+        key = cache_key(url=url, params=params)
+        metadata = {
+            "url": url,
+            "params": params,
+            "status_code": response.status_code,
+            "response_url": response.url,
+            "headers": dict(response.headers),
+        }
+
+        with self._lock:
+            if key in self.keys:
+                return
+
+            with zipfile.ZipFile(self.path, "a", compression=zipfile.ZIP_DEFLATED) as archive:
+                archive.writestr("{key}/response.json".format(key=key), json.dumps(metadata))
+                archive.writestr("{key}/body".format(key=key), response.content)
+
+            self.keys.add(key)
+
+    def read(self, url, params):
+        key = cache_key(url=url, params=params)
+
+        with self._lock:
+            if key not in self.keys:
+                raise RequestNotRecorded(url=url, params=params)
+
+            with zipfile.ZipFile(self.path) as archive:
+                metadata = json.loads(archive.read("{key}/response.json".format(key=key)).decode("utf8"))
+                content = archive.read("{key}/body".format(key=key))
+
+        response = requests.Response()
+        response.status_code = metadata["status_code"]
+        response.url = metadata["response_url"]
+        response.headers = CaseInsensitiveDict(metadata["headers"])
+        response._content = content
+
+        return response
+
+    def session(self, session):
+        if self.record:
+            return RecordingSession(session=session, cassette=self)
+
+        return ReplaySession(cassette=self)
+
+
+def saved_page_response(url, content):
+    response = requests.Response()
+    response.status_code = requests.codes.ok
+    response.url = url
+    response.headers = CaseInsensitiveDict({"Content-Type": "text/html"})
+    response._content = content
+
+    return response
+
+
+class RecordingSession:
+    def __init__(self, session, cassette):
+        self.session = session
+        self.cassette = cassette
+
+    def get(self, url, params=None, **kwargs):
+        response = self.session.get(url=url, params=params, **kwargs)
+
+        # Revalidated cache entries don't have a body, so there's nothing to replay
+        if response.status_code != requests.codes.not_modified:
+            self.cassette.write(url=url, params=params, response=response)
+
+        return response
+
+    def close(self):
+        self.session.close()
+
+
+class ReplaySession:
+    def __init__(self, cassette):
+        self.cassette = cassette
+
+    def get(self, url, params=None, **kwargs):
+        return self.cassette.read(url=url, params=params)
+
+    def close(self):
+        pass
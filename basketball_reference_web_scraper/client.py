@@ -1,70 +1,87 @@
 import requests
 
+from basketball_reference_web_scraper.bulk import BulkPlayerBoxScoresJob, CheckpointJournal, CSVFileSink, \
+    DEFAULT_MAX_ATTEMPTS
+from basketball_reference_web_scraper.data import OutputType
 from basketball_reference_web_scraper.errors import InvalidSeason, InvalidDate, InvalidPlayerAndSeason
-from basketball_reference_web_scraper.http_service import HTTPService
+from basketball_reference_web_scraper.http_service import HTTPService, DEFAULT_MAX_WORKERS, DEFAULT_PREFETCH_DAYS, \
+    default_rate_limiter
 from basketball_reference_web_scraper.output.columns import BOX_SCORE_COLUMN_NAMES, SCHEDULE_COLUMN_NAMES, \
     PLAYER_SEASON_TOTALS_COLUMN_NAMES, \
     PLAYER_ADVANCED_SEASON_TOTALS_COLUMN_NAMES, TEAM_BOX_SCORES_COLUMN_NAMES, PLAY_BY_PLAY_COLUMN_NAMES, \
-    PLAYER_SEASON_BOX_SCORE_COLUMN_NAMES, SEARCH_RESULTS_COLUMN_NAMES, STANDINGS_COLUMNS_NAMES, SALARIES_COLUMN_NAMES, CONTRACTS_COLUMN_NAMES, PLAYER_TOTAL_CONTRACT_COLUMN_NAMES
-from basketball_reference_web_scraper.output.fields import format_value, BasketballReferenceJSONEncoder
-from basketball_reference_web_scraper.output.service import OutputService
-from basketball_reference_web_scraper.output.writers import CSVWriter, JSONWriter, FileOptions, OutputOptions, \
-    SearchCSVWriter
-from basketball_reference_web_scraper.parser_service import ParserService
+    PLAYER_SEASON_BOX_SCORE_COLUMN_NAMES, SEARCH_RESULTS_COLUMN_NAMES, STANDINGS_COLUMNS_NAMES, SALARIES_COLUMN_NAMES, CONTRACTS_COLUMN_NAMES, PLAYER_TOTAL_CONTRACT_COLUMN_NAMES, \
+    COMBINED_PLAYER_SEASON_BOX_SCORE_COLUMN_NAMES
+from basketball_reference_web_scraper.output.service import default_output_service
+from basketball_reference_web_scraper.output.writers import FileOptions, OutputOptions, SearchCSVWriter, \
+    PlayerSeasonBoxScoresCSVWriter, SearchDataFrameWriter, PlayerSeasonBoxScoresDataFrameWriter, \
+    SearchJSONLinesWriter, PlayerSeasonBoxScoresJSONLinesWriter
+from basketball_reference_web_scraper.parser_service import default_parser_service
+from basketball_reference_web_scraper.rate_limiter import RateLimiter
 
 
-def standings(season_end_year, output_type=None, output_file_path=None, output_write_option=None,
-              json_options=None):
+def iter_standings(season_end_year):
     try:
-        http_service = HTTPService(parser=ParserService())
-        values = http_service.standings(season_end_year=season_end_year)
+        http_service = HTTPService(parser=default_parser_service())
+        yield from http_service.iter_standings(season_end_year=season_end_year)
     except requests.exceptions.HTTPError as http_error:
         if http_error.response.status_code == requests.codes.not_found:
             raise InvalidSeason(season_end_year=season_end_year)
         else:
             raise http_error
+
+
+def standings(season_end_year, output_type=None, output_file_path=None, output_write_option=None,
+              json_options=None):
+    values = iter_standings(season_end_year=season_end_year)
     options = OutputOptions.of(
         file_options=FileOptions.of(path=output_file_path, mode=output_write_option),
         output_type=output_type,
         json_options=json_options,
         csv_options={"column_names": STANDINGS_COLUMNS_NAMES}
     )
-    output_service = OutputService(
-        json_writer=JSONWriter(value_formatter=BasketballReferenceJSONEncoder),
-        csv_writer=CSVWriter(value_formatter=format_value)
-    )
+    output_service = default_output_service()
     return output_service.output(data=values, options=options)
 
 
-def player_box_scores(day, month, year, output_type=None, output_file_path=None, output_write_option=None,
-                      json_options=None):
+def iter_player_box_scores(day, month, year):
     try:
-        http_service = HTTPService(parser=ParserService())
-        values = http_service.player_box_scores(day=day, month=month, year=year)
+        http_service = HTTPService(parser=default_parser_service())
+        yield from http_service.iter_player_box_scores(day=day, month=month, year=year)
     except requests.exceptions.HTTPError as http_error:
         if http_error.response.status_code == requests.codes.not_found:
             raise InvalidDate(day=day, month=month, year=year)
         else:
             raise http_error
 
+
+def player_box_scores(day, month, year, output_type=None, output_file_path=None, output_write_option=None,
+                      json_options=None):
+    values = iter_player_box_scores(day=day, month=month, year=year)
     options = OutputOptions.of(
         file_options=FileOptions.of(path=output_file_path, mode=output_write_option),
         output_type=output_type,
         json_options=json_options,
         csv_options={"column_names": BOX_SCORE_COLUMN_NAMES}
     )
-    output_service = OutputService(
-        json_writer=JSONWriter(value_formatter=BasketballReferenceJSONEncoder),
-        csv_writer=CSVWriter(value_formatter=format_value)
-    )
+    output_service = default_output_service()
     return output_service.output(data=values, options=options)
 
 
-def regular_season_player_box_scores(player_identifier, season_end_year, output_type=None, output_file_path=None,
-                                     output_write_option=None, json_options=None, include_inactive_games=False):
+def player_box_scores_range(start_date, end_date, skip_off_days=True, prefetch_days=DEFAULT_PREFETCH_DAYS):
+    # Returns a generator of (date, box scores) tuples, one for each day in the range (inclusive)
+    http_service = HTTPService(parser=default_parser_service())
+    return http_service.player_box_scores_range(
+        start_date=start_date,
+        end_date=end_date,
+        skip_off_days=skip_off_days,
+        prefetch=prefetch_days,
+    )
+
+
+def iter_regular_season_player_box_scores(player_identifier, season_end_year, include_inactive_games=False):
     try:
-        http_service = HTTPService(parser=ParserService())
-        values = http_service.regular_season_player_box_scores(
+        http_service = HTTPService(parser=default_parser_service())
+        yield from http_service.iter_regular_season_player_box_scores(
             player_identifier=player_identifier,
             season_end_year=season_end_year,
             include_inactive_games=include_inactive_games,
@@ -75,26 +92,67 @@ def regular_season_player_box_scores(player_identifier, season_end_year, output_
             raise InvalidPlayerAndSeason(player_identifier=player_identifier, season_end_year=season_end_year)
         else:
             raise http_error
+
+
+def regular_season_player_box_scores(player_identifier, season_end_year, output_type=None, output_file_path=None,
+                                     output_write_option=None, json_options=None, include_inactive_games=False):
+    values = iter_regular_season_player_box_scores(
+        player_identifier=player_identifier,
+        season_end_year=season_end_year,
+        include_inactive_games=include_inactive_games,
+    )
     options = OutputOptions.of(
         file_options=FileOptions.of(path=output_file_path, mode=output_write_option),
         output_type=output_type,
         json_options=json_options,
         csv_options={"column_names": PLAYER_SEASON_BOX_SCORE_COLUMN_NAMES}
     )
-    output_service = OutputService(
-        json_writer=JSONWriter(value_formatter=BasketballReferenceJSONEncoder),
-        csv_writer=CSVWriter(value_formatter=format_value)
-    )
+    output_service = default_output_service()
     return output_service.output(data=values, options=options)
 
 
+def iter_playoff_player_box_scores(player_identifier, season_end_year, include_inactive_games=False):
+    try:
+        http_service = HTTPService(parser=default_parser_service())
+        yield from http_service.iter_playoff_player_box_scores(
+            player_identifier=player_identifier,
+            season_end_year=season_end_year,
+            include_inactive_games=include_inactive_games,
+        )
+    except requests.exceptions.HTTPError as http_error:
+        if http_error.response.status_code == requests.codes.internal_server_error \
+                or http_error.response.status_code == requests.codes.not_found:
+            raise InvalidPlayerAndSeason(player_identifier=player_identifier, season_end_year=season_end_year)
+        else:
+            raise http_error
+
+
 def playoff_player_box_scores(player_identifier, season_end_year, output_type=None, output_file_path=None,
                               output_write_option=None, json_options=None, include_inactive_games=False):
+    values = iter_playoff_player_box_scores(
+        player_identifier=player_identifier,
+        season_end_year=season_end_year,
+        include_inactive_games=include_inactive_games,
+    )
+    options = OutputOptions.of(
+        file_options=FileOptions.of(path=output_file_path, mode=output_write_option),
+        output_type=output_type,
+        json_options=json_options,
+        csv_options={"column_names": PLAYER_SEASON_BOX_SCORE_COLUMN_NAMES}
+    )
+    output_service = default_output_service()
+    return output_service.output(data=values, options=options)
+
+
+def player_season_box_scores(player_identifier, season_end_year, include_playoffs=True, output_type=None,
+                             output_file_path=None, output_write_option=None, json_options=None,
+                             include_inactive_games=False):
     try:
-        http_service = HTTPService(parser=ParserService())
-        values = http_service.playoff_player_box_scores(
+        http_service = HTTPService(parser=default_parser_service())
+        values = http_service.player_season_box_scores(
             player_identifier=player_identifier,
             season_end_year=season_end_year,
+            include_playoffs=include_playoffs,
             include_inactive_games=include_inactive_games,
         )
     except requests.exceptions.HTTPError as http_error:
@@ -108,67 +166,94 @@ def playoff_player_box_scores(player_identifier, season_end_year, output_type=No
         file_options=FileOptions.of(path=output_file_path, mode=output_write_option),
         output_type=output_type,
         json_options=json_options,
-        csv_options={"column_names": PLAYER_SEASON_BOX_SCORE_COLUMN_NAMES}
+        csv_options={"column_names": COMBINED_PLAYER_SEASON_BOX_SCORE_COLUMN_NAMES}
     )
-    output_service = OutputService(
-        json_writer=JSONWriter(value_formatter=BasketballReferenceJSONEncoder),
-        csv_writer=CSVWriter(value_formatter=format_value)
+    output_service = default_output_service(
+        csv_writer_class=PlayerSeasonBoxScoresCSVWriter,
+        dataframe_writer_class=PlayerSeasonBoxScoresDataFrameWriter,
+        json_lines_writer_class=PlayerSeasonBoxScoresJSONLinesWriter,
     )
     return output_service.output(data=values, options=options)
 
 
-def season_schedule(season_end_year, output_type=None, output_file_path=None, output_write_option=None,
-                    json_options=None):
+def bulk_player_box_scores(player_identifiers, season_end_years, output_type=None, output_file_path=None, sink=None,
+                           checkpoint_file_path=None, include_playoffs=True, include_inactive_games=False,
+                           max_workers=DEFAULT_MAX_WORKERS, max_attempts=DEFAULT_MAX_ATTEMPTS):
+    if sink is None:
+        # Box scores are appended to the output file as each player season finishes, which a JSON document can't support
+        if output_type != OutputType.CSV or output_file_path is None:
+            raise ValueError("Either a sink or a CSV output file path must be specified")
+
+        sink = CSVFileSink(path=output_file_path)
+
+    rate_limiter = default_rate_limiter()
+    if rate_limiter is None:
+        rate_limiter = RateLimiter()
+
+    job = BulkPlayerBoxScoresJob(
+        http_service=HTTPService(parser=default_parser_service(), max_workers=max_workers, rate_limiter=rate_limiter),
+        sink=sink,
+        journal=None if checkpoint_file_path is None else CheckpointJournal(path=checkpoint_file_path),
+        include_playoffs=include_playoffs,
+        include_inactive_games=include_inactive_games,
+        max_attempts=max_attempts,
+    )
+    return job.run(player_identifiers=player_identifiers, season_end_years=season_end_years)
+
+
+def iter_season_schedule(season_end_year):
     try:
-        http_service = HTTPService(parser=ParserService())
-        values = http_service.season_schedule(season_end_year=season_end_year)
+        http_service = HTTPService(parser=default_parser_service())
+        yield from http_service.iter_season_schedule(season_end_year=season_end_year)
     except requests.exceptions.HTTPError as http_error:
         # https://github.com/requests/requests/blob/master/requests/status_codes.py#L58
         if http_error.response.status_code == requests.codes.not_found:
             raise InvalidSeason(season_end_year=season_end_year)
         else:
             raise http_error
+
+
+def season_schedule(season_end_year, output_type=None, output_file_path=None, output_write_option=None,
+                    json_options=None):
+    values = iter_season_schedule(season_end_year=season_end_year)
     options = OutputOptions.of(
         file_options=FileOptions.of(path=output_file_path, mode=output_write_option),
         output_type=output_type,
         json_options=json_options,
         csv_options={"column_names": SCHEDULE_COLUMN_NAMES}
     )
-    output_service = OutputService(
-        json_writer=JSONWriter(value_formatter=BasketballReferenceJSONEncoder),
-        csv_writer=CSVWriter(value_formatter=format_value)
-    )
+    output_service = default_output_service()
     return output_service.output(data=values, options=options)
 
 
-def players_season_totals(season_end_year, output_type=None, output_file_path=None, output_write_option=None,
-                          json_options=None):
+def iter_players_season_totals(season_end_year):
     try:
-        http_service = HTTPService(parser=ParserService())
-        values = http_service.players_season_totals(season_end_year=season_end_year)
+        http_service = HTTPService(parser=default_parser_service())
+        yield from http_service.iter_players_season_totals(season_end_year=season_end_year)
     except requests.exceptions.HTTPError as http_error:
         if http_error.response.status_code == requests.codes.not_found:
             raise InvalidSeason(season_end_year=season_end_year)
         else:
             raise http_error
+
+
+def players_season_totals(season_end_year, output_type=None, output_file_path=None, output_write_option=None,
+                          json_options=None):
+    values = iter_players_season_totals(season_end_year=season_end_year)
     options = OutputOptions.of(
         file_options=FileOptions.of(path=output_file_path, mode=output_write_option),
         output_type=output_type,
         json_options=json_options,
         csv_options={"column_names": PLAYER_SEASON_TOTALS_COLUMN_NAMES}
     )
-    output_service = OutputService(
-        json_writer=JSONWriter(value_formatter=BasketballReferenceJSONEncoder),
-        csv_writer=CSVWriter(value_formatter=format_value)
-    )
+    output_service = default_output_service()
     return output_service.output(data=values, options=options)
 
 
-def players_advanced_season_totals(season_end_year, include_combined_values=False, output_type=None,
-                                   output_file_path=None, output_write_option=None, json_options=None):
+def iter_players_advanced_season_totals(season_end_year, include_combined_values=False):
     try:
-        http_service = HTTPService(parser=ParserService())
-        values = http_service.players_advanced_season_totals(
+        http_service = HTTPService(parser=default_parser_service())
+        yield from http_service.iter_players_advanced_season_totals(
             season_end_year,
             include_combined_values=include_combined_values
         )
@@ -177,23 +262,28 @@ def players_advanced_season_totals(season_end_year, include_combined_values=Fals
             raise InvalidSeason(season_end_year=season_end_year)
         else:
             raise http_error
+
+
+def players_advanced_season_totals(season_end_year, include_combined_values=False, output_type=None,
+                                   output_file_path=None, output_write_option=None, json_options=None):
+    values = iter_players_advanced_season_totals(
+        season_end_year=season_end_year,
+        include_combined_values=include_combined_values,
+    )
     options = OutputOptions.of(
         file_options=FileOptions.of(path=output_file_path, mode=output_write_option),
         output_type=output_type,
         json_options=json_options,
         csv_options={"column_names": PLAYER_ADVANCED_SEASON_TOTALS_COLUMN_NAMES}
     )
-    output_service = OutputService(
-        json_writer=JSONWriter(value_formatter=BasketballReferenceJSONEncoder),
-        csv_writer=CSVWriter(value_formatter=format_value)
-    )
+    output_service = default_output_service()
     return output_service.output(data=values, options=options)
 
 
 def team_box_scores(day, month, year, output_type=None, output_file_path=None, output_write_option=None,
-                    json_options=None):
+                    json_options=None, max_workers=DEFAULT_MAX_WORKERS):
     try:
-        http_service = HTTPService(parser=ParserService())
+        http_service = HTTPService(parser=default_parser_service(), max_workers=max_workers)
         values = http_service.team_box_scores(day=day, month=month, year=year)
     except requests.exceptions.HTTPError as http_error:
         if http_error.response.status_code == requests.codes.not_found:
@@ -206,56 +296,76 @@ def team_box_scores(day, month, year, output_type=None, output_file_path=None, o
         json_options=json_options,
         csv_options={"column_names": TEAM_BOX_SCORES_COLUMN_NAMES}
     )
-    output_service = OutputService(
-        json_writer=JSONWriter(value_formatter=BasketballReferenceJSONEncoder),
-        csv_writer=CSVWriter(value_formatter=format_value)
-    )
+    output_service = default_output_service()
     return output_service.output(data=values, options=options)
 
 
-def play_by_play(home_team, day, month, year, output_type=None, output_file_path=None, output_write_option=None,
-                 json_options=None):
+def team_box_scores_range(start_date, end_date, skip_off_days=True, prefetch_days=DEFAULT_PREFETCH_DAYS,
+                          max_workers=DEFAULT_MAX_WORKERS):
+    # Returns a generator of (date, box scores) tuples, one for each day in the range (inclusive)
+    http_service = HTTPService(parser=default_parser_service(), max_workers=max_workers)
+    return http_service.team_box_scores_range(
+        start_date=start_date,
+        end_date=end_date,
+        skip_off_days=skip_off_days,
+        prefetch=prefetch_days,
+    )
+
+
+def iter_play_by_play(home_team, day, month, year):
     try:
-        http_service = HTTPService(parser=ParserService())
-        values = http_service.play_by_play(home_team=home_team, day=day, month=month, year=year)
+        http_service = HTTPService(parser=default_parser_service())
+        yield from http_service.iter_play_by_play(home_team=home_team, day=day, month=month, year=year)
     except requests.exceptions.HTTPError as http_error:
         if http_error.response.status_code == requests.codes.not_found:
             raise InvalidDate(day=day, month=month, year=year)
         else:
             raise http_error
+
+
+def play_by_play(home_team, day, month, year, output_type=None, output_file_path=None, output_write_option=None,
+                 json_options=None):
+    values = iter_play_by_play(home_team=home_team, day=day, month=month, year=year)
     options = OutputOptions.of(
         file_options=FileOptions.of(path=output_file_path, mode=output_write_option),
         output_type=output_type,
         json_options=json_options,
         csv_options={"column_names": PLAY_BY_PLAY_COLUMN_NAMES}
     )
-    output_service = OutputService(
-        json_writer=JSONWriter(value_formatter=BasketballReferenceJSONEncoder),
-        csv_writer=CSVWriter(value_formatter=format_value)
-    )
+    output_service = default_output_service()
     return output_service.output(data=values, options=options)
 
 
+def iter_search(term):
+    http_service = HTTPService(parser=default_parser_service())
+    return http_service.iter_search(term=term)
+
+
 def search(term, output_type=None, output_file_path=None, output_write_option=None, json_options=None):
-    http_service = HTTPService(parser=ParserService())
-    values = http_service.search(term=term)
+    values = {
+        "players": list(iter_search(term=term))
+    }
     options = OutputOptions.of(
         file_options=FileOptions.of(path=output_file_path, mode=output_write_option),
         output_type=output_type,
         json_options=json_options,
         csv_options={"column_names": SEARCH_RESULTS_COLUMN_NAMES}
     )
-    output_service = OutputService(
-        json_writer=JSONWriter(value_formatter=BasketballReferenceJSONEncoder),
-        csv_writer=SearchCSVWriter(value_formatter=format_value)
+    output_service = default_output_service(
+        csv_writer_class=SearchCSVWriter,
+        dataframe_writer_class=SearchDataFrameWriter,
+        json_lines_writer_class=SearchJSONLinesWriter,
     )
     return output_service.output(data=values, options=options)
 
 
+def iter_salaries(team):
+    http_service = HTTPService(parser=default_parser_service())
+    return http_service.iter_player_salaries(team=team)
+
 
 def get_salaries(team, output_type=None, output_file_path=None, output_write_option=None, json_options=None):
-    http_service = HTTPService(parser=ParserService())
-    values = http_service.player_salaries(team=team)
+    values = iter_salaries(team=team)
 
     options = OutputOptions.of(
         file_options=FileOptions.of(path=output_file_path, mode=output_write_option),
@@ -263,16 +373,19 @@ def get_salaries(team, output_type=None, output_file_path=None, output_write_opt
         json_options=json_options,
         csv_options={"column_names": SALARIES_COLUMN_NAMES}
     )
-    output_service = OutputService(
-        json_writer=JSONWriter(value_formatter=BasketballReferenceJSONEncoder),
-        csv_writer=CSVWriter(value_formatter=format_value)
-    )
+    output_service = default_output_service()
     return output_service.output(data=values, options=options)
 
+
+def iter_contracts():
+    http_service = HTTPService(parser=default_parser_service())
+    return http_service.iter_team_contracts()
+
+
 def get_contracts(output_type=None, output_file_path=None, output_write_option=None, json_options=None): #rename get_contracts
-    http_service = HTTPService(parser=ParserService())
+    # Like HTTPService.team_contracts, this is None when the page doesn't have any team contracts
+    http_service = HTTPService(parser=default_parser_service())
     values = http_service.team_contracts()
-    print(f"Contract values: {values}")
 
     options = OutputOptions.of(
         file_options=FileOptions.of(path=output_file_path, mode=output_write_option),
@@ -280,16 +393,17 @@ def get_contracts(output_type=None, output_file_path=None, output_write_option=N
         json_options=json_options,
         csv_options={"column_names": CONTRACTS_COLUMN_NAMES}
     )
-    output_service = OutputService(
-        json_writer=JSONWriter(value_formatter=BasketballReferenceJSONEncoder),
-        csv_writer=CSVWriter(value_formatter=format_value)
-    )
+    output_service = default_output_service()
     return output_service.output(data=values, options=options)
 
+
+def iter_all_player_contracts():
+    http_service = HTTPService(parser=default_parser_service())
+    return http_service.iter_total_player_contracts()
+
+
 def all_player_contracts(output_type=None, output_file_path=None, output_write_option=None, json_options=None):
-    http_service = HTTPService(parser=ParserService())
-    values = http_service.total_player_contracts()
-    print(f"Player Contract values: {values}")
+    values = iter_all_player_contracts()
 
     options = OutputOptions.of(
         file_options=FileOptions.of(path=output_file_path, mode=output_write_option),
@@ -297,10 +411,24 @@ def all_player_contracts(output_type=None, output_file_path=None, output_write_o
         json_options=json_options,
         csv_options = {"column_names": PLAYER_TOTAL_CONTRACT_COLUMN_NAMES}
     )
-    output_service = OutputService(
-        json_writer=JSONWriter(value_formatter=BasketballReferenceJSONEncoder),
-        csv_writer=CSVWriter(value_formatter=format_value)
-    )
+    output_service = default_output_service()
     return output_service.output(data=values, options=options)
 
 
+def read_salaries(file_path):
+    # Reads the CSV output of get_salaries (like NYK_SALARIES.csv) into the same typed rows that get_salaries returns
+    with open(file_path, newline="", encoding="utf8") as csv_file:
+        return default_parser_service().parse_player_salaries_csv(csv_file=csv_file)
+
+
+def read_contracts(file_path):
+    # Reads the CSV output of get_contracts (like teamcontracts.csv) into the same typed rows that get_contracts returns
+    with open(file_path, newline="", encoding="utf8") as csv_file:
+        return default_parser_service().parse_team_contracts_csv(csv_file=csv_file)
+
+
+def read_all_player_contracts(file_path):
+    # Reads the CSV output of all_player_contracts (like allplayercontracts.csv) into the same typed rows that
+    # all_player_contracts returns
+    with open(file_path, newline="", encoding="utf8") as csv_file:
+        return default_parser_service().parse_total_player_contracts_csv(csv_file=csv_file)
@@ -0,0 +1,339 @@
+"""
+Columnar results, where a table's rows are returned as a NumPy array per column instead of as a list of dicts.
+
+The columns are gathered straight from the table's cells (see TableSchema.extract_columns), without a dict per row.
+Enum values are encoded as small integer codes - a value's code is the index of its member in the column's lookup table,
+and missing values (like the team of a player's combined totals) are -1. Since players can have more than one position,
+positions are encoded as a bitmask of their codes.
+
+Player contracts are returned as a ContractMatrix - a players x contract years matrix of salaries, instead of a dict per
+player per contract year.
+
+NumPy is an optional dependency, and is only imported when a columnar result is requested.
+"""
+from basketball_reference_web_scraper.data import Team, Position, Location, Outcome
+from basketball_reference_web_scraper.parsers import PLAYER_SEASON_BOX_SCORE_STATISTICS
+from basketball_reference_web_scraper.schemas import PLAYER_SEASON_TOTALS_SCHEMA, \
+    PLAYER_ADVANCED_SEASON_TOTALS_SCHEMA, PLAYER_BOX_SCORES_SCHEMA, PLAYER_SEASON_BOX_SCORES_SCHEMA, \
+    PLAYER_TOTAL_CONTRACTS_SCHEMA, CONTRACT_YEARS
+from basketball_reference_web_scraper.utilities import import_optional_dependency
+
+MISSING_CODE = -1
+DTYPES_BY_TYPE = {
+    int: "int64",
+    float: "float64",
+    str: "object",
+}
+# Blank values of nullable int columns (like a player's age) are NaN
+NULLABLE_INT_DTYPE = "float64"
+# Bits of a ContractMatrix's options
+PLAYER_OPTION = 1
+TEAM_OPTION = 2
+
+
+def schema_dtypes(schema):
+    return {
+        column.name: NULLABLE_INT_DTYPE if column.type is int and column.default is None else DTYPES_BY_TYPE[column.type]
+        for column in schema.columns
+    }
+
+
+def replace_column(values, name, new_name, new_values):
+    # Keeps the column in the same position, so columns stay in the same order as the keys of the parsed dicts
+    return {
+        (new_name if column_name == name else column_name): (new_values if column_name == name else column_values)
+        for column_name, column_values in values.items()
+    }
+
+
+def select_rows(values, selected):
+    return {
+        name: [value for value, is_selected in zip(column_values, selected) if is_selected]
+        for name, column_values in values.items()
+    }
+
+
+class EnumCodes:
+    dtype = "int8"
+
+    def __init__(self, enum_class, parse):
+        self.lookup = tuple(enum_class)
+        self.codes = {member: code for code, member in enumerate(self.lookup)}
+        self.parse = parse
+
+    def code(self, member):
+        if member is None:
+            return MISSING_CODE
+
+        return self.codes[member]
+
+    def encode(self, values):
+        # Columns only have a handful of distinct values, so each distinct value is only parsed once
+        codes_by_value = {}
+        codes = []
+        for value in values:
+            code = codes_by_value.get(value)
+            if code is None:
+                code = codes_by_value[value] = self.code(self.parse(value))
+            codes.append(code)
+
+        return codes
+
+    def decode(self, codes):
+        return [None if code == MISSING_CODE else self.lookup[code] for code in codes]
+
+
+class PositionsCodes(EnumCodes):
+    dtype = "uint8"
+
+    def code(self, members):
+        code = 0
+        for member in members:
+            code |= 1 << self.codes[member]
+
+        return code
+
+    def decode(self, codes):
+        return [
+            [member for bit, member in enumerate(self.lookup) if code & (1 << bit)]
+            for code in codes
+        ]
+
+
+class Columns(dict):
+    """
+    A dict of column name to NumPy array, where enum columns are arrays of codes.
+
+    The codes of each enum column are in codes (by column name) - lookups has the lookup table of each enum column, and
+    decode returns an enum column's values.
+    """
+
+    def __init__(self, arrays, codes):
+        super().__init__(arrays)
+        self.codes = codes
+
+    @property
+    def lookups(self):
+        return {name: codes.lookup for name, codes in self.codes.items()}
+
+    def decode(self, name):
+        return self.codes[name].decode(self[name])
+
+
+class ContractMatrix:
+    """
+    The contracts of every player, with a row per player and a column per contract year.
+
+    salaries is a players x years int64 array, where years without a salary (like the years after a contract ends) are
+    0. options is a players x years uint8 array of option bits (PLAYER_OPTION and TEAM_OPTION), and guaranteed is the
+    guaranteed amount of each player's contract (0 when it's blank). names, slugs, and teams are the players' names,
+    Basketball Reference identifiers, and team codes (in the order of the rows) - index has the row of each slug.
+    """
+
+    def __init__(self, names, slugs, teams, salaries, options, guaranteed, team_codes):
+        self.names = names
+        self.slugs = slugs
+        self.teams = teams
+        self.salaries = salaries
+        self.options = options
+        self.guaranteed = guaranteed
+        self.team_codes = team_codes
+        self.index = {}
+        for row, slug in enumerate(slugs):
+            self.index.setdefault(slug, row)
+
+    def __len__(self):
+        return len(self.names)
+
+    @property
+    def years(self):
+        return [int(year) for year in CONTRACT_YEARS]
+
+    @property
+    def player_options(self):
+        return (self.options & PLAYER_OPTION) != 0
+
+    @property
+    def team_options(self):
+        return (self.options & TEAM_OPTION) != 0
+
+    def decode_teams(self):
+        return self.team_codes.decode(self.teams)
+
+    def year_totals(self):
+        # The league-wide salaries of each contract year
+        return self.salaries.sum(axis=0)
+
+    def team_year_totals(self):
+        """
+        A teams x years array of the salaries of each team's players, where the row of a team is its code (see
+        team_codes.lookup). Players without a team aren't included.
+        """
+        numpy = import_optional_dependency(name="numpy", feature="Columnar results")
+        totals = numpy.zeros((len(self.team_codes.lookup), len(CONTRACT_YEARS)), dtype=self.salaries.dtype)
+        has_team = self.teams != MISSING_CODE
+        numpy.add.at(totals, self.teams[has_team], self.salaries[has_team])
+        return totals
+
+
+class ColumnarParser:
+    def __init__(self, team_abbreviation_parser, position_abbreviation_parser, location_abbreviation_parser,
+                 outcome_abbreviation_parser, outcome_parser, seconds_played_parser, salary_parser):
+        self.team_codes = EnumCodes(enum_class=Team, parse=team_abbreviation_parser.from_abbreviation)
+        self.positions_codes = PositionsCodes(enum_class=Position, parse=position_abbreviation_parser.from_abbreviations)
+        self.location_codes = EnumCodes(enum_class=Location, parse=location_abbreviation_parser.from_abbreviation)
+        self.outcome_codes = EnumCodes(enum_class=Outcome, parse=outcome_abbreviation_parser.from_abbreviation)
+        self.formatted_outcome_codes = EnumCodes(
+            enum_class=Outcome,
+            parse=lambda formatted_outcome: outcome_parser.parse_outcome(formatted_outcome=formatted_outcome),
+        )
+        self.seconds_played_parser = seconds_played_parser
+        self.salary_parser = salary_parser
+
+    @staticmethod
+    def to_columns(values, dtypes, codes):
+        numpy = import_optional_dependency(name="numpy", feature="Columnar results")
+        return Columns(
+            arrays={
+                name: numpy.array(
+                    codes[name].encode(column_values) if name in codes else column_values,
+                    dtype=codes[name].dtype if name in codes else dtypes[name],
+                )
+                for name, column_values in values.items()
+            },
+            codes=codes,
+        )
+
+    def player_totals_columns(self, schema, rows_html, include_combined_totals):
+        values = schema.extract_columns(rows_html)
+        values["name"] = [name.rstrip("*") for name in values["name"]]
+        # Basketball Reference includes a "total" row for players that got traded, with a team of "TOT"
+        values["is_combined_totals"] = [team == "TOT" for team in values["team"]]
+        if not include_combined_totals:
+            values = select_rows(
+                values=values,
+                selected=[not is_combined_totals for is_combined_totals in values["is_combined_totals"]],
+            )
+
+        return values
+
+    def parse_player_season_totals(self, rows_html):
+        values = self.player_totals_columns(
+            schema=PLAYER_SEASON_TOTALS_SCHEMA,
+            rows_html=rows_html,
+            include_combined_totals=False,
+        )
+        del values["is_combined_totals"]
+        return self.to_columns(
+            values=values,
+            dtypes=schema_dtypes(PLAYER_SEASON_TOTALS_SCHEMA),
+            codes={"positions": self.positions_codes, "team": self.team_codes},
+        )
+
+    def parse_player_advanced_season_totals(self, rows_html, include_combined_totals=False):
+        return self.to_columns(
+            values=self.player_totals_columns(
+                schema=PLAYER_ADVANCED_SEASON_TOTALS_SCHEMA,
+                rows_html=rows_html,
+                include_combined_totals=include_combined_totals,
+            ),
+            dtypes={**schema_dtypes(PLAYER_ADVANCED_SEASON_TOTALS_SCHEMA), "is_combined_totals": "bool"},
+            codes={"positions": self.positions_codes, "team": self.team_codes},
+        )
+
+    def parse_player_box_scores(self, box_scores):
+        values = PLAYER_BOX_SCORES_SCHEMA.extract_columns(box_score.html for box_score in box_scores)
+        values["name"] = [name.rstrip("*") for name in values["name"]]
+        values = replace_column(
+            values=values,
+            name="playing_time",
+            new_name="seconds_played",
+            new_values=[self.seconds_played_parser.parse(playing_time) for playing_time in values["playing_time"]],
+        )
+        return self.to_columns(
+            values=values,
+            dtypes={**schema_dtypes(PLAYER_BOX_SCORES_SCHEMA), "seconds_played": "int64"},
+            codes={
+                "team": self.team_codes,
+                "location": self.location_codes,
+                "opponent": self.team_codes,
+                "outcome": self.outcome_codes,
+            },
+        )
+
+    def parse_player_season_box_scores(self, box_scores, include_inactive_games=False):
+        """
+        Unlike the parsed dicts, where the statistics of inactive games are None, the statistics of inactive games are
+        0 (and NaN for the game score) - the active column tells them apart.
+        """
+        values = PLAYER_SEASON_BOX_SCORES_SCHEMA.extract_columns(box_score.html for box_score in box_scores)
+        active = [inactive_reason is None for inactive_reason in values["inactive_reason"]]
+
+        if not include_inactive_games:
+            values = select_rows(values=values, selected=active)
+            active = [True] * len(values["date"])
+
+        values = {
+            "date": values["date"],
+            "team": values["team"],
+            "location": values["location"],
+            "opponent": values["opponent"],
+            "outcome": values["outcome"],
+            "active": active,
+            "seconds_played": [
+                self.seconds_played_parser.parse(playing_time) if is_active else 0
+                for playing_time, is_active in zip(values["playing_time"], active)
+            ],
+            **{statistic: values[statistic] for statistic in PLAYER_SEASON_BOX_SCORE_STATISTICS},
+        }
+        values["game_score"] = [
+            game_score if is_active else float("nan")
+            for game_score, is_active in zip(values["game_score"], active)
+        ]
+
+        return self.to_columns(
+            values=values,
+            dtypes={
+                **schema_dtypes(PLAYER_SEASON_BOX_SCORES_SCHEMA),
+                "date": "datetime64[D]",
+                "active": "bool",
+                "seconds_played": "int64",
+            },
+            codes={
+                "team": self.team_codes,
+                "location": self.location_codes,
+                "opponent": self.team_codes,
+                "outcome": self.formatted_outcome_codes,
+            },
+        )
+
+    def salaries_or_zero(self, formatted_salaries):
+        return [0 if salary is None else salary for salary in self.salary_parser.parse_salaries(formatted_salaries)]
+
+    def parse_total_player_contracts(self, rows_html):
+        numpy = import_optional_dependency(name="numpy", feature="Columnar results")
+        values = PLAYER_TOTAL_CONTRACTS_SCHEMA.extract_columns(rows_html)
+        # Built a year at a time, so (once transposed) each year's salaries are contiguous for per-year sums
+        salaries = numpy.array(
+            [self.salaries_or_zero(values["year_" + year]) for year in CONTRACT_YEARS],
+            dtype="int64",
+        )
+        options = numpy.array(
+            [
+                [
+                    (PLAYER_OPTION if "salary-pl" in year_class else 0) | (TEAM_OPTION if "salary-tm" in year_class else 0)
+                    for year_class in values["year_" + year + "_class"]
+                ]
+                for year in CONTRACT_YEARS
+            ],
+            dtype="uint8",
+        )
+        return ContractMatrix(
+            names=[name.strip() for name in values["player_name"]],
+            slugs=values["slug"],
+            teams=numpy.array(self.team_codes.encode(values["team"]), dtype=self.team_codes.dtype),
+            salaries=salaries.T,
+            options=options.T,
+            guaranteed=numpy.array(self.salaries_or_zero(values["guaranteed"]), dtype="int64"),
+            team_codes=self.team_codes,
+        )
@@ -80,6 +80,8 @@ class Team(Enum):
 class OutputType(Enum):
     JSON = "JSON"
     CSV = "CSV"
+    DATAFRAME = "DATAFRAME"
+    JSONL = "JSONL"
 
 
 class OutputWriteOption(Enum):
@@ -328,3 +330,10 @@ class PlayerData:
         self.name = name
         self.resource_location = resource_location
         self.league_abbreviations = set(league_abbreviations)
+
+
+class PartialResults(list):
+    # A list of the values that were successfully fetched, along with the errors for the values that couldn't be fetched
+    def __init__(self, values, errors):
+        super().__init__(values)
+        self.errors = errors
@@ -20,3 +20,31 @@ class InvalidPlayerAndSeason(Exception):
         message = "Player with identifier \"{player_identifier}\" in season ending in {season_end_year} is invalid" \
             .format(player_identifier=player_identifier, season_end_year=season_end_year)
         super().__init__(message)
+
+
+class GameBoxScoreError(Exception):
+    def __init__(self, game_url_path, error):
+        message = "Box scores for game at \"{game_url_path}\" could not be fetched: {error}" \
+            .format(game_url_path=game_url_path, error=error)
+        super().__init__(message)
+        self.game_url_path = game_url_path
+        self.error = error
+
+
+class PlayerSeasonBoxScoresError(Exception):
+    def __init__(self, player_identifier, season_end_year, error):
+        message = "Box scores for player with identifier \"{player_identifier}\" in season ending in " \
+                  "{season_end_year} could not be fetched: {error}" \
+            .format(player_identifier=player_identifier, season_end_year=season_end_year, error=error)
+        super().__init__(message)
+        self.player_identifier = player_identifier
+        self.season_end_year = season_end_year
+        self.error = error
+
+
+class RequestNotRecorded(Exception):
+    def __init__(self, url, params):
+        message = "Request for \"{url}\" with parameters {params} has not been recorded".format(url=url, params=params)
+        super().__init__(message)
+        self.url = url
+        self.params = params
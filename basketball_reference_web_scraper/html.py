@@ -1,151 +1,325 @@
 import re
 
-from lxml import html
+from lxml import etree, html
 from lxml.html import HtmlComment
 
+from basketball_reference_web_scraper.schemas import PLAYER_SEASON_TOTALS_SCHEMA, \
+    PLAYER_ADVANCED_SEASON_TOTALS_SCHEMA, PLAYER_SEASON_BOX_SCORES_SCHEMA, SCHEDULE_SCHEMA, SALARIES_SCHEMA, \
+    TEAM_CONTRACTS_SCHEMA, PLAYER_TOTAL_CONTRACTS_SCHEMA, CONFERENCE_DIVISION_STANDINGS_SCHEMA, PLAYER_BOX_SCORES_SCHEMA
+from basketball_reference_web_scraper.utilities import memoized_property
+
+# Queries are compiled once when the module is loaded, rather than every time they're evaluated
+TABLE_QUERY = etree.XPath('//table[@id=$table_id]')
+DESCENDANT_TABLE_QUERY = etree.XPath('.//table[@id=$table_id]')
+DESCENDANT_BODY_ROWS_QUERY = etree.XPath('.//tbody/tr')
+PLAYER_ADVANCED_SEASON_TOTALS_ROWS_QUERY = etree.XPath("""
+    //table[@id="advanced_stats"]
+    /tbody
+    /tr[
+        contains(@class, "full_table") or 
+        contains(@class, "italic_text partial_table") 
+        and not(contains(@class, "rowSum"))
+    ]
+""")
+# Basketball Reference includes individual rows for players that played for multiple teams in a season
+# These rows have a separate class ("italic_text partial_table") than the players that played for a single team
+# across a season.
+PLAYER_SEASON_TOTALS_ROWS_QUERY = etree.XPath("""
+    //table[@id="totals_stats"]
+    /tbody
+    /tr[
+        contains(@class, "full_table") or 
+        contains(@class, "italic_text partial_table") 
+        and not(contains(@class, "rowSum"))
+    ]
+""")
+STATISTICS_TABLES_QUERY = etree.XPath('//table[contains(@class, "stats_table")]')
+FOOTER_ROWS_QUERY = etree.XPath('tfoot/tr')
+DAILY_LEADERS_ROWS_QUERY = etree.XPath('//table[@id="stats"]//tbody/tr[not(contains(@class, "thead"))]')
+REGULAR_SEASON_BOX_SCORES_TABLE_QUERY = etree.XPath('//table[@id="pgl_basic"]')
+PLAYOFF_BOX_SCORES_TABLE_CONTAINER_QUERY = etree.XPath('//div[@id="all_pgl_basic_playoffs"]')
+# Every 20 rows, there's a row that has the column header values - those should be ignored
+PLAYER_SEASON_BOX_SCORES_ROWS_QUERY = etree.XPath('//tbody/tr[not(contains(@class, "thead"))]')
+PLAY_BY_PLAY_TABLE_QUERY = etree.XPath('//table[@id="pbp"]')
+PLAY_BY_PLAY_TEAM_NAMES_QUERY = etree.XPath('//*[@id="content"]//div[@class="scorebox"]//strong//a')
+GAME_URL_PATHS_QUERY = etree.XPath('//td[contains(@class, "gamelink")]/a')
+OTHER_MONTHS_SCHEDULE_LINKS_QUERY = etree.XPath(
+    '//div[@id="content"]/div[@class="filter"]/div[not(contains(@class, "current"))]/a'
+)
+SCHEDULE_ROWS_QUERY = etree.XPath('//table[@id="schedule"]//tbody/tr')
+NBA_ABA_BAA_PLAYERS_CONTENT_QUERY = etree.XPath('//div[@id="searches"]/div[@id="players"]')
+NBA_ABA_BAA_PLAYERS_PAGINATION_LINKS_QUERY = etree.XPath(
+    '//div[@id="searches"]/div[@id="players"]/div[@class="search-pagination"]/a'
+)
+NBA_ABA_BAA_PLAYER_SEARCH_ITEMS_QUERY = etree.XPath(
+    '//div[@id="searches"]/div[@id="players"]/div[@class="search-item"]'
+)
+SEARCH_RESULT_RESOURCE_LINK_QUERY = etree.XPath('./div[@class="search-item-name"]//a')
+SEARCH_RESULT_LEAGUE_ABBREVIATION_QUERY = etree.XPath('./div[@class="search-item-league"]')
+PLAYER_NAME_HEADERS_QUERY = etree.XPath('.//h1[@itemprop="name"]')
+SALARIES_TABLE_QUERY = etree.XPath('//table[@id="contracts"]')
+CURRENT_PAYROLL_QUERY = etree.XPath('.//tfoot/tr/td[@data-stat="y1"]')
+DIVISION_STANDINGS_QUERY = etree.XPath('.//div[@id="all_standings"]')
+DESCENDANT_HEADERS_QUERY = etree.XPath('.//th')
+PLAYER_IDENTIFIERS_QUERY = etree.XPath('.//td/@data-append-csv')
+TEAM_CONTRACTS_TABLE_QUERY = etree.XPath('//table[@id="team_summary"]')
+PLAYER_TOTAL_CONTRACTS_TABLE_QUERY = etree.XPath('//table[@id="player-contracts"]')
+
+# Basketball Reference pages are served as UTF-8, and declare it in a meta tag near the top of the page
+DEFAULT_DOCUMENT_ENCODING = "utf-8"
+DOCUMENT_ENCODING_REGEX = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.IGNORECASE)
+DOCUMENT_ENCODING_SEARCH_LENGTH = 4096
+TABLE_TAG_REGEX = re.compile(rb'<(/?)table\b', re.IGNORECASE)
+STREAMING_CHUNK_SIZE = 64 * 1024
+# The same rows as PLAYER_SEASON_TOTALS_ROWS_QUERY, for a row that has already been found
+PLAYER_SEASON_TOTALS_ROW_QUERY = etree.XPath("""
+    self::tr[
+        parent::tbody and (
+            contains(@class, "full_table") or 
+            contains(@class, "italic_text partial_table") 
+            and not(contains(@class, "rowSum"))
+        )
+    ]
+""")
 
-class BasicBoxScoreRow:
-    def __init__(self, html):
-        self.html = html
 
-    @property
-    def playing_time(self):
-        cells = self.html.xpath('td[@data-stat="mp"]')
+def document_encoding(content):
+    match = DOCUMENT_ENCODING_REGEX.search(content, 0, DOCUMENT_ENCODING_SEARCH_LENGTH)
+    if match is None:
+        return DEFAULT_DOCUMENT_ENCODING
 
-        if len(cells) > 0:
-            return cells[0].text_content()
+    return match.group(1).decode("ascii")
 
-        return ''
 
-    @property
-    def minutes_played(self):
-        return self.playing_time
+def find_table_markup(content, table_id):
+    """
+    Finds the markup of the table with the given id in a page's raw bytes, without parsing the page.
 
-    @property
-    def made_field_goals(self):
-        cells = self.html.xpath('td[@data-stat="fg"]')
+    Some tables are only rendered (by JavaScript) from markup inside an HTML comment - those are found the same way as
+    the tables that are part of the page. Returns None when there is no table with the given id.
+    """
+    start_tag_regex = re.compile(
+        rb'<table\b[^>]*\bid=["\']' + re.escape(table_id.encode("ascii")) + rb'["\']',
+        re.IGNORECASE,
+    )
+    start = start_tag_regex.search(content)
+    if start is None:
+        return None
 
-        if len(cells) > 0:
-            return cells[0].text_content()
+    # Tables can be nested, so the end of the table is the first closing tag that isn't for a nested table
+    depth = 0
+    for tag in TABLE_TAG_REGEX.finditer(content, start.start()):
+        if tag.group(1):
+            depth -= 1
+            if depth == 0:
+                end = content.find(b">", tag.end())
+                if end == -1:
+                    return None
+                return content[start.start():end + 1]
+        else:
+            depth += 1
 
-        return ''
+    return None
 
-    @property
-    def attempted_field_goals(self):
-        cells = self.html.xpath('td[@data-stat="fga"]')
 
-        if len(cells) > 0:
-            return cells[0].text_content()
+def parse_table(content, table_id):
+    """
+    Parses only the table with the given id out of a page's raw bytes (see find_table_markup).
 
-        return ''
+    Returns None when the table can't be found, or when its markup doesn't parse to a table with the given id.
+    """
+    markup = find_table_markup(content=content, table_id=table_id)
+    if markup is None:
+        return None
 
-    @property
-    def made_three_point_field_goals(self):
-        cells = self.html.xpath('td[@data-stat="fg3"]')
+    # The table's markup is separated from the page's encoding declaration, so the encoding is passed along
+    table = html.fromstring(markup, parser=html.HTMLParser(encoding=document_encoding(content)))
+    if table.tag != "table" or table.get("id") != table_id:
+        return None
 
-        if len(cells) > 0:
-            return cells[0].text_content()
+    return table
 
-        return ''
 
-    @property
-    def attempted_three_point_field_goals(self):
-        cells = self.html.xpath('td[@data-stat="fg3a"]')
+def parse_table_or_document(content, table_id):
+    """
+    Returns the table with the given id when only it can be parsed out of a page's raw bytes, and otherwise falls back
+    to parsing the whole page.
 
-        if len(cells) > 0:
-            return cells[0].text_content()
+    Table queries start with //table[@id=...], so they match both the returned table and a table in the whole page.
+    """
+    table = parse_table(content=content, table_id=table_id)
+    if table is None:
+        return html.fromstring(content)
 
-        return ''
+    return table
 
-    @property
-    def made_free_throws(self):
-        cells = self.html.xpath('td[@data-stat="ft"]')
 
-        if len(cells) > 0:
-            return cells[0].text_content()
+def content_chunks(content, chunk_size=STREAMING_CHUNK_SIZE):
+    for start in range(0, len(content), chunk_size):
+        yield content[start:start + chunk_size]
 
-        return ''
 
-    @property
-    def attempted_free_throws(self):
-        cells = self.html.xpath('td[@data-stat="fta"]')
+def iter_table_rows(chunks, table_id):
+    """
+    Incrementally parses a page (given as chunks of its raw bytes) and yields each row of the table with the given id as
+    soon as the row's end tag has been parsed.
 
-        if len(cells) > 0:
-            return cells[0].text_content()
+    A yielded row is cleared, and removed from the tree, once the next row is requested, so it should be read before
+    continuing - only the row that is being read is ever kept in memory, however many rows the table has. Other tables
+    are discarded as soon as they've been parsed. Tables that are inside HTML comments are not found.
+    """
+    parser = None
+    table = None
+
+    for chunk in chunks:
+        if parser is None:
+            parser = etree.HTMLPullParser(
+                events=("start", "end"),
+                tag=("table", "tr"),
+                encoding=document_encoding(chunk),
+            )
+            # Rows are read the same way as rows of a parsed page, which are lxml.html elements
+            parser.set_element_class_lookup(html.HtmlElementClassLookup())
+
+        parser.feed(chunk)
+        for event, element in parser.read_events():
+            if element.tag == "table":
+                if event == "start":
+                    if table is None and element.get("id") == table_id:
+                        table = element
+                elif element is table:
+                    return
+                elif table is None:
+                    element.clear()
+            elif event == "end" and table is not None:
+                yield element
+                release(element=element)
+
+
+def release(element):
+    element.clear()
+    parent = element.getparent()
+    while element.getprevious() is not None:
+        del parent[0]
+    parent.remove(element)
+
+
+class DataStatRow:
+    """
+    Rows look up their values by the data-stat attribute of their cells, so instead of searching the row for each value,
+    the cells are indexed by their tag and data-stat attribute in a single pass over the row the first time a value is
+    looked up.
 
-        return ''
+    Rows of tables that have a schema can also be read as a record of typed values, which is extracted from the row's
+    cells in a single pass of its own (see basketball_reference_web_scraper.schemas).
+    """
+
+    schema = None
+
+    def __init__(self, html):
+        self.html = html
+        self._cells_by_data_stat = None
+        self._record = None
 
     @property
-    def offensive_rebounds(self):
-        cells = self.html.xpath('td[@data-stat="orb"]')
+    def cells_by_data_stat(self):
+        if self._cells_by_data_stat is None:
+            cells_by_data_stat = {}
+            for cell in self.html.iterchildren("td", "th"):
+                data_stat = cell.get("data-stat")
+                if data_stat is not None:
+                    cells_by_data_stat.setdefault((cell.tag, data_stat), []).append(cell)
 
-        if len(cells) > 0:
-            return cells[0].text_content()
+            self._cells_by_data_stat = cells_by_data_stat
 
-        return ''
+        return self._cells_by_data_stat
+
+    def cells(self, data_stat, tag="td"):
+        return self.cells_by_data_stat.get((tag, data_stat), [])
 
     @property
-    def defensive_rebounds(self):
-        cells = self.html.xpath('td[@data-stat="drb"]')
+    def record(self):
+        if self._record is None:
+            self._record = self.schema.extract(self.html)
+
+        return self._record
+
+    def cell_text(self, data_stat, tag="td"):
+        cells = self.cells(data_stat=data_stat, tag=tag)
 
         if len(cells) > 0:
             return cells[0].text_content()
 
         return ''
 
-    @property
-    def assists(self):
-        cells = self.html.xpath('td[@data-stat="ast"]')
 
-        if len(cells) > 0:
-            return cells[0].text_content()
+class BasicBoxScoreRow(DataStatRow):
+    def __init__(self, html):
+        super().__init__(html)
 
-        return ''
+    @property
+    def playing_time(self):
+        return self.cell_text(data_stat="mp")
 
     @property
-    def steals(self):
-        cells = self.html.xpath('td[@data-stat="stl"]')
+    def minutes_played(self):
+        return self.playing_time
 
-        if len(cells) > 0:
-            return cells[0].text_content()
+    @property
+    def made_field_goals(self):
+        return self.cell_text(data_stat="fg")
 
-        return ''
+    @property
+    def attempted_field_goals(self):
+        return self.cell_text(data_stat="fga")
 
     @property
-    def blocks(self):
-        cells = self.html.xpath('td[@data-stat="blk"]')
+    def made_three_point_field_goals(self):
+        return self.cell_text(data_stat="fg3")
 
-        if len(cells) > 0:
-            return cells[0].text_content()
+    @property
+    def attempted_three_point_field_goals(self):
+        return self.cell_text(data_stat="fg3a")
 
-        return ''
+    @property
+    def made_free_throws(self):
+        return self.cell_text(data_stat="ft")
 
     @property
-    def turnovers(self):
-        cells = self.html.xpath('td[@data-stat="tov"]')
+    def attempted_free_throws(self):
+        return self.cell_text(data_stat="fta")
 
-        if len(cells) > 0:
-            return cells[0].text_content()
+    @property
+    def offensive_rebounds(self):
+        return self.cell_text(data_stat="orb")
 
-        return ''
+    @property
+    def defensive_rebounds(self):
+        return self.cell_text(data_stat="drb")
 
     @property
-    def personal_fouls(self):
-        cells = self.html.xpath('td[@data-stat="pf"]')
+    def assists(self):
+        return self.cell_text(data_stat="ast")
 
-        if len(cells) > 0:
-            return cells[0].text_content()
+    @property
+    def steals(self):
+        return self.cell_text(data_stat="stl")
 
-        return ''
+    @property
+    def blocks(self):
+        return self.cell_text(data_stat="blk")
 
     @property
-    def points(self):
-        cells = self.html.xpath('td[@data-stat="pts"]')
+    def turnovers(self):
+        return self.cell_text(data_stat="tov")
 
-        if len(cells) > 0:
-            return cells[0].text_content()
+    @property
+    def personal_fouls(self):
+        return self.cell_text(data_stat="pf")
 
-        return ''
+    @property
+    def points(self):
+        return self.cell_text(data_stat="pts")
 
 
 class PlayerBoxScoreRow(BasicBoxScoreRow):
@@ -159,66 +333,36 @@ class PlayerBoxScoreRow(BasicBoxScoreRow):
 
     @property
     def team_abbreviation(self):
-        cells = self.html.xpath('td[@data-stat="team_id"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="team_id")
 
     @property
     def location_abbreviation(self):
-        cells = self.html.xpath('td[@data-stat="game_location"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="game_location")
 
     @property
     def opponent_abbreviation(self):
-        cells = self.html.xpath('td[@data-stat="opp_id"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="opp_id")
 
     @property
     def outcome(self):
-        cells = self.html.xpath('td[@data-stat="game_result"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="game_result")
 
     @property
     def plus_minus(self):
-        cells = self.html.xpath('td[@data-stat="plus_minus"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="plus_minus")
 
     @property
     def game_score(self):
-        cells = self.html.xpath('td[@data-stat="game_score"]')
+        return self.cell_text(data_stat="game_score")
 
-        if len(cells) > 0:
-            return cells[0].text_content()
 
-        return ''
-
-
-class PlayerIdentificationRow:
+class PlayerIdentificationRow(DataStatRow):
     def __init__(self, html):
-        self.html = html
+        super().__init__(html)
 
     @property
     def player_cell(self):
-        cells = self.html.xpath('td[@data-stat="player"]')
+        cells = self.cells(data_stat="player")
 
         if len(cells) > 0:
             return cells[0]
@@ -248,19 +392,16 @@ class PlayerAdvancedSeasonTotalsTable:
 
     @property
     def rows_query(self):
-        return """
-            //table[@id="advanced_stats"]
-            /tbody
-            /tr[
-                contains(@class, "full_table") or 
-                contains(@class, "italic_text partial_table") 
-                and not(contains(@class, "rowSum"))
-            ]
-        """
+        return PLAYER_ADVANCED_SEASON_TOTALS_ROWS_QUERY
+
+    @property
+    def rows_html(self):
+        # Every player row, including the combined totals of players that got traded
+        return self.rows_query(self.html)
 
     def get_rows(self, include_combined_totals=False):
         player_advanced_season_totals_rows = []
-        for row_html in self.html.xpath(self.rows_query):
+        for row_html in self.rows_query(self.html):
             row = PlayerAdvancedSeasonTotalsRow(html=row_html)
             if (include_combined_totals is True and row.is_combined_totals is True) or row.is_combined_totals is False:
                 # Basketball Reference includes a "total" row for players that got traded
@@ -277,23 +418,25 @@ class PlayerSeasonTotalTable:
 
     @property
     def rows_query(self):
-        # Basketball Reference includes individual rows for players that played for multiple teams in a season
-        # These rows have a separate class ("italic_text partial_table") than the players that played for a single team
-        # across a season.
-        return """
-            //table[@id="totals_stats"]
-            /tbody
-            /tr[
-                contains(@class, "full_table") or 
-                contains(@class, "italic_text partial_table") 
-                and not(contains(@class, "rowSum"))
-            ]
-        """
+        return PLAYER_SEASON_TOTALS_ROWS_QUERY
+
+    @staticmethod
+    def stream_rows(chunks):
+        for row_html in iter_table_rows(chunks=chunks, table_id="totals_stats"):
+            if PLAYER_SEASON_TOTALS_ROW_QUERY(row_html):
+                row = PlayerSeasonTotalsRow(html=row_html)
+                if not row.is_combined_totals:
+                    yield row
+
+    @property
+    def rows_html(self):
+        # Every player row, including the combined totals of players that got traded
+        return self.rows_query(self.html)
 
     @property
     def rows(self):
         player_season_totals_rows = []
-        for row_html in self.html.xpath(self.rows_query):
+        for row_html in self.rows_query(self.html):
             row = PlayerSeasonTotalsRow(html=row_html)
             # Basketball Reference includes a "total" row for players that got traded
             # which is essentially a sum of all player team rows
@@ -305,293 +448,152 @@ class PlayerSeasonTotalTable:
 
 
 class PlayerAdvancedSeasonTotalsRow(PlayerIdentificationRow):
+    schema = PLAYER_ADVANCED_SEASON_TOTALS_SCHEMA
+
     def __init__(self, html):
         super().__init__(html=html)
 
     @property
     def position_abbreviations(self):
-        cells = self.html.xpath('td[@data-stat="pos"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="pos")
 
     @property
     def age(self):
-        cells = self.html.xpath('td[@data-stat="age"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="age")
 
     @property
     def team_abbreviation(self):
-        cells = self.html.xpath('td[@data-stat="team_id"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="team_id")
 
     @property
     def games_played(self):
-        cells = self.html.xpath('td[@data-stat="g"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="g")
 
     @property
     def minutes_played(self):
-        cells = self.html.xpath('td[@data-stat="mp"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="mp")
 
     @property
     def player_efficiency_rating(self):
-        cells = self.html.xpath('td[@data-stat="per"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="per")
 
     @property
     def true_shooting_percentage(self):
-        cells = self.html.xpath('td[@data-stat="ts_pct"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="ts_pct")
 
     @property
     def three_point_attempt_rate(self):
-        cells = self.html.xpath('td[@data-stat="fg3a_per_fga_pct"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="fg3a_per_fga_pct")
 
     @property
     def free_throw_attempt_rate(self):
-        cells = self.html.xpath('td[@data-stat="fta_per_fga_pct"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="fta_per_fga_pct")
 
     @property
     def offensive_rebound_percentage(self):
-        cells = self.html.xpath('td[@data-stat="orb_pct"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="orb_pct")
 
     @property
     def defensive_rebound_percentage(self):
-        cells = self.html.xpath('td[@data-stat="drb_pct"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="drb_pct")
 
     @property
     def total_rebound_percentage(self):
-        cells = self.html.xpath('td[@data-stat="trb_pct"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="trb_pct")
 
     @property
     def assist_percentage(self):
-        cells = self.html.xpath('td[@data-stat="ast_pct"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="ast_pct")
 
     @property
     def steal_percentage(self):
-        cells = self.html.xpath('td[@data-stat="stl_pct"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="stl_pct")
 
     @property
     def block_percentage(self):
-        cells = self.html.xpath('td[@data-stat="blk_pct"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="blk_pct")
 
     @property
     def turnover_percentage(self):
-        cells = self.html.xpath('td[@data-stat="tov_pct"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="tov_pct")
 
     @property
     def usage_percentage(self):
-        cells = self.html.xpath('td[@data-stat="usg_pct"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="usg_pct")
 
     @property
     def offensive_win_shares(self):
-        cells = self.html.xpath('td[@data-stat="ows"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="ows")
 
     @property
     def defensive_win_shares(self):
-        cells = self.html.xpath('td[@data-stat="dws"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="dws")
 
     @property
     def win_shares(self):
-        cells = self.html.xpath('td[@data-stat="ws"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="ws")
 
     @property
     def win_shares_per_48_minutes(self):
-        cells = self.html.xpath('td[@data-stat="ws_per_48"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="ws_per_48")
 
     @property
     def offensive_plus_minus(self):
-        cells = self.html.xpath('td[@data-stat="obpm"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="obpm")
 
     @property
     def defensive_plus_minus(self):
-        cells = self.html.xpath('td[@data-stat="dbpm"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="dbpm")
 
     @property
     def plus_minus(self):
-        cells = self.html.xpath('td[@data-stat="bpm"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="bpm")
 
     @property
     def value_over_replacement_player(self):
-        cells = self.html.xpath('td[@data-stat="vorp"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="vorp")
 
     @property
     def is_combined_totals(self):
-        return self.team_abbreviation == "TOT"
+        return self.record["team"] == "TOT"
 
 
 class PlayerSeasonTotalsRow(PlayerBoxScoreRow, PlayerIdentificationRow):
+    schema = PLAYER_SEASON_TOTALS_SCHEMA
+
     def __init__(self, html):
         super().__init__(html=html)
 
     @property
     def position_abbreviations(self):
-        cells = self.html.xpath('td[@data-stat="pos"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="pos")
 
     @property
     def age(self):
-        cells = self.html.xpath('td[@data-stat="age"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="age")
 
     @property
     def games_played(self):
-        cells = self.html.xpath('td[@data-stat="g"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="g")
 
     @property
     def games_started(self):
-        cells = self.html.xpath('td[@data-stat="gs"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="gs")
 
     @property
     def is_combined_totals(self):
-        return self.team_abbreviation == "TOT"
+        return self.record["team"] == "TOT"
 
 
 class BoxScoresPage:
     def __init__(self, html):
         self.html = html
 
-    @property
+    @memoized_property
     def statistics_tables(self):
         return [
             StatisticsTable(table_html)
-            for table_html in self.html.xpath('//table[contains(@class, "stats_table")]')
+            for table_html in STATISTICS_TABLES_QUERY(self.html)
         ]
 
     @property
@@ -620,7 +622,7 @@ class StatisticsTable:
     @property
     def team_totals(self):
         # Team totals are stored as table footers
-        footers = self.html.xpath('tfoot/tr')
+        footers = FOOTER_ROWS_QUERY(self.html)
         if len(footers) > 0:
             return BasicBoxScoreRow(html=footers[0])
 
@@ -635,21 +637,44 @@ class DailyLeadersPage:
     def daily_leaders(self):
         return [
             PlayerGameBoxScoreRow(row_html)
-            for row_html in self.html.xpath('//table[@id="stats"]//tbody/tr[not(contains(@class, "thead"))]')
+            for row_html in DAILY_LEADERS_ROWS_QUERY(self.html)
         ]
 
 
 class PlayerSeasonBoxScoresPage:
-    def __init__(self, html):
-        self.html = html
+    """
+    When the page's raw content is given, each box scores table is parsed on its own from the content and the whole
+    page is only parsed (from the content) if a table can't be found that way.
+    """
+
+    def __init__(self, html=None, content=None):
+        self._html = html
+        self.content = content
 
     @property
-    def regular_season_box_scores_table_query(self):
-        return '//table[@id="pgl_basic"]'
+    def html(self):
+        if self._html is None:
+            self._html = html.fromstring(self.content)
+
+        return self._html
+
+    def parse_table(self, table_id):
+        if self.content is None:
+            return None
+
+        return parse_table(content=self.content, table_id=table_id)
 
     @property
+    def regular_season_box_scores_table_query(self):
+        return REGULAR_SEASON_BOX_SCORES_TABLE_QUERY
+
+    @memoized_property
     def regular_season_box_scores_table(self):
-        matching_tables = self.html.xpath(self.regular_season_box_scores_table_query)
+        table = self.parse_table(table_id="pgl_basic")
+        if table is not None:
+            return PlayerSeasonBoxScoresTable(html=table)
+
+        matching_tables = self.regular_season_box_scores_table_query(self.html)
 
         if len(matching_tables) != 1:
             return None
@@ -658,7 +683,7 @@ class PlayerSeasonBoxScoresPage:
 
     @property
     def playoff_box_scores_table_container_query(self):
-        return '//div[@id="all_pgl_basic_playoffs"]'
+        return PLAYOFF_BOX_SCORES_TABLE_CONTAINER_QUERY
 
     """
     This is a limitation of requests as the playoff box scores table is "hidden" in a comment that is rendered later
@@ -671,9 +696,13 @@ class PlayerSeasonBoxScoresPage:
     tree that will eventually be rendered on the page.
     """
 
-    @property
+    @memoized_property
     def playoff_box_scores_table(self):
-        matching_containers = self.html.xpath(self.playoff_box_scores_table_container_query)
+        table = self.parse_table(table_id="pgl_basic_playoffs")
+        if table is not None:
+            return PlayerSeasonBoxScoresTable(html=table)
+
+        matching_containers = self.playoff_box_scores_table_container_query(self.html)
 
         if len(matching_containers) != 1:
             return None
@@ -693,7 +722,7 @@ class PlayerSeasonBoxScoresPage:
 
         tree = html.fromstring(playoff_table_html)
 
-        matching_tables = tree.xpath('//table[@id="pgl_basic_playoffs"]')
+        matching_tables = TABLE_QUERY(tree, table_id="pgl_basic_playoffs")
 
         if len(matching_tables) != 1:
             return None
@@ -707,19 +736,19 @@ class PlayerSeasonBoxScoresTable:
 
     @property
     def rows_query(self):
-        # Every 20 rows, there's a row that has the column header values - those should be ignored
-        return '//tbody' \
-               '/tr[not(contains(@class, "thead"))]'
+        return PLAYER_SEASON_BOX_SCORES_ROWS_QUERY
 
     @property
     def rows(self):
         return [
             PlayerSeasonBoxScoresRow(html=row_html)
-            for row_html in self.html.xpath(self.rows_query)
+            for row_html in self.rows_query(self.html)
         ]
 
 
 class PlayerSeasonBoxScoresRow(PlayerBoxScoreRow):
+    schema = PLAYER_SEASON_BOX_SCORES_SCHEMA
+
     def __init__(self, html):
         super().__init__(html)
 
@@ -732,29 +761,20 @@ class PlayerSeasonBoxScoresRow(PlayerBoxScoreRow):
     def is_active(self):
         # When a player is not active (for a reason like "Inactive", "Did Not Play", "Did Not Dress")
         # the game played counter is blank (and a "reason" column will exist)
-        cells = self.html.xpath('td[@data-stat="reason"]')
-        return len(cells) < 1
+        return self.record["inactive_reason"] is None
 
     @property
     def date(self):
-        cells = self.html.xpath('td[@data-stat="date_game"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="date_game")
 
     @property
     def points_scored(self):
-        cells = self.html.xpath('td[@data-stat="pts"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="pts")
 
 
 class PlayerGameBoxScoreRow(PlayerBoxScoreRow, PlayerIdentificationRow):
+    schema = PLAYER_BOX_SCORES_SCHEMA
+
     def __init__(self, html):
         super().__init__(html)
 
@@ -765,23 +785,19 @@ class PlayByPlayPage:
 
     @property
     def table_query(self):
-        return '//table[@id="pbp"]'
+        return PLAY_BY_PLAY_TABLE_QUERY
 
     @property
     def team_names_query(self):
-        return \
-            '//*[@id="content"]' \
-            '//div[@class="scorebox"]' \
-            '//strong' \
-            '//a'
+        return PLAY_BY_PLAY_TEAM_NAMES_QUERY
 
-    @property
+    @memoized_property
     def play_by_play_table(self):
-        return PlayByPlayTable(html=self.html.xpath(self.table_query)[0])
+        return PlayByPlayTable(html=self.table_query(self.html)[0])
 
-    @property
+    @memoized_property
     def team_names(self):
-        names = self.html.xpath(self.team_names_query)
+        names = self.team_names_query(self.html)
 
         return [
             name.text_content()
@@ -818,15 +834,15 @@ class PlayByPlayRow:
     def timestamp_cell(self):
         return self.html[0]
 
-    @property
+    @memoized_property
     def timestamp(self):
         return self.timestamp_cell.text_content().strip()
 
-    @property
+    @memoized_property
     def away_team_play_description(self):
         return self.html[1].text_content().strip()
 
-    @property
+    @memoized_property
     def home_team_play_description(self):
         return self.html[5].text_content().strip()
 
@@ -838,7 +854,7 @@ class PlayByPlayRow:
     def is_home_team_play(self):
         return self.home_team_play_description != ""
 
-    @property
+    @memoized_property
     def formatted_scores(self):
         return self.html[3].text_content().strip()
 
@@ -863,11 +879,11 @@ class DailyBoxScoresPage:
 
     @property
     def game_url_paths_query(self):
-        return '//td[contains(@class, "gamelink")]/a'
+        return GAME_URL_PATHS_QUERY
 
     @property
     def game_url_paths(self):
-        game_links = self.html.xpath(self.game_url_paths_query)
+        game_links = self.game_url_paths_query(self.html)
         return [game_link.attrib['href'] for game_link in game_links]
 
 
@@ -877,18 +893,15 @@ class SchedulePage:
 
     @property
     def other_months_schedule_links_query(self):
-        return '//div[@id="content"]' \
-               '/div[@class="filter"]' \
-               '/div[not(contains(@class, "current"))]' \
-               '/a'
+        return OTHER_MONTHS_SCHEDULE_LINKS_QUERY
 
     @property
     def rows_query(self):
-        return '//table[@id="schedule"]//tbody/tr'
+        return SCHEDULE_ROWS_QUERY
 
     @property
     def other_months_schedule_urls(self):
-        links = self.html.xpath(self.other_months_schedule_links_query)
+        links = self.other_months_schedule_links_query(self.html)
         return [
             link.attrib['href']
             for link in links
@@ -898,16 +911,18 @@ class SchedulePage:
     def rows(self):
         return [
             ScheduleRow(html=row)
-            for row in self.html.xpath(self.rows_query)
+            for row in self.rows_query(self.html)
             # Every row in each month's schedule table represents a game
             # except for the row where the only content is "Playoffs"
             if row.text_content() != 'Playoffs'
         ]
 
 
-class ScheduleRow:
+class ScheduleRow(DataStatRow):
+    schema = SCHEDULE_SCHEMA
+
     def __init__(self, html):
-        self.html = html
+        super().__init__(html)
 
     def __eq__(self, other):
         if isinstance(other, ScheduleRow):
@@ -916,57 +931,27 @@ class ScheduleRow:
 
     @property
     def start_date(self):
-        cells = self.html.xpath('th[@data-stat="date_game"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="date_game", tag="th")
 
     @property
     def start_time_of_day(self):
-        cells = self.html.xpath('td[@data-stat="game_start_time"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="game_start_time")
 
     @property
     def away_team_name(self):
-        cells = self.html.xpath('td[@data-stat="visitor_team_name"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="visitor_team_name")
 
     @property
     def home_team_name(self):
-        cells = self.html.xpath('td[@data-stat="home_team_name"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="home_team_name")
 
     @property
     def away_team_score(self):
-        cells = self.html.xpath('td[@data-stat="visitor_pts"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="visitor_pts")
 
     @property
     def home_team_score(self):
-        cells = self.html.xpath('td[@data-stat="home_pts"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="home_pts")
 
 
 class SearchPage:
@@ -975,23 +960,19 @@ class SearchPage:
 
     @property
     def nba_aba_baa_players_content_query(self):
-        return '//div[@id="searches"]/div[@id="players"]'
+        return NBA_ABA_BAA_PLAYERS_CONTENT_QUERY
 
     @property
     def nba_aba_baa_players_pagination_links_query(self):
-        return '{NBA_ABA_PLAYERS_CONTENT_QUERY}/div[@class="search-pagination"]/a'.format(
-            NBA_ABA_PLAYERS_CONTENT_QUERY=self.nba_aba_baa_players_content_query
-        )
+        return NBA_ABA_BAA_PLAYERS_PAGINATION_LINKS_QUERY
 
     @property
     def nba_aba_baa_player_search_items_query(self):
-        return '{NBA_ABA_PLAYERS_CONTENT_QUERY}/div[@class="search-item"]'.format(
-            NBA_ABA_PLAYERS_CONTENT_QUERY=self.nba_aba_baa_players_content_query
-        )
+        return NBA_ABA_BAA_PLAYER_SEARCH_ITEMS_QUERY
 
-    @property
+    @memoized_property
     def nba_aba_baa_players_pagination_links(self):
-        return self.html.xpath(self.nba_aba_baa_players_pagination_links_query)
+        return self.nba_aba_baa_players_pagination_links_query(self.html)
 
     @property
     def nba_aba_baa_players_pagination_url(self):
@@ -1014,7 +995,7 @@ class SearchPage:
     def nba_aba_baa_players(self):
         return [
             PlayerSearchResult(html=result_html)
-            for result_html in self.html.xpath(self.nba_aba_baa_player_search_items_query)
+            for result_html in self.nba_aba_baa_player_search_items_query(self.html)
         ]
 
 
@@ -1024,11 +1005,11 @@ class SearchResult:
 
     @property
     def resource_link_query(self):
-        return './div[@class="search-item-name"]//a'
+        return SEARCH_RESULT_RESOURCE_LINK_QUERY
 
-    @property
+    @memoized_property
     def resource_link(self):
-        links = self.html.xpath(self.resource_link_query)
+        links = self.resource_link_query(self.html)
 
         if len(links) > 0:
             return links[0]
@@ -1062,11 +1043,11 @@ class SearchResult:
 class PlayerSearchResult(SearchResult):
     @property
     def league_abbreviation_query(self):
-        return './div[@class="search-item-league"]'
+        return SEARCH_RESULT_LEAGUE_ABBREVIATION_QUERY
 
-    @property
+    @memoized_property
     def league_abbreviations(self):
-        abbreviations = self.html.xpath(self.league_abbreviation_query)
+        abbreviations = self.league_abbreviation_query(self.html)
 
         if len(abbreviations) > 0:
             return abbreviations[0].text_content()
@@ -1074,13 +1055,13 @@ class PlayerSearchResult(SearchResult):
         return None
 
 
-class PlayerPageTotalsRow:
+class PlayerPageTotalsRow(DataStatRow):
     def __init__(self, html):
-        self.html = html
+        super().__init__(html)
 
     @property
     def league_abbreviation(self):
-        league_abbreviation_cells = self.html.xpath('.//td[@data-stat="lg_id"]')
+        league_abbreviation_cells = self.cells(data_stat="lg_id")
 
         if len(league_abbreviation_cells) > 0:
             return league_abbreviation_cells[0].text_content()
@@ -1101,7 +1082,7 @@ class PlayerPageTotalsTable:
     def rows(self):
         return [
             PlayerPageTotalsRow(html=row_html)
-            for row_html in self.html.xpath('.//tbody/tr')
+            for row_html in DESCENDANT_BODY_ROWS_QUERY(self.html)
         ]
 
     def __eq__(self, other):
@@ -1114,18 +1095,18 @@ class PlayerPage:
     def __init__(self, html):
         self.html = html
 
-    @property
+    @memoized_property
     def name(self):
-        name_headers = self.html.xpath('.//h1[@itemprop="name"]')
+        name_headers = PLAYER_NAME_HEADERS_QUERY(self.html)
 
         if len(name_headers) > 0:
             return name_headers[0].text_content().strip()
 
         return None
 
-    @property
+    @memoized_property
     def totals_table(self):
-        totals_tables = self.html.xpath('.//table[@id="per_game"]')
+        totals_tables = DESCENDANT_TABLE_QUERY(self.html, table_id="per_game")
 
         if len(totals_tables) > 0:
             return PlayerPageTotalsTable(html=totals_tables[0])
@@ -1140,11 +1121,11 @@ class SalariesPage:
 
     @property
     def salaries_table_query(self):
-        return '//table[@id="contracts"]'
+        return SALARIES_TABLE_QUERY
 
-    @property
+    @memoized_property
     def salaries_table(self):
-        table = self.html.xpath(self.salaries_table_query)
+        table = self.salaries_table_query(self.html)
 
         if len(table) != 1:
             return None
@@ -1160,93 +1141,55 @@ class SalariesTable:
     def rows(self):
         return [
             SalariesRow(html=row_html)
-            for row_html in self.html.xpath('.//tbody/tr')
+            for row_html in DESCENDANT_BODY_ROWS_QUERY(self.html)
         ]
     
     @property
     def currentpayroll(self):
-        foot = self.html.xpath('.//tfoot/tr/td[@data-stat="y1"]')
+        foot = CURRENT_PAYROLL_QUERY(self.html)
 
         if len(foot) > 0:
             return foot[0].text_content()
 
         return ''
 
-class SalariesRow:
+class SalariesRow(DataStatRow):
+    schema = SALARIES_SCHEMA
+
     def __init__(self, html):
-        self.html = html
+        super().__init__(html)
 
     @property
     def playername(self):
-        cells = self.html.xpath('th[@data-stat="player"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="player", tag="th")
 
     @property
     def playerage(self):
-        cells = self.html.xpath('td[@data-stat="age_today"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="age_today")
 
     @property
     def salary1(self):
-        cells = self.html.xpath('td[@data-stat="y1"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="y1")
 
     @property
     def salary2(self):
-        cells = self.html.xpath('td[@data-stat="y2"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="y2")
 
     @property
     def salary3(self):
-        cells = self.html.xpath('td[@data-stat="y3"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="y3")
 
     @property
     def salary4(self):
-        cells = self.html.xpath('td[@data-stat="y4"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="y4")
 
     @property
     def salary5(self):
-        cells = self.html.xpath('td[@data-stat="y5"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="y5")
 
     @property
     def salaryguaranteed(self):
-        cells = self.html.xpath('td[@data-stat="remain_gtd"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="remain_gtd")
     
 
 class StandingsPage:
@@ -1255,7 +1198,7 @@ class StandingsPage:
 
     @property
     def division_standings(self):
-        division_standings = self.html.xpath('.//div[@id="all_standings"]')
+        division_standings = DIVISION_STANDINGS_QUERY(self.html)
 
         if len(division_standings) == 1:
             return DivisionStandings(html=division_standings[0])
@@ -1269,7 +1212,7 @@ class DivisionStandings:
 
     @property
     def eastern_conference_table(self):
-        tables = self.html.xpath('.//table[@id="divs_standings_E"]')
+        tables = DESCENDANT_TABLE_QUERY(self.html, table_id="divs_standings_E")
 
         if len(tables) == 1:
             return ConferenceDivisionStandingsTable(html=tables[0])
@@ -1278,7 +1221,7 @@ class DivisionStandings:
 
     @property
     def western_conference_table(self):
-        tables = self.html.xpath('.//table[@id="divs_standings_W"]')
+        tables = DESCENDANT_TABLE_QUERY(self.html, table_id="divs_standings_W")
 
         if len(tables) == 1:
             return ConferenceDivisionStandingsTable(html=tables[0])
@@ -1294,13 +1237,15 @@ class ConferenceDivisionStandingsTable:
     def rows(self):
         return [
             ConferenceDivisionStandingsRow(html=row_html)
-            for row_html in self.html.xpath('.//tbody/tr')
+            for row_html in DESCENDANT_BODY_ROWS_QUERY(self.html)
         ]
 
 
-class ConferenceDivisionStandingsRow:
+class ConferenceDivisionStandingsRow(DataStatRow):
+    schema = CONFERENCE_DIVISION_STANDINGS_SCHEMA
+
     def __init__(self, html):
-        self.html = html
+        super().__init__(html)
 
     @property
     def is_division_name_row(self):
@@ -1312,7 +1257,7 @@ class ConferenceDivisionStandingsRow:
 
     @property
     def division_name(self):
-        cells = self.html.xpath('.//th')
+        cells = DESCENDANT_HEADERS_QUERY(self.html)
 
         if len(cells) == 1:
             return cells[0].text_content()
@@ -1321,7 +1266,7 @@ class ConferenceDivisionStandingsRow:
 
     @property
     def team_name(self):
-        cells = self.html.xpath('.//th[@data-stat="team_name"]')
+        cells = self.cells(data_stat="team_name", tag="th")
 
         if len(cells) == 1:
             return cells[0].text_content()
@@ -1330,7 +1275,7 @@ class ConferenceDivisionStandingsRow:
 
     @property
     def wins(self):
-        cells = self.html.xpath('.//td[@data-stat="wins"]')
+        cells = self.cells(data_stat="wins")
 
         if len(cells) == 1:
             return cells[0].text_content()
@@ -1339,7 +1284,7 @@ class ConferenceDivisionStandingsRow:
 
     @property
     def losses(self):
-        cells = self.html.xpath('.//td[@data-stat="losses"]')
+        cells = self.cells(data_stat="losses")
 
         if len(cells) == 1:
             return cells[0].text_content()
@@ -1347,13 +1292,13 @@ class ConferenceDivisionStandingsRow:
         return None
 
 
-class PlayerContractsRow:
+class PlayerContractsRow(DataStatRow):
     def __init__(self, html):
-        self.html = html
+        super().__init__(html)
 
     @property
     def player_name(self):
-        matching_cells = self.html.xpath('.//td[@data-stat="player"]')
+        matching_cells = self.cells(data_stat="player")
 
         if 1 == len(matching_cells):
             return matching_cells[0].text_content()
@@ -1362,7 +1307,7 @@ class PlayerContractsRow:
 
     @property
     def player_identifier(self):
-        matching_attribute_value = self.html.xpath('.//td/@data-append-csv')
+        matching_attribute_value = PLAYER_IDENTIFIERS_QUERY(self.html)
         if 1 == len(matching_attribute_value):
             return matching_attribute_value[0]
 
@@ -1370,7 +1315,7 @@ class PlayerContractsRow:
 
     @property
     def team_abbreviation(self):
-        matching_cells = self.html.xpath('.//td[@data-stat="team_id"]')
+        matching_cells = self.cells(data_stat="team_id")
 
         if 1 == len(matching_cells):
             return matching_cells[0].text_content()
@@ -1403,7 +1348,7 @@ class PlayerContractsRow:
 
     @property
     def guaranteed(self):
-        matching_cells = self.html.xpath('.//td[@data-stat="remain_gtd"]')
+        matching_cells = self.cells(data_stat="remain_gtd")
 
         if 1 == len(matching_cells):
             return matching_cells[0].text_content()
@@ -1411,7 +1356,7 @@ class PlayerContractsRow:
         return None
 
     def calculate_contract_year_data(self, contract_year_data_stat_attribute_value):
-        matching_cells = self.html.xpath(f'.//td[@data-stat="{contract_year_data_stat_attribute_value}"]')
+        matching_cells = self.cells(data_stat=contract_year_data_stat_attribute_value)
 
         if 1 == len(matching_cells):
             salary = matching_cells[0].text_content()
@@ -1427,11 +1372,11 @@ class TeamContractsPage:
 
     @property
     def team_contract_table_query(self):
-        return '//table[@id="team_summary"]'
+        return TEAM_CONTRACTS_TABLE_QUERY
     
-    @property
+    @memoized_property
     def teams_contract_table(self):
-        table = self.html.xpath(self.team_contract_table_query)
+        table = self.team_contract_table_query(self.html)
 
         if len(table) != 1:
             return None
@@ -1446,75 +1391,42 @@ class TeamContractsTable:
     def rows(self):
         return [
             TeamContractsRow(html=row_html)
-            for row_html in self.html.xpath('.//tbody/tr')
+            for row_html in DESCENDANT_BODY_ROWS_QUERY(self.html)
         ]
     
-class TeamContractsRow:
+class TeamContractsRow(DataStatRow):
+    schema = TEAM_CONTRACTS_SCHEMA
+
     def __init__(self, html):
-        self.html = html
+        super().__init__(html)
 
     @property
     def teamname(self):
-        cells = self.html.xpath('td[@data-stat="team_name"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="team_name")
 
     @property
     def year1(self):
-        cells = self.html.xpath('td[@data-stat="y1"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="y1")
 
     @property
     def year2(self):
-        cells = self.html.xpath('td[@data-stat="y2"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="y2")
 
     @property
     def year3(self):
-        cells = self.html.xpath('td[@data-stat="y3"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="y3")
 
     @property
     def year4(self):
-        cells = self.html.xpath('td[@data-stat="y4"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="y4")
 
     @property
     def year5(self):
-        cells = self.html.xpath('td[@data-stat="y5"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="y5")
     
     @property
     def year6(self):
-        cells = self.html.xpath('td[@data-stat="y6"]')
-
-        if len(cells) > 0:
-            return cells[0].text_content()
-
-        return ''
+        return self.cell_text(data_stat="y6")
 
 class PlayerTotalContractsPage:
     def __init__(self, html):
@@ -1522,11 +1434,11 @@ class PlayerTotalContractsPage:
 
     @property
     def player_total_contract_table_query(self):
-        return '//table[@id="player-contracts"]'
+        return PLAYER_TOTAL_CONTRACTS_TABLE_QUERY
 
-    @property
+    @memoized_property
     def player_total_contract_table(self):
-        table = self.html.xpath(self.player_total_contract_table_query)
+        table = self.player_total_contract_table_query(self.html)
 
         if len(table) != 1:
             return None
@@ -1537,20 +1449,28 @@ class PlayerTotalContractsTable:
     def __init__(self, html):
         self.html = html
 
+    @staticmethod
+    def stream_rows(chunks):
+        for row_html in iter_table_rows(chunks=chunks, table_id="player-contracts"):
+            if row_html.getparent().tag == "tbody":
+                yield PlayerTotalContractsRow(html=row_html)
+
     @property
     def rows(self):
         return [
             PlayerTotalContractsRow(html=row_html)
-            for row_html in self.html.xpath('.//tbody/tr')
+            for row_html in DESCENDANT_BODY_ROWS_QUERY(self.html)
         ]
 
-class PlayerTotalContractsRow:
+class PlayerTotalContractsRow(DataStatRow):
+    schema = PLAYER_TOTAL_CONTRACTS_SCHEMA
+
     def __init__(self, html):
-        self.html = html
+        super().__init__(html)
 
     @property
     def playername(self):
-        cells = self.html.xpath('td[@data-stat="player"]')
+        cells = self.cells(data_stat="player")
         if len(cells) > 0:
             return cells[0].text_content().strip()
         return ''
@@ -1581,7 +1501,7 @@ class PlayerTotalContractsRow:
 
     @property
     def salaryguaranteed(self):
-        cells = self.html.xpath('td[@data-stat="remain_gtd"]')
+        cells = self.cells(data_stat="remain_gtd")
         if len(cells) > 0:
             return cells[0].text_content().strip()
         return ''
@@ -1591,7 +1511,7 @@ class PlayerTotalContractsRow:
         return self.extract_option("salary-pl")
 
     def get_salary_with_option(self, year_stat):
-        cells = self.html.xpath(f'td[@data-stat="{year_stat}"]')
+        cells = self.cells(data_stat=year_stat)
         if len(cells) > 0:
             cell_class = cells[0].get('class', '')
             salary = cells[0].text_content().strip()
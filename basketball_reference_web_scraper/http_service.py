@@ -1,34 +1,254 @@
+import itertools
+import re
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+import pytz
 import requests
 from lxml import html
+from requests.adapters import HTTPAdapter
 
-from basketball_reference_web_scraper.data import TEAM_TO_TEAM_ABBREVIATION, TeamTotal, PlayerData
-from basketball_reference_web_scraper.errors import InvalidDate, InvalidPlayerAndSeason
+from basketball_reference_web_scraper.cache import current_season_end_year, SEASON_START_MONTH
+from basketball_reference_web_scraper.data import TEAM_TO_TEAM_ABBREVIATION, TeamTotal, PlayerData, PartialResults
+from basketball_reference_web_scraper.errors import InvalidDate, InvalidPlayerAndSeason, GameBoxScoreError, InvalidSeason
 from basketball_reference_web_scraper.html import DailyLeadersPage, PlayerSeasonBoxScoresPage, PlayerSeasonTotalTable, \
     PlayerAdvancedSeasonTotalsTable, PlayByPlayPage, SchedulePage, BoxScoresPage, DailyBoxScoresPage, SearchPage, \
-    PlayerPage, StandingsPage, SalariesPage, TeamContractsPage, PlayerTotalContractsPage
+    PlayerPage, StandingsPage, SalariesPage, TeamContractsPage, PlayerTotalContractsTable, parse_table_or_document, content_chunks
+from basketball_reference_web_scraper.rate_limiter import RateLimitedSession
+from basketball_reference_web_scraper.utilities import SingleFlight
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_KEEP_ALIVE = True
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_PREFETCH_DAYS = 2
+
+# Basketball Reference schedules list start times in Eastern Time, which is the time zone its daily pages use for dates
+SCHEDULE_TIME_ZONE = pytz.timezone("US/Eastern")
+
+# Monthly schedule pages are named like NBA_2018_games-november.html, with the calendar year appended when a season has
+# two pages for the same month (like the 2020 season's NBA_2020_games-october-2019.html)
+SCHEDULE_MONTH_URL_PATH_PATTERN = re.compile(r"_games-(?P<month>[a-z]+)(?:-(?P<year>\d{4}))?\.html$")
+SCHEDULE_MONTHS = [
+    "january", "february", "march", "april", "may", "june",
+    "july", "august", "september", "october", "november", "december",
+]
+
+_default_session = None
+_default_session_lock = threading.Lock()
+_default_cache = None
+_default_rate_limiter = None
+_default_cassette = None
+# Shared by all HTTPService instances so that concurrent client calls for the same page make a single request (see
+# HTTPService.response_source)
+_in_flight_requests = SingleFlight()
+
+
+def create_session(pool_connections=DEFAULT_POOL_CONNECTIONS, pool_maxsize=DEFAULT_POOL_MAXSIZE,
+                   keep_alive=DEFAULT_KEEP_ALIVE, headers=None):
+    session = requests.Session()
+    # A single adapter is mounted for both schemes so that every host shares the same pool configuration
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+    if not keep_alive:
+        session.headers["Connection"] = "close"
+
+    if headers is not None:
+        session.headers.update(headers)
+
+    return session
+
+
+def default_session():
+    global _default_session
+
+    with _default_session_lock:
+        if _default_session is None:
+            _default_session = create_session()
+
+        return _default_session
+
+
+def configure_default_session(pool_connections=DEFAULT_POOL_CONNECTIONS, pool_maxsize=DEFAULT_POOL_MAXSIZE,
+                              keep_alive=DEFAULT_KEEP_ALIVE, headers=None):
+    global _default_session
+
+    session = create_session(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        keep_alive=keep_alive,
+        headers=headers,
+    )
+
+    with _default_session_lock:
+        previous_session = _default_session
+        _default_session = session
+
+    if previous_session is not None:
+        previous_session.close()
+
+    return session
+
+
+def default_cache():
+    return _default_cache
+
+
+def configure_default_cache(cache):
+    # Passing None disables caching for HTTPService instances that aren't given their own cache
+    global _default_cache
+
+    previous_cache = _default_cache
+    _default_cache = cache
+
+    if previous_cache is not None and previous_cache is not cache:
+        previous_cache.close()
+
+    return cache
+
+
+def default_rate_limiter():
+    return _default_rate_limiter
+
+
+def configure_default_rate_limiter(rate_limiter):
+    # Passing None disables rate limiting for HTTPService instances that aren't given their own rate limiter
+    global _default_rate_limiter
+
+    _default_rate_limiter = rate_limiter
+
+    return rate_limiter
+
+
+def default_cassette():
+    return _default_cassette
+
+
+def configure_default_cassette(cassette):
+    # Passing None stops recording or replaying for HTTPService instances that aren't given their own cassette
+    global _default_cassette
+
+    _default_cassette = cassette
+
+    return cassette
+
+
+def schedule_month_overlaps(month_url_path, season_end_year, start_date, end_date):
+    match = SCHEDULE_MONTH_URL_PATH_PATTERN.search(month_url_path)
+    if match is None or match.group("month") not in SCHEDULE_MONTHS:
+        # Pages whose month can't be determined are always fetched
+        return True
+
+    month = SCHEDULE_MONTHS.index(match.group("month")) + 1
+    if match.group("year") is not None:
+        year = int(match.group("year"))
+    elif month >= SEASON_START_MONTH:
+        year = season_end_year - 1
+    else:
+        year = season_end_year
+
+    first_day = date(year, month, 1)
+    last_day = date(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return first_day <= end_date and start_date <= last_day
 
 
 class HTTPService:
     BASE_URL = 'https://www.basketball-reference.com'
 
-    def __init__(self, parser):
+    def __init__(self, parser, session=None, max_workers=DEFAULT_MAX_WORKERS, cache=None, rate_limiter=None,
+                 cassette=None):
         self.parser = parser
+        session = default_session() if session is None else session
+        self.session = session
+        self.max_workers = max_workers
+        self.cache = default_cache() if cache is None else cache
+        self.rate_limiter = default_rate_limiter() if rate_limiter is None else rate_limiter
+
+        # Rate limiting is applied underneath the cache so that cached pages don't count against the limit
+        if self.rate_limiter is not None:
+            self.session = RateLimitedSession(session=self.session, rate_limiter=self.rate_limiter)
+
+        # The cassette wraps the rate limiter so that replayed requests are never delayed, and so that the recorded
+        # responses are the ones returned after any throttled requests were retried
+        self.cassette = default_cassette() if cassette is None else cassette
+        if self.cassette is not None:
+            self.session = self.cassette.session(session=self.session)
+
+        # Concurrent requests for the same page are only shared by HTTPService instances that would get the same response
+        # for them, from the same session, cache and cassette (the rate limiter only delays requests)
+        self.response_source = (session, self.cache, self.cassette)
+
+    def get(self, url, params=None, allow_redirects=True):
+        if self.cache is not None:
+            return self.cache.get(session=self.session, url=url, params=params, allow_redirects=allow_redirects)
+
+        return self.session.get(url=url, params=params, allow_redirects=allow_redirects)
+
+    def map_concurrently(self, function, values):
+        # Results are returned in the same order as the values, regardless of the order requests complete in
+        if self.max_workers <= 1 or len(values) <= 1:
+            return [function(value) for value in values]
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(values))) as executor:
+            return list(executor.map(function, values))
+
+    def map_ahead(self, function, values, prefetch):
+        # Lazily yields results in the same order as the values, while up to `prefetch` of the following values are
+        # processed in the background
+        values = iter(values)
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, prefetch))) as executor:
+            pending = deque()
+            try:
+                for value in values:
+                    pending.append(executor.submit(function, value))
+                    if len(pending) > prefetch:
+                        break
+
+                while pending:
+                    result = pending.popleft().result()
+                    next_value = next(values, None)
+                    if next_value is not None:
+                        pending.append(executor.submit(function, next_value))
+
+                    yield result
+            finally:
+                # If the caller stops iterating early, values that haven't started being processed are abandoned
+                for future in pending:
+                    future.cancel()
 
     def standings(self, season_end_year):
+        return list(self.iter_standings(season_end_year=season_end_year))
+
+    def iter_standings(self, season_end_year):
         url = '{BASE_URL}/leagues/NBA_{season_end_year}.html'.format(
             BASE_URL=HTTPService.BASE_URL,
             season_end_year=season_end_year,
         )
 
-        response = requests.get(url=url, allow_redirects=False)
+        response = self.get(url=url, allow_redirects=False)
 
         response.raise_for_status()
 
         page = StandingsPage(html=html.fromstring(response.content))
-        return self.parser.parse_division_standings(standings=page.division_standings.eastern_conference_table.rows) + \
-               self.parser.parse_division_standings(standings=page.division_standings.western_conference_table.rows)
+        yield from self.parser.iter_division_standings(standings=page.division_standings.eastern_conference_table.rows)
+        yield from self.parser.iter_division_standings(standings=page.division_standings.western_conference_table.rows)
+
+    def player_box_scores(self, day, month, year, columnar=False):
+        if columnar:
+            page = self.daily_leaders_page(day=day, month=month, year=year)
+            return self.parser.parse_player_box_scores_columns(box_scores=page.daily_leaders)
 
-    def player_box_scores(self, day, month, year):
+        return list(self.iter_player_box_scores(day=day, month=month, year=year))
+
+    def iter_player_box_scores(self, day, month, year):
+        page = self.daily_leaders_page(day=day, month=month, year=year)
+        yield from self.parser.iter_player_box_scores(box_scores=page.daily_leaders)
+
+    def daily_leaders_page(self, day, month, year):
         url = '{BASE_URL}/friv/dailyleaders.cgi?month={month}&day={day}&year={year}'.format(
             BASE_URL=HTTPService.BASE_URL,
             day=day,
@@ -36,17 +256,16 @@ class HTTPService:
             year=year
         )
 
-        response = requests.get(url=url, allow_redirects=False)
+        response = self.get(url=url, allow_redirects=False)
 
         response.raise_for_status()
 
         if response.status_code == requests.codes.ok:
-            page = DailyLeadersPage(html=html.fromstring(response.content))
-            return self.parser.parse_player_box_scores(box_scores=page.daily_leaders)
+            return DailyLeadersPage(html=html.fromstring(response.content))
 
         raise InvalidDate(day=day, month=month, year=year)
 
-    def regular_season_player_box_scores(self, player_identifier, season_end_year, include_inactive_games=False):
+    def player_season_box_scores_page(self, player_identifier, season_end_year):
         # Makes assumption that basketball reference pattern of breaking out player pathing using first character of
         # surname can be derived from the fact that basketball reference also has a pattern of player identifiers
         # starting with first few characters of player's surname
@@ -58,37 +277,106 @@ class HTTPService:
             season_end_year=season_end_year,
         )
 
-        response = requests.get(url=url, allow_redirects=False)
+        # The regular season and playoff box scores are on the same page, so concurrent requests for both share a fetch
+        response = _in_flight_requests.do(
+            key=(url, self.response_source),
+            function=lambda: self.get(url=url, allow_redirects=False),
+        )
         response.raise_for_status()
 
-        page = PlayerSeasonBoxScoresPage(html=html.fromstring(response.content))
-        if page.regular_season_box_scores_table is None:
-            raise InvalidPlayerAndSeason(player_identifier=player_identifier, season_end_year=season_end_year)
+        return PlayerSeasonBoxScoresPage(content=response.content)
 
-        return self.parser.parse_player_season_box_scores(box_scores=page.regular_season_box_scores_table.rows, include_inactive_games=include_inactive_games)
+    def regular_season_player_box_scores(self, player_identifier, season_end_year, include_inactive_games=False,
+                                         columnar=False):
+        if columnar:
+            page = self.player_season_box_scores_page(
+                player_identifier=player_identifier,
+                season_end_year=season_end_year,
+            )
+            if page.regular_season_box_scores_table is None:
+                raise InvalidPlayerAndSeason(player_identifier=player_identifier, season_end_year=season_end_year)
 
-    def playoff_player_box_scores(self, player_identifier, season_end_year, include_inactive_games=False):
-        # Makes assumption that basketball reference pattern of breaking out player pathing using first character of
-        # surname can be derived from the fact that basketball reference also has a pattern of player identifiers
-        # starting with first few characters of player's surname
-        url = '{BASE_URL}/players/{player_surname_starting_character}/{player_identifier}/gamelog/{season_end_year}' \
-            .format(
-            BASE_URL=HTTPService.BASE_URL,
-            player_surname_starting_character=player_identifier[0],
+            return self.parser.parse_player_season_box_scores_columns(
+                box_scores=page.regular_season_box_scores_table.rows,
+                include_inactive_games=include_inactive_games,
+            )
+
+        return list(self.iter_regular_season_player_box_scores(
             player_identifier=player_identifier,
             season_end_year=season_end_year,
+            include_inactive_games=include_inactive_games,
+        ))
+
+    def iter_regular_season_player_box_scores(self, player_identifier, season_end_year, include_inactive_games=False):
+        page = self.player_season_box_scores_page(player_identifier=player_identifier, season_end_year=season_end_year)
+        if page.regular_season_box_scores_table is None:
+            raise InvalidPlayerAndSeason(player_identifier=player_identifier, season_end_year=season_end_year)
+
+        yield from self.parser.iter_player_season_box_scores(
+            box_scores=page.regular_season_box_scores_table.rows,
+            include_inactive_games=include_inactive_games,
         )
 
-        response = requests.get(url=url, allow_redirects=False)
-        response.raise_for_status()
+    def playoff_player_box_scores(self, player_identifier, season_end_year, include_inactive_games=False,
+                                  columnar=False):
+        if columnar:
+            page = self.player_season_box_scores_page(
+                player_identifier=player_identifier,
+                season_end_year=season_end_year,
+            )
+            if page.playoff_box_scores_table is None:
+                raise InvalidPlayerAndSeason(player_identifier=player_identifier, season_end_year=season_end_year)
 
-        page = PlayerSeasonBoxScoresPage(html=html.fromstring(response.content))
+            return self.parser.parse_player_season_box_scores_columns(
+                box_scores=page.playoff_box_scores_table.rows,
+                include_inactive_games=include_inactive_games,
+            )
+
+        return list(self.iter_playoff_player_box_scores(
+            player_identifier=player_identifier,
+            season_end_year=season_end_year,
+            include_inactive_games=include_inactive_games,
+        ))
+
+    def iter_playoff_player_box_scores(self, player_identifier, season_end_year, include_inactive_games=False):
+        page = self.player_season_box_scores_page(player_identifier=player_identifier, season_end_year=season_end_year)
         if page.playoff_box_scores_table is None:
             raise InvalidPlayerAndSeason(player_identifier=player_identifier, season_end_year=season_end_year)
 
-        return self.parser.parse_player_season_box_scores(box_scores=page.playoff_box_scores_table.rows, include_inactive_games=include_inactive_games)
+        yield from self.parser.iter_player_season_box_scores(
+            box_scores=page.playoff_box_scores_table.rows,
+            include_inactive_games=include_inactive_games,
+        )
+
+    def player_season_box_scores(self, player_identifier, season_end_year, include_playoffs=True,
+                                 include_inactive_games=False):
+        page = self.player_season_box_scores_page(player_identifier=player_identifier, season_end_year=season_end_year)
+        regular_season_box_scores_table = page.regular_season_box_scores_table
+        if regular_season_box_scores_table is None:
+            raise InvalidPlayerAndSeason(player_identifier=player_identifier, season_end_year=season_end_year)
+
+        box_scores = {
+            "regular_season": self.parser.parse_player_season_box_scores(
+                box_scores=regular_season_box_scores_table.rows,
+                include_inactive_games=include_inactive_games,
+            ),
+        }
+
+        if include_playoffs:
+            # Players that didn't make the playoffs don't have a playoff box scores table
+            playoff_box_scores_table = page.playoff_box_scores_table
+            box_scores["playoffs"] = [] if playoff_box_scores_table is None else \
+                self.parser.parse_player_season_box_scores(
+                    box_scores=playoff_box_scores_table.rows,
+                    include_inactive_games=include_inactive_games,
+                )
+
+        return box_scores
 
     def play_by_play(self, home_team, day, month, year):
+        return list(self.iter_play_by_play(home_team=home_team, day=day, month=month, year=year))
+
+    def iter_play_by_play(self, home_team, day, month, year):
         add_0_if_needed = lambda s: "0" + s if len(s) == 1 else s
 
         # the hard-coded `0` in the url assumes we always take the first match of the given date and team.
@@ -96,115 +384,258 @@ class HTTPService:
             BASE_URL=HTTPService.BASE_URL, year=year, month=add_0_if_needed(str(month)), day=add_0_if_needed(str(day)),
             team_abbr=TEAM_TO_TEAM_ABBREVIATION[home_team]
         )
-        response = requests.get(url=url)
+        response = self.get(url=url)
         response.raise_for_status()
 
         page = PlayByPlayPage(html=html.fromstring(response.content))
 
-        return self.parser.parse_play_by_plays(
+        yield from self.parser.iter_play_by_plays(
             play_by_plays=page.play_by_play_table.rows,
             away_team_name=page.away_team_name,
             home_team_name=page.home_team_name,
         )
 
-    def players_advanced_season_totals(self, season_end_year, include_combined_values=False):
+    def players_advanced_season_totals(self, season_end_year, include_combined_values=False, columnar=False):
+        if columnar:
+            table = self.players_advanced_season_totals_table(season_end_year=season_end_year)
+            return self.parser.parse_player_advanced_season_totals_columns(
+                totals_html=table.rows_html,
+                include_combined_totals=include_combined_values,
+            )
+
+        return list(self.iter_players_advanced_season_totals(
+            season_end_year=season_end_year,
+            include_combined_values=include_combined_values,
+        ))
+
+    def iter_players_advanced_season_totals(self, season_end_year, include_combined_values=False):
+        table = self.players_advanced_season_totals_table(season_end_year=season_end_year)
+        yield from self.parser.iter_player_advanced_season_totals(totals=table.get_rows(include_combined_values))
+
+    def players_advanced_season_totals_table(self, season_end_year):
         url = '{BASE_URL}/leagues/NBA_{season_end_year}_advanced.html'.format(
             BASE_URL=HTTPService.BASE_URL,
             season_end_year=season_end_year,
         )
 
-        response = requests.get(url=url)
+        response = self.get(url=url)
 
         response.raise_for_status()
 
-        table = PlayerAdvancedSeasonTotalsTable(html=html.fromstring(response.content))
-        return self.parser.parse_player_advanced_season_totals_parser(totals=table.get_rows(include_combined_values))
+        return PlayerAdvancedSeasonTotalsTable(
+            html=parse_table_or_document(content=response.content, table_id="advanced_stats"),
+        )
+
+    def players_season_totals(self, season_end_year, columnar=False):
+        if columnar:
+            response = self.players_season_totals_response(season_end_year=season_end_year)
+            table = PlayerSeasonTotalTable(
+                html=parse_table_or_document(content=response.content, table_id="totals_stats"),
+            )
+            return self.parser.parse_player_season_totals_columns(totals_html=table.rows_html)
+
+        return list(self.iter_players_season_totals(season_end_year=season_end_year))
+
+    def iter_players_season_totals(self, season_end_year):
+        response = self.players_season_totals_response(season_end_year=season_end_year)
 
-    def players_season_totals(self, season_end_year):
+        # Each row is parsed before the next one is read, since rows are released as the table is streamed
+        for row in PlayerSeasonTotalTable.stream_rows(chunks=content_chunks(content=response.content)):
+            yield from self.parser.iter_player_season_totals(totals=[row])
+
+    def players_season_totals_response(self, season_end_year):
         url = '{BASE_URL}/leagues/NBA_{season_end_year}_totals.html'.format(
             BASE_URL=HTTPService.BASE_URL,
             season_end_year=season_end_year,
         )
 
-        response = requests.get(url=url)
+        response = self.get(url=url)
 
         response.raise_for_status()
 
-        table = PlayerSeasonTotalTable(html=html.fromstring(response.content))
-        return self.parser.parse_player_season_totals(totals=table.rows)
+        return response
 
     def schedule_for_month(self, url):
-        response = requests.get(url=url)
+        return list(self.iter_schedule_for_month(url=url))
 
-        response.raise_for_status()
+    def iter_schedule_for_month(self, url):
+        response = self.get(url=url)
 
-        page = SchedulePage(html=html.fromstring(html=response.content))
-        return self.parser.parse_scheduled_games(games=page.rows)
+        response.raise_for_status()
 
+        page = SchedulePage(html=parse_table_or_document(content=response.content, table_id="schedule"))
+        yield from self.parser.iter_scheduled_games(games=page.rows)
 
     def player_salaries(self, team):
+        return list(self.iter_player_salaries(team=team))
+
+    def iter_player_salaries(self, team):
         url = '{BASE_URL}/contracts/{team_abbr}.html'.format(
             BASE_URL=HTTPService.BASE_URL,
             team_abbr=TEAM_TO_TEAM_ABBREVIATION[team]
         )
 
-        response = requests.get(url=url)
+        response = self.get(url=url)
 
         response.raise_for_status()
 
-        page = SalariesPage(html=html.fromstring(html=response.content))
-
-        return self.parser.parse_player_salaries(salaries=page.salaries_table.rows)
+        page = SalariesPage(html=parse_table_or_document(content=response.content, table_id="contracts"))
 
+        yield from self.parser.iter_player_salaries(salaries=page.salaries_table.rows)
 
     def team_contracts(self):
+        contracts = list(self.iter_team_contracts())
+        # There aren't any team contracts if the page doesn't have a team summary table
+        return contracts if contracts else None
+
+    def iter_team_contracts(self):
         url = '{BASE_URL}/contracts/'.format(
             BASE_URL=HTTPService.BASE_URL
         )
-        response = requests.get(url=url)
+        response = self.get(url=url)
         response.raise_for_status()
 
-        page = TeamContractsPage(html=html.fromstring(response.content))
-    
+        page = TeamContractsPage(html=parse_table_or_document(content=response.content, table_id="team_summary"))
+
         if page.teams_contract_table:
-            return self.parser.parse_team_contracts(contracts=page.teams_contract_table.rows)
+            yield from self.parser.iter_team_contracts(contracts=page.teams_contract_table.rows)
 
-    def total_player_contracts(self):
-        url = '{BASE_URL}/contracts/players.html'.format(BASE_URL=HTTPService.BASE_URL
-        )
-        response = requests.get(url=url)
-        response.raise_for_status()
+    def total_player_contracts(self, columnar=False):
+        if columnar:
+            # The matrix is built in a single pass over the streamed rows - each row is read before the next one is
+            rows = PlayerTotalContractsTable.stream_rows(
+                chunks=content_chunks(content=self.total_player_contracts_response().content),
+            )
+            return self.parser.parse_total_player_contracts_matrix(contracts_html=(row.html for row in rows))
+
+        return list(self.iter_total_player_contracts())
 
-        page = PlayerTotalContractsPage(html=html.fromstring(response.content))
+    def iter_total_player_contracts(self):
+        response = self.total_player_contracts_response()
 
-        return self.parser.parse_total_player_contracts(page.player_total_contract_table.rows)
+        # Each row is parsed before the next one is read, since rows are released as the table is streamed
+        for row in PlayerTotalContractsTable.stream_rows(chunks=content_chunks(content=response.content)):
+            yield from self.parser.iter_total_player_contracts([row])
 
+    def total_player_contracts_response(self):
+        url = '{BASE_URL}/contracts/players.html'.format(BASE_URL=HTTPService.BASE_URL)
+        response = self.get(url=url)
+        response.raise_for_status()
 
+        return response
 
     def season_schedule(self, season_end_year):
+        return list(self.iter_season_schedule(season_end_year=season_end_year))
+
+    def iter_season_schedule(self, season_end_year, start_date=None, end_date=None):
+        # When start_date and end_date are given, only the other months' pages that overlap them are fetched (the
+        # games of the season's first month are always returned, since they're on the season's page)
         url = '{BASE_URL}/leagues/NBA_{season_end_year}_games.html'.format(
             BASE_URL=HTTPService.BASE_URL,
             season_end_year=season_end_year
         )
 
-        response = requests.get(url=url)
+        response = self.get(url=url)
 
         response.raise_for_status()
 
         page = SchedulePage(html=html.fromstring(html=response.content))
-        season_schedule_values = self.parser.parse_scheduled_games(games=page.rows)
+        other_months_schedule_urls = page.other_months_schedule_urls
+        if start_date is not None and end_date is not None:
+            other_months_schedule_urls = [
+                month_url_path
+                for month_url_path in other_months_schedule_urls
+                if schedule_month_overlaps(
+                    month_url_path=month_url_path,
+                    season_end_year=season_end_year,
+                    start_date=start_date,
+                    end_date=end_date,
+                )
+            ]
+
+        yield from self.parser.iter_scheduled_games(games=page.rows)
+
+        # The other months' links are listed in calendar order, so the monthly schedules are yielded in that order,
+        # while the following months are fetched in the background
+        yield from itertools.chain.from_iterable(self.map_ahead(
+            lambda month_url_path: self.schedule_for_month(
+                url='{BASE_URL}{month_url_path}'.format(BASE_URL=HTTPService.BASE_URL, month_url_path=month_url_path)
+            ),
+            other_months_schedule_urls,
+            prefetch=self.max_workers,
+        ))
+
+    def season_game_dates(self, season_end_year):
+        try:
+            games = self.season_schedule(season_end_year=season_end_year)
+        except requests.exceptions.HTTPError as http_error:
+            if http_error.response.status_code == requests.codes.not_found:
+                raise InvalidSeason(season_end_year=season_end_year)
+            raise http_error
+
+        return set(game["start_time"].astimezone(SCHEDULE_TIME_ZONE).date() for game in games)
+
+    def season_game_dates_between(self, season_end_year, start_date, end_date):
+        try:
+            games = list(self.iter_season_schedule(
+                season_end_year=season_end_year,
+                start_date=start_date,
+                end_date=end_date,
+            ))
+        except requests.exceptions.HTTPError as http_error:
+            # The schedule of a season that hasn't been published yet doesn't have any game dates
+            if http_error.response.status_code == requests.codes.not_found:
+                return set()
+            raise http_error
+
+        game_dates = (game["start_time"].astimezone(SCHEDULE_TIME_ZONE).date() for game in games)
+        return set(game_date for game_date in game_dates if start_date <= game_date <= end_date)
+
+    def game_dates(self, start_date, end_date):
+        # Seasons don't always end before the next calendar year's season start month (like the 2020 season that was
+        # finished in October), so the season ending in the start date's year is always checked. Seasons are fetched
+        # one at a time, so the first dates are yielded before the following seasons' schedules are requested.
+        for season_end_year in range(start_date.year, current_season_end_year(today=end_date) + 1):
+            yield from sorted(self.season_game_dates_between(
+                season_end_year=season_end_year,
+                start_date=start_date,
+                end_date=end_date,
+            ))
+
+    def dates(self, start_date, end_date, skip_off_days=True):
+        if skip_off_days:
+            return self.game_dates(start_date=start_date, end_date=end_date)
+
+        return (start_date + timedelta(days=offset) for offset in range((end_date - start_date).days + 1))
+
+    def daily_player_box_scores(self, date):
+        try:
+            return date, self.player_box_scores(day=date.day, month=date.month, year=date.year)
+        except InvalidDate:
+            # Basketball Reference redirects from the daily leaders page for days without any games
+            return date, []
+
+    def player_box_scores_range(self, start_date, end_date, skip_off_days=True, prefetch=DEFAULT_PREFETCH_DAYS):
+        return self.map_ahead(
+            self.daily_player_box_scores,
+            self.dates(start_date=start_date, end_date=end_date, skip_off_days=skip_off_days),
+            prefetch=prefetch,
+        )
 
-        for month_url_path in page.other_months_schedule_urls:
-            url = '{BASE_URL}{month_url_path}'.format(BASE_URL=HTTPService.BASE_URL, month_url_path=month_url_path)
-            monthly_schedule = self.schedule_for_month(url=url)
-            season_schedule_values.extend(monthly_schedule)
+    def daily_team_box_scores(self, date):
+        return date, self.team_box_scores(day=date.day, month=date.month, year=date.year)
 
-        return season_schedule_values
+    def team_box_scores_range(self, start_date, end_date, skip_off_days=True, prefetch=DEFAULT_PREFETCH_DAYS):
+        return self.map_ahead(
+            self.daily_team_box_scores,
+            self.dates(start_date=start_date, end_date=end_date, skip_off_days=skip_off_days),
+            prefetch=prefetch,
+        )
 
     def team_box_score(self, game_url_path):
         url = "{BASE_URL}/{game_url_path}".format(BASE_URL=HTTPService.BASE_URL, game_url_path=game_url_path)
 
-        response = requests.get(url=url)
+        response = self.get(url=url)
 
         response.raise_for_status()
 
@@ -222,35 +653,50 @@ class HTTPService:
     def team_box_scores(self, day, month, year):
         url = "{BASE_URL}/boxscores/".format(BASE_URL=HTTPService.BASE_URL)
 
-        response = requests.get(url=url, params={"day": day, "month": month, "year": year})
+        response = self.get(url=url, params={"day": day, "month": month, "year": year})
 
         response.raise_for_status()
 
         page = DailyBoxScoresPage(html=html.fromstring(response.content))
+        game_results = self.map_concurrently(self.isolated_team_box_score, page.game_url_paths)
+
+        return PartialResults(
+            values=[
+                box_score
+                for box_scores, _ in game_results
+                if box_scores is not None
+                for box_score in box_scores
+            ],
+            errors=[error for _, error in game_results if error is not None],
+        )
 
-        return [
-            box_score
-            for game_url_path in page.game_url_paths
-            for box_score in self.team_box_score(game_url_path=game_url_path)
-        ]
+    def isolated_team_box_score(self, game_url_path):
+        # A single game failing to be fetched (or parsed, like a malformed page) shouldn't prevent the box scores for
+        # the other games from being returned
+        try:
+            return self.team_box_score(game_url_path=game_url_path), None
+        except Exception as error:
+            return None, GameBoxScoreError(game_url_path=game_url_path, error=error)
 
     def search(self, term):
-        response = requests.get(
+        return {
+            "players": list(self.iter_search(term=term))
+        }
+
+    def iter_search(self, term):
+        response = self.get(
             url="{BASE_URL}/search/search.fcgi".format(BASE_URL=HTTPService.BASE_URL),
             params={"search": term}
         )
 
         response.raise_for_status()
 
-        player_results = []
-
         if response.url.startswith("{BASE_URL}/search/search.fcgi".format(BASE_URL=HTTPService.BASE_URL)):
             page = SearchPage(html=html.fromstring(response.content))
-            parsed_results = self.parser.parse_player_search_results(nba_aba_baa_players=page.nba_aba_baa_players)
-            player_results += parsed_results["players"]
+            yield from self.parser.iter_player_search_results(nba_aba_baa_players=page.nba_aba_baa_players)
 
             while page.nba_aba_baa_players_pagination_url is not None:
-                response = requests.get(
+                response = self.get(
                     url="{BASE_URL}/search/{pagination_url}".format(
                         BASE_URL=HTTPService.BASE_URL,
                         pagination_url=page.nba_aba_baa_players_pagination_url
@@ -261,8 +707,7 @@ class HTTPService:
 
                 page = SearchPage(html=html.fromstring(response.content))
 
-                parsed_results = self.parser.parse_player_search_results(nba_aba_baa_players=page.nba_aba_baa_players)
-                player_results += parsed_results["players"]
+                yield from self.parser.iter_player_search_results(nba_aba_baa_players=page.nba_aba_baa_players)
 
         elif response.url.startswith("{BASE_URL}/players".format(BASE_URL=HTTPService.BASE_URL)):
             page = PlayerPage(html=html.fromstring(response.content))
@@ -275,9 +720,4 @@ class HTTPService:
                     if row.league_abbreviation is not None
                 ])
             )
-            player_results += [self.parser.parse_player_data(player=data)]
-
-        return {
-            "players": player_results
-        }
-
+            yield self.parser.parse_player_data(player=data)
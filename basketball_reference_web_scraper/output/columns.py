@@ -27,6 +27,11 @@ BOX_SCORE_COLUMN_NAMES = ["slug", "name"] + SHARED_COLUMN_NAMES
 
 PLAYER_SEASON_BOX_SCORE_COLUMN_NAMES = ["active", "date", "points_scored", "plus_minus"] + SHARED_COLUMN_NAMES
 
+COMBINED_PLAYER_SEASON_BOX_SCORE_COLUMN_NAMES = ["playoffs"] + PLAYER_SEASON_BOX_SCORE_COLUMN_NAMES
+
+BULK_PLAYER_SEASON_BOX_SCORE_COLUMN_NAMES = ["player_identifier", "season_end_year"] + \
+                                            COMBINED_PLAYER_SEASON_BOX_SCORE_COLUMN_NAMES
+
 SCHEDULE_COLUMN_NAMES = [
     "start_time",
     "away_team",
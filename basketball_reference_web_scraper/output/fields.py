@@ -8,11 +8,15 @@ class FieldFormatter:
     def can_format(data):
         raise NotImplementedError()
 
+    @staticmethod
+    def format_data(data):
+        raise NotImplementedError()
+
     def __init__(self, data):
         self.data = data
 
     def format(self):
-        raise NotImplementedError
+        return self.format_data(self.data)
 
 
 class EnumFormatter(FieldFormatter):
@@ -20,8 +24,9 @@ class EnumFormatter(FieldFormatter):
     def can_format(data):
         return isinstance(data, Enum)
 
-    def format(self):
-        return self.data.value
+    @staticmethod
+    def format_data(data):
+        return data.value
 
 
 class ListFormatter(FieldFormatter):
@@ -29,8 +34,9 @@ class ListFormatter(FieldFormatter):
     def can_format(data):
         return isinstance(data, list)
 
-    def format(self):
-        return "-".join(map(lambda value: format_value(value=value), self.data))
+    @staticmethod
+    def format_data(data):
+        return "-".join([format_value(value=value) for value in data])
 
 
 class SetFormatter(FieldFormatter):
@@ -38,8 +44,9 @@ class SetFormatter(FieldFormatter):
     def can_format(data):
         return isinstance(data, set)
 
-    def format(self):
-        return ListFormatter(data=list(self.data)).format()
+    @staticmethod
+    def format_data(data):
+        return ListFormatter.format_data(list(data))
 
 
 FORMATTER_CLASSES = [
@@ -47,18 +54,76 @@ FORMATTER_CLASSES = [
     ListFormatter,
     SetFormatter,
 ]
+# The formatting function of each type of value that's been formatted (None for values that are left as they are). Every
+# formatter class checks the value's type, so values of the same type always have the same formatter.
+FORMATTERS_BY_TYPE = {}
+
+
+def formatter_for(value):
+    value_type = type(value)
+    try:
+        return FORMATTERS_BY_TYPE[value_type]
+    except KeyError:
+        formatter_class = next(
+            (formatter_class for formatter_class in FORMATTER_CLASSES if formatter_class.can_format(value)),
+            None,
+        )
+        formatter = None if formatter_class is None else formatter_class.format_data
+        FORMATTERS_BY_TYPE[value_type] = formatter
+        return formatter
 
 
 def format_value(value):
-    formatter_class = next(
-        (formatter_class for formatter_class in FORMATTER_CLASSES if formatter_class.can_format(value)),
-        None,
-    )
+    formatter = formatter_for(value)
 
-    if formatter_class is None:
+    if formatter is None:
         return value
 
-    return formatter_class(data=value).format()
+    return formatter(value)
+
+
+class ColumnFormatter:
+    """
+    Formats the values of a column (like format_value), with the formatter resolved from the column's first non-null
+    value and reused for every value of the same type - values of other types are formatted by the fallback formatter.
+
+    Formatters other than format_value are called for every non-null value.
+    """
+
+    def __init__(self, fallback_formatter=format_value):
+        self.fallback_formatter = fallback_formatter
+        self.value_type = None
+        self.formatter = None
+
+    def resolve(self, value):
+        self.value_type = type(value)
+        if self.fallback_formatter is format_value:
+            self.formatter = formatter_for(value)
+        else:
+            self.formatter = self.fallback_formatter
+
+    def format(self, values):
+        if self.value_type is None:
+            first_value = next((value for value in values if value is not None), None)
+            if first_value is None:
+                return values
+
+            self.resolve(first_value)
+
+        value_type = self.value_type
+        formatter = self.formatter
+        fallback_formatter = self.fallback_formatter
+
+        if formatter is None:
+            return [
+                value if type(value) is value_type or value is None else fallback_formatter(value)
+                for value in values
+            ]
+
+        return [
+            formatter(value) if type(value) is value_type else (None if value is None else fallback_formatter(value))
+            for value in values
+        ]
 
 
 class BasketballReferenceJSONEncoder(JSONEncoder):
@@ -73,3 +138,87 @@ class BasketballReferenceJSONEncoder(JSONEncoder):
             return list(obj)
 
         return JSONEncoder.default(self, obj)
+
+
+# The function that converts each type of value that the JSON encoder can't encode (None for values that it can). Values
+# are converted before they're encoded, so the encoder never has to call default for them.
+JSON_CONVERTERS_BY_TYPE = {}
+
+
+def enum_json_value(value):
+    return value.value
+
+
+def date_json_value(value):
+    return value.isoformat()
+
+
+def sequence_json_value(values):
+    return [to_json_value(value) for value in values]
+
+
+def json_converter_for(value):
+    value_type = type(value)
+    try:
+        return JSON_CONVERTERS_BY_TYPE[value_type]
+    except KeyError:
+        if isinstance(value, Enum):
+            converter = enum_json_value
+        elif isinstance(value, (datetime, date)):
+            converter = date_json_value
+        elif isinstance(value, (list, set)):
+            converter = sequence_json_value
+        else:
+            converter = None
+        JSON_CONVERTERS_BY_TYPE[value_type] = converter
+        return converter
+
+
+def to_json_value(value):
+    converter = json_converter_for(value)
+
+    if converter is None:
+        return value
+
+    return converter(value)
+
+
+class JSONRecordConverter:
+    """
+    Converts records (like to_json_value), where the values that have to be converted (like enums and dates) are found
+    for each key from its first non-null value - only those keys' values are converted in the rest of the records,
+    which are assumed to have values of the same types.
+
+    Keys whose values have all been null so far (and keys that first appear in a later record) are checked again in
+    the following records, until they have a non-null value.
+    """
+
+    def __init__(self):
+        self.resolved_keys = set()
+        self.converted_keys = []
+
+    def resolve(self, record, keys):
+        for key in keys:
+            value = record[key]
+            if value is None:
+                continue
+
+            self.resolved_keys.add(key)
+            converter = json_converter_for(value)
+            if converter is not None:
+                self.converted_keys.append((key, type(value), converter))
+
+    def convert(self, record):
+        unresolved_keys = record.keys() - self.resolved_keys
+        if unresolved_keys:
+            self.resolve(record=record, keys=unresolved_keys)
+
+        converted_record = dict(record)
+        for key, value_type, converter in self.converted_keys:
+            value = converted_record.get(key)
+            if type(value) is value_type:
+                converted_record[key] = converter(value)
+            elif value is not None:
+                converted_record[key] = to_json_value(value)
+
+        return converted_record
@@ -1,16 +1,56 @@
+import threading
+from collections.abc import Iterator
+
 from basketball_reference_web_scraper.data import OutputType
+from basketball_reference_web_scraper.output.fields import format_value, BasketballReferenceJSONEncoder
+from basketball_reference_web_scraper.output.writers import DataFrameWriter, CSVWriter, JSONWriter, JSONLinesWriter
+
+# Output types whose rows are written as they're produced
+STREAMED_OUTPUT_TYPES = {OutputType.CSV, OutputType.JSONL}
+# By the classes of their CSV, DataFrame, and JSON Lines writers
+_default_output_services = {}
+_default_output_services_lock = threading.Lock()
+
+
+def default_output_service(csv_writer_class=CSVWriter, dataframe_writer_class=DataFrameWriter,
+                           json_lines_writer_class=JSONLinesWriter):
+    # Writers don't keep any state between calls, so the output services of the client's functions are shared
+    key = (csv_writer_class, dataframe_writer_class, json_lines_writer_class)
+
+    with _default_output_services_lock:
+        output_service = _default_output_services.get(key)
+        if output_service is None:
+            output_service = _default_output_services[key] = OutputService(
+                json_writer=JSONWriter(value_formatter=BasketballReferenceJSONEncoder),
+                csv_writer=csv_writer_class(value_formatter=format_value),
+                dataframe_writer=dataframe_writer_class(value_formatter=format_value),
+                json_lines_writer=json_lines_writer_class(value_formatter=BasketballReferenceJSONEncoder),
+            )
+
+        return output_service
 
 
 class OutputService:
-    def __init__(self, json_writer, csv_writer):
+    def __init__(self, json_writer, csv_writer, dataframe_writer=None, json_lines_writer=None):
         self.json_writer = json_writer
         self.csv_writer = csv_writer
+        self.dataframe_writer = DataFrameWriter(value_formatter=format_value) if dataframe_writer is None \
+            else dataframe_writer
+        self.json_lines_writer = JSONLinesWriter(value_formatter=BasketballReferenceJSONEncoder) \
+            if json_lines_writer is None else json_lines_writer
         self.output_type_writers = {
             OutputType.JSON: self.json_writer,
             OutputType.CSV: self.csv_writer,
+            OutputType.DATAFRAME: self.dataframe_writer,
+            OutputType.JSONL: self.json_lines_writer,
         }
 
     def output(self, data, options):
+        # Rows that are lazily parsed (like the rows of the client's iter_* functions) are only written as they're parsed
+        # for CSV and JSON Lines output - every other output needs all of the rows at once
+        if isinstance(data, Iterator) and options.output_type not in STREAMED_OUTPUT_TYPES:
+            data = list(data)
+
         if options.output_type is None:
             return data
 
@@ -20,7 +60,3 @@ class OutputService:
             raise ValueError("Unknown output type: {output_type}".format(output_type=options.output_type))
 
         return writer.write(data=data, options=options)
-
-
-
-
@@ -1,8 +1,11 @@
 import csv
+import itertools
 import json
+from enum import Enum
 
 from basketball_reference_web_scraper.data import OutputType, OutputWriteOption
-from basketball_reference_web_scraper.utilities import merge_two_dicts
+from basketball_reference_web_scraper.output.fields import ColumnFormatter, JSONRecordConverter
+from basketball_reference_web_scraper.utilities import merge_two_dicts, import_optional_dependency
 
 DEFAULT_JSON_SORT_KEYS = True
 DEFAULT_JSON_INDENT = 4
@@ -10,6 +13,14 @@ DEFAULT_JSON_OPTIONS = {
     "sort_keys": DEFAULT_JSON_SORT_KEYS,
     "indent": DEFAULT_JSON_INDENT,
 }
+# Each record is a single, compact line
+DEFAULT_JSON_LINES_OPTIONS = {
+    "separators": (",", ":"),
+}
+# Options that could split a record across lines
+UNSUPPORTED_JSON_LINES_OPTIONS = {"indent", "separators"}
+# The number of rows that are formatted (a column at a time) and written at once
+CSV_CHUNK_SIZE = 1000
 
 
 class FileOptions:
@@ -43,8 +54,21 @@ class OutputOptions:
                 formatting_options = DEFAULT_JSON_OPTIONS
             else:
                 formatting_options = merge_two_dicts(DEFAULT_JSON_OPTIONS, json_options)
+        elif output_type == OutputType.JSONL:
+            if json_options is None:
+                formatting_options = DEFAULT_JSON_LINES_OPTIONS
+            else:
+                unsupported_options = UNSUPPORTED_JSON_LINES_OPTIONS.intersection(json_options)
+                if unsupported_options:
+                    raise ValueError("Unsupported JSON Lines options: {options}".format(
+                        options=", ".join(sorted(unsupported_options)),
+                    ))
+                formatting_options = merge_two_dicts(DEFAULT_JSON_LINES_OPTIONS, json_options)
         elif output_type == OutputType.CSV:
             formatting_options = csv_options
+        elif output_type == OutputType.DATAFRAME:
+            # DataFrames have the same columns as CSV output
+            formatting_options = csv_options
         elif output_type is None:
             return OutputOptions(file_options=None, formatting_options={}, output_type=None)
         else:
@@ -102,32 +126,195 @@ class JSONWriter(Writer):
         )
 
 
+class JSONLinesWriter(Writer):
+    """
+    Writes each row as a JSON record on its own line (JSON Lines), as the rows are produced - so lines can be appended to
+    an existing file (with OutputWriteOption.APPEND), and lazily parsed rows are never all held in memory.
+
+    Enums and dates are converted before each record is encoded (see JSONRecordConverter), so the value formatter (the
+    JSON encoder class) only has to handle values that aren't rows' usual values.
+    """
+
+    def rows(self, data):
+        return data
+
+    def lines(self, rows, options):
+        encode = self.value_formatter(**options.formatting_options).encode
+        convert = JSONRecordConverter().convert
+        for row in rows:
+            yield encode(convert(row)) + "\n"
+
+    def write(self, data, options):
+        lines = self.lines(rows=self.rows(data=data), options=options)
+
+        if not options.file_options.should_write_to_file:
+            return "".join(lines)
+
+        # Like CSV output, the first line is encoded before the file is opened, so that the file isn't truncated if the
+        # rows can't be fetched
+        first_lines = list(itertools.islice(lines, 1))
+        with open(
+                options.file_options.path,
+                options.file_options.mode.value,
+                newline="",
+                encoding="utf8",
+        ) as json_lines_file:
+            json_lines_file.writelines(itertools.chain(first_lines, lines))
+
+
+class SearchJSONLinesWriter(JSONLinesWriter):
+    def rows(self, data):
+        return data["players"]
+
+
+class PlayerSeasonBoxScoresJSONLinesWriter(JSONLinesWriter):
+    def rows(self, data):
+        return (
+            dict(row, playoffs=playoffs)
+            for playoffs, box_scores in [(False, data["regular_season"]), (True, data.get("playoffs", []))]
+            for row in box_scores
+        )
+
+
 class CSVWriter(Writer):
     def rows(self, data):
-        return [
-            dict((key, self.value_formatter(value)) for key, value in row.items())
-            for row in data
-        ]
+        return data
+
+    def formatted_chunks(self, rows, column_names):
+        """
+        Yields chunks of up to CSV_CHUNK_SIZE rows, where each row is a list of its formatted values in the order of the
+        column names (missing values are None, which are written as empty strings).
+
+        Rows are only read a chunk at a time, so lazily parsed rows are never all held in memory. Each chunk is formatted
+        a column at a time, and each column's formatter is only resolved once (see ColumnFormatter).
+        """
+        rows = iter(rows)
+        column_formatters = [ColumnFormatter(fallback_formatter=self.value_formatter) for _ in column_names]
+        chunk = list(itertools.islice(rows, CSV_CHUNK_SIZE))
+
+        if chunk:
+            # Like csv.DictWriter, rows with values that don't have a column are an error - only the first row is
+            # checked, since every row of the data has the same keys
+            extra_names = chunk[0].keys() - set(column_names)
+            if extra_names:
+                raise ValueError("dict contains fields not in fieldnames: " + ", ".join(map(repr, extra_names)))
+
+        while chunk:
+            columns = [
+                column_formatter.format([row.get(column_name) for row in chunk])
+                for column_name, column_formatter in zip(column_names, column_formatters)
+            ]
+            yield zip(*columns)
+            chunk = list(itertools.islice(rows, CSV_CHUNK_SIZE))
 
     def write(self, data, options):
+        column_names = options.formatting_options.get("column_names")
+        chunks = self.formatted_chunks(rows=self.rows(data=data), column_names=column_names)
+        # The first chunk is read before the file is opened, so that the file isn't truncated if the rows can't be
+        # fetched (like for an invalid season)
+        first_chunks = list(itertools.islice(chunks, 1))
         with open(
                 options.file_options.path,
                 options.file_options.mode.value,
                 newline="",
                 encoding="utf8",
         ) as csv_file:
-            writer = csv.DictWriter(
-                csv_file,
-                fieldnames=options.formatting_options.get("column_names"),
-            )
-            writer.writeheader()
-            writer.writerows(self.rows(data=data))
+            writer = csv.writer(csv_file)
+            writer.writerow(column_names)
+            for chunk in itertools.chain(first_chunks, chunks):
+                writer.writerows(chunk)
 
 
 class SearchCSVWriter(CSVWriter):
+    def rows(self, data):
+        return data["players"]
+
+
+class PlayerSeasonBoxScoresCSVWriter(CSVWriter):
+    def rows(self, data):
+        return (
+            dict(row, playoffs=playoffs)
+            for playoffs, box_scores in [(False, data["regular_season"]), (True, data.get("playoffs", []))]
+            for row in box_scores
+        )
+
+
+class DataFrameWriter(Writer):
+    """
+    Returns the data as a pandas DataFrame, which is built a column at a time.
+
+    Enum columns (like teams or outcomes) are categoricals whose categories are every value of the enum, so a value has
+    the same code in every DataFrame. Columns of lists of enums (like a player's positions) are categoricals of the
+    formatted lists, like in CSV output.
+    """
+
+    def rows(self, data):
+        return data
+
+    def column(self, numpy, pandas, values):
+        value = next((value for value in values if value is not None), None)
+
+        if isinstance(value, Enum):
+            members = list(type(value))
+            codes_by_member = {member: code for code, member in enumerate(members)}
+            return pandas.Categorical.from_codes(
+                [-1 if value is None else codes_by_member[value] for value in values],
+                categories=[member.value for member in members],
+            )
+
+        if isinstance(value, (list, set)):
+            # Columns of lists only have a handful of distinct values (like combinations of positions), so each distinct
+            # value is only formatted once
+            formatted_values = {}
+            column_values = []
+            for value in values:
+                key = value if value is None else frozenset(value) if isinstance(value, set) else tuple(value)
+                if key not in formatted_values:
+                    formatted_values[key] = None if value is None else self.value_formatter(value)
+                column_values.append(formatted_values[key])
+            return pandas.Categorical(column_values)
+
+        # NumPy converts lists of numbers much faster than pandas' type inference does. Like pandas, int columns with
+        # missing values are float columns, with NaN for missing values.
+        value_types = set(map(type, values))
+        if value_types == {int}:
+            return numpy.array(values, dtype="int64")
+
+        if value_types == {bool}:
+            return numpy.array(values, dtype="bool")
+
+        if isinstance(value, (int, float)) and value_types <= {int, float, type(None)}:
+            return numpy.array(values, dtype="float64")
+
+        return values
+
+    def write(self, data, options):
+        pandas = import_optional_dependency(name="pandas", feature="DataFrame output")
+        # pandas depends on NumPy, so it's always installed alongside pandas
+        numpy = import_optional_dependency(name="numpy", feature="DataFrame output")
+        rows = list(self.rows(data=data))
+        column_names = (options.formatting_options or {}).get("column_names")
+        if column_names is None:
+            column_names = list(rows[0]) if len(rows) > 0 else []
+
+        return pandas.DataFrame(
+            {
+                name: self.column(numpy=numpy, pandas=pandas, values=[row.get(name) for row in rows])
+                for name in column_names
+            },
+            columns=column_names,
+        )
+
+
+class SearchDataFrameWriter(DataFrameWriter):
+    def rows(self, data):
+        return data["players"]
+
+
+class PlayerSeasonBoxScoresDataFrameWriter(DataFrameWriter):
     def rows(self, data):
         return [
-            dict((key, self.value_formatter(value)) for key, value in row.items())
-            for row in data["players"]
+            dict(row, playoffs=playoffs)
+            for playoffs, box_scores in [(False, data["regular_season"]), (True, data.get("playoffs", []))]
+            for row in box_scores
         ]
-
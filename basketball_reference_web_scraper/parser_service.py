@@ -1,3 +1,6 @@
+import threading
+
+from basketball_reference_web_scraper.columnar import ColumnarParser
 from basketball_reference_web_scraper.data import TEAM_ABBREVIATIONS_TO_TEAM, LOCATION_ABBREVIATIONS_TO_POSITION, OUTCOME_ABBREVIATIONS_TO_OUTCOME, TEAM_NAME_TO_TEAM, \
     POSITION_ABBREVIATIONS_TO_POSITION, LEAGUE_ABBREVIATIONS_TO_LEAGUE, Division, Team, DIVISIONS_TO_CONFERENCES
 from basketball_reference_web_scraper.parsers import PositionAbbreviationParser, TeamAbbreviationParser, \
@@ -6,11 +9,25 @@ from basketball_reference_web_scraper.parsers import PositionAbbreviationParser,
     PeriodTimestampParser, ScoresParser, PlayByPlaysParser, TeamNameParser, ScheduledStartTimeParser, \
     ScheduledGamesParser, PlayerBoxScoreOutcomeParser, PlayerSeasonBoxScoresParser, SearchResultNameParser, \
     ResourceLocationParser, SearchResultsParser, LeagueAbbreviationParser, PlayerDataParser, DivisionNameParser, \
-    TeamStandingsParser, ConferenceDivisionStandingsParser, TeamContractsParser, PlayerSalariesParser, TotalPlayerContractsParser
+    TeamStandingsParser, ConferenceDivisionStandingsParser, TeamContractsParser, PlayerSalariesParser, TotalPlayerContractsParser, \
+    SalaryParser, ContractsCSVParser
+
+_default_parser_service = None
+_default_parser_service_lock = threading.Lock()
+
+
+def default_parser_service():
+    # Parsers don't keep any state between calls, so a single ParserService is shared by every client call (and thread)
+    global _default_parser_service
+
+    with _default_parser_service_lock:
+        if _default_parser_service is None:
+            _default_parser_service = ParserService()
+
+        return _default_parser_service
 
 
 class ParserService:
-    PLAY_BY_PLAY_TIMESTAMP_FORMAT = "%M:%S.%f"
     PLAY_BY_PLAY_SCORES_REGEX = "(?P<away_team_score>[0-9]+)-(?P<home_team_score>[0-9]+)"
     SEARCH_RESULT_RESOURCE_LOCATION_REGEX = '(https?:\/\/www\.basketball-reference\.com\/)?(?P<resource_type>.+?(?=\/)).*\/(?P<resource_identifier>.+).html'
 
@@ -25,7 +42,7 @@ class ParserService:
         )
         self.outcome_parser = PlayerBoxScoreOutcomeParser(outcome_abbreviation_parser=self.outcome_abbreviation_parser)
         self.period_details_parser = PeriodDetailsParser(regulation_periods_count=4)
-        self.period_timestamp_parser = PeriodTimestampParser(timestamp_format=ParserService.PLAY_BY_PLAY_TIMESTAMP_FORMAT)
+        self.period_timestamp_parser = PeriodTimestampParser()
         self.position_abbreviation_parser = PositionAbbreviationParser(
             abbreviations_to_positions=POSITION_ABBREVIATIONS_TO_POSITION,
         )
@@ -84,17 +101,38 @@ class ParserService:
             team_standings_parser=self.team_standings_parser,
             divisions_to_conferences=DIVISIONS_TO_CONFERENCES,
         )
-        self.player_salaries_parser = PlayerSalariesParser()
-        self.team_contracts_parser = TeamContractsParser()
+        self.salary_parser = SalaryParser()
+        self.player_salaries_parser = PlayerSalariesParser(salary_parser=self.salary_parser)
+        self.team_contracts_parser = TeamContractsParser(salary_parser=self.salary_parser)
+        self.total_player_contracts_parser = TotalPlayerContractsParser(salary_parser=self.salary_parser)
+        self.contracts_csv_parser = ContractsCSVParser(salary_parser=self.salary_parser)
 
-        self.total_player_contracts_parser = TotalPlayerContractsParser
+        self.columnar_parser = ColumnarParser(
+            team_abbreviation_parser=self.team_abbreviation_parser,
+            position_abbreviation_parser=self.position_abbreviation_parser,
+            location_abbreviation_parser=self.location_abbreviation_parser,
+            outcome_abbreviation_parser=self.outcome_abbreviation_parser,
+            outcome_parser=self.outcome_parser,
+            seconds_played_parser=self.seconds_played_parser,
+            salary_parser=self.salary_parser,
+        )
 
     
     def parse_division_standings(self, standings):
         return self.conference_division_standings_parser.parse(division_standings=standings)
 
+    def iter_division_standings(self, standings):
+        return self.conference_division_standings_parser.iter_parse(division_standings=standings)
+
     def parse_play_by_plays(self, play_by_plays, away_team_name, home_team_name):
-        return self.play_by_plays_parser.parse(
+        return list(self.iter_play_by_plays(
+            play_by_plays=play_by_plays,
+            away_team_name=away_team_name,
+            home_team_name=home_team_name,
+        ))
+
+    def iter_play_by_plays(self, play_by_plays, away_team_name, home_team_name):
+        return self.play_by_plays_parser.iter_parse(
             play_by_plays=play_by_plays,
             away_team=self.team_name_parser.parse_team_name(team_name=away_team_name),
             home_team=self.team_name_parser.parse_team_name(team_name=home_team_name),
@@ -103,33 +141,92 @@ class ParserService:
     def parse_player_box_scores(self, box_scores):
         return self.player_box_scores_parser.parse(box_scores=box_scores)
 
+    def iter_player_box_scores(self, box_scores):
+        return self.player_box_scores_parser.iter_parse(box_scores=box_scores)
+
+    def parse_player_box_scores_columns(self, box_scores):
+        return self.columnar_parser.parse_player_box_scores(box_scores=box_scores)
+
     def parse_player_season_box_scores(self, box_scores, include_inactive_games=False):
         return self.player_season_box_scores_parser.parse(box_scores=box_scores, include_inactive_games=include_inactive_games)
 
+    def iter_player_season_box_scores(self, box_scores, include_inactive_games=False):
+        return self.player_season_box_scores_parser.iter_parse(
+            box_scores=box_scores,
+            include_inactive_games=include_inactive_games,
+        )
+
+    def parse_player_season_box_scores_columns(self, box_scores, include_inactive_games=False):
+        return self.columnar_parser.parse_player_season_box_scores(
+            box_scores=box_scores,
+            include_inactive_games=include_inactive_games,
+        )
+
     def parse_player_advanced_season_totals_parser(self, totals):
         return self.player_advanced_season_totals_parser.parse(totals=totals)
 
+    def iter_player_advanced_season_totals(self, totals):
+        return self.player_advanced_season_totals_parser.iter_parse(totals=totals)
+
+    def parse_player_advanced_season_totals_columns(self, totals_html, include_combined_totals=False):
+        return self.columnar_parser.parse_player_advanced_season_totals(
+            rows_html=totals_html,
+            include_combined_totals=include_combined_totals,
+        )
+
     def parse_player_season_totals(self, totals):
         return self.player_season_totals_parser.parse(totals=totals)
 
+    def iter_player_season_totals(self, totals):
+        return self.player_season_totals_parser.iter_parse(totals=totals)
+
+    def parse_player_season_totals_columns(self, totals_html):
+        return self.columnar_parser.parse_player_season_totals(rows_html=totals_html)
+
     def parse_scheduled_games(self, games):
         return self.scheduled_games_parser.parse_games(games)
 
+    def iter_scheduled_games(self, games):
+        return self.scheduled_games_parser.iter_games(games)
+
     def parse_team_totals(self, first_team_totals, second_team_totals):
         return self.team_totals_parser.parse(first_team_totals=first_team_totals, second_team_totals=second_team_totals)
 
     def parse_player_search_results(self, nba_aba_baa_players):
         return self.search_results_parser.parse(nba_aba_baa_players=nba_aba_baa_players)
 
+    def iter_player_search_results(self, nba_aba_baa_players):
+        return self.search_results_parser.iter_parse(nba_aba_baa_players=nba_aba_baa_players)
+
     def parse_player_data(self, player):
         return self.player_data_parser.parse(player=player)
 
     def parse_player_salaries(self, salaries):
         return self.player_salaries_parser.parse(salaries)
+
+    def iter_player_salaries(self, salaries):
+        return self.player_salaries_parser.iter_parse(salaries)
     
     def parse_team_contracts(self, contracts):
         return self.team_contracts_parser.parse(contracts)
+
+    def iter_team_contracts(self, contracts):
+        return self.team_contracts_parser.iter_parse(contracts)
     
     def parse_total_player_contracts(self, contract_rows):
-        player_total_contracts_parser = self.total_player_contracts_parser(contract_rows=contract_rows)
-        return player_total_contracts_parser.parse()
\ No newline at end of file
+        return self.total_player_contracts_parser.parse(contract_rows=contract_rows)
+
+    def iter_total_player_contracts(self, contract_rows):
+        return self.total_player_contracts_parser.iter_parse(contract_rows=contract_rows)
+
+    def parse_total_player_contracts_matrix(self, contracts_html):
+        return self.columnar_parser.parse_total_player_contracts(rows_html=contracts_html)
+
+    def parse_player_salaries_csv(self, csv_file):
+        return self.contracts_csv_parser.parse_player_salaries(csv_file=csv_file)
+
+    def parse_team_contracts_csv(self, csv_file):
+        return self.contracts_csv_parser.parse_team_contracts(csv_file=csv_file)
+
+    def parse_total_player_contracts_csv(self, csv_file):
+        return self.contracts_csv_parser.parse_total_player_contracts(csv_file=csv_file)
@@ -1,14 +1,38 @@
+import csv
 import re
 from datetime import datetime
 
 import pytz
 
 from basketball_reference_web_scraper.data import PeriodType, Outcome
+from basketball_reference_web_scraper.schemas import CONTRACT_YEARS
 from basketball_reference_web_scraper.utilities import str_to_int, str_to_float
 
 PLAYER_SEASON_BOX_SCORES_GAME_DATE_FORMAT = '%Y-%m-%d'
 PLAYER_SEASON_BOX_SCORES_OUTCOME_REGEX = '(?P<outcome_abbreviation>W|L) \\((?P<margin_of_victory>[^)]+)\\)'
 SEARCH_RESULT_NAME_REGEX = '(?P<name>^[^\\(]+)'
+PLAYER_SEASON_BOX_SCORE_STATISTICS = [
+    "made_field_goals",
+    "attempted_field_goals",
+    "made_three_point_field_goals",
+    "attempted_three_point_field_goals",
+    "made_free_throws",
+    "attempted_free_throws",
+    "offensive_rebounds",
+    "defensive_rebounds",
+    "assists",
+    "steals",
+    "blocks",
+    "turnovers",
+    "personal_fouls",
+    "points_scored",
+    "game_score",
+    "plus_minus",
+]
+PLAYER_SALARIES_SALARY_FIELDS = ["salary_1", "salary_2", "salary_3", "salary_4", "salary_5", "salary_guaranteed"]
+TEAM_CONTRACTS_SALARY_FIELDS = ["year_1", "year_2", "year_3", "year_4", "year_5", "year_6"]
+PLAYER_CONTRACTS_SALARY_FIELDS = ["salary", "guaranteed_salary"]
+PLAYER_CONTRACTS_OPTION_FIELDS = ["player_option", "team_option"]
 
 
 class TeamAbbreviationParser:
@@ -150,13 +174,14 @@ class PeriodDetailsParser:
 
 
 class PeriodTimestampParser:
-    def __init__(self, timestamp_format):
-        self.timestamp_format = timestamp_format
-
+    # Timestamps (like "11:24.5") are split by hand instead of parsed with datetime.strptime, since this runs for every
+    # play of every game
     def to_seconds(self, timestamp):
-        dt = datetime.strptime(timestamp, self.timestamp_format)
+        minutes, _, seconds = timestamp.partition(":")
+        seconds, _, fraction = seconds.partition(".")
+        # Like strptime's %f, the fraction's digits are the leading digits of microseconds
         return float(
-            (dt.minute * 60) + dt.second + (dt.microsecond / 1000000)
+            (int(minutes) * 60) + int(seconds) + (int(fraction.ljust(6, "0")) / 1000000 if fraction else 0)
         )
 
 
@@ -167,24 +192,22 @@ class ScoresParser:
             away_team_score_group_name='away_team_score',
             home_team_score_group_name='home_team_score',
     ):
-        self.scores_regex = scores_regex
+        self.scores_regex = re.compile(scores_regex)
         self.away_team_score_group_name = away_team_score_group_name
         self.home_team_score_group_name = home_team_score_group_name
 
     def parse_scores(self, formatted_scores):
-        return re.search(self.scores_regex, formatted_scores)
+        away_team_score, home_team_score = self.scores_regex.search(formatted_scores).group(
+            self.away_team_score_group_name,
+            self.home_team_score_group_name,
+        )
+        return int(away_team_score), int(home_team_score)
 
     def parse_away_team_score(self, formatted_scores):
-        return int(
-            self.parse_scores(formatted_scores=formatted_scores)
-                .group(self.away_team_score_group_name)
-        )
+        return self.parse_scores(formatted_scores=formatted_scores)[0]
 
     def parse_home_team_score(self, formatted_scores):
-        return int(
-            self.parse_scores(formatted_scores=formatted_scores)
-                .group(self.home_team_score_group_name)
-        )
+        return self.parse_scores(formatted_scores=formatted_scores)[1]
 
 
 class TeamNameParser:
@@ -288,93 +311,100 @@ class ScheduledGamesParser:
         self.team_name_parser = team_name_parser
 
     def parse_games(self, games):
+        return list(self.iter_games(games))
+
+    def iter_games(self, games):
+        for game in games:
+            yield self.parse_game(game=game.record)
+
+    def parse_game(self, game):
+        return {
+            "start_time": self.start_time_parser.parse_start_time(
+                formatted_date=game["start_date"],
+                formatted_time_of_day=game["start_time_of_day"],
+            ),
+            "away_team": self.team_name_parser.parse_team_name(team_name=game["away_team_name"]),
+            "home_team": self.team_name_parser.parse_team_name(team_name=game["home_team_name"]),
+            "away_team_score": game["away_team_score"],
+            "home_team_score": game["home_team_score"],
+        }
 
-        return [
-            {
-                "start_time": self.start_time_parser.parse_start_time(
-                    formatted_date=game.start_date,
-                    formatted_time_of_day=game.start_time_of_day,
-                ),
-                "away_team": self.team_name_parser.parse_team_name(team_name=game.away_team_name),
-                "home_team": self.team_name_parser.parse_team_name(team_name=game.home_team_name),
-                "away_team_score": str_to_int(value=game.away_team_score, default=None),
-                "home_team_score": str_to_int(value=game.home_team_score, default=None),
-            }
-            for game in games
-        ]
+
+class SalaryParser:
+    def parse_salary(self, formatted_salary):
+        return self.parse_salaries([formatted_salary])[0]
+
+    def parse_salaries(self, formatted_salaries):
+        # Salaries are formatted like $49,205,800. A column of salaries is parsed at once, without a function call per
+        # salary (str.replace is faster than a regex or str.translate here). Blank salaries (like the years after a
+        # contract ends) are None.
+        try:
+            return [
+                int(formatted_salary.replace("$", "").replace(",", "")) if formatted_salary.strip() else None
+                for formatted_salary in formatted_salaries
+            ]
+        except ValueError:
+            return [
+                str_to_int(formatted_salary.replace("$", "").replace(",", ""), default=None)
+                for formatted_salary in formatted_salaries
+            ]
+
+    def parse_fields(self, record, fields):
+        # Returns the record with the salaries of the given fields parsed
+        return {**record, **dict(zip(fields, self.parse_salaries([record[field] for field in fields])))}
 
 
 class PlayerSalariesParser:
+    def __init__(self, salary_parser):
+        self.salary_parser = salary_parser
+
     def parse(self, salaries):
+        return list(self.iter_parse(salaries))
+
+    def iter_parse(self, salaries):
+        # The salaries schema's columns are the parsed salary's fields
+        for salary in salaries:
+            yield self.salary_parser.parse_fields(record=salary.record, fields=PLAYER_SALARIES_SALARY_FIELDS)
 
-        return [ 
-            {
-                "player_name": salary.playername,
-                "player_age": str_to_int(value=salary.playerage, default=None),
-                "salary_1": salary.salary1,
-                "salary_2": salary.salary2,
-                "salary_3": salary.salary3,
-                "salary_4": salary.salary4,
-                "salary_5": salary.salary5,
-                "salary_guaranteed": salary.salaryguaranteed
-            }
 
-            for salary in salaries
-        ]
-    
 class TeamContractsParser:
+    def __init__(self, salary_parser):
+        self.salary_parser = salary_parser
+
     def parse(self, contracts):
-        if contracts:
-            print(contracts[0].teamname)
-        print('testies')
+        return list(self.iter_parse(contracts))
 
-        return [
-            {
-                "team_name": contract.teamname,
-                "year_1": contract.year1,
-                "year_2": contract.year2,
-                "year_3": contract.year3,
-                "year_4": contract.year4,
-                "year_5": contract.year5,
-                "year_6": contract.year6
-            }
-            for contract in contracts  
-        ]
+    def iter_parse(self, contracts):
+        for contract in contracts:
+            yield self.salary_parser.parse_fields(record=contract.record, fields=TEAM_CONTRACTS_SALARY_FIELDS)
 
 class TotalPlayerContractsParser:
-    def __init__(self, contract_rows):
-        self.contract_rows = contract_rows
-    
-    def parse(self):
-        data = []
-        for row in self.contract_rows:
-            years = ["year1", "year2", "year3", "year4", "year5", "year6"]
-            for year_stat in years:
-                salary, player_option, team_option = getattr(row, year_stat)
-                if salary:
-                    data.append({
-                        "player_name": row.playername,
-                        "year": year_stat.replace("year", ""),
+    def __init__(self, salary_parser):
+        self.salary_parser = salary_parser
+
+    def parse(self, contract_rows):
+        return list(self.iter_parse(contract_rows))
+
+    def iter_parse(self, contract_rows):
+        # Each contract is split into a row per contract year, and years without a salary are skipped
+        for row in contract_rows:
+            contract = row.record
+            salaries = self.salary_parser.parse_salaries(
+                [contract["year_" + year] for year in CONTRACT_YEARS] + [contract["guaranteed"]]
+            )
+            guaranteed_salary = salaries.pop()
+            for year, salary in zip(CONTRACT_YEARS, salaries):
+                if salary is not None:
+                    year_class = contract["year_" + year + "_class"]
+                    yield {
+                        "player_name": contract["player_name"].strip(),
+                        "year": int(year),
                         "salary": salary,
-                        "player_option": player_option or "FALSE",  
-                        "team_option": team_option or "FALSE",      
-                        "guaranteed_salary": row.salaryguaranteed
-                    })
-        return data
-
-    def extract_years_and_salaries(self, row):
-        years_salaries = []
-        for year_key, year_value in {
-            "Year 1": row.year1,
-            "Year 2": row.year2,
-            "Year 3": row.year3,
-            "Year 4": row.year4,
-            "Year 5": row.year5,
-            "Year 6": row.year6
-        }.items():
-            if year_value:  
-                years_salaries.append((year_key, year_value.strip()))  
-        return years_salaries
+                        "player_option": "salary-pl" in year_class,
+                        "team_option": "salary-tm" in year_class,
+                        "guaranteed_salary": guaranteed_salary,
+                    }
+
 
 class PlayerAdvancedSeasonTotalsParser:
     def __init__(self, position_abbreviation_parser, team_abbreviation_parser):
@@ -382,38 +412,18 @@ class PlayerAdvancedSeasonTotalsParser:
         self.team_abbreviation_parser = team_abbreviation_parser
 
     def parse(self, totals):
-        return [
-            {
-                "slug": str(total.slug),
-                "name": str(total.name).rstrip("*"),
-                "positions": self.position_abbreviation_parser.from_abbreviations(total.position_abbreviations),
-                "age": str_to_int(total.age, default=None),
-                "team": self.team_abbreviation_parser.from_abbreviation(total.team_abbreviation),
-                "games_played": str_to_int(total.games_played),
-                "minutes_played": str_to_int(total.minutes_played),
-                "player_efficiency_rating": str_to_float(total.player_efficiency_rating),
-                "true_shooting_percentage": str_to_float(total.true_shooting_percentage),
-                "three_point_attempt_rate": str_to_float(total.three_point_attempt_rate),
-                "free_throw_attempt_rate": str_to_float(total.free_throw_attempt_rate),
-                "offensive_rebound_percentage": str_to_float(total.offensive_rebound_percentage),
-                "defensive_rebound_percentage": str_to_float(total.defensive_rebound_percentage),
-                "total_rebound_percentage": str_to_float(total.total_rebound_percentage),
-                "assist_percentage": str_to_float(total.assist_percentage),
-                "steal_percentage": str_to_float(total.steal_percentage),
-                "block_percentage": str_to_float(total.block_percentage),
-                "turnover_percentage": str_to_float(total.turnover_percentage),
-                "usage_percentage": str_to_float(total.usage_percentage),
-                "offensive_win_shares": str_to_float(total.offensive_win_shares),
-                "defensive_win_shares": str_to_float(total.defensive_win_shares),
-                "win_shares": str_to_float(total.win_shares),
-                "win_shares_per_48_minutes": str_to_float(total.win_shares_per_48_minutes),
-                "offensive_box_plus_minus": str_to_float(total.offensive_plus_minus),
-                "defensive_box_plus_minus": str_to_float(total.defensive_plus_minus),
-                "box_plus_minus": str_to_float(total.plus_minus),
-                "value_over_replacement_player": str_to_float(total.value_over_replacement_player),
+        return list(self.iter_parse(totals))
+
+    def iter_parse(self, totals):
+        # Every other value is already typed by the advanced season totals schema
+        for total in totals:
+            yield {
+                **total.record,
+                "name": total.record["name"].rstrip("*"),
+                "positions": self.position_abbreviation_parser.from_abbreviations(total.record["positions"]),
+                "team": self.team_abbreviation_parser.from_abbreviation(total.record["team"]),
                 "is_combined_totals": total.is_combined_totals,
-            } for total in totals
-        ]
+            }
 
 
 class PlayerSeasonTotalsParser:
@@ -422,32 +432,17 @@ class PlayerSeasonTotalsParser:
         self.team_abbreviation_parser = team_abbreviation_parser
 
     def parse(self, totals):
-        return [
-            {
-                "slug": str(total.slug),
-                "name": str(total.name).rstrip("*"),
-                "positions": self.position_abbreviation_parser.from_abbreviations(total.position_abbreviations),
-                "age": str_to_int(total.age, default=None),
-                "team": self.team_abbreviation_parser.from_abbreviation(total.team_abbreviation),
-                "games_played": str_to_int(total.games_played),
-                "games_started": str_to_int(total.games_started),
-                "minutes_played": str_to_int(total.minutes_played),
-                "made_field_goals": str_to_int(total.made_field_goals),
-                "attempted_field_goals": str_to_int(total.attempted_field_goals),
-                "made_three_point_field_goals": str_to_int(total.made_three_point_field_goals),
-                "attempted_three_point_field_goals": str_to_int(total.attempted_three_point_field_goals),
-                "made_free_throws": str_to_int(total.made_free_throws),
-                "attempted_free_throws": str_to_int(total.attempted_free_throws),
-                "offensive_rebounds": str_to_int(total.offensive_rebounds),
-                "defensive_rebounds": str_to_int(total.defensive_rebounds),
-                "assists": str_to_int(total.assists),
-                "steals": str_to_int(total.steals),
-                "blocks": str_to_int(total.blocks),
-                "turnovers": str_to_int(total.turnovers),
-                "personal_fouls": str_to_int(total.personal_fouls),
-                "points": str_to_int(total.points),
-            } for total in totals
-        ]
+        return list(self.iter_parse(totals))
+
+    def iter_parse(self, totals):
+        # Every other value is already typed by the season totals schema
+        for total in totals:
+            yield {
+                **total.record,
+                "name": total.record["name"].rstrip("*"),
+                "positions": self.position_abbreviation_parser.from_abbreviations(total.record["positions"]),
+                "team": self.team_abbreviation_parser.from_abbreviation(total.record["team"]),
+            }
 
 
 class TeamTotalsParser:
@@ -506,8 +501,11 @@ class PlayerBoxScoresParser:
         self.seconds_played_parser = seconds_played_parser
 
     def parse(self, box_scores):
-        return [
-            {
+        return list(self.iter_parse(box_scores))
+
+    def iter_parse(self, box_scores):
+        for box_score in box_scores:
+            yield {
                 "slug": str(box_score.slug),
                 "name": str(box_score.name).rstrip("*"),
                 "team": self.team_abbreviation_parser.from_abbreviation(box_score.team_abbreviation),
@@ -529,8 +527,7 @@ class PlayerBoxScoresParser:
                 "turnovers": str_to_int(box_score.turnovers),
                 "personal_fouls": str_to_int(box_score.personal_fouls),
                 "game_score": str_to_float(box_score.game_score),
-            } for box_score in box_scores
-        ]
+            }
 
 
 class PlayerSeasonBoxScoresParser:
@@ -541,61 +538,32 @@ class PlayerSeasonBoxScoresParser:
         self.seconds_played_parser = seconds_played_parser
 
     def parse(self, box_scores, include_inactive_games=False):
-        results = []
+        return list(self.iter_parse(box_scores, include_inactive_games=include_inactive_games))
+
+    def iter_parse(self, box_scores, include_inactive_games=False):
         for box_score in box_scores:
+            record = box_score.record
             common = {
-                "date": datetime.strptime(str(box_score.date), "%Y-%m-%d").date(),
-                "team": self.team_abbreviation_parser.from_abbreviation(box_score.team_abbreviation),
-                "location": self.location_abbreviation_parser.from_abbreviation(box_score.location_abbreviation),
-                "opponent": self.team_abbreviation_parser.from_abbreviation(box_score.opponent_abbreviation),
-                "outcome": self.outcome_parser.parse_outcome(formatted_outcome=box_score.outcome),
+                "date": datetime.strptime(record["date"], "%Y-%m-%d").date(),
+                "team": self.team_abbreviation_parser.from_abbreviation(record["team"]),
+                "location": self.location_abbreviation_parser.from_abbreviation(record["location"]),
+                "opponent": self.team_abbreviation_parser.from_abbreviation(record["opponent"]),
+                "outcome": self.outcome_parser.parse_outcome(formatted_outcome=record["outcome"]),
             }
-            if box_score.is_active:
-                results.append({
+            if record["inactive_reason"] is None:
+                yield {
                     **common,
                     "active": True,
-                    "seconds_played": self.seconds_played_parser.parse(box_score.playing_time),
-                    "made_field_goals": str_to_int(box_score.made_field_goals),
-                    "attempted_field_goals": str_to_int(box_score.attempted_field_goals),
-                    "made_three_point_field_goals": str_to_int(box_score.made_three_point_field_goals),
-                    "attempted_three_point_field_goals": str_to_int(box_score.attempted_three_point_field_goals),
-                    "made_free_throws": str_to_int(box_score.made_free_throws),
-                    "attempted_free_throws": str_to_int(box_score.attempted_free_throws),
-                    "offensive_rebounds": str_to_int(box_score.offensive_rebounds),
-                    "defensive_rebounds": str_to_int(box_score.defensive_rebounds),
-                    "assists": str_to_int(box_score.assists),
-                    "steals": str_to_int(box_score.steals),
-                    "blocks": str_to_int(box_score.blocks),
-                    "turnovers": str_to_int(box_score.turnovers),
-                    "personal_fouls": str_to_int(box_score.personal_fouls),
-                    "points_scored": str_to_int(box_score.points_scored),
-                    "game_score": str_to_float(box_score.game_score),
-                    "plus_minus": str_to_int(box_score.plus_minus),
-                })
+                    "seconds_played": self.seconds_played_parser.parse(record["playing_time"]),
+                    **{statistic: record[statistic] for statistic in PLAYER_SEASON_BOX_SCORE_STATISTICS},
+                }
             elif include_inactive_games:
-                results.append({
+                yield {
                     **common,
                     "active": False,
                     "seconds_played": None,
-                    "made_field_goals": None,
-                    "attempted_field_goals": None,
-                    "made_three_point_field_goals": None,
-                    "attempted_three_point_field_goals": None,
-                    "made_free_throws": None,
-                    "attempted_free_throws": None,
-                    "offensive_rebounds": None,
-                    "defensive_rebounds": None,
-                    "assists": None,
-                    "steals": None,
-                    "blocks": None,
-                    "turnovers": None,
-                    "personal_fouls": None,
-                    "points_scored": None,
-                    "game_score": None,
-                    "plus_minus": None,
-                })
-
-        return results
+                    **{statistic: None for statistic in PLAYER_SEASON_BOX_SCORE_STATISTICS},
+                }
 
 
 class PlayByPlaysParser:
@@ -605,32 +573,41 @@ class PlayByPlaysParser:
         self.scores_parser = scores_parser
 
     def parse(self, play_by_plays, away_team, home_team):
+        return list(self.iter_parse(play_by_plays=play_by_plays, away_team=away_team, home_team=home_team))
+
+    def iter_parse(self, play_by_plays, away_team, home_team):
         current_period = 0
-        result = []
+        # The period number and type only change at the start of each period, so they're parsed once per period
+        period = None
+        period_type = None
         for play_by_play in play_by_plays:
             if play_by_play.is_start_of_period:
                 current_period += 1
+                period = self.period_details_parser.parse_period_number(period_count=current_period)
+                period_type = self.period_details_parser.parse_period_type(period_count=current_period)
             elif play_by_play.has_play_by_play_data:
-                result.append(self.format_data(
-                    current_period=current_period,
+                yield self.format_data(
+                    period=period,
+                    period_type=period_type,
                     play_by_play=play_by_play,
                     away_team=away_team,
                     home_team=home_team,
-                ))
-        return result
+                )
 
-    def format_data(self, current_period, play_by_play, away_team, home_team):
+    def format_data(self, period, period_type, play_by_play, away_team, home_team):
+        is_away_team_play = play_by_play.is_away_team_play
+        away_score, home_score = self.scores_parser.parse_scores(formatted_scores=play_by_play.formatted_scores)
         return {
-            "period": self.period_details_parser.parse_period_number(period_count=current_period),
-            "period_type": self.period_details_parser.parse_period_type(period_count=current_period),
+            "period": period,
+            "period_type": period_type,
             "remaining_seconds_in_period": self.period_timestamp_parser.to_seconds(timestamp=play_by_play.timestamp),
-            "relevant_team": away_team if play_by_play.is_away_team_play else home_team,
+            "relevant_team": away_team if is_away_team_play else home_team,
             "away_team": away_team,
             "home_team": home_team,
-            "away_score": self.scores_parser.parse_away_team_score(formatted_scores=play_by_play.formatted_scores),
-            "home_score": self.scores_parser.parse_home_team_score(formatted_scores=play_by_play.formatted_scores),
+            "away_score": away_score,
+            "home_score": home_score,
             "description": play_by_play.away_team_play_description
-            if play_by_play.is_away_team_play
+            if is_away_team_play
             else play_by_play.home_team_play_description,
         }
 
@@ -643,21 +620,23 @@ class SearchResultsParser:
 
     def parse(self, nba_aba_baa_players):
         return {
-            "players": [
-                {
-                    "name": self.search_result_name_parser.parse(search_result_name=result.resource_name),
-                    "identifier": self.search_result_location_parser.parse_resource_identifier(
-                        resource_location=result.resource_location
-                    ),
-                    "leagues": set(
-                        self.league_abbreviation_parser.from_abbreviations(
-                            abbreviations=result.league_abbreviations
-                        )
-                    ),
-                } for result in nba_aba_baa_players
-            ]
+            "players": list(self.iter_parse(nba_aba_baa_players=nba_aba_baa_players))
         }
 
+    def iter_parse(self, nba_aba_baa_players):
+        for result in nba_aba_baa_players:
+            yield {
+                "name": self.search_result_name_parser.parse(search_result_name=result.resource_name),
+                "identifier": self.search_result_location_parser.parse_resource_identifier(
+                    resource_location=result.resource_location
+                ),
+                "leagues": set(
+                    self.league_abbreviation_parser.from_abbreviations(
+                        abbreviations=result.league_abbreviations
+                    )
+                ),
+            }
+
 
 class PlayerDataParser:
     def __init__(self, search_result_location_parser, league_abbreviation_parser):
@@ -686,19 +665,69 @@ class ConferenceDivisionStandingsParser:
         self.divisions_to_conferences = divisions_to_conferences
 
     def parse(self, division_standings):
+        return list(self.iter_parse(division_standings=division_standings))
+
+    def iter_parse(self, division_standings):
         current_division = None
-        results = []
         for standing in division_standings:
             if standing.is_division_name_row:
                 current_division = self.division_name_parser.parse_division(formatted_name=standing.division_name)
             else:
-                results.append({
-                    "team": self.team_standings_parser.parse_team(formatted_name=standing.team_name),
-                    "wins": str_to_int(standing.wins),
-                    "losses": str_to_int(standing.losses),
+                yield {
+                    "team": self.team_standings_parser.parse_team(formatted_name=standing.record["team_name"]),
+                    "wins": standing.record["wins"],
+                    "losses": standing.record["losses"],
                     "division": current_division,
                     "conference": self.divisions_to_conferences.get(current_division),
-                })
-        return results
+                }
+
+
+class ContractsCSVParser:
+    """
+    Parses the CSV output of the salaries and contracts API methods (like the NYK_SALARIES.csv, teamcontracts.csv and
+    allplayercontracts.csv files) into the same typed rows that the API methods return.
+
+    The file is read into a list per column, and each column is converted at once.
+    """
+
+    def __init__(self, salary_parser):
+        self.salary_parser = salary_parser
 
+    @staticmethod
+    def parse_options(formatted_options):
+        # Options were written as True / FALSE by older versions, and are written as True / False now
+        return [formatted_option.strip().lower() == "true" for formatted_option in formatted_options]
 
+    @staticmethod
+    def parse_integers(formatted_integers):
+        return [str_to_int(formatted_integer, default=None) for formatted_integer in formatted_integers]
+
+    def parse(self, csv_file, salary_fields, integer_fields=(), option_fields=()):
+        reader = csv.reader(csv_file)
+        field_names = next(reader, [])
+        columns = dict(zip(field_names, map(list, zip(*reader))))
+        if not columns:
+            return []
+
+        for field in salary_fields:
+            columns[field] = self.salary_parser.parse_salaries(columns[field])
+        for field in integer_fields:
+            columns[field] = self.parse_integers(columns[field])
+        for field in option_fields:
+            columns[field] = self.parse_options(columns[field])
+
+        return [dict(zip(field_names, values)) for values in zip(*columns.values())]
+
+    def parse_player_salaries(self, csv_file):
+        return self.parse(csv_file=csv_file, salary_fields=PLAYER_SALARIES_SALARY_FIELDS, integer_fields=["player_age"])
+
+    def parse_team_contracts(self, csv_file):
+        return self.parse(csv_file=csv_file, salary_fields=TEAM_CONTRACTS_SALARY_FIELDS)
+
+    def parse_total_player_contracts(self, csv_file):
+        return self.parse(
+            csv_file=csv_file,
+            salary_fields=PLAYER_CONTRACTS_SALARY_FIELDS,
+            integer_fields=["year"],
+            option_fields=PLAYER_CONTRACTS_OPTION_FIELDS,
+        )
@@ -0,0 +1,178 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+
+import requests
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+# Basketball Reference allows roughly 20 requests per minute before it starts responding with 429s
+DEFAULT_REQUESTS_PER_WINDOW = 20
+DEFAULT_WINDOW_SECONDS = 60
+DEFAULT_RETRY_AFTER_SECONDS = 60
+DEFAULT_THROTTLED_RATE_FACTOR = 0.5
+DEFAULT_RECOVERY_RATE_FRACTION = 0.1
+DEFAULT_MINIMUM_RATE_FRACTION = 0.1
+DEFAULT_MAX_RETRIES = 3
+
+THROTTLED_STATUS_CODES = {requests.codes.too_many_requests, requests.codes.service_unavailable}
+
+
+def parse_retry_after(value, now):
+    # Retry-After can either be a number of seconds or an HTTP date
+    if value is None:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - now)
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """
+    A token bucket that allows bursts of up to requests_per_window requests, refilled at
+    requests_per_window / window_seconds tokens per second.
+
+    When a request is throttled, no requests are allowed until the Retry-After delay has passed, and the refill rate is
+    cut. Every successful request after that recovers part of the rate until the configured rate is reached again.
+
+    If a state_path is specified, the bucket is stored in that file and guarded by a file lock so that multiple
+    processes on the same host share the same limit.
+    """
+
+    def __init__(self,
+                 requests_per_window=DEFAULT_REQUESTS_PER_WINDOW,
+                 window_seconds=DEFAULT_WINDOW_SECONDS,
+                 state_path=None,
+                 default_retry_after=DEFAULT_RETRY_AFTER_SECONDS,
+                 throttled_rate_factor=DEFAULT_THROTTLED_RATE_FACTOR,
+                 recovery_rate_fraction=DEFAULT_RECOVERY_RATE_FRACTION,
+                 minimum_rate_fraction=DEFAULT_MINIMUM_RATE_FRACTION,
+                 clock=time.time,
+                 sleep=time.sleep):
+        if state_path is not None and fcntl is None:
+            raise ValueError("Sharing a rate limiter across processes requires the fcntl module")
+
+        self.capacity = requests_per_window
+        self.maximum_rate = requests_per_window / window_seconds
+        self.minimum_rate = self.maximum_rate * minimum_rate_fraction
+        self.state_path = state_path
+        self.default_retry_after = default_retry_after
+        self.throttled_rate_factor = throttled_rate_factor
+        self.recovery_rate = self.maximum_rate * recovery_rate_fraction
+        self.clock = clock
+        self.sleep = sleep
+        self._lock = threading.Lock()
+        self._state = self.initial_state()
+
+    def initial_state(self):
+        return {
+            "tokens": float(self.capacity),
+            "rate": self.maximum_rate,
+            "updated_at": self.clock(),
+            "blocked_until": 0.0,
+        }
+
+    @contextmanager
+    def locked_state(self):
+        with self._lock:
+            if self.state_path is None:
+                yield self._state
+                return
+
+            with open(self.state_path, "a+", encoding="utf8") as state_file:
+                fcntl.flock(state_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    state_file.seek(0)
+                    contents = state_file.read()
+                    state = json.loads(contents) if contents else self.initial_state()
+                    yield state
+                    state_file.seek(0)
+                    state_file.truncate()
+                    json.dump(state, state_file)
+                    state_file.flush()
+                finally:
+                    fcntl.flock(state_file.fileno(), fcntl.LOCK_UN)
+
+    def refill(self, state, now):
+        elapsed = max(0.0, now - state["updated_at"])
+        state["tokens"] = min(float(self.capacity), state["tokens"] + elapsed * state["rate"])
+        state["updated_at"] = now
+
+    def acquire(self):
+        while True:
+            with self.locked_state() as state:
+                now = self.clock()
+                self.refill(state=state, now=now)
+
+                if now < state["blocked_until"]:
+                    wait = state["blocked_until"] - now
+                elif state["tokens"] >= 1:
+                    state["tokens"] -= 1
+                    return
+                else:
+                    wait = (1 - state["tokens"]) / state["rate"]
+
+            self.sleep(wait)
+
+    def throttled(self, retry_after=None):
+        with self.locked_state() as state:
+            now = self.clock()
+            self.refill(state=state, now=now)
+            delay = self.default_retry_after if retry_after is None else retry_after
+            state["blocked_until"] = max(state["blocked_until"], now + delay)
+            state["rate"] = max(self.minimum_rate, state["rate"] * self.throttled_rate_factor)
+            state["tokens"] = 0.0
+
+    def succeeded(self):
+        with self.locked_state() as state:
+            if state["rate"] < self.maximum_rate:
+                self.refill(state=state, now=self.clock())
+                state["rate"] = min(self.maximum_rate, state["rate"] + self.recovery_rate)
+
+    @property
+    def rate(self):
+        with self.locked_state() as state:
+            return state["rate"]
+
+
+class RateLimitedSession:
+    def __init__(self, session, rate_limiter, max_retries=DEFAULT_MAX_RETRIES):
+        self.session = session
+        self.rate_limiter = rate_limiter
+        self.max_retries = max_retries
+
+    def get(self, url, **kwargs):
+        attempts = 0
+        while True:
+            self.rate_limiter.acquire()
+            response = self.session.get(url=url, **kwargs)
+
+            if response.status_code not in THROTTLED_STATUS_CODES:
+                self.rate_limiter.succeeded()
+                return response
+
+            self.rate_limiter.throttled(
+                retry_after=parse_retry_after(
+                    value=response.headers.get("Retry-After"),
+                    now=self.rate_limiter.clock(),
+                )
+            )
+
+            attempts += 1
+            if attempts > self.max_retries:
+                return response
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,257 @@
+from basketball_reference_web_scraper.utilities import str_to_int, str_to_float
+
+
+def text(value, default=''):
+    return value if value else default
+
+
+CONVERTERS = {
+    int: str_to_int,
+    float: str_to_float,
+    str: text,
+}
+
+
+class Column:
+    """
+    A value in a table row, read from the first cell with the given tag and data-stat attribute and converted to type.
+
+    By default, the cell's text content is converted. When attribute is set, the value of that attribute of the cell is
+    used instead. The default is used when the row doesn't have a matching cell, when the cell's value is empty (for str
+    columns), or when the cell's value isn't a number (for int and float columns).
+    """
+
+    def __init__(self, name, data_stat, type=str, default=None, tag="td", attribute=None):
+        self.name = name
+        self.data_stat = data_stat
+        self.type = type
+        self.default = self.type_default(type) if default is None else default
+        self.tag = tag
+        self.attribute = attribute
+        self.converter = CONVERTERS[type]
+
+    @staticmethod
+    def type_default(type):
+        if type is int:
+            return 0
+
+        if type is float:
+            return 0.0
+
+        return ''
+
+    def value(self, cell):
+        if self.attribute is None:
+            value = cell.text_content()
+        else:
+            value = cell.get(self.attribute)
+            if value is None:
+                return self.default
+
+        return self.converter(value, self.default)
+
+
+class NullableColumn(Column):
+    """
+    A column whose default is None, for values like a player's age that are sometimes left blank.
+    """
+
+    def __init__(self, name, data_stat, type=str, tag="td", attribute=None):
+        super().__init__(name=name, data_stat=data_stat, type=type, tag=tag, attribute=attribute)
+        self.default = None
+
+
+class TableSchema:
+    """
+    Declares the columns of a table, and turns the table's rows into records (dicts of column name to typed value).
+
+    Each row's cells are only visited once - every cell is matched to the columns that read it by its tag and data-stat
+    attribute. Records have a key for every column, in the order the columns are declared.
+    """
+
+    def __init__(self, columns):
+        self.columns = columns
+        self.defaults = {column.name: column.default for column in columns}
+        self.columns_by_cell = {}
+        for column in columns:
+            self.columns_by_cell.setdefault((column.tag, column.data_stat), []).append(column)
+
+    def values(self, row_html):
+        # Yields the name and value of each column that the row has a cell for
+        columns_by_cell = self.columns_by_cell
+        matched_cells = set()
+
+        for cell in row_html.iterchildren("td", "th"):
+            key = (cell.tag, cell.get("data-stat"))
+            columns = columns_by_cell.get(key)
+            # Like DataStatRow.cell_text, only the first matching cell is used
+            if columns is None or key in matched_cells:
+                continue
+
+            matched_cells.add(key)
+            for column in columns:
+                yield column.name, column.value(cell)
+
+    def extract(self, row_html):
+        record = self.defaults.copy()
+        record.update(self.values(row_html))
+        return record
+
+    def extract_all(self, rows_html):
+        return [self.extract(row_html) for row_html in rows_html]
+
+    def extract_columns(self, rows_html):
+        """
+        Like extract_all, except that the values are gathered into a list per column (in row order) instead of into a
+        record per row.
+
+        Each row is read before the next one is requested, so rows can be streamed (see html.iter_table_rows).
+        """
+        columns = {column.name: [] for column in self.columns}
+        column_defaults = [(columns[column.name], column.default) for column in self.columns]
+        for index, row_html in enumerate(rows_html):
+            for column_values, default in column_defaults:
+                column_values.append(default)
+            for name, value in self.values(row_html):
+                columns[name][index] = value
+
+        return columns
+
+
+BOX_SCORE_COUNTING_STATISTICS_COLUMNS = [
+    Column(name="made_field_goals", data_stat="fg", type=int),
+    Column(name="attempted_field_goals", data_stat="fga", type=int),
+    Column(name="made_three_point_field_goals", data_stat="fg3", type=int),
+    Column(name="attempted_three_point_field_goals", data_stat="fg3a", type=int),
+    Column(name="made_free_throws", data_stat="ft", type=int),
+    Column(name="attempted_free_throws", data_stat="fta", type=int),
+    Column(name="offensive_rebounds", data_stat="orb", type=int),
+    Column(name="defensive_rebounds", data_stat="drb", type=int),
+    Column(name="assists", data_stat="ast", type=int),
+    Column(name="steals", data_stat="stl", type=int),
+    Column(name="blocks", data_stat="blk", type=int),
+    Column(name="turnovers", data_stat="tov", type=int),
+    Column(name="personal_fouls", data_stat="pf", type=int),
+]
+
+PLAYER_IDENTIFICATION_COLUMNS = [
+    Column(name="slug", data_stat="player", attribute="data-append-csv"),
+    Column(name="name", data_stat="player"),
+    Column(name="positions", data_stat="pos"),
+    NullableColumn(name="age", data_stat="age", type=int),
+    Column(name="team", data_stat="team_id"),
+]
+
+PLAYER_SEASON_TOTALS_SCHEMA = TableSchema(columns=PLAYER_IDENTIFICATION_COLUMNS + [
+    Column(name="games_played", data_stat="g", type=int),
+    Column(name="games_started", data_stat="gs", type=int),
+    Column(name="minutes_played", data_stat="mp", type=int),
+] + BOX_SCORE_COUNTING_STATISTICS_COLUMNS + [
+    Column(name="points", data_stat="pts", type=int),
+])
+
+PLAYER_ADVANCED_SEASON_TOTALS_SCHEMA = TableSchema(columns=PLAYER_IDENTIFICATION_COLUMNS + [
+    Column(name="games_played", data_stat="g", type=int),
+    Column(name="minutes_played", data_stat="mp", type=int),
+    Column(name="player_efficiency_rating", data_stat="per", type=float),
+    Column(name="true_shooting_percentage", data_stat="ts_pct", type=float),
+    Column(name="three_point_attempt_rate", data_stat="fg3a_per_fga_pct", type=float),
+    Column(name="free_throw_attempt_rate", data_stat="fta_per_fga_pct", type=float),
+    Column(name="offensive_rebound_percentage", data_stat="orb_pct", type=float),
+    Column(name="defensive_rebound_percentage", data_stat="drb_pct", type=float),
+    Column(name="total_rebound_percentage", data_stat="trb_pct", type=float),
+    Column(name="assist_percentage", data_stat="ast_pct", type=float),
+    Column(name="steal_percentage", data_stat="stl_pct", type=float),
+    Column(name="block_percentage", data_stat="blk_pct", type=float),
+    Column(name="turnover_percentage", data_stat="tov_pct", type=float),
+    Column(name="usage_percentage", data_stat="usg_pct", type=float),
+    Column(name="offensive_win_shares", data_stat="ows", type=float),
+    Column(name="defensive_win_shares", data_stat="dws", type=float),
+    Column(name="win_shares", data_stat="ws", type=float),
+    Column(name="win_shares_per_48_minutes", data_stat="ws_per_48", type=float),
+    Column(name="offensive_box_plus_minus", data_stat="obpm", type=float),
+    Column(name="defensive_box_plus_minus", data_stat="dbpm", type=float),
+    Column(name="box_plus_minus", data_stat="bpm", type=float),
+    Column(name="value_over_replacement_player", data_stat="vorp", type=float),
+])
+
+PLAYER_SEASON_BOX_SCORES_SCHEMA = TableSchema(columns=[
+    Column(name="date", data_stat="date_game"),
+    Column(name="team", data_stat="team_id"),
+    Column(name="location", data_stat="game_location"),
+    Column(name="opponent", data_stat="opp_id"),
+    Column(name="outcome", data_stat="game_result"),
+    # Inactive games (like "Did Not Play" or "Inactive") have a reason instead of statistics
+    NullableColumn(name="inactive_reason", data_stat="reason"),
+    Column(name="playing_time", data_stat="mp"),
+] + BOX_SCORE_COUNTING_STATISTICS_COLUMNS + [
+    Column(name="points_scored", data_stat="pts", type=int),
+    Column(name="game_score", data_stat="game_score", type=float),
+    Column(name="plus_minus", data_stat="plus_minus", type=int),
+])
+
+PLAYER_BOX_SCORES_SCHEMA = TableSchema(columns=[
+    Column(name="slug", data_stat="player", attribute="data-append-csv"),
+    Column(name="name", data_stat="player"),
+    Column(name="team", data_stat="team_id"),
+    Column(name="location", data_stat="game_location"),
+    Column(name="opponent", data_stat="opp_id"),
+    Column(name="outcome", data_stat="game_result"),
+    Column(name="playing_time", data_stat="mp"),
+] + BOX_SCORE_COUNTING_STATISTICS_COLUMNS + [
+    Column(name="game_score", data_stat="game_score", type=float),
+])
+
+SCHEDULE_SCHEMA = TableSchema(columns=[
+    Column(name="start_date", data_stat="date_game", tag="th"),
+    Column(name="start_time_of_day", data_stat="game_start_time"),
+    Column(name="away_team_name", data_stat="visitor_team_name"),
+    Column(name="home_team_name", data_stat="home_team_name"),
+    NullableColumn(name="away_team_score", data_stat="visitor_pts", type=int),
+    NullableColumn(name="home_team_score", data_stat="home_pts", type=int),
+])
+
+SALARIES_SCHEMA = TableSchema(columns=[
+    Column(name="player_name", data_stat="player", tag="th"),
+    NullableColumn(name="player_age", data_stat="age_today", type=int),
+    Column(name="salary_1", data_stat="y1"),
+    Column(name="salary_2", data_stat="y2"),
+    Column(name="salary_3", data_stat="y3"),
+    Column(name="salary_4", data_stat="y4"),
+    Column(name="salary_5", data_stat="y5"),
+    Column(name="salary_guaranteed", data_stat="remain_gtd"),
+])
+
+TEAM_CONTRACTS_SCHEMA = TableSchema(columns=[
+    Column(name="team_name", data_stat="team_name"),
+    Column(name="year_1", data_stat="y1"),
+    Column(name="year_2", data_stat="y2"),
+    Column(name="year_3", data_stat="y3"),
+    Column(name="year_4", data_stat="y4"),
+    Column(name="year_5", data_stat="y5"),
+    Column(name="year_6", data_stat="y6"),
+])
+
+CONTRACT_YEARS = ["1", "2", "3", "4", "5", "6"]
+
+# Each contract year's cell has the salary as its content, and whether it's a player or team option as its class
+PLAYER_TOTAL_CONTRACTS_SCHEMA = TableSchema(columns=[
+    Column(name="player_name", data_stat="player"),
+    Column(name="slug", data_stat="player", attribute="data-append-csv"),
+    Column(name="team", data_stat="team_id"),
+] + [
+    column
+    for year in CONTRACT_YEARS
+    for column in [
+        Column(name="year_" + year, data_stat="y" + year),
+        Column(name="year_" + year + "_class", data_stat="y" + year, attribute="class"),
+    ]
+] + [
+    Column(name="guaranteed", data_stat="remain_gtd"),
+])
+
+CONFERENCE_DIVISION_STANDINGS_SCHEMA = TableSchema(columns=[
+    Column(name="team_name", data_stat="team_name", tag="th"),
+    Column(name="wins", data_stat="wins", type=int),
+    Column(name="losses", data_stat="losses", type=int),
+])
@@ -1,3 +1,7 @@
+import importlib
+import threading
+
+
 def str_to_int(value, default=int(0)):
     stripped_value = value.strip()
     try:
@@ -14,7 +18,80 @@ def str_to_float(value, default=float(0)):
         return default
 
 
+class memoized_property:
+    """
+    Like property, except that the value is only computed the first time it's read from an instance and is then stored
+    on the instance, so later reads don't repeat the work (functools.cached_property isn't available in Python 3.7).
+    """
+
+    def __init__(self, function):
+        self.function = function
+        self.name = function.__name__
+        self.__doc__ = function.__doc__
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        value = self.function(instance)
+        instance.__dict__[self.name] = value
+        return value
+
+
+def import_optional_dependency(name, feature):
+    # Optional dependencies (like numpy or pandas) aren't installed with this package, so they're only imported once a
+    # feature that needs them is used
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        raise ImportError(
+            "{feature} require {name}, which can be installed with pip install {name}".format(feature=feature, name=name)
+        ) from None
+
+
 def merge_two_dicts(first, second):
     combined = first.copy()
     combined.update(second)
     return combined
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls - while a call for a key is in-flight, other callers with the same key wait for, and
+    share, its result instead of making the same call again.
+    """
+
+    class Call:
+        def __init__(self):
+            self.done = threading.Event()
+            self.result = None
+            self.error = None
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, function):
+        with self._lock:
+            call = self._calls.get(key)
+            is_leader = call is None
+            if is_leader:
+                call = SingleFlight.Call()
+                self._calls[key] = call
+
+        if is_leader:
+            try:
+                call.result = function()
+            except Exception as error:
+                call.error = error
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+        else:
+            call.done.wait()
+
+        if call.error is not None:
+            raise call.error
+
+        return call.result
@@ -0,0 +1,72 @@
+"""
+Measures the per-call setup overhead of the client's functions, comparing the previous approach of creating a new
+ParserService, OutputService, JSONWriter and CSVWriter on every call against the shared default_parser_service and
+default_output_service.
+
+Requests aren't made - HTTPService.iter_standings is replaced by one that returns no rows, so the calls only measure
+their setup (and the output of an empty list of rows).
+
+    PYTHONPATH=. python benchmarks/client_setup.py
+"""
+import timeit
+from unittest import mock
+
+from basketball_reference_web_scraper import client
+from basketball_reference_web_scraper.http_service import HTTPService
+from basketball_reference_web_scraper.output.columns import STANDINGS_COLUMNS_NAMES
+from basketball_reference_web_scraper.output.fields import format_value, BasketballReferenceJSONEncoder
+from basketball_reference_web_scraper.output.service import OutputService, default_output_service
+from basketball_reference_web_scraper.output.writers import CSVWriter, JSONWriter, FileOptions, OutputOptions
+from basketball_reference_web_scraper.parser_service import ParserService, default_parser_service
+
+NUMBER = 2000
+REPEAT = 5
+
+
+def previous_setup():
+    HTTPService(parser=ParserService())
+    OutputService(
+        json_writer=JSONWriter(value_formatter=BasketballReferenceJSONEncoder),
+        csv_writer=CSVWriter(value_formatter=format_value),
+    )
+
+
+def shared_setup():
+    HTTPService(parser=default_parser_service())
+    default_output_service()
+
+
+def previous_standings(season_end_year):
+    # client.standings, before the parser and output services were shared
+    values = HTTPService(parser=ParserService()).iter_standings(season_end_year=season_end_year)
+    options = OutputOptions.of(
+        file_options=FileOptions.of(),
+        output_type=None,
+        csv_options={"column_names": STANDINGS_COLUMNS_NAMES},
+    )
+    output_service = OutputService(
+        json_writer=JSONWriter(value_formatter=BasketballReferenceJSONEncoder),
+        csv_writer=CSVWriter(value_formatter=format_value)
+    )
+    return output_service.output(data=values, options=options)
+
+
+def best_time(function):
+    return min(timeit.repeat(function, number=NUMBER, repeat=REPEAT)) / NUMBER
+
+
+def main():
+    print("{:<24} {:>14} {:>14}".format("call", "time (us)", "calls / s"))
+    with mock.patch.object(HTTPService, "iter_standings", return_value=iter([])):
+        for name, function in [
+            ("previous setup", previous_setup),
+            ("shared setup", shared_setup),
+            ("previous standings", lambda: previous_standings(season_end_year=2019)),
+            ("client.standings", lambda: client.standings(season_end_year=2019)),
+        ]:
+            time = best_time(function)
+            print("{:<24} {:>14.2f} {:>14,.0f}".format(name, time * 1e6, 1 / time))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Measures CSV output throughput (cells per second), comparing CSVWriter against the previous approach of formatting every
+cell with a scan over FORMATTER_CLASSES (allocating a formatter object for each formatted cell) into a dict per row, and
+writing the dicts with csv.DictWriter.
+
+The rows are generated in the format of player season box scores, which are written to a temporary file.
+
+    PYTHONPATH=. python benchmarks/csv_writer.py
+"""
+import csv
+import os
+import tempfile
+import timeit
+from datetime import date, timedelta
+
+from basketball_reference_web_scraper.data import Team, Location, Outcome, OutputType, OutputWriteOption
+from basketball_reference_web_scraper.output.columns import PLAYER_SEASON_BOX_SCORE_COLUMN_NAMES
+from basketball_reference_web_scraper.output.fields import format_value, FORMATTER_CLASSES
+from basketball_reference_web_scraper.output.writers import CSVWriter, FileOptions, OutputOptions
+
+NUMBER = 3
+REPEAT = 3
+ROWS = 50000
+TEAMS = list(Team)
+
+
+def box_scores():
+    return [
+        {
+            "date": date(2019, 1, 1) + timedelta(days=index % 180),
+            "team": TEAMS[index % len(TEAMS)],
+            "location": Location.HOME if index % 2 else Location.AWAY,
+            "opponent": TEAMS[(index + 1) % len(TEAMS)],
+            "outcome": Outcome.WIN if index % 3 else Outcome.LOSS,
+            "active": True,
+            "seconds_played": 1800 + index % 600,
+            "made_field_goals": index % 12,
+            "attempted_field_goals": index % 20,
+            "made_three_point_field_goals": index % 5,
+            "attempted_three_point_field_goals": index % 9,
+            "made_free_throws": index % 7,
+            "attempted_free_throws": index % 8,
+            "offensive_rebounds": index % 4,
+            "defensive_rebounds": index % 9,
+            "assists": index % 11,
+            "steals": index % 3,
+            "blocks": index % 2,
+            "turnovers": index % 5,
+            "personal_fouls": index % 6,
+            "points_scored": index % 40,
+            "game_score": (index % 300) / 10,
+            "plus_minus": index % 21 - 10,
+        }
+        for index in range(ROWS)
+    ]
+
+
+def previous_format_value(value):
+    formatter_class = next(
+        (formatter_class for formatter_class in FORMATTER_CLASSES if formatter_class.can_format(value)),
+        None,
+    )
+
+    if formatter_class is None:
+        return value
+
+    return formatter_class(data=value).format()
+
+
+def previous_write(rows, path, column_names):
+    with open(path, "w", newline="", encoding="utf8") as csv_file:
+        writer = csv.DictWriter(csv_file, fieldnames=column_names)
+        writer.writeheader()
+        writer.writerows(
+            dict((key, previous_format_value(value)) for key, value in row.items())
+            for row in rows
+        )
+
+
+def best_time(function):
+    return min(timeit.repeat(function, number=NUMBER, repeat=REPEAT)) / NUMBER
+
+
+def main():
+    rows = box_scores()
+    column_names = [name for name in PLAYER_SEASON_BOX_SCORE_COLUMN_NAMES if name in rows[0]]
+    cells = len(rows) * len(column_names)
+    writer = CSVWriter(value_formatter=format_value)
+
+    with tempfile.TemporaryDirectory() as directory:
+        previous_path = os.path.join(directory, "previous.csv")
+        path = os.path.join(directory, "box_scores.csv")
+        options = OutputOptions.of(
+            file_options=FileOptions.of(path=path, mode=OutputWriteOption.WRITE),
+            output_type=OutputType.CSV,
+            csv_options={"column_names": column_names},
+        )
+
+        previous_write(rows=rows, path=previous_path, column_names=column_names)
+        writer.write(data=rows, options=options)
+        with open(previous_path, encoding="utf8") as previous_file, open(path, encoding="utf8") as csv_file:
+            assert previous_file.read() == csv_file.read()
+
+        print("{:<24} {:>14} {:>14}".format("writer", "time (ms)", "cells / s"))
+        for name, write in [
+            ("previous", lambda: previous_write(rows=rows, path=previous_path, column_names=column_names)),
+            ("CSVWriter", lambda: writer.write(data=rows, options=options)),
+        ]:
+            time = best_time(write)
+            print("{:<24} {:>14.2f} {:>14,.0f}".format(name, time * 1e3, cells / time))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Measures play-by-play parsing throughput (rows per second), comparing ParserService.parse_play_by_plays against the
+previous approach of parsing each row's timestamp with datetime.strptime, searching for the away and home team scores
+with separate (uncompiled) regex searches, and parsing the period details for every row.
+
+There's no play-by-play page in tests/integration/files, so a game's play-by-play table is generated in the same
+format, between the teams of the 201701010ATL.html box score.
+
+    PYTHONPATH=. python benchmarks/play_by_play.py
+"""
+import re
+import timeit
+from datetime import datetime
+
+from lxml import html
+
+from basketball_reference_web_scraper.html import PlayByPlayPage
+from basketball_reference_web_scraper.parser_service import ParserService
+
+NUMBER = 20
+REPEAT = 5
+PERIODS = ["1st Quarter", "2nd Quarter", "3rd Quarter", "4th Quarter", "1st Overtime"]
+PLAYS_PER_PERIOD = 120
+
+
+def play_by_play_page():
+    rows = []
+    away_score = 0
+    home_score = 0
+    for period_index, period in enumerate(PERIODS):
+        rows.append('<tr class="thead" id="q{}"><th colspan="6">{}</th></tr>'.format(period_index + 1, period))
+        rows.append(
+            '<tr class="thead"><th aria-label="Time">Time</th><th>San Antonio</th><th></th><th>Score</th><th></th>'
+            '<th>Atlanta</th></tr>'
+        )
+        rows.append('<tr><td>12:00.0</td><td colspan="5">Start of {}</td></tr>'.format(period))
+        for play_index in range(PLAYS_PER_PERIOD):
+            remaining_seconds = 720 - (play_index + 1) * 720 / (PLAYS_PER_PERIOD + 1)
+            timestamp = "{}:{:04.1f}".format(int(remaining_seconds // 60), remaining_seconds % 60)
+            if play_index % 2 == 0:
+                away_score += 2
+                cells = ['<a href="/players/l/leonaka01.html">K. Leonard</a> makes 2-pt shot', "+2", "", ""]
+            else:
+                home_score += 2
+                cells = ["", "", "+2", '<a href="/players/m/millspa01.html">P. Millsap</a> makes 2-pt shot']
+            rows.append(
+                '<tr><td>{}</td><td>{}</td><td>{}</td><td>{}-{}</td><td>{}</td><td>{}</td></tr>'.format(
+                    timestamp, cells[0], cells[1], away_score, home_score, cells[2], cells[3],
+                )
+            )
+    return (
+        '<html><body><div id="content"><div class="scorebox">'
+        '<div><strong><a href="/teams/SAS/2017.html">San Antonio Spurs</a></strong></div>'
+        '<div><strong><a href="/teams/ATL/2017.html">Atlanta Hawks</a></strong></div>'
+        '</div></div>'
+        '<table id="pbp"><tr><th colspan="6">Play-By-Play</th></tr>' + "".join(rows) + '</table>'
+        '</body></html>'
+    )
+
+
+class PreviousPlayByPlaysParser:
+    SCORES_REGEX = "(?P<away_team_score>[0-9]+)-(?P<home_team_score>[0-9]+)"
+
+    def __init__(self, period_details_parser):
+        self.period_details_parser = period_details_parser
+
+    def parse(self, play_by_plays, away_team, home_team):
+        current_period = 0
+        result = []
+        for play_by_play in play_by_plays:
+            if play_by_play.is_start_of_period:
+                current_period += 1
+            elif play_by_play.has_play_by_play_data:
+                dt = datetime.strptime(play_by_play.timestamp, "%M:%S.%f")
+                result.append({
+                    "period": self.period_details_parser.parse_period_number(period_count=current_period),
+                    "period_type": self.period_details_parser.parse_period_type(period_count=current_period),
+                    "remaining_seconds_in_period": float((dt.minute * 60) + dt.second + (dt.microsecond / 1000000)),
+                    "relevant_team": away_team if play_by_play.is_away_team_play else home_team,
+                    "away_team": away_team,
+                    "home_team": home_team,
+                    "away_score": int(re.search(self.SCORES_REGEX, play_by_play.formatted_scores).group("away_team_score")),
+                    "home_score": int(re.search(self.SCORES_REGEX, play_by_play.formatted_scores).group("home_team_score")),
+                    "description": play_by_play.away_team_play_description
+                    if play_by_play.is_away_team_play
+                    else play_by_play.home_team_play_description,
+                })
+        return result
+
+
+def best_time(function):
+    return min(timeit.repeat(function, number=NUMBER, repeat=REPEAT)) / NUMBER
+
+
+def main():
+    parser_service = ParserService()
+    previous_parser = PreviousPlayByPlaysParser(period_details_parser=parser_service.period_details_parser)
+    page = PlayByPlayPage(html=html.fromstring(play_by_play_page()))
+    away_team = parser_service.team_name_parser.parse_team_name(team_name=page.away_team_name)
+    home_team = parser_service.team_name_parser.parse_team_name(team_name=page.home_team_name)
+    # Rows memoize their cells' text, so the cells are read up front to only time the parsing of the text
+    rows = page.play_by_play_table.rows
+    parsed_rows = parser_service.play_by_plays_parser.parse(play_by_plays=rows, away_team=away_team, home_team=home_team)
+
+    assert parsed_rows == previous_parser.parse(play_by_plays=rows, away_team=away_team, home_team=home_team)
+
+    print("{:<24} {:>14} {:>14}".format("parser", "time (ms)", "rows / s"))
+    for name, parser in [
+        ("previous", previous_parser),
+        ("ParserService", parser_service.play_by_plays_parser),
+    ]:
+        time = best_time(lambda: parser.parse(play_by_plays=rows, away_team=away_team, home_team=home_team))
+        print("{:<24} {:>14.2f} {:>14,.0f}".format(name, time * 1e3, len(parsed_rows) / time))
+
+    # Including reading the rows' cells from a freshly parsed page
+    content = play_by_play_page()
+
+    def parse_page():
+        fresh_page = PlayByPlayPage(html=html.fromstring(content))
+        return parser_service.parse_play_by_plays(
+            play_by_plays=fresh_page.play_by_play_table.rows,
+            away_team_name=fresh_page.away_team_name,
+            home_team_name=fresh_page.home_team_name,
+        )
+
+    time = best_time(parse_page)
+    print("{:<24} {:>14.2f} {:>14,.0f}".format("page (end to end)", time * 1e3, len(parsed_rows) / time))
+
+
+if __name__ == "__main__":
+    main()
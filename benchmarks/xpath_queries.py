@@ -0,0 +1,72 @@
+"""
+Compares evaluating the module-level compiled XPath queries in basketball_reference_web_scraper.html against
+evaluating the same expressions as strings (which compiles them on every call), on the pages in
+tests/integration/files.
+
+Compiling a query only saves its parsing, so the queries over a whole page (which are evaluated once per page, and
+whose time is spent walking the document) are within noise of the string versions (about 0.9x to 1.1x). Only the short
+relative queries that are evaluated for every table or row, like tfoot/tr, are faster (about 2.7x).
+
+    PYTHONPATH=. python benchmarks/xpath_queries.py
+"""
+import os
+import timeit
+
+from lxml import html
+
+from basketball_reference_web_scraper.html import SCHEDULE_ROWS_QUERY, GAME_URL_PATHS_QUERY, \
+    OTHER_MONTHS_SCHEDULE_LINKS_QUERY, PLAYER_SEASON_TOTALS_ROWS_QUERY, STATISTICS_TABLES_QUERY, FOOTER_ROWS_QUERY, \
+    TABLE_QUERY
+
+FILES_DIRECTORY = os.path.join(os.path.dirname(__file__), os.pardir, "tests", "integration", "files")
+NUMBER = 1000
+REPEAT = 5
+
+QUERIES_BY_FILE_NAME = {
+    "NBA_2019_games-april.html": [SCHEDULE_ROWS_QUERY, OTHER_MONTHS_SCHEDULE_LINKS_QUERY],
+    "NBA_2019_totals_jemerrio_jones_blank_age.html": [PLAYER_SEASON_TOTALS_ROWS_QUERY],
+    "201701010ATL.html": [STATISTICS_TABLES_QUERY, GAME_URL_PATHS_QUERY],
+}
+
+
+def best_time(function):
+    return min(timeit.repeat(function, number=NUMBER, repeat=REPEAT)) / NUMBER
+
+
+def main():
+    print("{:<48} {:>14} {:>14} {:>8}".format("page / query", "string (us)", "compiled (us)", "speedup"))
+    for file_name, queries in QUERIES_BY_FILE_NAME.items():
+        with open(os.path.join(FILES_DIRECTORY, file_name), "rb") as page:
+            page_html = html.fromstring(page.read())
+
+        for query in queries:
+            string_time = best_time(lambda: page_html.xpath(query.path))
+            compiled_time = best_time(lambda: query(page_html))
+            print("{:<48} {:>14.1f} {:>14.1f} {:>7.2f}x".format(
+                "{} {}".format(file_name, " ".join(query.path.split())[:20]),
+                string_time * 1e6,
+                compiled_time * 1e6,
+                string_time / compiled_time,
+            ))
+
+    # Parameterized and relative queries are where compilation dominates, since they are evaluated once per table
+    with open(os.path.join(FILES_DIRECTORY, "201701010ATL.html"), "rb") as page:
+        page_html = html.fromstring(page.read())
+    table = STATISTICS_TABLES_QUERY(page_html)[0]
+    for name, string_query, compiled_query in [
+        ("tfoot/tr", lambda: table.xpath("tfoot/tr"), lambda: FOOTER_ROWS_QUERY(table)),
+        (
+            "table by id",
+            lambda: page_html.xpath('//table[@id="{}"]'.format("box-SAS-game-basic")),
+            lambda: TABLE_QUERY(page_html, table_id="box-SAS-game-basic"),
+        ),
+    ]:
+        string_time = best_time(string_query)
+        compiled_time = best_time(compiled_query)
+        print("{:<48} {:>14.1f} {:>14.1f} {:>7.2f}x".format(
+            name, string_time * 1e6, compiled_time * 1e6, string_time / compiled_time,
+        ))
+
+
+if __name__ == "__main__":
+    main()
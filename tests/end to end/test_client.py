@@ -1,19 +1,25 @@
 import datetime
 import os
-import time
 from unittest import TestCase
 
 from basketball_reference_web_scraper.client import player_box_scores, season_schedule, players_advanced_season_totals, \
     play_by_play
 from basketball_reference_web_scraper.data import Location, Outcome
 from basketball_reference_web_scraper.data import OutputWriteOption, OutputType, Team, PeriodType
+from basketball_reference_web_scraper.http_service import configure_default_rate_limiter
+from basketball_reference_web_scraper.rate_limiter import RateLimiter
 
 
-class TestClient(TestCase):
-    def setUp(self):
-        # To avoid getting rate-limited
-        time.sleep(20)
+def setUpModule():
+    # To avoid getting rate-limited
+    configure_default_rate_limiter(RateLimiter())
+
+
+def tearDownModule():
+    configure_default_rate_limiter(None)
 
+
+class TestClient(TestCase):
     def test_player_box_scores(self):
         box_scores = player_box_scores(day=11, month=3, year=2024)
         self.assertIsNotNone(box_scores)
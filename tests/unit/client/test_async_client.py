@@ -0,0 +1,73 @@
+import asyncio
+from unittest import TestCase
+from unittest.mock import patch, MagicMock
+
+from requests import HTTPError, codes
+
+from basketball_reference_web_scraper import async_client
+from basketball_reference_web_scraper.data import OutputType
+from basketball_reference_web_scraper.errors import InvalidSeason, InvalidDate, InvalidPlayerAndSeason
+from basketball_reference_web_scraper.http_service import HTTPService
+
+
+class TestAsyncClient(TestCase):
+    @patch.object(HTTPService, "standings")
+    def test_standings_returns_values(self, mocked_standings):
+        mocked_standings.return_value = [{"wins": 1}]
+        self.assertEqual([{"wins": 1}], asyncio.run(async_client.standings(season_end_year=2018)))
+
+    @patch.object(HTTPService, "standings")
+    def test_standings_json_output(self, mocked_standings):
+        mocked_standings.return_value = [{"wins": 1}]
+        self.assertEqual(
+            '[\n    {\n        "wins": 1\n    }\n]',
+            asyncio.run(async_client.standings(season_end_year=2018, output_type=OutputType.JSON)),
+        )
+
+    @patch.object(HTTPService, "season_schedule")
+    def test_season_schedule_not_found_raises_invalid_season(self, mocked_season_schedule):
+        mocked_season_schedule.side_effect = HTTPError(response=MagicMock(status_code=codes.not_found))
+        self.assertRaisesRegex(
+            InvalidSeason,
+            "Season end year of jaebaebae is invalid",
+            asyncio.run,
+            async_client.season_schedule(season_end_year="jaebaebae"),
+        )
+
+    @patch.object(HTTPService, "team_box_scores")
+    def test_team_box_scores_not_found_raises_invalid_date(self, mocked_team_box_scores):
+        mocked_team_box_scores.side_effect = HTTPError(response=MagicMock(status_code=codes.not_found))
+        self.assertRaisesRegex(
+            InvalidDate,
+            "Date with year set to jae, month set to bae, and day set to bae is invalid",
+            asyncio.run,
+            async_client.team_box_scores(day="bae", month="bae", year="jae"),
+        )
+
+    @patch.object(HTTPService, "regular_season_player_box_scores")
+    def test_regular_season_player_box_scores_internal_server_error_raises_invalid_player_and_season(
+            self,
+            mocked_regular_season_player_box_scores,
+    ):
+        mocked_regular_season_player_box_scores.side_effect = HTTPError(
+            response=MagicMock(status_code=codes.internal_server_error)
+        )
+        self.assertRaises(
+            InvalidPlayerAndSeason,
+            asyncio.run,
+            async_client.regular_season_player_box_scores(player_identifier="jaebaebae", season_end_year=2018),
+        )
+
+    @patch.object(HTTPService, "players_season_totals")
+    def test_other_http_error_is_raised(self, mocked_players_season_totals):
+        mocked_players_season_totals.side_effect = HTTPError(response=MagicMock(status_code=codes.bad_gateway))
+        self.assertRaises(HTTPError, asyncio.run, async_client.players_season_totals(season_end_year=2018))
+
+    def test_configure_default_http_service(self):
+        original_http_service = async_client._default_http_service
+        try:
+            http_service = async_client.configure_default_http_service(max_concurrency=8)
+            self.assertIs(http_service, async_client.default_http_service())
+            self.assertEqual(8, http_service.max_concurrency)
+        finally:
+            async_client._default_http_service = original_http_service
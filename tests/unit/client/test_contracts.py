@@ -0,0 +1,25 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from basketball_reference_web_scraper.client import get_contracts, iter_contracts
+from basketball_reference_web_scraper.http_service import HTTPService
+
+
+class TestContracts(TestCase):
+    @patch.object(HTTPService, "iter_team_contracts")
+    def test_no_contracts_is_none(self, mocked_team_contracts):
+        mocked_team_contracts.return_value = iter([])
+
+        self.assertIsNone(get_contracts())
+
+    @patch.object(HTTPService, "iter_team_contracts")
+    def test_contracts_are_list(self, mocked_team_contracts):
+        mocked_team_contracts.return_value = iter([{"team_name": "Boston Celtics"}])
+
+        self.assertEqual([{"team_name": "Boston Celtics"}], get_contracts())
+
+    @patch.object(HTTPService, "iter_team_contracts")
+    def test_iterating_over_no_contracts_yields_nothing(self, mocked_team_contracts):
+        mocked_team_contracts.return_value = iter([])
+
+        self.assertEqual([], list(iter_contracts()))
@@ -9,7 +9,7 @@ from basketball_reference_web_scraper.http_service import HTTPService
 
 
 class TestPlayerAdvancedSeasonTotals(TestCase):
-    @patch.object(HTTPService, "players_advanced_season_totals")
+    @patch.object(HTTPService, "iter_players_advanced_season_totals")
     def test_not_found_raises_invalid_season(self, mocked_players_advanced_season_totals):
         end_year = "jaebaebae"
         expected_message = "Season end year of {end_year} is invalid".format(end_year=end_year)
@@ -17,7 +17,7 @@ class TestPlayerAdvancedSeasonTotals(TestCase):
             response=MagicMock(status_code=codes.not_found))
         self.assertRaisesRegex(InvalidSeason, expected_message, players_advanced_season_totals, season_end_year=end_year)
 
-    @patch.object(HTTPService, "players_advanced_season_totals")
+    @patch.object(HTTPService, "iter_players_advanced_season_totals")
     def test_other_http_error_is_raised(self, mocked_players_advanced_season_totals):
         mocked_players_advanced_season_totals.side_effect = HTTPError(
             response=MagicMock(status_code=codes.internal_server_error))
@@ -8,12 +8,12 @@ from basketball_reference_web_scraper.http_service import HTTPService
 
 
 class TestPlayerBoxScores(TestCase):
-    @mock.patch.object(HTTPService, 'player_box_scores')
+    @mock.patch.object(HTTPService, 'iter_player_box_scores')
     def test_raises_invalid_date_for_404_response(self, mocked_player_box_scores):
         mocked_player_box_scores.side_effect = HTTPError(response=mock.Mock(status_code=codes.not_found))
         self.assertRaises(InvalidDate, player_box_scores, day=1, month=1, year=2018)
 
-    @mock.patch.object(HTTPService, 'player_box_scores')
+    @mock.patch.object(HTTPService, 'iter_player_box_scores')
     def test_raises_non_404_http_error(self, mocked_player_box_scores):
         mocked_player_box_scores.side_effect = HTTPError(response=mock.Mock(status_code=codes.server_error))
         self.assertRaises(HTTPError, player_box_scores, day=1, month=1, year=2018)
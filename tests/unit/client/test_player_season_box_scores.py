@@ -0,0 +1,38 @@
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from requests import HTTPError, codes
+
+from basketball_reference_web_scraper.client import player_season_box_scores
+from basketball_reference_web_scraper.errors import InvalidPlayerAndSeason
+from basketball_reference_web_scraper.http_service import HTTPService
+
+
+class TestPlayerSeasonBoxScores(TestCase):
+    @patch.object(HTTPService, "player_season_box_scores")
+    def test_raises_exception_for_500_response(self, mocked_player_season_box_scores):
+        mocked_player_season_box_scores.side_effect = HTTPError(
+            response=MagicMock(status_code=codes.internal_server_error)
+        )
+        self.assertRaises(InvalidPlayerAndSeason, player_season_box_scores, 'Mock Player', 2000)
+
+    @patch.object(HTTPService, "player_season_box_scores")
+    def test_raises_exception_for_404_response(self, mocked_player_season_box_scores):
+        mocked_player_season_box_scores.side_effect = HTTPError(response=MagicMock(status_code=codes.not_found))
+        self.assertRaises(InvalidPlayerAndSeason, player_season_box_scores, 'Mock Player', 2000)
+
+    @patch.object(HTTPService, "player_season_box_scores")
+    def test_raises_non_500_http_error(self, mocked_player_season_box_scores):
+        mocked_player_season_box_scores.side_effect = HTTPError(response=MagicMock(status_code=codes.bad_request))
+        self.assertRaises(HTTPError, player_season_box_scores, 'Mock Player', 2000)
+
+    @patch.object(HTTPService, "player_season_box_scores")
+    def test_include_playoffs_is_passed_through(self, mocked_player_season_box_scores):
+        mocked_player_season_box_scores.return_value = {"regular_season": []}
+        player_season_box_scores('Mock Player', 2000, include_playoffs=False)
+        mocked_player_season_box_scores.assert_called_once_with(
+            player_identifier='Mock Player',
+            season_end_year=2000,
+            include_playoffs=False,
+            include_inactive_games=False,
+        )
@@ -1,24 +1,66 @@
+import os
+import tempfile
+from types import GeneratorType
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
 from requests import HTTPError, codes
 
-from basketball_reference_web_scraper.client import players_season_totals
+from basketball_reference_web_scraper.client import players_season_totals, iter_players_season_totals
+from basketball_reference_web_scraper.data import OutputType
 from basketball_reference_web_scraper.errors import InvalidSeason
 from basketball_reference_web_scraper.http_service import HTTPService
 
 
 class TestPlayerSeasonTotals(TestCase):
-    @patch.object(HTTPService, 'players_season_totals')
+    @patch.object(HTTPService, 'iter_players_season_totals')
     def test_not_found_raises_invalid_season(self, mocked_players_season_totals):
         end_year = "jaebaebae"
         expected_message = "Season end year of {end_year} is invalid".format(end_year=end_year)
         mocked_players_season_totals.side_effect = HTTPError(response=MagicMock(status_code=codes.not_found))
         self.assertRaisesRegex(InvalidSeason, expected_message, players_season_totals, season_end_year=end_year)
 
-    @patch.object(HTTPService, 'players_season_totals')
+    @patch.object(HTTPService, 'iter_players_season_totals')
     def test_other_http_error_is_raised(self, mocked_players_season_totals):
         mocked_players_season_totals.side_effect = HTTPError(
             response=MagicMock(status_code=codes.internal_server_error)
         )
         self.assertRaises(HTTPError, players_season_totals, season_end_year=2018)
+
+
+class TestIterPlayerSeasonTotals(TestCase):
+    @patch.object(HTTPService, 'iter_players_season_totals')
+    def test_totals_are_yielded_as_they_are_parsed(self, mocked_iter_players_season_totals):
+        mocked_iter_players_season_totals.return_value = iter([{"name": "first"}, {"name": "second"}])
+
+        totals = iter_players_season_totals(season_end_year=2018)
+
+        self.assertIsInstance(totals, GeneratorType)
+        mocked_iter_players_season_totals.assert_not_called()
+        self.assertEqual({"name": "first"}, next(totals))
+        mocked_iter_players_season_totals.assert_called_once_with(season_end_year=2018)
+        self.assertEqual([{"name": "second"}], list(totals))
+
+    @patch.object(HTTPService, 'iter_players_season_totals')
+    def test_not_found_raises_invalid_season_when_iterated(self, mocked_iter_players_season_totals):
+        mocked_iter_players_season_totals.side_effect = HTTPError(response=MagicMock(status_code=codes.not_found))
+        self.assertRaises(InvalidSeason, list, iter_players_season_totals(season_end_year=2018))
+
+    @patch.object(HTTPService, 'iter_players_season_totals')
+    def test_totals_are_returned_as_list(self, mocked_iter_players_season_totals):
+        mocked_iter_players_season_totals.return_value = iter([{"name": "first"}])
+        self.assertEqual([{"name": "first"}], players_season_totals(season_end_year=2018))
+
+    @patch.object(HTTPService, 'iter_players_season_totals')
+    def test_csv_file_is_not_written_for_invalid_season(self, mocked_iter_players_season_totals):
+        mocked_iter_players_season_totals.side_effect = HTTPError(response=MagicMock(status_code=codes.not_found))
+        with tempfile.TemporaryDirectory() as directory:
+            output_file_path = os.path.join(directory, "totals.csv")
+            self.assertRaises(
+                InvalidSeason,
+                players_season_totals,
+                season_end_year=2018,
+                output_type=OutputType.CSV,
+                output_file_path=output_file_path,
+            )
+            self.assertFalse(os.path.exists(output_file_path))
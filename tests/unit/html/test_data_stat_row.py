@@ -0,0 +1,44 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from lxml import html
+
+from basketball_reference_web_scraper.html import DataStatRow, PlayerAdvancedSeasonTotalsRow
+
+
+class TestDataStatRow(TestCase):
+    def setUp(self):
+        self.row_html = html.fragment_fromstring(
+            '<tr>'
+            '<th data-stat="player">header</th>'
+            '<td data-stat="player" data-append-csv="westbru01">Russell Westbrook</td>'
+            '<td data-stat="pos">PG</td>'
+            '<td data-stat="pos">SG</td>'
+            '<td>no data stat</td>'
+            '</tr>'
+        )
+
+    def test_cells_are_indexed_by_tag_and_data_stat(self):
+        row = DataStatRow(html=self.row_html)
+        self.assertEqual([self.row_html[0]], row.cells(data_stat="player", tag="th"))
+        self.assertEqual([self.row_html[1]], row.cells(data_stat="player"))
+        self.assertEqual([self.row_html[2], self.row_html[3]], row.cells(data_stat="pos"))
+        self.assertEqual([], row.cells(data_stat="age"))
+
+    def test_cell_text_is_first_matching_cell(self):
+        row = DataStatRow(html=self.row_html)
+        self.assertEqual("PG", row.cell_text(data_stat="pos"))
+        self.assertEqual("header", row.cell_text(data_stat="player", tag="th"))
+        self.assertEqual("", row.cell_text(data_stat="age"))
+
+    def test_row_is_traversed_once_for_all_properties(self):
+        row_html = MagicMock(iterchildren=MagicMock(side_effect=lambda *tags: self.row_html.iterchildren(*tags)))
+        row = PlayerAdvancedSeasonTotalsRow(html=row_html)
+
+        self.assertEqual("westbru01", row.slug)
+        self.assertEqual("Russell Westbrook", row.name)
+        self.assertEqual("PG", row.position_abbreviations)
+        self.assertEqual("", row.age)
+
+        row_html.iterchildren.assert_called_once_with("td", "th")
+        row_html.xpath.assert_not_called()
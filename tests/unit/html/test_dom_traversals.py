@@ -0,0 +1,98 @@
+from unittest import TestCase
+from unittest.mock import patch, MagicMock
+
+from lxml import etree, html
+
+from basketball_reference_web_scraper import html as pages
+from basketball_reference_web_scraper.data import Team
+from basketball_reference_web_scraper.html import PlayByPlayPage, SearchPage, PlayerSeasonBoxScoresPage
+from basketball_reference_web_scraper.parser_service import ParserService
+
+
+class CountingElement(html.HtmlElement):
+    # lxml creates a new proxy object each time an element is accessed, so the count is kept on the class
+    text_content_calls = 0
+
+    def text_content(self):
+        CountingElement.text_content_calls += 1
+        return super().text_content()
+
+
+def parse(content):
+    parser = html.HTMLParser()
+    parser.set_element_class_lookup(etree.ElementDefaultClassLookup(element=CountingElement))
+    CountingElement.text_content_calls = 0
+    return html.fromstring(content, parser=parser)
+
+
+def counting_query(query):
+    return MagicMock(wraps=query)
+
+
+class TestPlayByPlayPageTraversals(TestCase):
+    CONTENT = '''
+        <html><body><div id="content"><div class="scorebox">
+            <div><strong><a>Boston Celtics</a></strong></div>
+            <div><strong><a>Los Angeles Lakers</a></strong></div>
+        </div></div>
+        <table id="pbp">
+            <tr><th colspan="6">1st Quarter</th></tr>
+            <tr><th colspan="6">1st Quarter</th></tr>
+            <tr><td>11:45.0</td><td>Away play</td><td></td><td>2-0</td><td></td><td></td></tr>
+            <tr><td>11:30.0</td><td></td><td></td><td>2-2</td><td></td><td>Home play</td></tr>
+        </table>
+        </body></html>
+    '''
+
+    @patch.object(pages, "PLAY_BY_PLAY_TEAM_NAMES_QUERY", counting_query(pages.PLAY_BY_PLAY_TEAM_NAMES_QUERY))
+    @patch.object(pages, "PLAY_BY_PLAY_TABLE_QUERY", counting_query(pages.PLAY_BY_PLAY_TABLE_QUERY))
+    def test_each_cell_is_read_once(self):
+        page = PlayByPlayPage(html=parse(self.CONTENT))
+
+        play_by_plays = ParserService().parse_play_by_plays(
+            play_by_plays=page.play_by_play_table.rows,
+            away_team_name=page.away_team_name,
+            home_team_name=page.home_team_name,
+        )
+
+        self.assertEqual([Team.BOSTON_CELTICS, Team.LOS_ANGELES_LAKERS], [play["relevant_team"] for play in play_by_plays])
+        self.assertEqual(["Away play", "Home play"], [play["description"] for play in play_by_plays])
+        pages.PLAY_BY_PLAY_TEAM_NAMES_QUERY.assert_called_once()
+        pages.PLAY_BY_PLAY_TABLE_QUERY.assert_called_once()
+        # 2 team names, then the timestamp, away team description and scores of the away team's play, and also the
+        # home team description of the home team's play
+        self.assertEqual(2 + 3 + 4, CountingElement.text_content_calls)
+
+
+class TestSearchPageTraversals(TestCase):
+    CONTENT = '''
+        <html><body><div id="searches"><div id="players">
+            <div class="search-pagination"><a href="previous">Previous 100 Results</a><a href="next">Next</a></div>
+        </div></div></body></html>
+    '''
+
+    @patch.object(
+        pages,
+        "NBA_ABA_BAA_PLAYERS_PAGINATION_LINKS_QUERY",
+        counting_query(pages.NBA_ABA_BAA_PLAYERS_PAGINATION_LINKS_QUERY),
+    )
+    def test_pagination_links_are_queried_once(self):
+        page = SearchPage(html=parse(self.CONTENT))
+
+        self.assertEqual("next", page.nba_aba_baa_players_pagination_url)
+        self.assertEqual(2, len(page.nba_aba_baa_players_pagination_links))
+        pages.NBA_ABA_BAA_PLAYERS_PAGINATION_LINKS_QUERY.assert_called_once()
+
+
+class TestPlayerSeasonBoxScoresPageTraversals(TestCase):
+    @patch.object(
+        pages,
+        "REGULAR_SEASON_BOX_SCORES_TABLE_QUERY",
+        counting_query(pages.REGULAR_SEASON_BOX_SCORES_TABLE_QUERY),
+    )
+    def test_regular_season_table_is_queried_once(self):
+        page = PlayerSeasonBoxScoresPage(html=parse('<html><body><table id="pgl_basic"></table></body></html>'))
+
+        self.assertIsNotNone(page.regular_season_box_scores_table)
+        self.assertEqual([], page.regular_season_box_scores_table.rows)
+        pages.REGULAR_SEASON_BOX_SCORES_TABLE_QUERY.assert_called_once()
@@ -13,30 +13,33 @@ class TestPlayerAdvancedSeasonTotalsTable(TestCase):
         self.assertEqual(
             """
             //table[@id="advanced_stats"]
-            /tbody
-            /tr[
-                contains(@class, "full_table") or 
-                contains(@class, "italic_text partial_table") 
-                and not(contains(@class, "rowSum"))
-            ]
+    /tbody
+    /tr[
+        contains(@class, "full_table") or 
+        contains(@class, "italic_text partial_table") 
+        and not(contains(@class, "rowSum"))
+    ]
             """.strip(),
-            PlayerAdvancedSeasonTotalsTable(html=self.html).rows_query.strip(),
+            PlayerAdvancedSeasonTotalsTable(html=self.html).rows_query.path.strip(),
         )
 
+    @patch.object(PlayerAdvancedSeasonTotalsTable, 'rows_query', new_callable=PropertyMock)
     @patch.object(PlayerAdvancedSeasonTotalsRow, 'is_combined_totals', new_callable=PropertyMock, return_value=False)
-    def test_returns_all_rows_when_rows_are_not_combined_totals_rows(self, _):
+    def test_returns_all_rows_when_rows_are_not_combined_totals_rows(self, _, mocked_rows_query):
         first_html_row = MagicMock()
         html_rows = [first_html_row]
-        self.html.xpath = MagicMock(return_value=html_rows)
+        mocked_rows_query.return_value = MagicMock(return_value=html_rows)
 
         rows = PlayerAdvancedSeasonTotalsTable(self.html).get_rows()
         self.assertTrue(len(html_rows) == len(rows))
+        mocked_rows_query.return_value.assert_called_once_with(self.html)
 
+    @patch.object(PlayerAdvancedSeasonTotalsTable, 'rows_query', new_callable=PropertyMock)
     @patch.object(PlayerAdvancedSeasonTotalsRow, 'is_combined_totals', new_callable=PropertyMock, return_value=True)
-    def test_returns_no_rows_when_all_rows_are_combined_totals_rows(self, _):
+    def test_returns_no_rows_when_all_rows_are_combined_totals_rows(self, _, mocked_rows_query):
         first_html_row = MagicMock()
         html_rows = [first_html_row]
-        self.html.xpath = MagicMock(return_value=html_rows)
+        mocked_rows_query.return_value = MagicMock(return_value=html_rows)
 
         rows = PlayerAdvancedSeasonTotalsTable(self.html).get_rows()
         self.assertTrue(0 == len(rows))
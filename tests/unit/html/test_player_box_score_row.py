@@ -1,6 +1,8 @@
 from unittest import TestCase
 from unittest.mock import MagicMock
 
+from lxml import html
+
 from basketball_reference_web_scraper.html import PlayerBoxScoreRow
 
 
@@ -25,68 +27,50 @@ class TestPlayerBoxScoreRow(TestCase):
         )
 
     def test_team_abbreviation_when_cells_exist(self):
-        cell = MagicMock(text_content=MagicMock(return_value="some team abbreviation"))
-        self.html.xpath = MagicMock(return_value=[cell])
+        self.html = html.fragment_fromstring('<tr><td data-stat="team_id">some team abbreviation</td></tr>')
         self.assertEqual(PlayerBoxScoreRow(html=self.html).team_abbreviation, "some team abbreviation")
-        self.html.xpath.assert_called_once_with('td[@data-stat="team_id"]')
 
     def test_team_abbreviation_is_empty_string_when_cells_do_not_exist(self):
-        self.html.xpath = MagicMock(return_value=[])
+        self.html = html.fragment_fromstring('<tr></tr>')
         self.assertEqual(PlayerBoxScoreRow(html=self.html).team_abbreviation, '')
-        self.html.xpath.assert_called_once_with('td[@data-stat="team_id"]')
 
     def test_location_abbreviation_when_cells_exist(self):
-        cell = MagicMock(text_content=MagicMock(return_value="some location abbreviation"))
-        self.html.xpath = MagicMock(return_value=[cell])
+        self.html = html.fragment_fromstring('<tr><td data-stat="game_location">some location abbreviation</td></tr>')
         self.assertEqual(PlayerBoxScoreRow(html=self.html).location_abbreviation, "some location abbreviation")
-        self.html.xpath.assert_called_once_with('td[@data-stat="game_location"]')
 
     def test_location_abbreviation_is_empty_string_when_cells_exist(self):
-        self.html.xpath = MagicMock(return_value=[])
+        self.html = html.fragment_fromstring('<tr></tr>')
         self.assertEqual(PlayerBoxScoreRow(html=self.html).location_abbreviation, '')
-        self.html.xpath.assert_called_once_with('td[@data-stat="game_location"]')
 
     def test_opponent_abbreviation_when_cells_exist(self):
-        cell = MagicMock(text_content=MagicMock(return_value="some opponent abbreviation"))
-        self.html.xpath = MagicMock(return_value=[cell])
+        self.html = html.fragment_fromstring('<tr><td data-stat="opp_id">some opponent abbreviation</td></tr>')
         self.assertEqual(PlayerBoxScoreRow(html=self.html).opponent_abbreviation, "some opponent abbreviation")
-        self.html.xpath.assert_called_once_with('td[@data-stat="opp_id"]')
 
     def test_opponent_abbreviation_is_empty_string_when_cells_exist(self):
-        self.html.xpath = MagicMock(return_value=[])
+        self.html = html.fragment_fromstring('<tr></tr>')
         self.assertEqual(PlayerBoxScoreRow(html=self.html).opponent_abbreviation, '')
-        self.html.xpath.assert_called_once_with('td[@data-stat="opp_id"]')
 
     def test_outcome_when_cells_exist(self):
-        cell = MagicMock(text_content=MagicMock(return_value="some outcome"))
-        self.html.xpath = MagicMock(return_value=[cell])
+        self.html = html.fragment_fromstring('<tr><td data-stat="game_result">some outcome</td></tr>')
         self.assertEqual(PlayerBoxScoreRow(html=self.html).outcome, "some outcome")
-        self.html.xpath.assert_called_once_with('td[@data-stat="game_result"]')
 
     def test_outcome_is_empty_string_when_cells_exist(self):
-        self.html.xpath = MagicMock(return_value=[])
+        self.html = html.fragment_fromstring('<tr></tr>')
         self.assertEqual(PlayerBoxScoreRow(html=self.html).outcome, '')
-        self.html.xpath.assert_called_once_with('td[@data-stat="game_result"]')
 
     def test_plus_minus_when_cells_exist(self):
-        cell = MagicMock(text_content=MagicMock(return_value="some plus minus"))
-        self.html.xpath = MagicMock(return_value=[cell])
+        self.html = html.fragment_fromstring('<tr><td data-stat="plus_minus">some plus minus</td></tr>')
         self.assertEqual(PlayerBoxScoreRow(html=self.html).plus_minus, "some plus minus")
-        self.html.xpath.assert_called_once_with('td[@data-stat="plus_minus"]')
 
     def test_plus_minus_is_empty_string_when_cells_exist(self):
-        self.html.xpath = MagicMock(return_value=[])
+        self.html = html.fragment_fromstring('<tr></tr>')
         self.assertEqual(PlayerBoxScoreRow(html=self.html).plus_minus, '')
-        self.html.xpath.assert_called_once_with('td[@data-stat="plus_minus"]')
 
     def test_game_score_when_cells_exist(self):
-        cell = MagicMock(text_content=MagicMock(return_value="some game score"))
-        self.html.xpath = MagicMock(return_value=[cell])
+        self.html = html.fragment_fromstring('<tr><td data-stat="game_score">some game score</td></tr>')
         self.assertEqual(PlayerBoxScoreRow(html=self.html).game_score, "some game score")
-        self.html.xpath.assert_called_once_with('td[@data-stat="game_score"]')
 
     def test_game_score_is_empty_string_when_cells_exist(self):
-        self.html.xpath = MagicMock(return_value=[])
+        self.html = html.fragment_fromstring('<tr></tr>')
         self.assertEqual(PlayerBoxScoreRow(html=self.html).game_score, '')
-        self.html.xpath.assert_called_once_with('td[@data-stat="game_score"]')
 
@@ -1,6 +1,8 @@
 from unittest import TestCase
 from unittest.mock import MagicMock, patch, PropertyMock
 
+from lxml import html
+
 from basketball_reference_web_scraper.html import PlayerIdentificationRow
 
 
@@ -9,15 +11,12 @@ class TestPlayerIdentificationRow(TestCase):
         self.html = MagicMock()
 
     def test_player_cell_when_cells_exist(self):
-        cell = MagicMock()
-        self.html.xpath = MagicMock(return_value=[cell])
-        self.assertEqual(PlayerIdentificationRow(html=self.html).player_cell, cell)
-        self.html.xpath.assert_called_once_with('td[@data-stat="player"]')
+        row_html = html.fragment_fromstring('<tr><th data-stat="player"></th><td data-stat="player"></td></tr>')
+        self.assertEqual(PlayerIdentificationRow(html=row_html).player_cell, row_html[1])
 
     def test_player_cell_is_none_when_cells_do_not_exist(self):
-        self.html.xpath = MagicMock(return_value=[])
-        self.assertIsNone(PlayerIdentificationRow(html=self.html).player_cell)
-        self.html.xpath.assert_called_once_with('td[@data-stat="player"]')
+        row_html = html.fragment_fromstring('<tr><th data-stat="player"></th></tr>')
+        self.assertIsNone(PlayerIdentificationRow(html=row_html).player_cell)
 
     @patch.object(PlayerIdentificationRow, 'player_cell', new_callable=PropertyMock)
     def test_slug_when_player_cell_is_not_none(self, mocked_player_cell):
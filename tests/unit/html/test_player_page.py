@@ -1,49 +1,37 @@
 from unittest import TestCase
-from unittest.mock import MagicMock
+
+from lxml import html
 
 from basketball_reference_web_scraper.html import PlayerPage, PlayerPageTotalsTable
 
 
 class TestPlayerPage(TestCase):
     def test_name_is_none_when_no_name_headers(self):
-        html = MagicMock()
-        html.xpath = MagicMock(return_value=[])
+        page_html = html.fromstring('<html><body><h1>not a name</h1></body></html>')
 
-        self.assertIsNone(PlayerPage(html=html).name)
-        html.xpath.assert_called_once_with('.//h1[@itemprop="name"]')
+        self.assertIsNone(PlayerPage(html=page_html).name)
 
     def test_name_is_first_name_header_content_when_name_headers(self):
-        first_name_header = MagicMock()
-        first_name_header.text_content = MagicMock(return_value="first name")
-
-        second_name_header = MagicMock()
-        second_name_header.text_content = MagicMock(return_value="second name")
-
-        html = MagicMock()
-        html.xpath = MagicMock(return_value=[first_name_header, second_name_header])
+        page_html = html.fromstring(
+            '<html><body><h1 itemprop="name"> first name </h1><h1 itemprop="name">second name</h1></body></html>'
+        )
 
         self.assertEqual(
-            PlayerPage(html=html).name,
+            PlayerPage(html=page_html).name,
             "first name"
         )
-        html.xpath.assert_called_once_with('.//h1[@itemprop="name"]')
 
     def test_totals_table_is_none_when_no_totals_tables(self):
-        html = MagicMock()
-        html.xpath = MagicMock(return_value=[])
+        page_html = html.fromstring('<html><body><table id="totals"></table></body></html>')
 
-        self.assertIsNone(PlayerPage(html=html).totals_table)
-        html.xpath.assert_called_once_with('.//table[@id="per_game"]')
+        self.assertIsNone(PlayerPage(html=page_html).totals_table)
 
     def test_totals_table_is_first_table_when_totals_tables(self):
-        first_table = MagicMock()
-        second_table = MagicMock()
-
-        html = MagicMock()
-        html.xpath = MagicMock(return_value=[first_table, second_table])
+        page_html = html.fromstring(
+            '<html><body><table id="per_game" class="first"></table><table id="per_game"></table></body></html>'
+        )
 
         self.assertEqual(
-            PlayerPage(html=html).totals_table,
-            PlayerPageTotalsTable(html=first_table),
+            PlayerPage(html=page_html).totals_table,
+            PlayerPageTotalsTable(html=page_html.find_class("first")[0]),
         )
-        html.xpath.assert_called_once_with('.//table[@id="per_game"]')
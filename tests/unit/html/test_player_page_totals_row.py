@@ -1,32 +1,26 @@
 from unittest import TestCase
 from unittest.mock import MagicMock
 
+from lxml import html
+
 from basketball_reference_web_scraper.html import PlayerPageTotalsRow
 
 
 class TestPlayerPageTotalsRow(TestCase):
     def test_league_abbreviation_is_none_when_no_matching_league_abbreviations(self):
-        html = MagicMock()
-        html.xpath = MagicMock(return_value=[])
+        row_html = html.fragment_fromstring('<tr><td data-stat="season">2019-20</td></tr>')
 
-        self.assertIsNone(PlayerPageTotalsRow(html=html).league_abbreviation)
-        html.xpath.assert_called_once_with('.//td[@data-stat="lg_id"]')
+        self.assertIsNone(PlayerPageTotalsRow(html=row_html).league_abbreviation)
 
     def test_league_abbreviation_is_first_abbreviation_text_content_when_matching_league_abbreviations(self):
-        first_abbreviation = MagicMock()
-        first_abbreviation.text_content = MagicMock(return_value="first abbreviation")
-
-        second_abbreviation = MagicMock()
-        second_abbreviation.text_content = MagicMock(return_value="second abbreviation")
-
-        html = MagicMock()
-        html.xpath = MagicMock(return_value=[first_abbreviation, second_abbreviation])
+        row_html = html.fragment_fromstring(
+            '<tr><td data-stat="lg_id">first abbreviation</td><td data-stat="lg_id">second abbreviation</td></tr>'
+        )
 
         self.assertEqual(
-            PlayerPageTotalsRow(html=html).league_abbreviation,
+            PlayerPageTotalsRow(html=row_html).league_abbreviation,
             "first abbreviation"
         )
-        html.xpath.assert_called_once_with('.//td[@data-stat="lg_id"]')
 
     def test_different_class_is_not_equal(self):
         self.assertNotEqual(
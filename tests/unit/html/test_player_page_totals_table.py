@@ -1,35 +1,31 @@
 from unittest import TestCase
 from unittest.mock import MagicMock
 
+from lxml import html
+
 from basketball_reference_web_scraper.html import PlayerPageTotalsTable, PlayerPageTotalsRow
 
 
 class TestPlayerPageTotalsTable(TestCase):
     def test_rows_are_empty_array_when_no_results(self):
-        html = MagicMock()
-        html.xpath = MagicMock(return_value=[])
+        table_html = html.fragment_fromstring('<table><thead><tr></tr></thead><tbody></tbody></table>')
 
         self.assertEqual(
-            PlayerPageTotalsTable(html=html).rows,
+            PlayerPageTotalsTable(html=table_html).rows,
             []
         )
-        html.xpath.assert_called_once_with('.//tbody/tr')
 
     def test_rows_when_results(self):
-        first_row = MagicMock(name="first row html")
-        second_row = MagicMock(name="second row html")
-
-        html = MagicMock()
-        html.xpath = MagicMock(return_value=[first_row, second_row])
+        table_html = html.fragment_fromstring('<table><tbody><tr></tr><tr></tr></tbody></table>')
+        first_row, second_row = table_html.xpath('tbody/tr')
 
         self.assertEqual(
-            PlayerPageTotalsTable(html=html).rows,
+            PlayerPageTotalsTable(html=table_html).rows,
             [
                 PlayerPageTotalsRow(html=first_row),
                 PlayerPageTotalsRow(html=second_row),
             ]
         )
-        html.xpath.assert_called_once_with('.//tbody/tr')
 
     def test_different_class_is_not_equal(self):
         self.assertNotEqual(
@@ -7,34 +7,32 @@ from basketball_reference_web_scraper.html import PlayerSearchResult
 class TestPlayerSearchResult(TestCase):
     def test_league_abbreviation_query(self):
         self.assertEqual(
-            PlayerSearchResult(html=MagicMock()).league_abbreviation_query,
+            PlayerSearchResult(html=MagicMock()).league_abbreviation_query.path,
             './div[@class="search-item-league"]'
         )
 
     @patch.object(PlayerSearchResult, 'league_abbreviation_query', new_callable=PropertyMock)
     def test_league_abbreviations_are_none_when_no_matching_abbreviations(self, mocked_query):
-        mocked_query.return_value = "some query"
+        mocked_query.return_value = MagicMock(return_value=[])
 
         html = MagicMock()
-        html.xpath = MagicMock(return_value=[])
 
         self.assertIsNone(PlayerSearchResult(html=html).league_abbreviations)
-        html.xpath.assert_called_once_with("some query")
+        mocked_query.return_value.assert_called_once_with(html)
 
     @patch.object(PlayerSearchResult, 'league_abbreviation_query', new_callable=PropertyMock)
     def test_league_abbreviations_are_first_abbreviation_text_content_when__matching_abbreviations(self, mocked_query):
-        mocked_query.return_value = "some query"
         first_abbreviation = MagicMock()
         first_abbreviation.text_content = MagicMock(return_value="first abbreviation")
 
         second_abbreviation = MagicMock()
         second_abbreviation.text_content = MagicMock(return_value="second abbreviation")
 
+        mocked_query.return_value = MagicMock(return_value=[first_abbreviation, second_abbreviation])
         html = MagicMock()
-        html.xpath = MagicMock(return_value=[first_abbreviation, second_abbreviation])
 
         self.assertEqual(
             PlayerSearchResult(html=html).league_abbreviations,
             "first abbreviation",
         )
-        html.xpath.assert_called_once_with("some query")
+        mocked_query.return_value.assert_called_once_with(html)
@@ -1,6 +1,8 @@
 from unittest import TestCase
 from unittest.mock import MagicMock
 
+from lxml import html
+
 from basketball_reference_web_scraper.html import PlayerSeasonBoxScoresRow
 
 
@@ -25,32 +27,25 @@ class TestPlayerSeasonBoxScoresRow(TestCase):
         )
 
     def test_is_active_is_false_when_cells_exist(self):
-        cell = MagicMock()
-        self.html.xpath = MagicMock(return_value=[cell])
+        self.html = html.fragment_fromstring('<tr><td data-stat="reason">Inactive</td></tr>')
         self.assertFalse(PlayerSeasonBoxScoresRow(html=self.html).is_active)
-        self.html.xpath.assert_called_once_with('td[@data-stat="reason"]')
 
     def test_is_active_is_true_when_cells_do_not_exist(self):
-        self.html.xpath = MagicMock(return_value=[])
+        self.html = html.fragment_fromstring('<tr></tr>')
         self.assertTrue(PlayerSeasonBoxScoresRow(html=self.html).is_active)
-        self.html.xpath.assert_called_once_with('td[@data-stat="reason"]')
 
     def test_date_when_cells_exist(self):
-        self.html.xpath = MagicMock(return_value=[MagicMock(text_content=MagicMock(return_value="some date"))])
+        self.html = html.fragment_fromstring('<tr><td data-stat="date_game">some date</td></tr>')
         self.assertEqual(PlayerSeasonBoxScoresRow(html=self.html).date, "some date")
-        self.html.xpath.assert_called_once_with('td[@data-stat="date_game"]')
 
     def test_date_is_empty_string_when_cells_do_not_exist(self):
-        self.html.xpath = MagicMock(return_value=[])
+        self.html = html.fragment_fromstring('<tr></tr>')
         self.assertEqual(PlayerSeasonBoxScoresRow(html=self.html).date, '')
-        self.html.xpath.assert_called_once_with('td[@data-stat="date_game"]')
 
     def test_points_scored_when_cells_exist(self):
-        self.html.xpath = MagicMock(return_value=[MagicMock(text_content=MagicMock(return_value="some points"))])
+        self.html = html.fragment_fromstring('<tr><td data-stat="pts">some points</td></tr>')
         self.assertEqual(PlayerSeasonBoxScoresRow(html=self.html).points_scored, "some points")
-        self.html.xpath.assert_called_once_with('td[@data-stat="pts"]')
 
     def test_points_scored_is_empty_string_when_cells_do_not_exist(self):
-        self.html.xpath = MagicMock(return_value=[])
+        self.html = html.fragment_fromstring('<tr></tr>')
         self.assertEqual(PlayerSeasonBoxScoresRow(html=self.html).points_scored, '')
-        self.html.xpath.assert_called_once_with('td[@data-stat="pts"]')
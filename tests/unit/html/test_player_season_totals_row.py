@@ -1,5 +1,7 @@
 from unittest import TestCase
-from unittest.mock import MagicMock, patch, PropertyMock
+from unittest.mock import MagicMock
+
+from lxml import html
 
 from basketball_reference_web_scraper.html import PlayerSeasonTotalsRow
 
@@ -9,71 +11,41 @@ class TestPlayerSeasonTotalsRow(TestCase):
         self.html = MagicMock()
 
     def test_position_abbreviations_when_cells_exist(self):
-        self.html.xpath = MagicMock(
-            return_value=[
-                MagicMock(text_content=MagicMock(return_value="some position abbreviations"))
-            ]
-        )
-
+        self.html = html.fragment_fromstring('<tr><td data-stat="pos">some position abbreviations</td></tr>')
         self.assertEqual(PlayerSeasonTotalsRow(html=self.html).position_abbreviations, "some position abbreviations")
-        self.html.xpath.assert_called_once_with('td[@data-stat="pos"]')
 
     def test_position_abbreviations_is_empty_string_when_cells_do_not_exist(self):
-        self.html.xpath = MagicMock(return_value=[])
+        self.html = html.fragment_fromstring('<tr></tr>')
         self.assertEqual(PlayerSeasonTotalsRow(html=self.html).position_abbreviations, "")
-        self.html.xpath.assert_called_once_with('td[@data-stat="pos"]')
 
     def test_age_when_cells_exist(self):
-        self.html.xpath = MagicMock(
-            return_value=[
-                MagicMock(text_content=MagicMock(return_value="some age"))
-            ]
-        )
-
+        self.html = html.fragment_fromstring('<tr><td data-stat="age">some age</td></tr>')
         self.assertEqual(PlayerSeasonTotalsRow(html=self.html).age, "some age")
-        self.html.xpath.assert_called_once_with('td[@data-stat="age"]')
 
     def test_age_is_empty_string_when_cells_do_not_exist(self):
-        self.html.xpath = MagicMock(return_value=[])
+        self.html = html.fragment_fromstring('<tr></tr>')
         self.assertEqual(PlayerSeasonTotalsRow(html=self.html).age, "")
-        self.html.xpath.assert_called_once_with('td[@data-stat="age"]')
 
     def test_games_played_when_cells_exist(self):
-        self.html.xpath = MagicMock(
-            return_value=[
-                MagicMock(text_content=MagicMock(return_value="some games played"))
-            ]
-        )
-
+        self.html = html.fragment_fromstring('<tr><td data-stat="g">some games played</td></tr>')
         self.assertEqual(PlayerSeasonTotalsRow(html=self.html).games_played, "some games played")
-        self.html.xpath.assert_called_once_with('td[@data-stat="g"]')
 
     def test_games_played_is_empty_string_when_cells_do_not_exist(self):
-        self.html.xpath = MagicMock(return_value=[])
+        self.html = html.fragment_fromstring('<tr></tr>')
         self.assertEqual(PlayerSeasonTotalsRow(html=self.html).games_played, "")
-        self.html.xpath.assert_called_once_with('td[@data-stat="g"]')
 
     def test_games_started_when_cells_exist(self):
-        self.html.xpath = MagicMock(
-            return_value=[
-                MagicMock(text_content=MagicMock(return_value="some games started"))
-            ]
-        )
-
+        self.html = html.fragment_fromstring('<tr><td data-stat="gs">some games started</td></tr>')
         self.assertEqual(PlayerSeasonTotalsRow(html=self.html).games_started, "some games started")
-        self.html.xpath.assert_called_once_with('td[@data-stat="gs"]')
 
     def test_games_started_is_empty_string_when_cells_do_not_exist(self):
-        self.html.xpath = MagicMock(return_value=[])
+        self.html = html.fragment_fromstring('<tr></tr>')
         self.assertEqual(PlayerSeasonTotalsRow(html=self.html).games_started, "")
-        self.html.xpath.assert_called_once_with('td[@data-stat="gs"]')
 
-    @patch.object(PlayerSeasonTotalsRow, 'team_abbreviation', new_callable=PropertyMock)
-    def test_is_combined_totals_when_team_abbreviation_is_tot(self, mocked_team_abbreviation):
-        mocked_team_abbreviation.return_value = "TOT"
+    def test_is_combined_totals_when_team_abbreviation_is_tot(self):
+        self.html = html.fragment_fromstring('<tr><td data-stat="team_id">TOT</td></tr>')
         self.assertTrue(PlayerSeasonTotalsRow(html=self.html).is_combined_totals)
 
-    @patch.object(PlayerSeasonTotalsRow, 'team_abbreviation', new_callable=PropertyMock)
-    def test_is_not_combined_totals_when_team_abbreviation_is_tot(self, mocked_team_abbreviation):
-        mocked_team_abbreviation.return_value = "jaebaebae"
+    def test_is_not_combined_totals_when_team_abbreviation_is_tot(self):
+        self.html = html.fragment_fromstring('<tr><td data-stat="team_id">jaebaebae</td></tr>')
         self.assertFalse(PlayerSeasonTotalsRow(html=self.html).is_combined_totals)
@@ -1,5 +1,5 @@
 from unittest import TestCase
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, PropertyMock, patch
 
 from basketball_reference_web_scraper.html import PlayerSeasonBoxScoresTable, PlayerSeasonBoxScoresRow
 
@@ -11,17 +11,20 @@ class TestPlayerSeasonBoxScoresTable(TestCase):
     def test_rows_query(self):
         self.assertEqual(
             '//tbody/tr[not(contains(@class, "thead"))]',
-            PlayerSeasonBoxScoresTable(html=self.html).rows_query,
+            PlayerSeasonBoxScoresTable(html=self.html).rows_query.path,
         )
 
-    def test_rows_returns_empty_array_when_there_are_not_any_matching_rows(self):
-        self.html.xpath = MagicMock(return_value=[])
+    @patch.object(PlayerSeasonBoxScoresTable, "rows_query", new_callable=PropertyMock)
+    def test_rows_returns_empty_array_when_there_are_not_any_matching_rows(self, mocked_rows_query):
+        mocked_rows_query.return_value = MagicMock(return_value=[])
         self.assertListEqual([], PlayerSeasonBoxScoresTable(html=self.html).rows)
+        mocked_rows_query.return_value.assert_called_once_with(self.html)
 
-    def test_rows_returns_populated_array_when_there_are_matching_rows(self):
+    @patch.object(PlayerSeasonBoxScoresTable, "rows_query", new_callable=PropertyMock)
+    def test_rows_returns_populated_array_when_there_are_matching_rows(self, mocked_rows_query):
         first_row_html = MagicMock(name="first matching row html")
         second_row_html = MagicMock(name="second matching row html")
-        self.html.xpath = MagicMock(return_value=[first_row_html, second_row_html])
+        mocked_rows_query.return_value = MagicMock(return_value=[first_row_html, second_row_html])
         self.assertListEqual([
                 PlayerSeasonBoxScoresRow(html=first_row_html),
                 PlayerSeasonBoxScoresRow(html=second_row_html),
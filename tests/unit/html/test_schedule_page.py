@@ -10,58 +10,52 @@ class TestSchedulePage(TestCase):
 
     def test_other_months_schedule_links_query(self):
         self.assertEqual(
-            SchedulePage(html=self.html).other_months_schedule_links_query,
+            SchedulePage(html=self.html).other_months_schedule_links_query.path,
             '//div[@id="content"]/div[@class="filter"]/div[not(contains(@class, "current"))]/a'
         )
 
     def test_rows_query(self):
         self.assertEqual(
-            SchedulePage(html=self.html).rows_query,
+            SchedulePage(html=self.html).rows_query.path,
             '//table[@id="schedule"]//tbody/tr'
         )
 
     @patch.object(SchedulePage, 'other_months_schedule_links_query', new_callable=PropertyMock)
     def test_other_months_schedule_urls(self, mocked_other_months_schedule_links_query):
-        query = "some query"
-        mocked_other_months_schedule_links_query.return_value = query
         link_href = "some link href"
         link = MagicMock()
         link.attrib = MagicMock()
         link.attrib.__getitem__ = MagicMock(return_value=link_href)
         links = [link]
-        self.html.xpath = MagicMock(return_value=links)
+        mocked_other_months_schedule_links_query.return_value = MagicMock(return_value=links)
 
         self.assertEqual(
             SchedulePage(html=self.html).other_months_schedule_urls,
             [link_href]
         )
-        self.html.xpath.assert_called_once_with(query)
+        mocked_other_months_schedule_links_query.return_value.assert_called_once_with(self.html)
         link.attrib.__getitem__.assert_called_once_with('href')
 
     @patch.object(SchedulePage, 'rows_query', new_callable=PropertyMock)
     def test_no_rows_are_returned_when_all_rows_have_playoffs_content(self, mocked_rows_query):
-        query = "some query"
-        mocked_rows_query.return_value = query
         playoff_row = MagicMock()
         playoff_row.text_content = MagicMock(return_value="Playoffs")
         rows = [playoff_row]
-        self.html.xpath = MagicMock(return_value=rows)
+        mocked_rows_query.return_value = MagicMock(return_value=rows)
 
         self.assertEqual(
             SchedulePage(html=self.html).rows,
             []
         )
-        self.html.xpath.assert_called_once_with(query)
+        mocked_rows_query.return_value.assert_called_once_with(self.html)
         playoff_row.text_content.assert_called_once_with()
 
     @patch.object(SchedulePage, 'rows_query', new_callable=PropertyMock)
     def test_all_rows_are_returned_when_all_rows_have_playoffs_content(self, mocked_rows_query):
-        query = "some query"
-        mocked_rows_query.return_value = query
         non_playoff_row = MagicMock()
         non_playoff_row.text_content = MagicMock(return_value="jaebaebae")
         rows = [non_playoff_row]
-        self.html.xpath = MagicMock(return_value=rows)
+        mocked_rows_query.return_value = MagicMock(return_value=rows)
 
         self.assertEqual(
             SchedulePage(html=self.html).rows,
@@ -7,40 +7,33 @@ from basketball_reference_web_scraper.html import SearchPage, PlayerSearchResult
 class TestSearchPage(TestCase):
     def test_nba_aba_baa_players_content_query(self):
         self.assertEqual(
-            SearchPage(html=MagicMock()).nba_aba_baa_players_content_query,
+            SearchPage(html=MagicMock()).nba_aba_baa_players_content_query.path,
             '//div[@id="searches"]/div[@id="players"]',
         )
 
-    @patch.object(SearchPage, 'nba_aba_baa_players_content_query', new_callable=PropertyMock)
-    def test_nba_aba_baa_players_pagination_links_query(self, mocked_query):
-        mocked_query.return_value = "some query"
-
+    def test_nba_aba_baa_players_pagination_links_query(self):
         self.assertEqual(
-            SearchPage(html=MagicMock()).nba_aba_baa_players_pagination_links_query,
-            'some query/div[@class="search-pagination"]/a',
+            SearchPage(html=MagicMock()).nba_aba_baa_players_pagination_links_query.path,
+            '//div[@id="searches"]/div[@id="players"]/div[@class="search-pagination"]/a',
         )
 
-    @patch.object(SearchPage, 'nba_aba_baa_players_content_query', new_callable=PropertyMock)
-    def test_nba_aba_baa_player_search_items_query(self, mocked_query):
-        mocked_query.return_value = "some query"
-
+    def test_nba_aba_baa_player_search_items_query(self):
         self.assertEqual(
-            SearchPage(html=MagicMock()).nba_aba_baa_player_search_items_query,
-            'some query/div[@class="search-item"]',
+            SearchPage(html=MagicMock()).nba_aba_baa_player_search_items_query.path,
+            '//div[@id="searches"]/div[@id="players"]/div[@class="search-item"]',
         )
 
     @patch.object(SearchPage, 'nba_aba_baa_players_pagination_links_query', new_callable=PropertyMock)
     def test_nba_aba_baa_players_pagination_links(self, mocked_query):
-        mocked_query.return_value = "some query"
         html = MagicMock()
         links = [MagicMock(return_value="some"), MagicMock(return_value="links")]
-        html.xpath = MagicMock(return_value=links)
+        mocked_query.return_value = MagicMock(return_value=links)
 
         self.assertEqual(
             SearchPage(html=html).nba_aba_baa_players_pagination_links,
             links,
         )
-        html.xpath.asset_called_once_with("some query")
+        mocked_query.return_value.assert_called_once_with(html)
 
     @patch.object(SearchPage, 'nba_aba_baa_players_pagination_links', new_callable=PropertyMock)
     def test_nba_aba_baa_players_pagination_url_is_none_when_no_pagination_links(self, mocked_links):
@@ -98,14 +91,12 @@ class TestSearchPage(TestCase):
 
     @patch.object(SearchPage, 'nba_aba_baa_player_search_items_query', new_callable=PropertyMock)
     def test_nba_aba_baa_players(self, mocked_query):
-        mocked_query.return_value = "some query"
-
         first_result = MagicMock(name="first html result")
         second_result = MagicMock(name="second html result")
         third_result = MagicMock(name="third html result")
 
         html = MagicMock()
-        html.xpath = MagicMock(return_value=[first_result, second_result, third_result])
+        mocked_query.return_value = MagicMock(return_value=[first_result, second_result, third_result])
 
         self.assertEqual(
             SearchPage(html=html).nba_aba_baa_players,
@@ -7,31 +7,29 @@ from basketball_reference_web_scraper.html import SearchResult
 class TestSearchResult(TestCase):
     def test_resource_link_query(self):
         self.assertEqual(
-            SearchResult(html=MagicMock()).resource_link_query,
+            SearchResult(html=MagicMock()).resource_link_query.path,
             './div[@class="search-item-name"]//a',
         )
 
     @patch.object(SearchResult, "resource_link_query", new_callable=PropertyMock)
     def test_resource_link_when_no_matching_links(self, mocked_query):
-        mocked_query.return_value = "some query"
         html = MagicMock()
-        html.xpath = MagicMock(return_value=[])
+        mocked_query.return_value = MagicMock(return_value=[])
 
         self.assertIsNone(SearchResult(html=html).resource_link)
-        html.xpath.assert_called_once_with("some query")
+        mocked_query.return_value.assert_called_once_with(html)
 
     @patch.object(SearchResult, "resource_link_query", new_callable=PropertyMock)
     def test_resource_link_when_matching_links(self, mocked_query):
-        mocked_query.return_value = "some query"
         first_link = MagicMock()
         html = MagicMock()
-        html.xpath = MagicMock(return_value=[first_link])
+        mocked_query.return_value = MagicMock(return_value=[first_link])
 
         self.assertEqual(
             SearchResult(html=html).resource_link,
             first_link,
         )
-        html.xpath.assert_called_once_with("some query")
+        mocked_query.return_value.assert_called_once_with(html)
 
     @patch.object(SearchResult, "resource_link", new_callable=PropertyMock)
     def test_resource_location_when_resource_link_is_none(self, mocked_resource_link):
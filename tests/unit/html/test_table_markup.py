@@ -0,0 +1,80 @@
+import os
+from unittest import TestCase
+
+from basketball_reference_web_scraper.html import find_table_markup, parse_table, parse_table_or_document, \
+    PlayerSeasonBoxScoresPage, TABLE_QUERY
+
+BOX_SCORES_PAGE_PATH = os.path.join(os.path.dirname(__file__), "../../integration/files/201701010ATL.html")
+
+
+class TestTableMarkup(TestCase):
+    def setUp(self):
+        with open(BOX_SCORES_PAGE_PATH, "rb") as page:
+            self.content = page.read()
+
+    def test_finds_table_that_is_part_of_page(self):
+        markup = find_table_markup(content=self.content, table_id="box-SAS-game-basic")
+
+        self.assertTrue(markup.startswith(b"<table"))
+        self.assertTrue(markup.endswith(b"</table>"))
+        self.assertIn(b'id="box-SAS-game-basic"', markup)
+
+    def test_finds_table_in_comment(self):
+        table = parse_table(content=self.content, table_id="four_factors")
+
+        self.assertEqual("four_factors", table.get("id"))
+        self.assertEqual(["91.5", "91.5"], [cell.text for cell in table.xpath('.//td[@data-stat="pace"]')])
+
+    def test_missing_table_is_none(self):
+        self.assertIsNone(find_table_markup(content=self.content, table_id="jaebaebae"))
+        self.assertIsNone(parse_table(content=self.content, table_id="jaebaebae"))
+
+    def test_nested_tables_are_part_of_table(self):
+        content = b'<div><table id="outer"><tr><td><table id="inner"></table></td></tr></table><table></table></div>'
+
+        self.assertEqual(
+            b'<table id="outer"><tr><td><table id="inner"></table></td></tr></table>',
+            find_table_markup(content=content, table_id="outer"),
+        )
+
+    def test_table_is_decoded_with_page_encoding(self):
+        content = '<html><head><meta charset="utf-8"></head><body><table id="players"><tr><td>Luka Dončić</td>' \
+                  '</tr></table></body></html>'.encode("utf8")
+
+        self.assertEqual("Luka Dončić", parse_table(content=content, table_id="players").text_content())
+
+    def test_table_or_document_is_table_when_found(self):
+        table = parse_table_or_document(content=self.content, table_id="box-SAS-game-basic")
+
+        self.assertEqual("table", table.tag)
+        self.assertEqual([table], TABLE_QUERY(table, table_id="box-SAS-game-basic"))
+
+    def test_table_or_document_falls_back_to_whole_page(self):
+        document = parse_table_or_document(content=self.content, table_id="jaebaebae")
+
+        self.assertEqual("html", document.tag)
+        self.assertEqual(1, len(TABLE_QUERY(document, table_id="box-SAS-game-basic")))
+
+
+class TestPlayerSeasonBoxScoresPageContent(TestCase):
+    CONTENT = b'''
+        <html><body>
+        <table id="pgl_basic"><tbody><tr><td data-stat="date_game">2019-01-01</td></tr></tbody></table>
+        <div id="all_pgl_basic_playoffs"><!--
+            <table id="pgl_basic_playoffs"><tbody><tr><td data-stat="date_game">2019-04-01</td></tr></tbody></table>
+        --></div>
+        </body></html>
+    '''
+
+    def test_tables_are_parsed_without_parsing_whole_page(self):
+        page = PlayerSeasonBoxScoresPage(content=self.CONTENT)
+
+        self.assertEqual("2019-01-01", page.regular_season_box_scores_table.rows[0].date)
+        self.assertEqual("2019-04-01", page.playoff_box_scores_table.rows[0].date)
+        self.assertIsNone(page._html)
+
+    def test_whole_page_is_parsed_when_table_is_missing(self):
+        page = PlayerSeasonBoxScoresPage(content=b'<html><body><div id="content"></div></body></html>')
+
+        self.assertIsNone(page.playoff_box_scores_table)
+        self.assertIsNotNone(page._html)
@@ -0,0 +1,69 @@
+import os
+from unittest import TestCase
+
+from lxml import html
+
+from basketball_reference_web_scraper.html import iter_table_rows, content_chunks, PlayerSeasonTotalTable, \
+    PlayerTotalContractsTable
+
+TOTALS_PAGE_PATH = os.path.join(
+    os.path.dirname(__file__),
+    "../../integration/files/NBA_2019_totals_jemerrio_jones_blank_age.html",
+)
+
+
+class TestIterTableRows(TestCase):
+    CONTENT = '''
+        <html><head><meta charset="utf-8"></head><body>
+        <table id="other"><tbody><tr><td>other</td></tr></tbody></table>
+        <table id="target"><thead><tr><th>header</th></tr></thead><tbody>
+        ''' + ''.join('<tr><td>Dončić {}</td></tr>'.format(index) for index in range(100)) + '''
+        </tbody></table>
+        <table id="after"><tbody><tr><td>after</td></tr></tbody></table>
+        </body></html>
+    '''
+
+    def test_rows_of_only_target_table_are_yielded(self):
+        rows = [
+            row.text_content()
+            for row in iter_table_rows(chunks=content_chunks(self.CONTENT.encode("utf8"), chunk_size=64), table_id="target")
+        ]
+
+        self.assertEqual(["header"] + ["Dončić {}".format(index) for index in range(100)], rows)
+
+    def test_rows_before_current_row_are_released(self):
+        for row in iter_table_rows(chunks=content_chunks(self.CONTENT.encode("utf8"), chunk_size=64), table_id="target"):
+            self.assertIsInstance(row, html.HtmlElement)
+            # Besides the current row, the tree only has the rows in the rest of the last chunk that was parsed
+            self.assertIsNone(row.getprevious())
+            self.assertLessEqual(len(row.getparent()), 4)
+
+    def test_missing_table_has_no_rows(self):
+        self.assertEqual([], list(iter_table_rows(chunks=[self.CONTENT.encode("utf8")], table_id="jaebaebae")))
+
+
+class TestStreamRows(TestCase):
+    def test_streamed_season_totals_rows_are_the_same_as_parsed_rows(self):
+        with open(TOTALS_PAGE_PATH, "rb") as page:
+            content = page.read()
+
+        self.assertEqual(
+            [row.record for row in PlayerSeasonTotalTable(html=html.fromstring(content)).rows],
+            [row.record for row in PlayerSeasonTotalTable.stream_rows(chunks=content_chunks(content))],
+        )
+
+    def test_streamed_player_contracts_rows_are_body_rows(self):
+        content = b'''
+            <table id="player-contracts">
+            <thead><tr><th data-stat="player">Player</th></tr></thead>
+            <tbody><tr><td data-stat="player">Stephen Curry</td><td data-stat="y1" class="salary-pl">$1</td></tr></tbody>
+            </table>
+        '''
+
+        self.assertEqual(
+            [("Stephen Curry", "$1", "salary-pl")],
+            [
+                (row.record["player_name"], row.record["year_1"], row.record["year_1_class"])
+                for row in PlayerTotalContractsTable.stream_rows(chunks=[content])
+            ],
+        )
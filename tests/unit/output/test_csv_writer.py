@@ -1,7 +1,11 @@
+import csv
+import io
 from unittest import TestCase, mock
 
-from basketball_reference_web_scraper.data import OutputWriteOption
-from basketball_reference_web_scraper.output.writers import CSVWriter, FileOptions, OutputOptions, OutputType
+from basketball_reference_web_scraper.data import OutputWriteOption, Team, Position
+from basketball_reference_web_scraper.output.fields import format_value
+from basketball_reference_web_scraper.output.writers import CSVWriter, FileOptions, OutputOptions, OutputType, \
+    PlayerSeasonBoxScoresCSVWriter
 
 
 class TestCSVWriter(TestCase):
@@ -11,87 +15,167 @@ class TestCSVWriter(TestCase):
             {"value": "row"},
             {"value": "data"}
         ]
-        self.COLUMN_NAMES = ["some", "column", "names"]
+        self.COLUMN_NAMES = ["value", "column", "names"]
         self.row_formatter = mock.Mock(side_effect=lambda x: x)
-        self.csv_dict_writer = mock.Mock(writeheader=mock.Mock(), writerows=mock.Mock())
+        self.csv_writer = mock.Mock(writerow=mock.Mock(), writerows=mock.Mock())
         self.writer = CSVWriter(value_formatter=self.row_formatter)
 
-    @mock.patch("csv.DictWriter")
-    def test_opens_correct_file(self, mock_csv_dict_writer):
-        with mock.patch("builtins.open", mock.mock_open()) as mock_file:
-            mock_csv_dict_writer.return_value = self.csv_dict_writer
-            self.writer.write(
-                data=self.DATA,
-                options=OutputOptions(
-                    file_options=FileOptions(
-                        path="some file path",
-                        mode=OutputWriteOption.WRITE,
-                    ),
-                    formatting_options={
-                        "column_names": self.COLUMN_NAMES
-                    },
-                    output_type=OutputType.CSV,
+    def write(self, data, column_names):
+        self.writer.write(
+            data=data,
+            options=OutputOptions(
+                file_options=FileOptions(
+                    path="some file path",
+                    mode=OutputWriteOption.WRITE,
                 ),
-            )
+                formatting_options={
+                    "column_names": column_names
+                },
+                output_type=OutputType.CSV,
+            ),
+        )
+
+    @mock.patch("csv.writer")
+    def test_opens_correct_file(self, mock_csv_writer):
+        with mock.patch("builtins.open", mock.mock_open()) as mock_file:
+            mock_csv_writer.return_value = self.csv_writer
+            self.write(data=self.DATA, column_names=self.COLUMN_NAMES)
             mock_file.assert_called_with("some file path", OutputWriteOption.WRITE.value, newline="", encoding="utf8")
 
-    @mock.patch("csv.DictWriter")
-    def test_file_and_columns_are_used_by_writer(self, mock_csv_dict_writer):
+    @mock.patch("csv.writer")
+    def test_file_is_used_by_writer(self, mock_csv_writer):
         with mock.patch("builtins.open", mock.mock_open()) as mock_file:
-            mock_csv_dict_writer.return_value = self.csv_dict_writer
-            self.writer.write(
-                data=self.DATA,
-                options=OutputOptions(
-                    file_options=FileOptions(
-                        path="some file path",
-                        mode=OutputWriteOption.WRITE,
-                    ),
-                    formatting_options={
-                        "column_names": self.COLUMN_NAMES
-                    },
-                    output_type=OutputType.CSV,
-                ),
-            )
-            mock_csv_dict_writer.assert_called_with(mock_file(), fieldnames=self.COLUMN_NAMES)
+            mock_csv_writer.return_value = self.csv_writer
+            self.write(data=self.DATA, column_names=self.COLUMN_NAMES)
+            mock_csv_writer.assert_called_with(mock_file())
 
-    @mock.patch("csv.DictWriter")
-    def test_header_is_written(self, mock_csv_dict_writer):
+    @mock.patch("csv.writer")
+    def test_header_is_written(self, mock_csv_writer):
         with mock.patch("builtins.open", mock.mock_open()):
-            mock_csv_dict_writer.return_value = self.csv_dict_writer
-            self.writer.write(
-                data=self.DATA,
+            mock_csv_writer.return_value = self.csv_writer
+            self.write(data=self.DATA, column_names=self.COLUMN_NAMES)
+            self.csv_writer.writerow.assert_called_once_with(self.COLUMN_NAMES)
+
+    @mock.patch("csv.writer")
+    def test_rows_are_written_in_column_order(self, mock_csv_writer):
+        with mock.patch("builtins.open", mock.mock_open()):
+            mock_csv_writer.return_value = self.csv_writer
+            self.write(data=self.DATA, column_names=self.COLUMN_NAMES)
+            self.csv_writer.writerows.assert_called_once()
+            self.assertEqual(
+                [
+                    ("some", None, None),
+                    ("row", None, None),
+                    ("data", None, None),
+                ],
+                list(self.csv_writer.writerows.call_args[0][0]),
+            )
+
+    def test_values_are_written_like_dict_writer(self):
+        csv_file = io.StringIO()
+        data = [
+            {"name": "LeBron James", "team": Team.LOS_ANGELES_LAKERS, "positions": [Position.SMALL_FORWARD],
+             "points": 25, "age": None},
+            {"name": "Luka Doncic", "team": None, "positions": [Position.POINT_GUARD, Position.SMALL_FORWARD],
+             "points": 30, "age": 20},
+            {"name": "Stephen Curry", "team": Team.GOLDEN_STATE_WARRIORS, "positions": [], "points": 0},
+        ]
+        column_names = ["name", "age", "team", "positions", "points"]
+        with mock.patch("builtins.open", return_value=csv_file), mock.patch.object(csv_file, "close"):
+            CSVWriter(value_formatter=format_value).write(
+                data=data,
                 options=OutputOptions(
-                    file_options=FileOptions(
-                        path="some file path",
-                        mode=OutputWriteOption.WRITE,
-                    ),
-                    formatting_options={
-                        "column_names": self.COLUMN_NAMES
-                    },
+                    file_options=FileOptions(path="some file path", mode=OutputWriteOption.WRITE),
+                    formatting_options={"column_names": column_names},
                     output_type=OutputType.CSV,
                 ),
             )
-            self.csv_dict_writer.writeheader.assert_called_once_with()
 
-    @mock.patch("csv.DictWriter")
-    def test_rows_are_written(self, mock_csv_dict_writer):
-        with mock.patch("builtins.open", mock.mock_open()):
-            mock_csv_dict_writer.return_value = self.csv_dict_writer
-            self.writer.write(
+        dict_writer_file = io.StringIO()
+        dict_writer = csv.DictWriter(dict_writer_file, fieldnames=column_names)
+        dict_writer.writeheader()
+        dict_writer.writerows([{key: format_value(value) for key, value in row.items()} for row in data])
+
+        self.assertEqual(dict_writer_file.getvalue(), csv_file.getvalue())
+
+    def test_values_that_do_not_have_a_column_are_an_error(self):
+        with mock.patch("builtins.open", mock.mock_open()) as mock_file:
+            self.assertRaisesRegex(
+                ValueError,
+                "dict contains fields not in fieldnames: 'value'",
+                self.write,
                 data=self.DATA,
+                column_names=["some", "column", "names"],
+            )
+            mock_file.assert_not_called()
+
+    @mock.patch("basketball_reference_web_scraper.output.writers.CSV_CHUNK_SIZE", 2)
+    def test_rows_are_written_in_chunks(self):
+        with mock.patch("csv.writer", return_value=self.csv_writer), mock.patch("builtins.open", mock.mock_open()):
+            self.write(data=self.DATA, column_names=["value"])
+
+        self.assertEqual(
+            [[("some",), ("row",)], [("data",)]],
+            [list(call[0][0]) for call in self.csv_writer.writerows.call_args_list],
+        )
+
+    @mock.patch("basketball_reference_web_scraper.output.writers.CSV_CHUNK_SIZE", 2)
+    def test_rows_are_written_as_they_are_parsed(self):
+        parsed_rows = []
+
+        def rows():
+            for value in ["some", "row", "data"]:
+                parsed_rows.append(value)
+                yield {"value": value}
+
+        parsed_rows_when_written = []
+        self.csv_writer.writerows.side_effect = lambda rows_to_write: parsed_rows_when_written.append(len(parsed_rows))
+        with mock.patch("csv.writer", return_value=self.csv_writer), \
+                mock.patch("builtins.open", mock.mock_open()):
+            self.write(data=rows(), column_names=["value"])
+
+        # Each chunk is written before the rows of the next chunk are parsed
+        self.assertEqual([2, 3], parsed_rows_when_written)
+        self.assertEqual(["some", "row", "data"], parsed_rows)
+
+    def test_file_is_not_opened_when_rows_cannot_be_parsed(self):
+        def rows():
+            raise ValueError("some error")
+            yield
+
+        with mock.patch("builtins.open", mock.mock_open()) as mock_file:
+            self.assertRaisesRegex(
+                ValueError,
+                "some error",
+                self.writer.write,
+                data=rows(),
                 options=OutputOptions(
-                    file_options=FileOptions(
-                        path="some file path",
-                        mode=OutputWriteOption.WRITE,
-                    ),
-                    formatting_options={
-                        "column_names": self.COLUMN_NAMES
-                    },
+                    file_options=FileOptions(path="some file path", mode=OutputWriteOption.WRITE),
+                    formatting_options={"column_names": ["value"]},
                     output_type=OutputType.CSV,
                 ),
             )
-            self.csv_dict_writer.writerows.assert_called_once_with([
-                {"value": "some"},
-                {"value": "row"},
-                {"value": "data"}
-            ])
+            mock_file.assert_not_called()
+
+
+class TestPlayerSeasonBoxScoresCSVWriter(TestCase):
+    def test_rows_are_flattened_with_playoffs_flag(self):
+        writer = PlayerSeasonBoxScoresCSVWriter(value_formatter=lambda x: x)
+        self.assertEqual(
+            [
+                {"playoffs": False, "value": "some"},
+                {"playoffs": True, "value": "row"},
+                {"playoffs": True, "value": "data"},
+            ],
+            list(writer.rows(data={
+                "regular_season": [{"value": "some"}],
+                "playoffs": [{"value": "row"}, {"value": "data"}],
+            })),
+        )
+
+    def test_missing_playoffs_are_ignored(self):
+        writer = PlayerSeasonBoxScoresCSVWriter(value_formatter=lambda x: x)
+        self.assertEqual(
+            [{"playoffs": False, "value": "some"}],
+            list(writer.rows(data={"regular_season": [{"value": "some"}]})),
+        )
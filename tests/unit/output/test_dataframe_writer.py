@@ -0,0 +1,153 @@
+import math
+import subprocess
+import sys
+from datetime import date
+from unittest import TestCase, skipIf
+from unittest.mock import patch
+
+from basketball_reference_web_scraper.data import OutputType, Team, Position, Location, League
+from basketball_reference_web_scraper.output.fields import format_value
+from basketball_reference_web_scraper.output.writers import DataFrameWriter, FileOptions, OutputOptions, \
+    PlayerSeasonBoxScoresDataFrameWriter, SearchDataFrameWriter
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+
+def dataframe_options(column_names=None):
+    return OutputOptions.of(
+        file_options=FileOptions.of(),
+        output_type=OutputType.DATAFRAME,
+        csv_options=None if column_names is None else {"column_names": column_names},
+    )
+
+
+class TestDataFrameOutputOptions(TestCase):
+    def test_columns_are_csv_columns(self):
+        self.assertEqual({"column_names": ["name", "team"]}, dataframe_options(["name", "team"]).formatting_options)
+        self.assertEqual(OutputType.DATAFRAME, dataframe_options().output_type)
+
+
+class TestMissingPandas(TestCase):
+    @patch.dict(sys.modules, {"pandas": None})
+    def test_dataframe_output_raises_import_error(self):
+        self.assertRaisesRegex(
+            ImportError,
+            "DataFrame output require pandas, which can be installed with pip install pandas",
+            DataFrameWriter(value_formatter=format_value).write,
+            data=[],
+            options=dataframe_options(),
+        )
+
+    def test_pandas_is_not_imported_by_client(self):
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys; from basketball_reference_web_scraper import client, async_client; "
+                "sys.exit('pandas' in sys.modules)",
+            ],
+        )
+
+        self.assertEqual(0, result.returncode)
+
+
+@skipIf(pandas is None, "pandas is not installed")
+class TestDataFrameWriter(TestCase):
+    def setUp(self):
+        self.writer = DataFrameWriter(value_formatter=format_value)
+        self.data = [
+            {
+                "name": "Jimmy Butler",
+                "positions": [Position.SMALL_FORWARD, Position.SHOOTING_GUARD],
+                "team": Team.PHILADELPHIA_76ERS,
+                "age": 29,
+                "points": 1004,
+                "win_shares": 7.1,
+                "is_combined_totals": False,
+            },
+            {
+                "name": "Luka Doncic",
+                "positions": [Position.SMALL_FORWARD],
+                "team": Team.DALLAS_MAVERICKS,
+                "age": None,
+                "points": 1526,
+                "win_shares": 4.1,
+                "is_combined_totals": False,
+            },
+            {
+                "name": "Jimmy Butler",
+                "positions": [Position.SMALL_FORWARD, Position.SHOOTING_GUARD],
+                "team": None,
+                "age": 29,
+                "points": 1474,
+                "win_shares": 9.0,
+                "is_combined_totals": True,
+            },
+        ]
+
+    def test_enum_columns_are_categoricals_of_every_enum_value(self):
+        dataframe = self.writer.write(data=self.data, options=dataframe_options())
+
+        self.assertIsInstance(dataframe["team"].dtype, pandas.CategoricalDtype)
+        self.assertEqual([team.value for team in Team], list(dataframe["team"].cat.categories))
+        self.assertEqual(["PHILADELPHIA 76ERS", "DALLAS MAVERICKS"], list(dataframe["team"][:2]))
+        self.assertTrue(pandas.isna(dataframe["team"][2]))
+
+    def test_enum_list_columns_are_categoricals_of_formatted_lists(self):
+        dataframe = self.writer.write(data=self.data, options=dataframe_options())
+
+        self.assertIsInstance(dataframe["positions"].dtype, pandas.CategoricalDtype)
+        self.assertEqual(
+            ["SMALL FORWARD-SHOOTING GUARD", "SMALL FORWARD", "SMALL FORWARD-SHOOTING GUARD"],
+            list(dataframe["positions"]),
+        )
+
+    def test_number_columns_are_numeric(self):
+        dataframe = self.writer.write(data=self.data, options=dataframe_options())
+
+        self.assertEqual("int64", dataframe["points"].dtype)
+        self.assertEqual("float64", dataframe["win_shares"].dtype)
+        self.assertEqual("bool", dataframe["is_combined_totals"].dtype)
+        # Like pandas, missing ints are NaN
+        self.assertEqual("float64", dataframe["age"].dtype)
+        self.assertTrue(math.isnan(dataframe["age"][1]))
+
+    def test_columns_are_in_column_names_order(self):
+        dataframe = self.writer.write(data=self.data, options=dataframe_options(["points", "name", "jaebaebae"]))
+
+        self.assertEqual(["points", "name", "jaebaebae"], list(dataframe.columns))
+        self.assertEqual([1004, 1526, 1474], list(dataframe["points"]))
+        self.assertTrue(dataframe["jaebaebae"].isna().all())
+
+    def test_other_values_are_unchanged(self):
+        dataframe = self.writer.write(
+            data=[{"date": date(2019, 1, 1), "location": Location.HOME}],
+            options=dataframe_options(),
+        )
+
+        self.assertEqual(date(2019, 1, 1), dataframe["date"][0])
+        self.assertEqual("HOME", dataframe["location"][0])
+
+    def test_no_data_is_empty_dataframe(self):
+        self.assertEqual(0, len(self.writer.write(data=[], options=dataframe_options(["name"]))))
+
+    def test_search_results_are_players(self):
+        dataframe = SearchDataFrameWriter(value_formatter=format_value).write(
+            data={"players": [{"name": "Stephen Curry", "leagues": {League.NATIONAL_BASKETBALL_ASSOCIATION}}]},
+            options=dataframe_options(),
+        )
+
+        self.assertEqual(["Stephen Curry"], list(dataframe["name"]))
+        self.assertEqual(["NATIONAL_BASKETBALL_ASSOCIATION"], list(dataframe["leagues"]))
+
+    def test_player_season_box_scores_have_playoffs_column(self):
+        dataframe = PlayerSeasonBoxScoresDataFrameWriter(value_formatter=format_value).write(
+            data={"regular_season": [{"points_scored": 10}], "playoffs": [{"points_scored": 20}]},
+            options=dataframe_options(),
+        )
+
+        self.assertEqual([10, 20], list(dataframe["points_scored"]))
+        self.assertEqual([False, True], list(dataframe["playoffs"]))
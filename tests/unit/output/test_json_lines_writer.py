@@ -0,0 +1,154 @@
+import json
+import os
+import shutil
+import tempfile
+from datetime import date, datetime
+from unittest import TestCase
+
+from basketball_reference_web_scraper.data import OutputType, OutputWriteOption, Team, Position, League, Location
+from basketball_reference_web_scraper.output.fields import BasketballReferenceJSONEncoder, JSONRecordConverter
+from basketball_reference_web_scraper.output.writers import JSONLinesWriter, FileOptions, OutputOptions, \
+    SearchJSONLinesWriter, PlayerSeasonBoxScoresJSONLinesWriter
+
+
+def json_lines_options(path=None, mode=None, json_options=None):
+    return OutputOptions.of(
+        file_options=FileOptions.of(path=path, mode=mode),
+        output_type=OutputType.JSONL,
+        json_options=json_options,
+    )
+
+
+class TestJSONLinesOutputOptions(TestCase):
+    def test_records_are_compact(self):
+        self.assertEqual({"separators": (",", ":")}, json_lines_options().formatting_options)
+        self.assertEqual(
+            {"separators": (",", ":"), "sort_keys": True},
+            json_lines_options(json_options={"sort_keys": True}).formatting_options,
+        )
+
+    def test_options_that_split_records_across_lines_are_rejected(self):
+        self.assertRaises(ValueError, json_lines_options, json_options={"indent": 4})
+        self.assertRaises(ValueError, json_lines_options, json_options={"separators": (", ", ": ")})
+
+
+class TestJSONRecordConverter(TestCase):
+    def test_records_are_encoded_like_json_encoder(self):
+        records = [
+            {"team": Team.BOSTON_CELTICS, "date": date(2019, 1, 1), "positions": [Position.POINT_GUARD], "points": 1},
+            {"team": None, "date": date(2019, 1, 2), "positions": [], "points": 2},
+            {"team": Team.ATLANTA_HAWKS, "date": datetime(2019, 1, 3, 19, 30), "positions": [], "points": 3},
+        ]
+        converter = JSONRecordConverter()
+
+        self.assertEqual(
+            [json.dumps(record, cls=BasketballReferenceJSONEncoder) for record in records],
+            [json.dumps(converter.convert(record)) for record in records],
+        )
+
+    def test_records_are_not_changed(self):
+        record = {"team": Team.BOSTON_CELTICS}
+
+        self.assertEqual({"team": "BOSTON CELTICS"}, JSONRecordConverter().convert(record))
+        self.assertEqual({"team": Team.BOSTON_CELTICS}, record)
+
+    def test_keys_are_resolved_from_first_non_null_value(self):
+        converter = JSONRecordConverter()
+        converter.convert({"location": None, "points": 1})
+
+        self.assertEqual({"location": "HOME", "points": 2}, converter.convert({"location": Location.HOME, "points": 2}))
+        self.assertEqual(["location"], [key for key, _, _ in converter.converted_keys])
+
+    def test_keys_that_first_appear_in_later_records_are_converted(self):
+        converter = JSONRecordConverter()
+        converter.convert({"points": 1})
+
+        self.assertEqual(
+            {"points": 2, "date": "2019-01-01"},
+            converter.convert({"points": 2, "date": date(2019, 1, 1)}),
+        )
+
+
+class TestJSONLinesWriter(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "box_scores.jsonl")
+        self.writer = JSONLinesWriter(value_formatter=BasketballReferenceJSONEncoder)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def read_lines(self):
+        with open(self.path, encoding="utf8") as json_lines_file:
+            return json_lines_file.read().splitlines()
+
+    def test_each_record_is_a_line(self):
+        self.assertEqual(
+            '{"name":"LeBron James","team":"LOS ANGELES LAKERS","points":25}\n'
+            '{"name":"Luka Doncic","team":null,"points":30}\n',
+            self.writer.write(
+                data=[
+                    {"name": "LeBron James", "team": Team.LOS_ANGELES_LAKERS, "points": 25},
+                    {"name": "Luka Doncic", "team": None, "points": 30},
+                ],
+                options=json_lines_options(),
+            ),
+        )
+
+    def test_no_rows_are_empty(self):
+        self.assertEqual("", self.writer.write(data=[], options=json_lines_options()))
+
+    def test_lines_are_appended(self):
+        self.writer.write(data=[{"points": 1}], options=json_lines_options(path=self.path))
+        self.writer.write(
+            data=iter([{"points": 2}, {"points": 3}]),
+            options=json_lines_options(path=self.path, mode=OutputWriteOption.APPEND),
+        )
+
+        self.assertEqual(['{"points":1}', '{"points":2}', '{"points":3}'], self.read_lines())
+
+    def test_rows_are_written_as_they_are_parsed(self):
+        def rows():
+            yield {"points": 1}
+            # The first row has been written by the time the second one is parsed
+            with open(self.path, encoding="utf8") as json_lines_file:
+                yield {"points": len(json_lines_file.read().splitlines()) + 1}
+
+        with open(self.path, "w", encoding="utf8") as json_lines_file:
+            json_lines_file.write('{"points":0}\n')
+
+        self.writer.write(data=rows(), options=json_lines_options(path=self.path, mode=OutputWriteOption.APPEND))
+
+        self.assertEqual('{"points":1}', self.read_lines()[1])
+
+    def test_file_is_not_opened_when_rows_cannot_be_parsed(self):
+        def rows():
+            raise ValueError("some error")
+            yield
+
+        self.assertRaisesRegex(
+            ValueError,
+            "some error",
+            self.writer.write,
+            data=rows(),
+            options=json_lines_options(path=self.path),
+        )
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_search_results_are_players(self):
+        self.assertEqual(
+            '{"name":"Stephen Curry","leagues":["NATIONAL_BASKETBALL_ASSOCIATION"]}\n',
+            SearchJSONLinesWriter(value_formatter=BasketballReferenceJSONEncoder).write(
+                data={"players": [{"name": "Stephen Curry", "leagues": {League.NATIONAL_BASKETBALL_ASSOCIATION}}]},
+                options=json_lines_options(),
+            ),
+        )
+
+    def test_player_season_box_scores_have_playoffs_key(self):
+        self.assertEqual(
+            '{"points_scored":10,"playoffs":false}\n{"points_scored":20,"playoffs":true}\n',
+            PlayerSeasonBoxScoresJSONLinesWriter(value_formatter=BasketballReferenceJSONEncoder).write(
+                data={"regular_season": [{"points_scored": 10}], "playoffs": [{"points_scored": 20}]},
+                options=json_lines_options(),
+            ),
+        )
@@ -1,8 +1,10 @@
+from concurrent.futures import ThreadPoolExecutor
 from unittest import TestCase, mock
 
 from basketball_reference_web_scraper.data import OutputType, OutputWriteOption
-from basketball_reference_web_scraper.output.service import OutputService
-from basketball_reference_web_scraper.output.writers import OutputOptions, FileOptions
+from basketball_reference_web_scraper.output.service import OutputService, default_output_service
+from basketball_reference_web_scraper.output.writers import OutputOptions, FileOptions, CSVWriter, SearchCSVWriter, \
+    SearchDataFrameWriter, JSONWriter, SearchJSONLinesWriter, JSONLinesWriter
 
 
 class TestOutput(TestCase):
@@ -107,3 +109,85 @@ class TestOutput(TestCase):
             data=self.values,
             options=options,
         )
+
+    def test_output_dataframe(self):
+        dataframe_writer = mock.Mock(write=mock.Mock(return_value="some dataframe"))
+        options = OutputOptions(
+            output_type=OutputType.DATAFRAME,
+            file_options=FileOptions.of(),
+            formatting_options={}
+        )
+
+        self.assertEqual(
+            "some dataframe",
+            OutputService(
+                json_writer=self.json_writer,
+                csv_writer=self.csv_writer,
+                dataframe_writer=dataframe_writer,
+            ).output(data=self.values, options=options),
+        )
+        dataframe_writer.write.assert_called_once_with(data=self.values, options=options)
+
+    def test_rows_are_not_all_parsed_before_outputting_csv(self):
+        options = OutputOptions(
+            output_type=OutputType.CSV,
+            file_options=FileOptions(path=self.output_file_path, mode=OutputWriteOption.WRITE),
+            formatting_options={}
+        )
+        rows = iter(self.values)
+
+        self.output_service.output(data=rows, options=options)
+        self.csv_writer.write.assert_called_once_with(data=rows, options=options)
+
+    def test_rows_are_not_all_parsed_before_outputting_json_lines(self):
+        json_lines_writer = mock.Mock(write=mock.Mock())
+        options = OutputOptions(
+            output_type=OutputType.JSONL,
+            file_options=FileOptions(path=self.output_file_path, mode=OutputWriteOption.APPEND),
+            formatting_options={}
+        )
+        rows = iter(self.values)
+
+        OutputService(
+            json_writer=self.json_writer,
+            csv_writer=self.csv_writer,
+            json_lines_writer=json_lines_writer,
+        ).output(data=rows, options=options)
+        json_lines_writer.write.assert_called_once_with(data=rows, options=options)
+
+    def test_parsed_rows_are_returned_as_list_when_output_type_is_none(self):
+        self.assertEqual(
+            self.values,
+            self.output_service.output(
+                data=iter(self.values),
+                options=OutputOptions(file_options=FileOptions.of(), formatting_options={}, output_type=None),
+            ),
+        )
+
+    def test_parsed_rows_are_output_as_list_for_json(self):
+        options = OutputOptions(output_type=OutputType.JSON, file_options=FileOptions.of(), formatting_options={})
+
+        self.output_service.output(data=iter(self.values), options=options)
+        self.json_writer.write.assert_called_once_with(data=self.values, options=options)
+
+
+class TestDefaultOutputService(TestCase):
+    def test_output_service_is_shared(self):
+        self.assertIs(default_output_service(), default_output_service())
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            self.assertEqual({default_output_service()}, set(executor.map(lambda _: default_output_service(), range(8))))
+
+    def test_output_services_have_writers_of_classes(self):
+        output_service = default_output_service(
+            csv_writer_class=SearchCSVWriter,
+            dataframe_writer_class=SearchDataFrameWriter,
+            json_lines_writer_class=SearchJSONLinesWriter,
+        )
+
+        self.assertIsNot(default_output_service(), output_service)
+        self.assertIsInstance(output_service.json_writer, JSONWriter)
+        self.assertIsInstance(output_service.csv_writer, SearchCSVWriter)
+        self.assertIsInstance(output_service.dataframe_writer, SearchDataFrameWriter)
+        self.assertIsInstance(output_service.json_lines_writer, SearchJSONLinesWriter)
+        self.assertIs(type(default_output_service().json_lines_writer), JSONLinesWriter)
+        self.assertIs(type(default_output_service().csv_writer), CSVWriter)
@@ -1,7 +1,7 @@
-from unittest import TestCase
+from unittest import TestCase, mock
 
 from basketball_reference_web_scraper.data import Team, Location, Outcome, Position
-from basketball_reference_web_scraper.output.fields import format_value
+from basketball_reference_web_scraper.output.fields import format_value, ColumnFormatter, EnumFormatter, formatter_for
 
 
 class TestRowFormatter(TestCase):
@@ -34,3 +34,37 @@ class TestRowFormatter(TestCase):
 
     def test_string_value(self):
         self.assertEqual(format_value("jaebaebae"), "jaebaebae")
+
+
+class TestFormatterFor(TestCase):
+    def test_values_of_same_type_have_same_formatter(self):
+        self.assertIs(EnumFormatter.format_data, formatter_for(Team.BOSTON_CELTICS))
+        self.assertIs(formatter_for(Team.BOSTON_CELTICS), formatter_for(Team.ATLANTA_HAWKS))
+
+    def test_values_that_are_not_formatted_have_no_formatter(self):
+        self.assertIsNone(formatter_for("jaebaebae"))
+        self.assertIsNone(formatter_for(None))
+
+
+class TestColumnFormatter(TestCase):
+    def test_formatter_is_resolved_from_first_non_null_value(self):
+        column_formatter = ColumnFormatter()
+
+        self.assertEqual([None, "BOSTON CELTICS"], column_formatter.format([None, Team.BOSTON_CELTICS]))
+        self.assertEqual(["ATLANTA HAWKS", None], column_formatter.format([Team.ATLANTA_HAWKS, None]))
+        self.assertIs(Team, column_formatter.value_type)
+
+    def test_values_of_other_types_are_formatted_by_fallback_formatter(self):
+        self.assertEqual(
+            ["jaebaebae", "HOME", "POINT GUARD-SMALL FORWARD", 1],
+            ColumnFormatter().format(["jaebaebae", Location.HOME, [Position.POINT_GUARD, Position.SMALL_FORWARD], 1]),
+        )
+
+    def test_null_columns_are_unchanged(self):
+        self.assertEqual([None, None], ColumnFormatter().format([None, None]))
+
+    def test_other_formatters_are_called_for_every_value(self):
+        fallback_formatter = mock.Mock(side_effect=lambda value: value * 2)
+
+        self.assertEqual([2, None, 4], ColumnFormatter(fallback_formatter=fallback_formatter).format([1, None, 2]))
+        self.assertEqual(2, fallback_formatter.call_count)
@@ -0,0 +1,151 @@
+import io
+import os
+from unittest import TestCase
+
+from lxml import html
+
+from basketball_reference_web_scraper.html import PlayerTotalContractsRow, SalariesRow, TeamContractsRow
+from basketball_reference_web_scraper.parser_service import ParserService
+
+ROOT_PATH = os.path.join(os.path.dirname(__file__), "../../..")
+
+
+class TestTotalPlayerContractsParser(TestCase):
+    def test_contract_years_are_typed(self):
+        row = PlayerTotalContractsRow(html=html.fragment_fromstring(
+            '<tr><td data-stat="player">Gary Trent Jr.</td>'
+            '<td class="right " data-stat="y1">$18,560,000</td>'
+            '<td class="right salary-pl" data-stat="y2">$19,000,000</td>'
+            '<td class="right salary-tm" data-stat="y3">$20,000,000</td>'
+            '<td class="right iz" data-stat="y4"></td><td class="right iz" data-stat="y5"></td>'
+            '<td class="right iz" data-stat="y6"></td>'
+            '<td class="right " data-stat="remain_gtd"></td></tr>'
+        ))
+
+        self.assertEqual(
+            [
+                {"player_name": "Gary Trent Jr.", "year": 1, "salary": 18560000, "player_option": False,
+                 "team_option": False, "guaranteed_salary": None},
+                {"player_name": "Gary Trent Jr.", "year": 2, "salary": 19000000, "player_option": True,
+                 "team_option": False, "guaranteed_salary": None},
+                {"player_name": "Gary Trent Jr.", "year": 3, "salary": 20000000, "player_option": False,
+                 "team_option": True, "guaranteed_salary": None},
+            ],
+            ParserService().parse_total_player_contracts(contract_rows=[row]),
+        )
+
+
+class TestPlayerSalariesParser(TestCase):
+    def test_salaries_are_typed(self):
+        row = SalariesRow(html=html.fragment_fromstring(
+            '<tr><th data-stat="player">Mikal Bridges</th><td data-stat="age_today">28</td>'
+            '<td data-stat="y1">$23,300,000</td><td data-stat="y2">$24,900,000</td><td data-stat="y3"></td>'
+            '<td data-stat="remain_gtd">$48,200,000</td></tr>'
+        ))
+
+        self.assertEqual(
+            [{
+                "player_name": "Mikal Bridges",
+                "player_age": 28,
+                "salary_1": 23300000,
+                "salary_2": 24900000,
+                "salary_3": None,
+                "salary_4": None,
+                "salary_5": None,
+                "salary_guaranteed": 48200000,
+            }],
+            ParserService().parse_player_salaries(salaries=[row]),
+        )
+
+
+class TestTeamContractsParser(TestCase):
+    def test_payrolls_are_typed(self):
+        row = TeamContractsRow(html=html.fragment_fromstring(
+            '<tr><td data-stat="team_name">Phoenix Suns</td><td data-stat="y1">$219,627,801</td>'
+            '<td data-stat="y2"></td></tr>'
+        ))
+
+        self.assertEqual(
+            [{
+                "team_name": "Phoenix Suns",
+                "year_1": 219627801,
+                "year_2": None,
+                "year_3": None,
+                "year_4": None,
+                "year_5": None,
+                "year_6": None,
+            }],
+            ParserService().parse_team_contracts(contracts=[row]),
+        )
+
+
+class TestContractsCSVParser(TestCase):
+    def setUp(self):
+        self.parser_service = ParserService()
+
+    def parse_file(self, parse, file_name):
+        with open(os.path.join(ROOT_PATH, file_name), newline="", encoding="utf8") as csv_file:
+            return parse(csv_file=csv_file)
+
+    def test_all_player_contracts_file(self):
+        contracts = self.parse_file(self.parser_service.parse_total_player_contracts_csv, "allplayercontracts.csv")
+
+        self.assertEqual(1025, len(contracts))
+        self.assertEqual(
+            {
+                "player_name": "Stephen Curry",
+                "year": 1,
+                "salary": 55761216,
+                "player_option": False,
+                "team_option": False,
+                "guaranteed_salary": 115368033,
+            },
+            contracts[0],
+        )
+        self.assertEqual({False, True}, set(contract["team_option"] for contract in contracts))
+        self.assertIn(None, set(contract["guaranteed_salary"] for contract in contracts))
+
+    def test_team_contracts_file(self):
+        contracts = self.parse_file(self.parser_service.parse_team_contracts_csv, "teamcontracts.csv")
+
+        self.assertEqual(30, len(contracts))
+        self.assertEqual(
+            {
+                "team_name": "Phoenix Suns",
+                "year_1": 219627801,
+                "year_2": 225549903,
+                "year_3": 153741578,
+                "year_4": 97040745,
+                "year_5": None,
+                "year_6": None,
+            },
+            contracts[0],
+        )
+
+    def test_player_salaries_file(self):
+        salaries = self.parse_file(self.parser_service.parse_player_salaries_csv, "NYK_SALARIES.csv")
+
+        self.assertEqual(20, len(salaries))
+        self.assertEqual(49205800, salaries[0]["salary_1"])
+        self.assertIsNone(salaries[0]["salary_5"])
+        self.assertEqual(28, salaries[0]["player_age"])
+
+    def test_typed_csv_output_is_parsed(self):
+        self.assertEqual(
+            [{
+                "player_name": "Stephen Curry",
+                "year": 2,
+                "salary": 59606817,
+                "player_option": True,
+                "team_option": False,
+                "guaranteed_salary": None,
+            }],
+            self.parser_service.parse_total_player_contracts_csv(csv_file=io.StringIO(
+                "player_name,year,salary,player_option,team_option,guaranteed_salary\r\n"
+                "Stephen Curry,2,59606817,True,False,\r\n"
+            )),
+        )
+
+    def test_file_without_rows_is_empty(self):
+        self.assertEqual([], self.parser_service.parse_team_contracts_csv(csv_file=io.StringIO("team_name,year_1\r\n")))
+        self.assertEqual([], self.parser_service.parse_team_contracts_csv(csv_file=io.StringIO("")))
@@ -1,15 +1,23 @@
 from unittest import TestCase
 
-from basketball_reference_web_scraper.parser_service import ParserService
 from basketball_reference_web_scraper.parsers import PeriodTimestampParser
 
 
 class TestPeriodTimestampParser(TestCase):
     def setUp(self):
-        self.parser = PeriodTimestampParser(timestamp_format=ParserService.PLAY_BY_PLAY_TIMESTAMP_FORMAT)
+        self.parser = PeriodTimestampParser()
 
     def test_less_than_a_minute_to_seconds(self):
         self.assertEqual(32.1, self.parser.to_seconds(timestamp="0:32.1"))
 
     def test_more_than_a_minute_to_seconds(self):
         self.assertEqual(684.5, self.parser.to_seconds(timestamp="11:24.5"))
+
+    def test_fraction_digits_are_leading_digits_of_microseconds(self):
+        self.assertEqual(5.05, self.parser.to_seconds(timestamp="0:05.05"))
+
+    def test_timestamp_without_fraction_to_seconds(self):
+        self.assertEqual(720.0, self.parser.to_seconds(timestamp="12:00"))
+
+    def test_invalid_timestamp_raises_value_error(self):
+        self.assertRaises(ValueError, self.parser.to_seconds, timestamp="jaebaebae")
@@ -0,0 +1,101 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from basketball_reference_web_scraper.data import PeriodType, Team
+from basketball_reference_web_scraper.parser_service import ParserService
+
+
+def start_of_period():
+    return MagicMock(is_start_of_period=True)
+
+
+def play(timestamp, away_team_play_description, home_team_play_description, formatted_scores):
+    return MagicMock(
+        is_start_of_period=False,
+        has_play_by_play_data=True,
+        timestamp=timestamp,
+        is_away_team_play=away_team_play_description != "",
+        away_team_play_description=away_team_play_description,
+        home_team_play_description=home_team_play_description,
+        formatted_scores=formatted_scores,
+    )
+
+
+class TestPlayByPlaysParser(TestCase):
+    def setUp(self):
+        self.parser_service = ParserService()
+        self.parser = self.parser_service.play_by_plays_parser
+
+    def test_plays_are_parsed(self):
+        self.assertEqual(
+            [
+                {
+                    "period": 1,
+                    "period_type": PeriodType.QUARTER,
+                    "remaining_seconds_in_period": 684.5,
+                    "relevant_team": Team.BOSTON_CELTICS,
+                    "away_team": Team.BOSTON_CELTICS,
+                    "home_team": Team.LOS_ANGELES_LAKERS,
+                    "away_score": 2,
+                    "home_score": 0,
+                    "description": "Away play",
+                },
+                {
+                    "period": 1,
+                    "period_type": PeriodType.QUARTER,
+                    "remaining_seconds_in_period": 600.0,
+                    "relevant_team": Team.LOS_ANGELES_LAKERS,
+                    "away_team": Team.BOSTON_CELTICS,
+                    "home_team": Team.LOS_ANGELES_LAKERS,
+                    "away_score": 2,
+                    "home_score": 3,
+                    "description": "Home play",
+                },
+            ],
+            self.parser.parse(
+                play_by_plays=[
+                    start_of_period(),
+                    play("11:24.5", "Away play", "", "2-0"),
+                    MagicMock(is_start_of_period=False, has_play_by_play_data=False),
+                    play("10:00.0", "", "Home play", "2-3"),
+                ],
+                away_team=Team.BOSTON_CELTICS,
+                home_team=Team.LOS_ANGELES_LAKERS,
+            ),
+        )
+
+    def test_period_details_are_parsed_once_per_period(self):
+        period_details_parser = MagicMock(wraps=self.parser_service.period_details_parser)
+        self.parser.period_details_parser = period_details_parser
+
+        plays = self.parser.parse(
+            play_by_plays=[start_of_period()] * 5 + [play("4:59.0", "Away play", "", "100-100")] * 3,
+            away_team=Team.BOSTON_CELTICS,
+            home_team=Team.LOS_ANGELES_LAKERS,
+        )
+
+        self.assertEqual([(1, PeriodType.OVERTIME)] * 3, [(play["period"], play["period_type"]) for play in plays])
+        self.assertEqual(5, period_details_parser.parse_period_number.call_count)
+        self.assertEqual(5, period_details_parser.parse_period_type.call_count)
+
+    def test_plays_are_parsed_as_they_are_iterated(self):
+        read_play_by_plays = []
+
+        def play_by_plays():
+            for play_by_play in [
+                start_of_period(),
+                play("11:24.5", "Away play", "", "2-0"),
+                play("2:00.0", "", "Home play", "2-3"),
+            ]:
+                read_play_by_plays.append(play_by_play)
+                yield play_by_play
+
+        plays = self.parser.iter_parse(
+            play_by_plays=play_by_plays(),
+            away_team=Team.BOSTON_CELTICS,
+            home_team=Team.LOS_ANGELES_LAKERS,
+        )
+
+        self.assertEqual("Away play", next(plays)["description"])
+        self.assertEqual(2, len(read_play_by_plays))
+        self.assertEqual(["Home play"], [play["description"] for play in plays])
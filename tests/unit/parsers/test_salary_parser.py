@@ -0,0 +1,24 @@
+from unittest import TestCase
+
+from basketball_reference_web_scraper.parsers import SalaryParser
+
+
+class TestSalaryParser(TestCase):
+    def setUp(self):
+        self.parser = SalaryParser()
+
+    def test_formatted_salary_is_dollars(self):
+        self.assertEqual(49205800, self.parser.parse_salary("$49,205,800"))
+
+    def test_unformatted_salary_is_dollars(self):
+        self.assertEqual(49205800, self.parser.parse_salary("49205800"))
+
+    def test_blank_salary_is_none(self):
+        self.assertIsNone(self.parser.parse_salary(""))
+        self.assertIsNone(self.parser.parse_salary("  "))
+
+    def test_column_of_salaries_is_parsed(self):
+        self.assertEqual([1000000, None, 750], self.parser.parse_salaries(["$1,000,000", "", "$750"]))
+
+    def test_salaries_that_are_not_numbers_are_none(self):
+        self.assertEqual([1000000, None], self.parser.parse_salaries(["$1,000,000", "jaebaebae"]))
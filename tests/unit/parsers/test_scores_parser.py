@@ -0,0 +1,21 @@
+from unittest import TestCase
+
+from basketball_reference_web_scraper.parser_service import ParserService
+from basketball_reference_web_scraper.parsers import ScoresParser
+
+
+class TestScoresParser(TestCase):
+    def setUp(self):
+        self.parser = ScoresParser(scores_regex=ParserService.PLAY_BY_PLAY_SCORES_REGEX)
+
+    def test_parse_scores_is_away_and_home_team_scores(self):
+        self.assertEqual((98, 102), self.parser.parse_scores(formatted_scores="98-102"))
+
+    def test_parse_away_team_score(self):
+        self.assertEqual(98, self.parser.parse_away_team_score(formatted_scores="98-102"))
+
+    def test_parse_home_team_score(self):
+        self.assertEqual(102, self.parser.parse_home_team_score(formatted_scores="98-102"))
+
+    def test_regex_is_compiled_once(self):
+        self.assertEqual(ParserService.PLAY_BY_PLAY_SCORES_REGEX, self.parser.scores_regex.pattern)
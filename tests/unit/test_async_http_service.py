@@ -0,0 +1,79 @@
+import asyncio
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from basketball_reference_web_scraper import http_service as http_service_module
+from basketball_reference_web_scraper.async_http_service import AsyncHTTPService
+from basketball_reference_web_scraper.http_service import configure_default_cache
+
+
+class TestAsyncHTTPService(TestCase):
+    def test_delegates_to_http_service(self):
+        http_service = MagicMock()
+        http_service.standings.return_value = ["some standings"]
+        service = AsyncHTTPService(http_service=http_service)
+
+        result = asyncio.run(service.standings(season_end_year=2018))
+
+        self.assertEqual(["some standings"], result)
+        http_service.standings.assert_called_once_with(season_end_year=2018)
+
+    def test_uses_default_cache_configured_after_creation(self):
+        original_cache = http_service_module._default_cache
+        service = AsyncHTTPService()
+        cache = MagicMock()
+        try:
+            configure_default_cache(cache)
+            self.assertIs(cache, service.http_service.cache)
+        finally:
+            configure_default_cache(original_cache)
+
+    def test_calls_are_not_run_on_event_loop_thread(self):
+        event_loop_thread_ids = []
+        call_thread_ids = []
+        http_service = MagicMock()
+        http_service.search.side_effect = lambda term: call_thread_ids.append(threading.get_ident())
+        service = AsyncHTTPService(http_service=http_service)
+
+        async def search():
+            event_loop_thread_ids.append(threading.get_ident())
+            await service.search(term="jaebaebae")
+
+        asyncio.run(search())
+
+        self.assertNotEqual(event_loop_thread_ids, call_thread_ids)
+
+    def test_concurrency_is_bounded(self):
+        lock = threading.Lock()
+        counts = {"in_flight": 0, "maximum": 0}
+
+        def player_box_scores(day, month, year):
+            with lock:
+                counts["in_flight"] += 1
+                counts["maximum"] = max(counts["maximum"], counts["in_flight"])
+            time.sleep(0.01)
+            with lock:
+                counts["in_flight"] -= 1
+
+        http_service = MagicMock()
+        http_service.player_box_scores.side_effect = player_box_scores
+        service = AsyncHTTPService(http_service=http_service, max_concurrency=2)
+
+        async def fetch_month():
+            await asyncio.gather(*[service.player_box_scores(day=day, month=1, year=2018) for day in range(1, 11)])
+
+        asyncio.run(fetch_month())
+
+        self.assertEqual(10, http_service.player_box_scores.call_count)
+        self.assertLessEqual(counts["maximum"], 2)
+
+    def test_can_be_reused_across_event_loops(self):
+        http_service = MagicMock()
+        service = AsyncHTTPService(http_service=http_service)
+
+        asyncio.run(service.team_contracts())
+        asyncio.run(service.team_contracts())
+
+        self.assertEqual(2, http_service.team_contracts.call_count)
@@ -0,0 +1,243 @@
+import csv
+import os
+import shutil
+import tempfile
+from unittest import TestCase, mock
+
+from requests import HTTPError, ConnectionError, codes
+
+from basketball_reference_web_scraper import client
+from basketball_reference_web_scraper.bulk import CheckpointJournal, CSVFileSink, BulkPlayerBoxScoresJob, COMPLETED, \
+    FAILED
+from basketball_reference_web_scraper.errors import InvalidPlayerAndSeason, PlayerSeasonBoxScoresError
+
+
+class TemporaryDirectoryTestCase(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+
+class TestCheckpointJournal(TemporaryDirectoryTestCase):
+    def setUp(self):
+        super().setUp()
+        self.path = os.path.join(self.directory, "journal.jsonl")
+
+    def test_missing_file_is_empty(self):
+        self.assertEqual({}, CheckpointJournal(path=self.path).entries)
+
+    def test_recorded_entries_are_read_back(self):
+        journal = CheckpointJournal(path=self.path)
+        journal.record(player_identifier="westbru01", season_end_year=2018, status=COMPLETED)
+        journal.record(player_identifier="westbru01", season_end_year=2007, status=FAILED)
+
+        journal = CheckpointJournal(path=self.path)
+        self.assertTrue(journal.is_finished(player_identifier="westbru01", season_end_year=2018))
+        self.assertTrue(journal.is_finished(player_identifier="westbru01", season_end_year=2007))
+        self.assertFalse(journal.is_finished(player_identifier="westbru01", season_end_year=2019))
+
+    def test_partially_written_entry_is_dropped(self):
+        journal = CheckpointJournal(path=self.path)
+        journal.record(player_identifier="westbru01", season_end_year=2018, status=COMPLETED)
+        with open(self.path, "a", encoding="utf8") as journal_file:
+            journal_file.write('{"player_identifier": "west')
+
+        journal = CheckpointJournal(path=self.path)
+        journal.record(player_identifier="westbru01", season_end_year=2019, status=COMPLETED)
+
+        self.assertEqual(
+            {("westbru01", 2018): COMPLETED, ("westbru01", 2019): COMPLETED},
+            CheckpointJournal(path=self.path).entries,
+        )
+
+
+class TestCSVFileSink(TemporaryDirectoryTestCase):
+    def test_rows_are_appended_with_single_header(self):
+        path = os.path.join(self.directory, "box_scores.csv")
+        sink = CSVFileSink(path=path, column_names=["player_identifier", "season_end_year", "playoffs", "points"])
+
+        sink(player_identifier="westbru01", season_end_year=2018, box_scores={
+            "regular_season": [{"points": 10}],
+            "playoffs": [{"points": 20}],
+        })
+        CSVFileSink(path=path, column_names=sink.column_names)(
+            player_identifier="hardeja01",
+            season_end_year=2018,
+            box_scores={"regular_season": [{"points": 30}]},
+        )
+
+        with open(path, newline="", encoding="utf8") as csv_file:
+            self.assertEqual(
+                [
+                    ["player_identifier", "season_end_year", "playoffs", "points"],
+                    ["westbru01", "2018", "False", "10"],
+                    ["westbru01", "2018", "True", "20"],
+                    ["hardeja01", "2018", "False", "30"],
+                ],
+                list(csv.reader(csv_file)),
+            )
+
+    def test_resumes_after_partially_written_row(self):
+        path = os.path.join(self.directory, "box_scores.csv")
+        column_names = ["player_identifier", "season_end_year", "playoffs", "points"]
+        CSVFileSink(path=path, column_names=column_names)(
+            player_identifier="westbru01",
+            season_end_year=2018,
+            box_scores={"regular_season": [{"points": 10}]},
+        )
+        with open(path, "a", newline="", encoding="utf8") as csv_file:
+            csv_file.write("westbru01,20")
+
+        CSVFileSink(path=path, column_names=column_names)(
+            player_identifier="westbru01",
+            season_end_year=2019,
+            box_scores={"regular_season": [{"points": 20}]},
+        )
+
+        with open(path, newline="", encoding="utf8") as csv_file:
+            self.assertEqual(
+                [
+                    ["player_identifier", "season_end_year", "playoffs", "points"],
+                    ["westbru01", "2018", "False", "10"],
+                    ["westbru01", "2019", "False", "20"],
+                ],
+                list(csv.reader(csv_file)),
+            )
+
+
+class TestBulkPlayerBoxScoresJob(TemporaryDirectoryTestCase):
+    def setUp(self):
+        super().setUp()
+        self.http_service = mock.Mock(max_workers=2)
+        self.http_service.player_season_box_scores.side_effect = \
+            lambda player_identifier, season_end_year, **kwargs: {"regular_season": [player_identifier, season_end_year]}
+        self.sink = mock.Mock()
+        self.sleep = mock.Mock()
+        self.journal = CheckpointJournal(path=os.path.join(self.directory, "journal.jsonl"))
+
+    def job(self, **kwargs):
+        return BulkPlayerBoxScoresJob(
+            http_service=self.http_service,
+            sink=self.sink,
+            journal=self.journal,
+            sleep=self.sleep,
+            **kwargs
+        )
+
+    def test_every_player_season_is_sent_to_sink(self):
+        results = self.job().run(player_identifiers=["westbru01", "hardeja01"], season_end_years=[2018, 2019])
+
+        self.assertCountEqual(
+            [("westbru01", 2018), ("westbru01", 2019), ("hardeja01", 2018), ("hardeja01", 2019)],
+            results,
+        )
+        self.assertEqual([], results.errors)
+        self.sink.assert_any_call(
+            player_identifier="hardeja01",
+            season_end_year=2019,
+            box_scores={"regular_season": ["hardeja01", 2019]},
+        )
+        self.assertEqual(4, self.sink.call_count)
+
+    def test_finished_player_seasons_are_skipped(self):
+        self.journal.record(player_identifier="westbru01", season_end_year=2018, status=COMPLETED)
+
+        results = self.job().run(player_identifiers=["westbru01"], season_end_years=[2018, 2019])
+
+        self.assertEqual([("westbru01", 2019)], results)
+        self.http_service.player_season_box_scores.assert_called_once_with(
+            player_identifier="westbru01",
+            season_end_year=2019,
+            include_playoffs=True,
+            include_inactive_games=False,
+        )
+
+    def test_invalid_player_season_is_recorded_as_failed(self):
+        self.http_service.player_season_box_scores.side_effect = HTTPError(
+            response=mock.Mock(status_code=codes.not_found),
+        )
+
+        results = self.job().run(player_identifiers=["westbru01"], season_end_years=[2007])
+
+        self.assertEqual([], results)
+        self.assertIsInstance(results.errors[0], PlayerSeasonBoxScoresError)
+        self.assertIsInstance(results.errors[0].error, InvalidPlayerAndSeason)
+        self.assertEqual({("westbru01", 2007): FAILED}, self.journal.entries)
+        self.sleep.assert_not_called()
+
+    def test_parsing_error_does_not_stop_other_player_seasons(self):
+        def player_season_box_scores(player_identifier, season_end_year, **kwargs):
+            if player_identifier == "hardeja01":
+                raise ValueError("Unknown team: XYZ")
+            return {"regular_season": [player_identifier, season_end_year]}
+
+        self.http_service.player_season_box_scores.side_effect = player_season_box_scores
+
+        results = self.job().run(
+            player_identifiers=["westbru01", "hardeja01", "curryst01"],
+            season_end_years=[2018, 2019],
+        )
+
+        self.assertCountEqual(
+            [("westbru01", 2018), ("westbru01", 2019), ("curryst01", 2018), ("curryst01", 2019)],
+            results,
+        )
+        self.assertCountEqual(
+            [("hardeja01", 2018), ("hardeja01", 2019)],
+            [(error.player_identifier, error.season_end_year) for error in results.errors],
+        )
+        self.assertIsInstance(results.errors[0].error, ValueError)
+        # Not recorded, so that they're fetched again on the next run
+        self.assertFalse(self.journal.is_finished(player_identifier="hardeja01", season_end_year=2018))
+        self.assertEqual(4, self.sink.call_count)
+        self.sleep.assert_not_called()
+
+    def test_transient_errors_are_retried_with_backoff(self):
+        self.http_service.player_season_box_scores.side_effect = [
+            ConnectionError(),
+            HTTPError(response=mock.Mock(status_code=codes.service_unavailable)),
+            {"regular_season": []},
+        ]
+
+        results = self.job(retry_backoff=5).run(player_identifiers=["westbru01"], season_end_years=[2018])
+
+        self.assertEqual([("westbru01", 2018)], results)
+        self.assertEqual([mock.call(5), mock.call(10)], self.sleep.call_args_list)
+
+    def test_exhausted_retries_are_not_recorded(self):
+        error = ConnectionError()
+        self.http_service.player_season_box_scores.side_effect = error
+
+        results = self.job(max_attempts=2).run(player_identifiers=["westbru01"], season_end_years=[2018])
+
+        self.assertEqual(2, self.http_service.player_season_box_scores.call_count)
+        self.assertIs(error, results.errors[0].error)
+        self.assertEqual({}, self.journal.entries)
+        self.sink.assert_not_called()
+
+    def test_sink_error_leaves_player_season_unrecorded(self):
+        self.sink.side_effect = OSError()
+
+        self.assertRaises(OSError, self.job().run, player_identifiers=["westbru01"], season_end_years=[2018])
+        self.assertEqual({}, self.journal.entries)
+
+
+class TestClientBulkPlayerBoxScores(TestCase):
+    def test_requires_sink_or_csv_output_file(self):
+        self.assertRaises(ValueError, client.bulk_player_box_scores, ["westbru01"], [2018])
+
+    @mock.patch("basketball_reference_web_scraper.client.BulkPlayerBoxScoresJob")
+    def test_csv_output_file_is_used_as_sink(self, mocked_job):
+        client.bulk_player_box_scores(
+            ["westbru01"],
+            [2018],
+            output_type=client.OutputType.CSV,
+            output_file_path="some file path",
+        )
+
+        sink = mocked_job.call_args[1]["sink"]
+        self.assertIsInstance(sink, CSVFileSink)
+        self.assertEqual("some file path", sink.path)
+        self.assertIsNotNone(mocked_job.call_args[1]["http_service"].rate_limiter)
@@ -0,0 +1,217 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+from datetime import date, datetime
+from unittest import TestCase, mock
+
+from requests import codes
+
+from basketball_reference_web_scraper import http_service
+from basketball_reference_web_scraper.cache import CachePolicy, CacheEntry, SQLiteResponseCache, ResponseCache, \
+    cache_key, current_season_end_year
+from basketball_reference_web_scraper.http_service import HTTPService, configure_default_cache
+
+
+class TestCurrentSeasonEndYear(TestCase):
+    def test_before_october_is_current_year(self):
+        self.assertEqual(2019, current_season_end_year(today=date(2019, 4, 1)))
+
+    def test_october_onwards_is_next_year(self):
+        self.assertEqual(2020, current_season_end_year(today=date(2019, 10, 22)))
+
+
+class TestCacheKey(TestCase):
+    def test_params_order_does_not_matter(self):
+        self.assertEqual(
+            cache_key(url="some url", params={"day": 1, "month": 2}),
+            cache_key(url="some url", params={"month": 2, "day": 1}),
+        )
+
+    def test_params_are_part_of_key(self):
+        self.assertNotEqual(
+            cache_key(url="some url", params={"day": 1}),
+            cache_key(url="some url", params={"day": 2}),
+        )
+
+
+class TestCachePolicy(TestCase):
+    def setUp(self):
+        self.policy = CachePolicy(current_time_to_live=60)
+        self.today = date(2019, 1, 10)
+
+    def test_finished_season_totals_are_immutable(self):
+        self.assertIsNone(self.policy.time_to_live(
+            url="https://www.basketball-reference.com/leagues/NBA_2018_totals.html", params=None, today=self.today,
+        ))
+
+    def test_current_season_totals_expire(self):
+        self.assertEqual(60, self.policy.time_to_live(
+            url="https://www.basketball-reference.com/leagues/NBA_2019_totals.html", params=None, today=self.today,
+        ))
+
+    def test_finished_season_gamelog_is_immutable(self):
+        self.assertIsNone(self.policy.time_to_live(
+            url="https://www.basketball-reference.com/players/w/westbru01/gamelog/2018", params=None, today=self.today,
+        ))
+
+    def test_current_season_gamelog_expires(self):
+        self.assertEqual(60, self.policy.time_to_live(
+            url="https://www.basketball-reference.com/players/w/westbru01/gamelog/2019", params=None, today=self.today,
+        ))
+
+    def test_old_play_by_play_is_immutable(self):
+        self.assertIsNone(self.policy.time_to_live(
+            url="https://www.basketball-reference.com/boxscores/pbp/201901010BOS.html", params=None, today=self.today,
+        ))
+
+    def test_recent_box_score_expires(self):
+        self.assertEqual(60, self.policy.time_to_live(
+            url="https://www.basketball-reference.com/boxscores/201901090BOS.html", params=None, today=self.today,
+        ))
+
+    def test_old_daily_box_scores_from_params_are_immutable(self):
+        self.assertIsNone(self.policy.time_to_live(
+            url="https://www.basketball-reference.com/boxscores/",
+            params={"day": 1, "month": 1, "year": 2019},
+            today=self.today,
+        ))
+
+    def test_old_daily_leaders_from_query_string_are_immutable(self):
+        self.assertIsNone(self.policy.time_to_live(
+            url="https://www.basketball-reference.com/friv/dailyleaders.cgi?month=1&day=1&year=2019",
+            params=None,
+            today=self.today,
+        ))
+
+    def test_contracts_expire(self):
+        self.assertEqual(60, self.policy.time_to_live(
+            url="https://www.basketball-reference.com/contracts/players.html", params=None, today=self.today,
+        ))
+
+
+class TestSQLiteResponseCache(TestCase):
+    URL = "https://www.basketball-reference.com/contracts/players.html"
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.now = datetime(2019, 1, 10).timestamp()
+        self.cache = SQLiteResponseCache(
+            path=os.path.join(self.directory, "cache.sqlite"),
+            policy=CachePolicy(current_time_to_live=60),
+            clock=lambda: self.now,
+        )
+        self.session = mock.Mock()
+        self.session.get.return_value = mock.Mock(
+            status_code=codes.ok,
+            url=self.URL,
+            content=b"some content",
+            headers={"ETag": "some etag", "Last-Modified": "some date"},
+        )
+
+    def tearDown(self):
+        self.cache.close()
+        shutil.rmtree(self.directory)
+
+    def test_write_and_read(self):
+        entry = CacheEntry(url="some url", content=b"some content", etag=None, last_modified=None, expires_at=None)
+        self.cache.write("some key", entry)
+        self.assertEqual(entry, self.cache.read("some key"))
+
+    def test_missing_key_is_none(self):
+        self.assertIsNone(self.cache.read("some key"))
+
+    def test_fresh_entry_is_not_requested_again(self):
+        self.cache.get(session=self.session, url=self.URL)
+        response = self.cache.get(session=self.session, url=self.URL)
+
+        self.assertEqual(1, self.session.get.call_count)
+        self.assertEqual(b"some content", response.content)
+        self.assertEqual(self.URL, response.url)
+        self.assertEqual(codes.ok, response.status_code)
+
+    def test_stale_entry_is_revalidated(self):
+        self.cache.get(session=self.session, url=self.URL)
+        self.now += 120
+        self.session.get.return_value = mock.Mock(status_code=codes.not_modified)
+
+        response = self.cache.get(session=self.session, url=self.URL)
+
+        self.session.get.assert_called_with(
+            url=self.URL,
+            params=None,
+            allow_redirects=True,
+            headers={"If-None-Match": "some etag", "If-Modified-Since": "some date"},
+        )
+        self.assertEqual(b"some content", response.content)
+        self.assertEqual(self.now + 60, self.cache.read(cache_key(url=self.URL)).expires_at)
+
+    def test_stale_entry_is_replaced_when_modified(self):
+        self.cache.get(session=self.session, url=self.URL)
+        self.now += 120
+        self.session.get.return_value = mock.Mock(
+            status_code=codes.ok, url=self.URL, content=b"new content", headers={},
+        )
+
+        response = self.cache.get(session=self.session, url=self.URL)
+
+        self.assertEqual(b"new content", response.content)
+        self.assertEqual(b"new content", self.cache.read(cache_key(url=self.URL)).content)
+
+    def test_immutable_entry_never_expires(self):
+        url = "https://www.basketball-reference.com/leagues/NBA_2001_totals.html"
+        self.cache.get(session=self.session, url=url)
+        self.now += 10 ** 9
+        self.cache.get(session=self.session, url=url)
+
+        self.assertEqual(1, self.session.get.call_count)
+
+    def test_unsuccessful_responses_are_not_cached(self):
+        self.session.get.return_value = mock.Mock(status_code=codes.not_found)
+        self.cache.get(session=self.session, url=self.URL)
+        self.assertIsNone(self.cache.read(cache_key(url=self.URL)))
+
+    def test_http_service_uses_cache(self):
+        service = HTTPService(parser=mock.Mock(), session=self.session, cache=self.cache)
+        service.get(url=self.URL)
+        service.get(url=self.URL)
+        self.assertEqual(1, self.session.get.call_count)
+
+    def test_close_closes_every_thread_connection(self):
+        connections = [self.cache.connection]
+        thread = threading.Thread(target=lambda: connections.append(self.cache.connection))
+        thread.start()
+        thread.join()
+
+        self.cache.close()
+
+        for connection in connections:
+            self.assertRaises(sqlite3.ProgrammingError, connection.execute, "SELECT 1")
+
+    def test_cache_can_be_used_after_close(self):
+        entry = CacheEntry(url="some url", content=b"some content", etag=None, last_modified=None, expires_at=None)
+        self.cache.write("some key", entry)
+        self.cache.close()
+
+        self.assertEqual(entry, self.cache.read("some key"))
+        self.cache.close()
+
+    def test_replaced_default_cache_is_closed(self):
+        original_cache = http_service._default_cache
+        http_service._default_cache = None
+        try:
+            with mock.patch.object(self.cache, "close") as mocked_close:
+                configure_default_cache(self.cache)
+                configure_default_cache(self.cache)
+                mocked_close.assert_not_called()
+
+                configure_default_cache(None)
+                mocked_close.assert_called_once_with()
+        finally:
+            http_service._default_cache = original_cache
+
+
+class TestResponseCache(TestCase):
+    def test_read_and_write_are_abstract(self):
+        self.assertRaises(TypeError, ResponseCache)
@@ -0,0 +1,119 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase, mock
+
+from requests import codes
+
+from basketball_reference_web_scraper.cassette import Cassette, RecordingSession, ReplaySession
+from basketball_reference_web_scraper.data import Team
+from basketball_reference_web_scraper.errors import RequestNotRecorded
+from basketball_reference_web_scraper.http_service import HTTPService
+from basketball_reference_web_scraper.parser_service import ParserService
+
+
+class TestCassette(TestCase):
+    URL = "https://www.basketball-reference.com/boxscores/"
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "cassette.zip")
+        self.session = mock.Mock()
+        self.session.get.return_value = mock.Mock(
+            status_code=codes.ok,
+            url=self.URL,
+            content=b"some content",
+            headers={"Content-Type": "text/html"},
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_session_depends_on_mode(self):
+        self.assertIsInstance(Cassette(path=self.path, record=True).session(session=self.session), RecordingSession)
+        self.assertIsInstance(Cassette(path=self.path).session(session=self.session), ReplaySession)
+
+    def test_recorded_response_is_replayed(self):
+        recording_session = Cassette(path=self.path, record=True).session(session=self.session)
+        recording_session.get(url=self.URL, params={"day": 1}, allow_redirects=False)
+
+        response = Cassette(path=self.path).session(session=None).get(url=self.URL, params={"day": 1})
+
+        self.assertEqual(codes.ok, response.status_code)
+        self.assertEqual(self.URL, response.url)
+        self.assertEqual(b"some content", response.content)
+        self.assertEqual("text/html", response.headers["content-type"])
+
+    def test_request_is_only_recorded_once(self):
+        recording_session = Cassette(path=self.path, record=True).session(session=self.session)
+        recording_session.get(url=self.URL)
+        self.session.get.return_value.content = b"some other content"
+        recording_session.get(url=self.URL)
+
+        self.assertEqual(b"some content", Cassette(path=self.path).read(url=self.URL, params=None).content)
+
+    def test_not_modified_responses_are_not_recorded(self):
+        self.session.get.return_value = mock.Mock(status_code=codes.not_modified)
+        Cassette(path=self.path, record=True).session(session=self.session).get(url=self.URL)
+
+        self.assertRaises(RequestNotRecorded, Cassette(path=self.path).read, url=self.URL, params=None)
+
+    def test_request_that_is_not_recorded_raises_error(self):
+        self.assertRaises(RequestNotRecorded, Cassette(path=self.path).session(session=None).get, url=self.URL)
+
+    def test_http_service_replays_real_page_without_network(self):
+        with open(os.path.join(os.path.dirname(__file__), "../integration/files/201701010ATL.html"), "rb") as page:
+            self.session.get.return_value.content = page.read()
+
+        HTTPService(
+            parser=ParserService(),
+            session=self.session,
+            cassette=Cassette(path=self.path, record=True),
+        ).team_box_score(game_url_path="boxscores/201701010ATL.html")
+
+        offline_session = mock.Mock()
+        box_scores = HTTPService(
+            parser=ParserService(),
+            session=offline_session,
+            cassette=Cassette(path=self.path),
+        ).team_box_score(game_url_path="boxscores/201701010ATL.html")
+
+        offline_session.get.assert_not_called()
+        self.assertEqual([Team.SAN_ANTONIO_SPURS, Team.ATLANTA_HAWKS], [box_score["team"] for box_score in box_scores])
+
+
+class TestCassetteFromDirectory(TestCase):
+    DIRECTORY = os.path.join(os.path.dirname(__file__), "../integration/files")
+    URL = "https://www.basketball-reference.com/leagues/NBA_2019_games-april.html"
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "cassette.zip")
+        self.cassette = Cassette.from_directory(
+            path=self.path,
+            directory=self.DIRECTORY,
+            url_to_path={self.URL: "NBA_2019_games-april.html"},
+        )
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_saved_page_is_replayed(self):
+        response = ReplaySession(cassette=Cassette(path=self.path)).get(url=self.URL)
+
+        with open(os.path.join(self.DIRECTORY, "NBA_2019_games-april.html"), "rb") as page:
+            self.assertEqual(page.read(), response.content)
+        self.assertEqual(codes.ok, response.status_code)
+        self.assertEqual(self.URL, response.url)
+
+    def test_http_service_parses_replayed_page_without_network(self):
+        offline_session = mock.Mock()
+        games = HTTPService(
+            parser=ParserService(),
+            session=offline_session,
+            cassette=self.cassette,
+        ).schedule_for_month(url=self.URL)
+
+        offline_session.get.assert_not_called()
+        self.assertTrue(games)
+        self.assertTrue(all(game["start_time"].month == 4 for game in games))
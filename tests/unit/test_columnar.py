@@ -0,0 +1,289 @@
+import math
+import os
+import sys
+from unittest import TestCase, skipIf
+from unittest import mock
+from unittest.mock import patch
+
+from lxml import html
+
+from basketball_reference_web_scraper.columnar import EnumCodes, PositionsCodes, MISSING_CODE, PLAYER_OPTION, \
+    TEAM_OPTION
+from basketball_reference_web_scraper.data import Team, Position, Location, Outcome, TEAM_ABBREVIATIONS_TO_TEAM
+from basketball_reference_web_scraper.html import PlayerSeasonTotalTable, PlayerSeasonBoxScoresRow, \
+    PlayerGameBoxScoreRow, PlayerAdvancedSeasonTotalsTable, PlayerTotalContractsRow
+from basketball_reference_web_scraper.http_service import HTTPService
+from basketball_reference_web_scraper.parser_service import ParserService
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+TOTALS_PAGE_PATH = os.path.join(
+    os.path.dirname(__file__),
+    "../integration/files/NBA_2019_totals_jemerrio_jones_blank_age.html",
+)
+
+
+def decoded_values(columns):
+    # The values of each column as the values of the parsed dicts, with NaN as None
+    return {
+        name: [
+            None if isinstance(value, float) and math.isnan(value) else value
+            for value in (columns.decode(name) if name in columns.codes else columns[name].tolist())
+        ]
+        for name in columns
+    }
+
+
+def dict_values(dicts):
+    return {name: [row[name] for row in dicts] for name in dicts[0]}
+
+
+class TestEnumCodes(TestCase):
+    def setUp(self):
+        self.codes = EnumCodes(enum_class=Team, parse=TEAM_ABBREVIATIONS_TO_TEAM.get)
+
+    def test_codes_are_indices_of_lookup_table(self):
+        codes = self.codes.encode(["BOS", "ATL", "BOS"])
+
+        self.assertEqual([Team.BOSTON_CELTICS, Team.ATLANTA_HAWKS, Team.BOSTON_CELTICS], [self.codes.lookup[code] for code in codes])
+        self.assertEqual(list(Team), list(self.codes.lookup))
+
+    def test_missing_values_are_missing_code(self):
+        self.assertEqual([MISSING_CODE], self.codes.encode(["TOT"]))
+        self.assertEqual([None, Team.ATLANTA_HAWKS], self.codes.decode([MISSING_CODE, self.codes.encode(["ATL"])[0]]))
+
+    def test_distinct_values_are_parsed_once(self):
+        parsed_values = []
+        codes = EnumCodes(enum_class=Location, parse=lambda value: parsed_values.append(value) or Location.HOME)
+
+        codes.encode(["", "", "", ""])
+
+        self.assertEqual([""], parsed_values)
+
+
+class TestPositionsCodes(TestCase):
+    def setUp(self):
+        self.codes = PositionsCodes(
+            enum_class=Position,
+            parse=ParserService().position_abbreviation_parser.from_abbreviations,
+        )
+
+    def test_positions_are_bitmask(self):
+        codes = self.codes.encode(["PG", "SF-PF", ""])
+
+        self.assertEqual([1, 4 | 8, 0], codes)
+        self.assertEqual(
+            [[Position.POINT_GUARD], [Position.SMALL_FORWARD, Position.POWER_FORWARD], []],
+            self.codes.decode(codes),
+        )
+
+
+class TestMissingNumpy(TestCase):
+    @patch.dict(sys.modules, {"numpy": None})
+    def test_columnar_results_raise_import_error(self):
+        self.assertRaisesRegex(
+            ImportError,
+            "Columnar results require numpy, which can be installed with pip install numpy",
+            ParserService().parse_player_season_totals_columns,
+            totals_html=[],
+        )
+
+
+@skipIf(numpy is None, "NumPy is not installed")
+class TestColumnarParser(TestCase):
+    def setUp(self):
+        self.parser_service = ParserService()
+
+    def test_season_totals_columns_are_the_same_as_parsed_dicts(self):
+        with open(TOTALS_PAGE_PATH, "rb") as page:
+            table = PlayerSeasonTotalTable(html=html.fromstring(page.read()))
+
+        columns = self.parser_service.parse_player_season_totals_columns(totals_html=table.rows_html)
+        dicts = self.parser_service.parse_player_season_totals(totals=table.rows)
+
+        self.assertEqual(list(dicts[0]), list(columns))
+        self.assertEqual(numpy.dtype("int8"), columns["team"].dtype)
+        self.assertEqual(numpy.dtype("int64"), columns["points"].dtype)
+        self.assertEqual(dict_values(dicts), decoded_values(columns))
+
+    def test_advanced_season_totals_columns_include_combined_totals(self):
+        table = PlayerAdvancedSeasonTotalsTable(html=html.fromstring(
+            '<table id="advanced_stats"><tbody>'
+            '<tr class="full_table"><td data-stat="player">Jimmy Butler</td><td data-stat="pos">SF</td>'
+            '<td data-stat="team_id">TOT</td><td data-stat="per">21.4</td></tr>'
+            '<tr class="italic_text partial_table"><td data-stat="player">Jimmy Butler</td><td data-stat="pos">SF</td>'
+            '<td data-stat="team_id">PHI</td><td data-stat="per">19.4</td></tr>'
+            '</tbody></table>'
+        ))
+
+        for include_combined_totals in [True, False]:
+            columns = self.parser_service.parse_player_advanced_season_totals_columns(
+                totals_html=table.rows_html,
+                include_combined_totals=include_combined_totals,
+            )
+            dicts = self.parser_service.parse_player_advanced_season_totals_parser(
+                totals=table.get_rows(include_combined_totals),
+            )
+
+            self.assertEqual(dict_values(dicts), decoded_values(columns))
+            self.assertEqual(numpy.dtype("bool"), columns["is_combined_totals"].dtype)
+
+    def test_player_box_scores_columns_are_the_same_as_parsed_dicts(self):
+        box_scores = [
+            PlayerGameBoxScoreRow(html=html.fragment_fromstring(
+                '<tr>'
+                '<td data-stat="player" data-append-csv="hardeja01">James Harden</td>'
+                '<td data-stat="team_id">HOU</td><td data-stat="game_location">@</td><td data-stat="opp_id">MEM</td>'
+                '<td data-stat="game_result">W</td><td data-stat="mp">40:12</td><td data-stat="fg">17</td>'
+                '<td data-stat="game_score">41.2</td>'
+                '</tr>'
+            )),
+        ]
+
+        columns = self.parser_service.parse_player_box_scores_columns(box_scores=box_scores)
+
+        self.assertEqual(
+            dict_values(self.parser_service.parse_player_box_scores(box_scores=box_scores)),
+            decoded_values(columns),
+        )
+        self.assertEqual([2412], columns["seconds_played"].tolist())
+
+    def test_season_box_scores_columns_mark_inactive_games(self):
+        box_scores = [
+            PlayerSeasonBoxScoresRow(html=html.fragment_fromstring(row))
+            for row in [
+                '<tr><td data-stat="date_game">2019-01-01</td><td data-stat="team_id">LAL</td>'
+                '<td data-stat="game_location"></td><td data-stat="opp_id">SAC</td>'
+                '<td data-stat="game_result">W (+5)</td><td data-stat="mp">35:30</td><td data-stat="pts">24</td>'
+                '<td data-stat="game_score">20.5</td><td data-stat="plus_minus">-3</td></tr>',
+                '<tr><td data-stat="date_game">2019-01-03</td><td data-stat="team_id">LAL</td>'
+                '<td data-stat="game_location">@</td><td data-stat="opp_id">BOS</td>'
+                '<td data-stat="game_result">L (-2)</td><td data-stat="reason">Inactive</td></tr>',
+            ]
+        ]
+
+        active_columns = self.parser_service.parse_player_season_box_scores_columns(box_scores=box_scores)
+        columns = self.parser_service.parse_player_season_box_scores_columns(
+            box_scores=box_scores,
+            include_inactive_games=True,
+        )
+
+        self.assertEqual(
+            list(self.parser_service.parse_player_season_box_scores(box_scores=box_scores)[0]),
+            list(columns),
+        )
+        self.assertEqual(numpy.dtype("datetime64[D]"), active_columns["date"].dtype)
+        self.assertEqual(["2019-01-01"], [str(date) for date in active_columns["date"]])
+        self.assertEqual([True, False], columns["active"].tolist())
+        self.assertEqual([Location.HOME, Location.AWAY], columns.decode("location"))
+        self.assertEqual([Outcome.WIN, Outcome.LOSS], columns.decode("outcome"))
+        self.assertEqual([2130, 0], columns["seconds_played"].tolist())
+        self.assertEqual([24, 0], columns["points_scored"].tolist())
+        self.assertEqual(20.5, columns["game_score"][0])
+        self.assertTrue(math.isnan(columns["game_score"][1]))
+
+
+@skipIf(numpy is None, "NumPy is not installed")
+class TestContractMatrix(TestCase):
+    CONTRACTS_HTML = [
+        '<tr><td data-stat="player" data-append-csv="trentga02">Gary Trent Jr.</td><td data-stat="team_id">MIL</td>'
+        '<td class="right " data-stat="y1">$18,560,000</td>'
+        '<td class="right salary-pl" data-stat="y2">$19,000,000</td>'
+        '<td class="right iz" data-stat="y3"></td><td class="right iz" data-stat="y4"></td>'
+        '<td class="right iz" data-stat="y5"></td><td class="right iz" data-stat="y6"></td>'
+        '<td class="right " data-stat="remain_gtd">$18,560,000</td></tr>',
+        '<tr><td data-stat="player" data-append-csv="portibo01">Bobby Portis</td><td data-stat="team_id">MIL</td>'
+        '<td class="right " data-stat="y1">$12,578,286</td>'
+        '<td class="right salary-tm" data-stat="y2">$13,445,754</td>'
+        '<td class="right " data-stat="y3">$14,313,222</td><td class="right iz" data-stat="y4"></td>'
+        '<td class="right iz" data-stat="y5"></td><td class="right iz" data-stat="y6"></td>'
+        '<td class="right " data-stat="remain_gtd"></td></tr>',
+        '<tr><td data-stat="player" data-append-csv="currist01">Stephen Curry</td><td data-stat="team_id">GSW</td>'
+        '<td class="right " data-stat="y1">$55,761,216</td>'
+        '<td class="right iz" data-stat="y2"></td><td class="right iz" data-stat="y3"></td>'
+        '<td class="right iz" data-stat="y4"></td><td class="right iz" data-stat="y5"></td>'
+        '<td class="right iz" data-stat="y6"></td><td class="right " data-stat="remain_gtd">$55,761,216</td></tr>',
+    ]
+
+    def setUp(self):
+        self.parser_service = ParserService()
+        self.matrix = self.parser_service.parse_total_player_contracts_matrix(
+            contracts_html=[html.fragment_fromstring(row) for row in self.CONTRACTS_HTML],
+        )
+
+    def test_salaries_are_players_by_years(self):
+        self.assertEqual(3, len(self.matrix))
+        self.assertEqual([1, 2, 3, 4, 5, 6], self.matrix.years)
+        self.assertEqual(numpy.dtype("int64"), self.matrix.salaries.dtype)
+        self.assertEqual(
+            [
+                [18560000, 19000000, 0, 0, 0, 0],
+                [12578286, 13445754, 14313222, 0, 0, 0],
+                [55761216, 0, 0, 0, 0, 0],
+            ],
+            self.matrix.salaries.tolist(),
+        )
+        self.assertEqual([18560000, 0, 55761216], self.matrix.guaranteed.tolist())
+
+    def test_options_are_bitmask(self):
+        self.assertEqual(numpy.dtype("uint8"), self.matrix.options.dtype)
+        self.assertEqual([0, PLAYER_OPTION, 0, 0, 0, 0], self.matrix.options[0].tolist())
+        self.assertEqual([0, TEAM_OPTION, 0, 0, 0, 0], self.matrix.options[1].tolist())
+        self.assertEqual([[False, True], [False, False], [False, False]], self.matrix.player_options[:, :2].tolist())
+        self.assertEqual([[False, False], [False, True], [False, False]], self.matrix.team_options[:, :2].tolist())
+
+    def test_players_are_indexed_by_slug(self):
+        self.assertEqual(["Gary Trent Jr.", "Bobby Portis", "Stephen Curry"], self.matrix.names)
+        self.assertEqual(2, self.matrix.index["currist01"])
+        self.assertEqual(
+            [Team.MILWAUKEE_BUCKS, Team.MILWAUKEE_BUCKS, Team.GOLDEN_STATE_WARRIORS],
+            self.matrix.decode_teams(),
+        )
+
+    def test_year_and_team_totals(self):
+        self.assertEqual([86899502, 32445754, 14313222, 0, 0, 0], self.matrix.year_totals().tolist())
+
+        totals = self.matrix.team_year_totals()
+        lookup = self.matrix.team_codes.lookup
+
+        self.assertEqual((len(Team), 6), totals.shape)
+        self.assertEqual([31138286, 32445754, 14313222, 0, 0, 0], totals[lookup.index(Team.MILWAUKEE_BUCKS)].tolist())
+        self.assertEqual(55761216, totals[lookup.index(Team.GOLDEN_STATE_WARRIORS)].sum())
+        self.assertEqual(self.matrix.salaries.sum(), totals.sum())
+
+    def test_matrix_has_the_same_contracts_as_parsed_dicts(self):
+        dicts = self.parser_service.parse_total_player_contracts(contract_rows=[
+            PlayerTotalContractsRow(html=html.fragment_fromstring(row)) for row in self.CONTRACTS_HTML
+        ])
+
+        self.assertEqual(
+            [
+                (contract["player_name"], contract["year"], contract["salary"], contract["player_option"],
+                 contract["team_option"])
+                for contract in dicts
+            ],
+            [
+                (self.matrix.names[row], year, int(self.matrix.salaries[row, column]),
+                 bool(self.matrix.player_options[row, column]), bool(self.matrix.team_options[row, column]))
+                for row in range(len(self.matrix))
+                for column, year in enumerate(self.matrix.years)
+                if self.matrix.salaries[row, column]
+            ],
+        )
+
+    def test_http_service_builds_matrix_from_streamed_table(self):
+        content = (
+            '<html><body><table id="player-contracts"><thead><tr><th data-stat="player">Player</th></tr></thead>'
+            '<tbody>' + "".join(self.CONTRACTS_HTML) + '</tbody></table></body></html>'
+        ).encode("utf8")
+        service = HTTPService(parser=self.parser_service, session=mock.Mock(**{
+            "get.return_value": mock.Mock(content=content),
+        }))
+
+        matrix = service.total_player_contracts(columnar=True)
+
+        self.assertEqual(self.matrix.salaries.tolist(), matrix.salaries.tolist())
+        self.assertEqual(["trentga02", "portibo01", "currist01"], matrix.slugs)
@@ -1,18 +1,525 @@
+import threading
+import time
+from datetime import date, datetime
 from unittest import TestCase, mock
 
-from requests import codes
+import pytz
+from requests import codes, HTTPError
 
-from basketball_reference_web_scraper.errors import InvalidDate
-from basketball_reference_web_scraper.http_service import HTTPService
+from basketball_reference_web_scraper import http_service
+from basketball_reference_web_scraper.errors import InvalidDate, GameBoxScoreError, InvalidPlayerAndSeason
+from basketball_reference_web_scraper.http_service import HTTPService, create_session, configure_default_session, \
+    default_session, schedule_month_overlaps
 
 
 class TestHTTPService(TestCase):
-    @mock.patch("requests.get")
-    def test_player_box_scores_raises_invalid_date_for_300_response(self, mocked_get):
-        response = mock.Mock(status_code=codes.multiple_choices)
-        mocked_get.return_value = response
+    def test_player_box_scores_raises_invalid_date_for_300_response(self):
+        session = mock.Mock()
+        session.get.return_value = mock.Mock(status_code=codes.multiple_choices)
         self.assertRaisesRegex(
             InvalidDate,
             "Date with year set to 2018, month set to 1, and day set to 1 is invalid",
-            HTTPService(parser=mock.MagicMock()).player_box_scores,
+            HTTPService(parser=mock.MagicMock(), session=session).player_box_scores,
             day=1, month=1, year=2018)
+
+    def test_get_uses_session(self):
+        session = mock.Mock()
+        HTTPService(parser=mock.MagicMock(), session=session).get(url="some url", params={"some": "param"})
+        session.get.assert_called_once_with(url="some url", params={"some": "param"}, allow_redirects=True)
+
+    def test_default_session_is_used_when_session_is_not_specified(self):
+        self.assertIs(HTTPService(parser=mock.MagicMock()).session, default_session())
+
+
+class TestCreateSession(TestCase):
+    def test_pool_size_is_configured(self):
+        session = create_session(pool_connections=3, pool_maxsize=7)
+        adapter = session.get_adapter("https://www.basketball-reference.com")
+        self.assertEqual(3, adapter._pool_connections)
+        self.assertEqual(7, adapter._pool_maxsize)
+
+    def test_http_and_https_share_adapter(self):
+        session = create_session()
+        self.assertIs(
+            session.get_adapter("https://www.basketball-reference.com"),
+            session.get_adapter("http://www.basketball-reference.com"),
+        )
+
+    def test_headers_are_added(self):
+        session = create_session(headers={"User-Agent": "jaebaebae"})
+        self.assertEqual("jaebaebae", session.headers["User-Agent"])
+
+    def test_keep_alive_disabled_closes_connections(self):
+        self.assertEqual("close", create_session(keep_alive=False).headers["Connection"])
+
+
+class TestConfigureDefaultSession(TestCase):
+    def setUp(self):
+        self.original_session = http_service._default_session
+
+    def tearDown(self):
+        http_service._default_session = self.original_session
+
+    def test_replaces_default_session(self):
+        session = configure_default_session(pool_maxsize=2)
+        self.assertIs(session, default_session())
+
+    def test_closes_previous_default_session(self):
+        previous_session = mock.Mock()
+        http_service._default_session = previous_session
+        configure_default_session()
+        previous_session.close.assert_called_once_with()
+
+
+class TestSeasonSchedule(TestCase):
+    SEASON_SCHEDULE_HTML = b"""
+        <html><body><div id="content"><div class="filter">
+            <div class="current"><a href="/leagues/NBA_2018_games-october.html">October</a></div>
+            <div><a href="/leagues/NBA_2018_games-november.html">November</a></div>
+            <div><a href="/leagues/NBA_2018_games-december.html">December</a></div>
+            <div><a href="/leagues/NBA_2018_games-january.html">January</a></div>
+        </div></div></body></html>
+    """
+
+    def setUp(self):
+        session = mock.Mock()
+        session.get.return_value = mock.Mock(content=self.SEASON_SCHEDULE_HTML)
+        parser = mock.Mock()
+        parser.iter_scheduled_games.side_effect = lambda games: iter(["october"])
+        self.service = HTTPService(parser=parser, session=session, max_workers=3)
+
+    def test_monthly_schedules_are_combined_in_calendar_order(self):
+        delays = {"november": 0.03, "december": 0.0, "january": 0.01}
+
+        def schedule_for_month(url):
+            month = url.rsplit("-", 1)[1].replace(".html", "")
+            time.sleep(delays[month])
+            return [month]
+
+        with mock.patch.object(self.service, "schedule_for_month", side_effect=schedule_for_month):
+            self.assertEqual(
+                ["october", "november", "december", "january"],
+                self.service.season_schedule(season_end_year=2018),
+            )
+
+    def test_monthly_schedule_urls(self):
+        with mock.patch.object(self.service, "schedule_for_month", return_value=[]) as mocked_schedule_for_month:
+            self.service.season_schedule(season_end_year=2018)
+            self.assertCountEqual(
+                [
+                    mock.call(url="https://www.basketball-reference.com/leagues/NBA_2018_games-november.html"),
+                    mock.call(url="https://www.basketball-reference.com/leagues/NBA_2018_games-december.html"),
+                    mock.call(url="https://www.basketball-reference.com/leagues/NBA_2018_games-january.html"),
+                ],
+                mocked_schedule_for_month.call_args_list,
+            )
+
+    def test_only_monthly_schedules_in_date_range_are_fetched(self):
+        with mock.patch.object(self.service, "schedule_for_month", return_value=[]) as mocked_schedule_for_month:
+            list(self.service.iter_season_schedule(
+                season_end_year=2018,
+                start_date=date(2017, 12, 15),
+                end_date=date(2018, 1, 15),
+            ))
+            self.assertCountEqual(
+                [
+                    mock.call(url="https://www.basketball-reference.com/leagues/NBA_2018_games-december.html"),
+                    mock.call(url="https://www.basketball-reference.com/leagues/NBA_2018_games-january.html"),
+                ],
+                mocked_schedule_for_month.call_args_list,
+            )
+
+    def test_monthly_schedule_error_is_raised(self):
+        with mock.patch.object(self.service, "schedule_for_month", side_effect=HTTPError()):
+            self.assertRaises(HTTPError, self.service.season_schedule, season_end_year=2018)
+
+
+class TestScheduleMonthOverlaps(TestCase):
+    def test_months_before_season_start_month_are_in_season_end_year(self):
+        self.assertTrue(schedule_month_overlaps(
+            month_url_path="/leagues/NBA_2018_games-january.html",
+            season_end_year=2018,
+            start_date=date(2018, 1, 31),
+            end_date=date(2018, 2, 1),
+        ))
+        self.assertFalse(schedule_month_overlaps(
+            month_url_path="/leagues/NBA_2018_games-january.html",
+            season_end_year=2018,
+            start_date=date(2017, 1, 1),
+            end_date=date(2017, 1, 31),
+        ))
+
+    def test_months_after_season_start_month_are_in_previous_year(self):
+        self.assertTrue(schedule_month_overlaps(
+            month_url_path="/leagues/NBA_2018_games-december.html",
+            season_end_year=2018,
+            start_date=date(2017, 12, 31),
+            end_date=date(2018, 1, 1),
+        ))
+
+    def test_year_in_url_path_is_used(self):
+        self.assertTrue(schedule_month_overlaps(
+            month_url_path="/leagues/NBA_2020_games-october-2020.html",
+            season_end_year=2020,
+            start_date=date(2020, 10, 1),
+            end_date=date(2020, 10, 11),
+        ))
+        self.assertFalse(schedule_month_overlaps(
+            month_url_path="/leagues/NBA_2020_games-october-2019.html",
+            season_end_year=2020,
+            start_date=date(2020, 10, 1),
+            end_date=date(2020, 10, 11),
+        ))
+
+    def test_unknown_month_overlaps(self):
+        self.assertTrue(schedule_month_overlaps(
+            month_url_path="/leagues/NBA_2018_games.html",
+            season_end_year=2018,
+            start_date=date(2017, 1, 1),
+            end_date=date(2017, 1, 31),
+        ))
+
+
+class TestTeamBoxScores(TestCase):
+    DAILY_BOX_SCORES_HTML = b"""
+        <html><body><table>
+            <tr><td class="right gamelink"><a href="/boxscores/201701010ATL.html">Final</a></td></tr>
+            <tr><td class="right gamelink"><a href="/boxscores/201701010IND.html">Final</a></td></tr>
+            <tr><td class="right gamelink"><a href="/boxscores/201701010LAL.html">Final</a></td></tr>
+        </table></body></html>
+    """
+
+    def setUp(self):
+        session = mock.Mock()
+        session.get.return_value = mock.Mock(content=self.DAILY_BOX_SCORES_HTML)
+        self.service = HTTPService(parser=mock.Mock(), session=session, max_workers=3)
+
+    def test_box_scores_follow_game_order(self):
+        delays = {"ATL": 0.03, "IND": 0.0, "LAL": 0.01}
+
+        def team_box_score(game_url_path):
+            team_abbreviation = game_url_path[-8:-5]
+            time.sleep(delays[team_abbreviation])
+            return [team_abbreviation + " home", team_abbreviation + " away"]
+
+        with mock.patch.object(self.service, "team_box_score", side_effect=team_box_score):
+            result = self.service.team_box_scores(day=1, month=1, year=2017)
+
+        self.assertEqual(["ATL home", "ATL away", "IND home", "IND away", "LAL home", "LAL away"], result)
+        self.assertEqual([], result.errors)
+
+    def test_failed_game_returns_partial_results_and_errors(self):
+        not_found = HTTPError(response=mock.Mock(status_code=codes.not_found))
+
+        def team_box_score(game_url_path):
+            if game_url_path == "/boxscores/201701010IND.html":
+                raise not_found
+            return [game_url_path]
+
+        with mock.patch.object(self.service, "team_box_score", side_effect=team_box_score):
+            result = self.service.team_box_scores(day=1, month=1, year=2017)
+
+        self.assertEqual(["/boxscores/201701010ATL.html", "/boxscores/201701010LAL.html"], result)
+        self.assertEqual(1, len(result.errors))
+        self.assertIsInstance(result.errors[0], GameBoxScoreError)
+        self.assertEqual("/boxscores/201701010IND.html", result.errors[0].game_url_path)
+        self.assertIs(not_found, result.errors[0].error)
+
+    def test_game_that_cannot_be_parsed_returns_partial_results_and_errors(self):
+        def team_box_score(game_url_path):
+            if game_url_path == "/boxscores/201701010LAL.html":
+                raise AttributeError("'NoneType' object has no attribute 'text_content'")
+            return [game_url_path]
+
+        with mock.patch.object(self.service, "team_box_score", side_effect=team_box_score):
+            result = self.service.team_box_scores(day=1, month=1, year=2017)
+
+        self.assertEqual(["/boxscores/201701010ATL.html", "/boxscores/201701010IND.html"], result)
+        self.assertEqual(["/boxscores/201701010LAL.html"], [error.game_url_path for error in result.errors])
+        self.assertIsInstance(result.errors[0].error, AttributeError)
+
+
+class TestPlayerSeasonBoxScores(TestCase):
+    GAMELOG_HTML = b"""
+        <html><body>
+            <table id="pgl_basic"><tbody><tr><td data-stat="pts">10</td></tr></tbody></table>
+            <div id="all_pgl_basic_playoffs"><!--
+                <table id="pgl_basic_playoffs"><tbody>
+                    <tr><td data-stat="pts">20</td></tr><tr><td data-stat="pts">30</td></tr>
+                </tbody></table>
+            --></div>
+        </body></html>
+    """
+
+    def setUp(self):
+        self.session = mock.Mock()
+        self.session.get.return_value = mock.Mock(content=self.GAMELOG_HTML)
+        self.parser = mock.Mock()
+        self.parser.parse_player_season_box_scores.side_effect = \
+            lambda box_scores, include_inactive_games: [row.points_scored for row in box_scores]
+        self.parser.iter_player_season_box_scores.side_effect = \
+            lambda box_scores, include_inactive_games: (row.points_scored for row in box_scores)
+        self.service = HTTPService(parser=self.parser, session=self.session)
+
+    def test_regular_season_and_playoffs_are_parsed_from_single_fetch(self):
+        self.assertEqual(
+            {"regular_season": ["10"], "playoffs": ["20", "30"]},
+            self.service.player_season_box_scores(player_identifier="westbru01", season_end_year=2018),
+        )
+        self.session.get.assert_called_once_with(
+            url="https://www.basketball-reference.com/players/w/westbru01/gamelog/2018",
+            params=None,
+            allow_redirects=False,
+        )
+
+    def test_playoffs_can_be_excluded(self):
+        self.assertEqual(
+            {"regular_season": ["10"]},
+            self.service.player_season_box_scores(
+                player_identifier="westbru01",
+                season_end_year=2018,
+                include_playoffs=False,
+            ),
+        )
+
+    def test_missing_playoffs_table_is_empty(self):
+        self.session.get.return_value = mock.Mock(
+            content=b'<html><body><table id="pgl_basic"><tbody></tbody></table></body></html>'
+        )
+        self.assertEqual(
+            {"regular_season": [], "playoffs": []},
+            self.service.player_season_box_scores(player_identifier="westbru01", season_end_year=2018),
+        )
+
+    def test_missing_regular_season_table_raises_invalid_player_and_season(self):
+        self.session.get.return_value = mock.Mock(content=b"<html><body></body></html>")
+        self.assertRaises(
+            InvalidPlayerAndSeason,
+            self.service.player_season_box_scores,
+            player_identifier="westbru01",
+            season_end_year=2018,
+        )
+
+    def test_columnar_box_scores_are_parsed_from_table_rows(self):
+        self.parser.parse_player_season_box_scores_columns.side_effect = \
+            lambda box_scores, include_inactive_games: {"points_scored": [row.points_scored for row in box_scores]}
+
+        self.assertEqual(
+            {"points_scored": ["20", "30"]},
+            self.service.playoff_player_box_scores(player_identifier="westbru01", season_end_year=2018, columnar=True),
+        )
+        self.parser.parse_player_season_box_scores.assert_not_called()
+
+    def test_concurrent_regular_season_and_playoff_calls_share_fetch(self):
+        release = threading.Event()
+
+        def get(**kwargs):
+            release.wait()
+            return mock.Mock(content=self.GAMELOG_HTML)
+
+        self.session.get.side_effect = get
+        results = {}
+        threads = [
+            threading.Thread(target=lambda: results.update(regular_season=self.service.regular_season_player_box_scores(
+                player_identifier="westbru01",
+                season_end_year=2018,
+            ))),
+            threading.Thread(target=lambda: results.update(playoffs=self.service.playoff_player_box_scores(
+                player_identifier="westbru01",
+                season_end_year=2018,
+            ))),
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.02)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual({"regular_season": ["10"], "playoffs": ["20", "30"]}, results)
+        self.session.get.assert_called_once()
+
+    def concurrent_regular_season_player_box_scores(self, services):
+        release = threading.Event()
+
+        def get(**kwargs):
+            release.wait()
+            return mock.Mock(content=self.GAMELOG_HTML)
+
+        for service in services:
+            service.session.get.side_effect = get
+
+        threads = [
+            threading.Thread(target=lambda service=service: service.regular_season_player_box_scores(
+                player_identifier="westbru01",
+                season_end_year=2018,
+            ))
+            for service in services
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.02)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+    def test_services_with_same_session_share_fetch(self):
+        other_service = HTTPService(parser=self.parser, session=self.session)
+        self.concurrent_regular_season_player_box_scores(services=[self.service, other_service])
+
+        self.session.get.assert_called_once()
+
+    def test_services_with_different_sessions_do_not_share_fetch(self):
+        other_session = mock.Mock()
+        other_service = HTTPService(parser=self.parser, session=other_session)
+        self.concurrent_regular_season_player_box_scores(services=[self.service, other_service])
+
+        self.session.get.assert_called_once()
+        other_session.get.assert_called_once()
+
+
+class TestMapAhead(TestCase):
+    def test_results_are_yielded_in_order(self):
+        service = HTTPService(parser=mock.Mock(), session=mock.Mock(), max_workers=3)
+        self.assertEqual([2, 4, 6, 8], list(service.map_ahead(lambda value: value * 2, [1, 2, 3, 4], prefetch=2)))
+
+    def test_following_values_are_processed_before_they_are_consumed(self):
+        service = HTTPService(parser=mock.Mock(), session=mock.Mock(), max_workers=3)
+        processed = threading.Event()
+        function = mock.Mock(side_effect=lambda value: processed.set() if value == 2 else value)
+
+        results = service.map_ahead(function, [1, 2, 3, 4, 5], prefetch=1)
+        self.assertEqual(1, next(results))
+        self.assertTrue(processed.wait(timeout=1))
+        results.close()
+
+        self.assertNotIn(mock.call(5), function.call_args_list)
+
+
+class TestDateRanges(TestCase):
+    def setUp(self):
+        self.service = HTTPService(parser=mock.Mock(), session=mock.Mock(), max_workers=2)
+        eastern = pytz.timezone("US/Eastern")
+        self.schedules = {
+            2016: [],
+            2017: [
+                # Late games on the East Coast start after midnight UTC
+                {"start_time": eastern.localize(datetime(2016, 12, 30, 22, 30)).astimezone(pytz.utc)},
+                {"start_time": eastern.localize(datetime(2017, 1, 1, 19, 0)).astimezone(pytz.utc)},
+            ],
+        }
+        self.season_schedule = mock.patch.object(
+            self.service,
+            "iter_season_schedule",
+            side_effect=lambda season_end_year, start_date, end_date: iter(self.schedules[season_end_year]),
+        ).start()
+        self.addCleanup(mock.patch.stopall)
+
+    def test_off_days_are_skipped(self):
+        self.assertEqual(
+            [date(2016, 12, 30), date(2017, 1, 1)],
+            list(self.service.dates(start_date=date(2016, 12, 29), end_date=date(2017, 1, 2))),
+        )
+        self.assertEqual(
+            [
+                mock.call(season_end_year=2016, start_date=date(2016, 12, 29), end_date=date(2017, 1, 2)),
+                mock.call(season_end_year=2017, start_date=date(2016, 12, 29), end_date=date(2017, 1, 2)),
+            ],
+            self.season_schedule.call_args_list,
+        )
+
+    def test_dates_outside_of_range_are_skipped(self):
+        self.assertEqual(
+            [date(2016, 12, 30)],
+            list(self.service.dates(start_date=date(2016, 12, 30), end_date=date(2016, 12, 31))),
+        )
+
+    def test_off_days_are_not_skipped(self):
+        self.assertEqual(
+            [date(2016, 12, 31), date(2017, 1, 1)],
+            list(self.service.dates(start_date=date(2016, 12, 31), end_date=date(2017, 1, 1), skip_off_days=False)),
+        )
+        self.season_schedule.assert_not_called()
+
+    def test_season_that_is_not_published_has_no_game_dates(self):
+        def iter_season_schedule(season_end_year, start_date, end_date):
+            if season_end_year == 2018:
+                raise HTTPError(response=mock.Mock(status_code=codes.not_found))
+            return iter(self.schedules[season_end_year])
+
+        self.season_schedule.side_effect = iter_season_schedule
+        self.assertEqual(
+            [date(2016, 12, 30), date(2017, 1, 1)],
+            list(self.service.dates(start_date=date(2016, 12, 1), end_date=date(2017, 10, 31))),
+        )
+
+    def test_other_season_http_error_is_raised(self):
+        self.season_schedule.side_effect = HTTPError(response=mock.Mock(status_code=codes.bad_gateway))
+        self.assertRaises(
+            HTTPError,
+            list,
+            self.service.dates(start_date=date(2017, 1, 1), end_date=date(2017, 1, 2)),
+        )
+
+    def test_player_box_scores_range(self):
+        with mock.patch.object(self.service, "player_box_scores", side_effect=[["first"], InvalidDate(1, 1, 2017)]):
+            self.assertEqual(
+                [(date(2016, 12, 30), ["first"]), (date(2017, 1, 1), [])],
+                list(self.service.player_box_scores_range(start_date=date(2016, 12, 30), end_date=date(2017, 1, 1))),
+            )
+
+    def test_team_box_scores_range(self):
+        with mock.patch.object(self.service, "team_box_scores", side_effect=lambda day, month, year: [day]):
+            self.assertEqual(
+                [(date(2016, 12, 30), [30]), (date(2017, 1, 1), [1])],
+                list(self.service.team_box_scores_range(start_date=date(2016, 12, 1), end_date=date(2017, 1, 31))),
+            )
+
+
+class TestColumnarPlayersSeasonTotals(TestCase):
+    TOTALS_HTML = b"""
+        <html><body><table id="totals_stats"><tbody>
+            <tr class="full_table"><td data-stat="pts">10</td></tr>
+            <tr class="full_table"><td data-stat="team_id">TOT</td></tr>
+        </tbody></table></body></html>
+    """
+
+    def setUp(self):
+        self.parser = mock.Mock()
+        self.service = HTTPService(parser=self.parser, session=mock.Mock(**{
+            "get.return_value": mock.Mock(content=self.TOTALS_HTML),
+        }))
+
+    def test_every_row_is_parsed_into_columns(self):
+        self.parser.parse_player_season_totals_columns.side_effect = \
+            lambda totals_html: [row.text_content() for row in totals_html]
+
+        self.assertEqual(["10", "TOT"], self.service.players_season_totals(season_end_year=2019, columnar=True))
+        self.parser.parse_player_season_totals.assert_not_called()
+
+
+class TestIterPlayersSeasonTotals(TestCase):
+    TOTALS_HTML = b"""
+        <html><body><table id="totals_stats"><tbody>
+            <tr class="full_table"><td data-stat="pts">10</td></tr>
+            <tr class="full_table"><td data-stat="team_id">TOT</td></tr>
+            <tr class="full_table"><td data-stat="pts">20</td></tr>
+        </tbody></table></body></html>
+    """
+
+    def setUp(self):
+        self.parser = mock.Mock()
+        self.parser.iter_player_season_totals.side_effect = lambda totals: (row.record["points"] for row in totals)
+        self.service = HTTPService(parser=self.parser, session=mock.Mock(**{
+            "get.return_value": mock.Mock(content=self.TOTALS_HTML),
+        }))
+
+    def test_rows_are_parsed_as_the_table_is_streamed(self):
+        totals = self.service.iter_players_season_totals(season_end_year=2019)
+
+        self.assertEqual(10, next(totals))
+        self.assertEqual(1, self.parser.iter_player_season_totals.call_count)
+        self.assertEqual([20], list(totals))
+
+    def test_list_of_totals_excludes_combined_totals(self):
+        self.assertEqual([10, 20], self.service.players_season_totals(season_end_year=2019))
@@ -0,0 +1,32 @@
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from unittest import TestCase
+
+from basketball_reference_web_scraper.parser_service import ParserService, default_parser_service
+
+
+class TestDefaultParserService(TestCase):
+    def test_parser_service_is_shared(self):
+        parser_service = default_parser_service()
+
+        self.assertIsInstance(parser_service, ParserService)
+        self.assertIs(parser_service, default_parser_service())
+
+    def test_parser_service_is_created_once_by_concurrent_calls(self):
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            parser_services = set(executor.map(lambda _: default_parser_service(), range(32)))
+
+        self.assertEqual({default_parser_service()}, parser_services)
+
+    def test_parser_service_is_not_created_on_import(self):
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys; from basketball_reference_web_scraper import client, async_client, parser_service; "
+                "sys.exit(parser_service._default_parser_service is not None)",
+            ],
+        )
+
+        self.assertEqual(0, result.returncode)
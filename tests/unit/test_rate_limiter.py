@@ -0,0 +1,161 @@
+import os
+import shutil
+import tempfile
+import threading
+from unittest import TestCase, mock
+
+from requests import codes
+
+from basketball_reference_web_scraper.http_service import HTTPService
+from basketball_reference_web_scraper.rate_limiter import RateLimiter, RateLimitedSession, parse_retry_after
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestParseRetryAfter(TestCase):
+    def test_none(self):
+        self.assertIsNone(parse_retry_after(value=None, now=0))
+
+    def test_seconds(self):
+        self.assertEqual(120.0, parse_retry_after(value="120", now=0))
+
+    def test_http_date(self):
+        self.assertEqual(30.0, parse_retry_after(value="Thu, 01 Jan 1970 00:01:00 GMT", now=30))
+
+    def test_invalid_value(self):
+        self.assertIsNone(parse_retry_after(value="jaebaebae", now=0))
+
+
+class TestRateLimiter(TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.rate_limiter = RateLimiter(
+            requests_per_window=2,
+            window_seconds=10,
+            clock=self.clock.time,
+            sleep=self.clock.sleep,
+        )
+
+    def test_burst_up_to_window_limit_does_not_wait(self):
+        self.rate_limiter.acquire()
+        self.rate_limiter.acquire()
+        self.assertEqual([], self.clock.sleeps)
+
+    def test_waits_for_token_once_window_limit_is_reached(self):
+        for _ in range(3):
+            self.rate_limiter.acquire()
+        self.assertAlmostEqual(5.0, sum(self.clock.sleeps))
+
+    def test_throttling_waits_for_retry_after_and_cuts_rate(self):
+        self.rate_limiter.throttled(retry_after=30)
+        self.rate_limiter.acquire()
+        self.assertGreaterEqual(sum(self.clock.sleeps), 30)
+        self.assertAlmostEqual(0.1, self.rate_limiter.rate)
+
+    def test_throttling_without_retry_after_uses_default(self):
+        rate_limiter = RateLimiter(default_retry_after=15, clock=self.clock.time, sleep=self.clock.sleep)
+        rate_limiter.throttled()
+        rate_limiter.acquire()
+        self.assertAlmostEqual(15, sum(self.clock.sleeps))
+
+    def test_rate_recovers_after_successes(self):
+        self.rate_limiter.throttled(retry_after=0)
+        for _ in range(10):
+            self.rate_limiter.succeeded()
+        self.assertAlmostEqual(0.2, self.rate_limiter.rate)
+
+    def test_rate_does_not_drop_below_minimum(self):
+        for _ in range(10):
+            self.rate_limiter.throttled(retry_after=0)
+        self.assertAlmostEqual(0.02, self.rate_limiter.rate)
+
+    def test_shared_across_threads(self):
+        rate_limiter = RateLimiter(requests_per_window=5, window_seconds=10, clock=self.clock.time, sleep=mock.Mock())
+        threads = [threading.Thread(target=rate_limiter.acquire) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertLess(rate_limiter._state["tokens"], 1)
+
+
+class TestFileRateLimiter(TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.clock = FakeClock()
+        self.state_path = os.path.join(self.directory, "rate_limiter.json")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def rate_limiter(self):
+        return RateLimiter(
+            requests_per_window=2,
+            window_seconds=10,
+            state_path=self.state_path,
+            clock=self.clock.time,
+            sleep=self.clock.sleep,
+        )
+
+    def test_state_is_shared_between_instances(self):
+        first = self.rate_limiter()
+        second = self.rate_limiter()
+        first.acquire()
+        first.acquire()
+        second.acquire()
+        self.assertAlmostEqual(5.0, sum(self.clock.sleeps))
+
+    def test_throttling_is_shared_between_instances(self):
+        self.rate_limiter().throttled(retry_after=30)
+        self.rate_limiter().acquire()
+        self.assertGreaterEqual(sum(self.clock.sleeps), 30)
+
+
+class TestRateLimitedSession(TestCase):
+    def setUp(self):
+        self.rate_limiter = mock.Mock(clock=lambda: 0)
+        self.session = mock.Mock()
+        self.rate_limited_session = RateLimitedSession(
+            session=self.session,
+            rate_limiter=self.rate_limiter,
+            max_retries=2,
+        )
+
+    def test_successful_response(self):
+        response = mock.Mock(status_code=codes.ok)
+        self.session.get.return_value = response
+        self.assertIs(response, self.rate_limited_session.get(url="some url", params=None))
+        self.rate_limiter.acquire.assert_called_once_with()
+        self.rate_limiter.succeeded.assert_called_once_with()
+        self.session.get.assert_called_once_with(url="some url", params=None)
+
+    def test_throttled_response_is_retried_with_retry_after(self):
+        throttled = mock.Mock(status_code=codes.too_many_requests, headers={"Retry-After": "7"})
+        response = mock.Mock(status_code=codes.ok)
+        self.session.get.side_effect = [throttled, response]
+        self.assertIs(response, self.rate_limited_session.get(url="some url"))
+        self.rate_limiter.throttled.assert_called_once_with(retry_after=7.0)
+        self.assertEqual(2, self.rate_limiter.acquire.call_count)
+
+    def test_throttled_response_is_returned_after_max_retries(self):
+        throttled = mock.Mock(status_code=codes.too_many_requests, headers={})
+        self.session.get.return_value = throttled
+        self.assertIs(throttled, self.rate_limited_session.get(url="some url"))
+        self.assertEqual(3, self.session.get.call_count)
+
+    def test_http_service_wraps_session(self):
+        service = HTTPService(parser=mock.Mock(), session=self.session, rate_limiter=self.rate_limiter)
+        self.session.get.return_value = mock.Mock(status_code=codes.ok)
+        service.get(url="some url")
+        self.rate_limiter.acquire.assert_called_once_with()
@@ -0,0 +1,119 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from lxml import html
+
+from basketball_reference_web_scraper.html import PlayerSeasonTotalsRow
+from basketball_reference_web_scraper.schemas import Column, NullableColumn, TableSchema, PLAYER_SEASON_TOTALS_SCHEMA
+
+
+class TestTableSchema(TestCase):
+    def setUp(self):
+        self.schema = TableSchema(columns=[
+            Column(name="name", data_stat="player", tag="th"),
+            Column(name="slug", data_stat="player", tag="th", attribute="data-append-csv"),
+            NullableColumn(name="age", data_stat="age", type=int),
+            Column(name="games_played", data_stat="g", type=int),
+            Column(name="win_shares", data_stat="ws", type=float, default=-1.0),
+        ])
+
+    def test_record_has_typed_values_in_column_order(self):
+        record = self.schema.extract(html.fragment_fromstring(
+            '<tr>'
+            '<td data-stat="ws">1.5</td>'
+            '<th data-stat="player" data-append-csv="westbru01">Russell Westbrook</th>'
+            '<td data-stat="age"> 29 </td>'
+            '<td data-stat="g">80</td>'
+            '</tr>'
+        ))
+
+        self.assertEqual(
+            [("name", "Russell Westbrook"), ("slug", "westbru01"), ("age", 29), ("games_played", 80), ("win_shares", 1.5)],
+            list(record.items()),
+        )
+
+    def test_missing_and_invalid_values_are_defaults(self):
+        record = self.schema.extract(html.fragment_fromstring(
+            '<tr><td data-stat="player">not a header</td><td data-stat="age"></td><td data-stat="ws">-</td></tr>'
+        ))
+
+        self.assertEqual({"name": "", "slug": "", "age": None, "games_played": 0, "win_shares": -1.0}, record)
+
+    def test_empty_text_is_default(self):
+        schema = TableSchema(columns=[NullableColumn(name="inactive_reason", data_stat="reason")])
+
+        self.assertEqual(
+            {"inactive_reason": None},
+            schema.extract(html.fragment_fromstring('<tr><td data-stat="reason"></td></tr>')),
+        )
+        self.assertEqual(
+            {"inactive_reason": "Inactive"},
+            schema.extract(html.fragment_fromstring('<tr><td data-stat="reason">Inactive</td></tr>')),
+        )
+
+    def test_first_matching_cell_is_used(self):
+        record = self.schema.extract(html.fragment_fromstring(
+            '<tr><td data-stat="g">1</td><td data-stat="g">2</td></tr>'
+        ))
+
+        self.assertEqual(1, record["games_played"])
+
+    def test_row_cells_are_visited_once(self):
+        row_html = html.fragment_fromstring('<tr><td data-stat="g">1</td><td data-stat="ws">2</td></tr>')
+        mocked_row_html = MagicMock(iterchildren=MagicMock(side_effect=row_html.iterchildren))
+
+        self.schema.extract(mocked_row_html)
+
+        mocked_row_html.iterchildren.assert_called_once_with("td", "th")
+        mocked_row_html.xpath.assert_not_called()
+
+
+class TestPlayerSeasonTotalsSchema(TestCase):
+    def test_row_record(self):
+        row = PlayerSeasonTotalsRow(html=html.fragment_fromstring(
+            '<tr>'
+            '<td data-stat="player" data-append-csv="jonesje01">Jemerrio Jones</td>'
+            '<td data-stat="pos">SF</td>'
+            '<td data-stat="age"></td>'
+            '<td data-stat="team_id">LAL</td>'
+            '<td data-stat="g">6</td>'
+            '<td data-stat="fg_pct">.423</td>'
+            '<td data-stat="pts">24</td>'
+            '</tr>'
+        ))
+
+        self.assertIs(PLAYER_SEASON_TOTALS_SCHEMA, row.schema)
+        self.assertEqual("jonesje01", row.record["slug"])
+        self.assertIsNone(row.record["age"])
+        self.assertEqual(6, row.record["games_played"])
+        self.assertEqual(0, row.record["games_started"])
+        self.assertEqual(24, row.record["points"])
+        self.assertNotIn("fg_pct", row.record)
+        self.assertFalse(row.is_combined_totals)
+
+
+class TestExtractColumns(TestCase):
+    def test_values_are_gathered_by_column_in_row_order(self):
+        schema = TableSchema(columns=[
+            Column(name="name", data_stat="player", tag="th"),
+            NullableColumn(name="age", data_stat="age", type=int),
+        ])
+
+        columns = schema.extract_columns(
+            html.fragment_fromstring(row)
+            for row in [
+                '<tr><th data-stat="player">Russell Westbrook</th><td data-stat="age">29</td></tr>',
+                '<tr><td data-stat="age">20</td><th data-stat="player">Luka Doncic</th></tr>',
+                '<tr><th data-stat="player">Jemerrio Jones</th></tr>',
+            ]
+        )
+
+        self.assertEqual(
+            {"name": ["Russell Westbrook", "Luka Doncic", "Jemerrio Jones"], "age": [29, 20, None]},
+            columns,
+        )
+
+    def test_no_rows_have_empty_columns(self):
+        schema = TableSchema(columns=[Column(name="games_played", data_stat="g", type=int)])
+
+        self.assertEqual({"games_played": []}, schema.extract_columns([]))
@@ -1,6 +1,10 @@
+import threading
+import time
 from unittest import TestCase
+from unittest.mock import Mock
 
-from basketball_reference_web_scraper.utilities import str_to_int, str_to_float, merge_two_dicts
+from basketball_reference_web_scraper.utilities import str_to_int, str_to_float, merge_two_dicts, SingleFlight, \
+    memoized_property
 
 
 class TestStrToInt(TestCase):
@@ -58,3 +62,73 @@ class TestMergeTwoDicts(TestCase):
 
     def test_merge_non_empty_dicts_with_shared_keys(self):
         self.assertEqual({"jae": "baebae2"}, merge_two_dicts({"jae": "baebae"}, {"jae": "baebae2"}))
+
+
+class TestSingleFlight(TestCase):
+    def test_returns_result(self):
+        self.assertEqual("jaebaebae", SingleFlight().do(key="some key", function=lambda: "jaebaebae"))
+
+    def test_raises_error(self):
+        def fail():
+            raise ValueError("jaebaebae")
+
+        self.assertRaisesRegex(ValueError, "jaebaebae", SingleFlight().do, key="some key", function=fail)
+
+    def test_sequential_calls_are_not_shared(self):
+        single_flight = SingleFlight()
+        function = Mock(side_effect=[1, 2])
+        self.assertEqual(1, single_flight.do(key="some key", function=function))
+        self.assertEqual(2, single_flight.do(key="some key", function=function))
+
+    def test_concurrent_calls_with_same_key_are_shared(self):
+        single_flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        function = Mock()
+
+        def slow_function():
+            started.set()
+            release.wait()
+            return function()
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(single_flight.do(key="some key", function=slow_function)))
+        leader.start()
+        started.wait()
+        follower = threading.Thread(target=lambda: results.append(single_flight.do(key="some key", function=function)))
+        follower.start()
+        # Give the follower a chance to start waiting on the in-flight call
+        time.sleep(0.01)
+        release.set()
+        leader.join()
+        follower.join()
+
+        function.assert_called_once_with()
+        self.assertEqual([function.return_value, function.return_value], results)
+
+
+class TestMemoizedProperty(TestCase):
+    class Page:
+        def __init__(self, compute):
+            self.compute = compute
+
+        @memoized_property
+        def value(self):
+            """The computed value"""
+            return self.compute()
+
+    def test_value_is_computed_once_per_instance(self):
+        compute = Mock(return_value="jaebaebae")
+        page = self.Page(compute=compute)
+
+        self.assertEqual("jaebaebae", page.value)
+        self.assertEqual("jaebaebae", page.value)
+        compute.assert_called_once_with()
+
+    def test_instances_do_not_share_values(self):
+        self.assertEqual(1, self.Page(compute=lambda: 1).value)
+        self.assertEqual(2, self.Page(compute=lambda: 2).value)
+
+    def test_class_access_returns_descriptor(self):
+        self.assertIsInstance(self.Page.value, memoized_property)
+        self.assertEqual("The computed value", self.Page.value.__doc__)